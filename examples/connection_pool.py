@@ -0,0 +1,31 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from databricks.sql.pool import ConnectionPool
+
+pool = ConnectionPool(
+    server_hostname=os.getenv("DATABRICKS_SERVER_HOSTNAME"),
+    http_path=os.getenv("DATABRICKS_HTTP_PATH"),
+    access_token=os.getenv("DATABRICKS_TOKEN"),
+    min_size=2,
+    max_size=4,
+)
+
+
+def handle_request(i):
+    # Borrow an open connection instead of opening a new session per request
+    with pool.connection() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT :i * :i AS square", {"i": i})
+            return cursor.fetchone().square
+
+
+with pool:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        print(list(executor.map(handle_request, range(20))))
+
+    metrics = pool.metrics()
+    print(
+        f"{metrics.checkouts} checkouts served by {metrics.connections_created} "
+        f"connections, average wait {metrics.avg_wait_seconds * 1000:.1f} ms"
+    )
@@ -0,0 +1,34 @@
+import asyncio
+import os
+
+from databricks.sql import aio
+
+
+async def count_rows(connection, table):
+    async with connection.cursor() as cursor:
+        await cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        (row,) = await cursor.fetchall()
+        return table, row[0]
+
+
+async def main():
+    async with await aio.connect(
+        server_hostname=os.getenv("DATABRICKS_SERVER_HOSTNAME"),
+        http_path=os.getenv("DATABRICKS_HTTP_PATH"),
+        access_token=os.getenv("DATABRICKS_TOKEN"),
+    ) as connection:
+
+        # Queries run concurrently; waiting for them does not block any thread
+        tables = ["samples.nyctaxi.trips", "samples.tpch.orders"]
+        for table, count in await asyncio.gather(
+            *(count_rows(connection, table) for table in tables)
+        ):
+            print(table, count)
+
+        async with connection.cursor() as cursor:
+            await cursor.execute("SELECT * FROM RANGE(10)")
+            async for row in cursor:
+                print(row)
+
+
+asyncio.run(main())
@@ -0,0 +1,23 @@
+from databricks import sql
+import os
+
+with sql.connect(
+    server_hostname=os.getenv("DATABRICKS_SERVER_HOSTNAME"),
+    http_path=os.getenv("DATABRICKS_HTTP_PATH"),
+    access_token=os.getenv("DATABRICKS_TOKEN"),
+) as connection:
+
+    queries = [
+        "SELECT COUNT(*) FROM samples.nyctaxi.trips",
+        "SELECT COUNT(*) FROM samples.tpch.orders",
+        ("SELECT * FROM samples.tpch.customer WHERE c_custkey = :key", {"key": 42}),
+    ]
+
+    # At most 4 queries run at once; any query still running after 60 s is cancelled
+    for result in connection.run_concurrently(
+        queries, max_concurrency=4, timeout=60, ordered=False
+    ):
+        if result.succeeded:
+            print(result.operation, result.result.num_rows, result.duration_seconds)
+        else:
+            print(result.operation, "failed:", result.error)
@@ -4,7 +4,7 @@ from databricks.sql.exc import *
 
 # PEP 249 module globals
 apilevel = "2.0"
-threadsafety = 1  # Threads may share the module, but not connections.
+threadsafety = 2  # Threads may share the module and connections, but not cursors.
 
 paramstyle = "named"
 
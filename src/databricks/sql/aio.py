@@ -0,0 +1,266 @@
+"""
+asyncio interface to the connector.
+
+`AsyncConnection` and `AsyncCursor` wrap the blocking `Connection` and `Cursor`. Each
+network call (opening the session, submitting a statement, one status poll, fetching a
+batch) runs on an executor thread. The waits between status polls, timed by the
+connection's `polling_strategy`, are `asyncio.sleep` calls, so a query holds no thread
+while it runs on the server. Many concurrent queries therefore need only as many
+threads as there are calls in flight at once.
+
+```python
+from databricks.sql import aio
+
+async with await aio.connect(server_hostname, http_path, access_token) as connection:
+    async with connection.cursor() as cursor:
+        await cursor.execute("SELECT * FROM range(10)")
+        async for row in cursor:
+            print(row)
+```
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+from concurrent.futures import Executor
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from databricks.sql.backend.types import CommandState
+from databricks.sql.client import (
+    DEFAULT_ARRAY_SIZE,
+    DEFAULT_RESULT_BUFFER_SIZE_BYTES,
+    Connection,
+    Cursor,
+)
+from databricks.sql.types import Row
+
+if TYPE_CHECKING:
+    import pyarrow
+    from databricks.sql.parameters.native import TParameterCollection
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_PENDING_STATES = (CommandState.PENDING, CommandState.RUNNING)
+
+
+async def _run_blocking(
+    executor: Optional[Executor], func: Callable[..., T], *args, **kwargs
+) -> T:
+    """Run a blocking call on `executor` (the loop's default if None), preserving
+    the caller's context variables."""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        executor, functools.partial(context.run, func, *args, **kwargs)
+    )
+
+
+async def connect(
+    server_hostname: str,
+    http_path: str,
+    access_token: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    **kwargs,
+) -> "AsyncConnection":
+    """
+    Open a connection without blocking the event loop.
+
+    Takes the same arguments as `databricks.sql.connect`. Blocking calls made through the
+    returned connection run on `executor`, or on the event loop's default executor if None.
+    """
+    connection = await _run_blocking(
+        executor, Connection, server_hostname, http_path, access_token, **kwargs
+    )
+    return AsyncConnection(connection, executor=executor)
+
+
+class AsyncConnection:
+    def __init__(self, connection: Connection, executor: Optional[Executor] = None):
+        """
+        Wrap an open `Connection` for use from asyncio code.
+
+        Prefer `await databricks.sql.aio.connect(...)`, which also opens the session off
+        the event loop.
+        """
+        self.connection: Connection = connection
+        self._executor = executor
+
+    async def __aenter__(self) -> "AsyncConnection":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def open(self) -> bool:
+        return self.connection.open
+
+    def cursor(
+        self,
+        arraysize: int = DEFAULT_ARRAY_SIZE,
+        buffer_size_bytes: int = DEFAULT_RESULT_BUFFER_SIZE_BYTES,
+        row_limit: Optional[int] = None,
+    ) -> "AsyncCursor":
+        """
+        Return a new AsyncCursor using the connection. Takes the same arguments as
+        `Connection.cursor`.
+        """
+        cursor = self.connection.cursor(
+            arraysize=arraysize,
+            buffer_size_bytes=buffer_size_bytes,
+            row_limit=row_limit,
+        )
+        return AsyncCursor(self, cursor)
+
+    async def close(self) -> None:
+        """Close the underlying session and all of its cursors."""
+        await self._run(self.connection.close)
+
+    async def _run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        return await _run_blocking(self._executor, func, *args, **kwargs)
+
+
+class AsyncCursor:
+    def __init__(self, connection: AsyncConnection, cursor: Cursor):
+        """
+        asyncio counterpart of `Cursor`. Obtain one from `AsyncConnection.cursor()`.
+
+        `async for row in cursor` iterates over the rows of the active result set, and
+        `cursor.iter_arrow_batches()` over the same result as pyarrow Tables.
+        """
+        self.connection: AsyncConnection = connection
+        self.cursor: Cursor = cursor
+
+    async def __aenter__(self) -> "AsyncCursor":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __aiter__(self) -> AsyncIterator[Row]:
+        return self._iter_rows()
+
+    @property
+    def arraysize(self) -> int:
+        return self.cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self, value: int) -> None:
+        self.cursor.arraysize = value
+
+    @property
+    def description(self) -> Optional[List[Tuple]]:
+        return self.cursor.description
+
+    @property
+    def rowcount(self) -> int:
+        return self.cursor.rowcount
+
+    @property
+    def query_id(self) -> Optional[str]:
+        return self.cursor.query_id
+
+    async def execute(
+        self,
+        operation: str,
+        parameters: Optional["TParameterCollection"] = None,
+        enforce_embedded_schema_correctness=False,
+        query_tags: Optional[Dict[str, Optional[str]]] = None,
+    ) -> "AsyncCursor":
+        """
+        Execute a query and wait for it to complete without blocking the event loop.
+
+        Takes the same arguments as `Cursor.execute`, except `input_stream`. The statement
+        is submitted asynchronously and its status is polled with `asyncio.sleep` between
+        polls. If the awaiting task is cancelled, the query is cancelled on the server.
+
+        :returns self
+        """
+        await self._run(
+            self.cursor.execute_async,
+            operation,
+            parameters,
+            enforce_embedded_schema_correctness=enforce_embedded_schema_correctness,
+            query_tags=query_tags,
+        )
+        try:
+            operation_state = await self._wait_until_done()
+        except asyncio.CancelledError:
+            logger.debug("AsyncCursor.execute cancelled; cancelling the query")
+            # Not awaited: this task has been cancelled, so let the cancel run on
+            # its own and propagate the cancellation straight away.
+            asyncio.get_running_loop().run_in_executor(
+                self.connection._executor, self.cursor.cancel
+            )
+            raise
+        await self._run(self.cursor._collect_async_execution_result, operation_state)
+        return self
+
+    async def _wait_until_done(self) -> CommandState:
+        # The first check is immediate; later ones follow the connection's
+        # polling strategy
+        intervals = self.connection.connection.polling_strategy.intervals()
+        while True:
+            operation_state = await self._run(self.cursor.get_query_state)
+            if operation_state not in _PENDING_STATES:
+                return operation_state
+            await asyncio.sleep(next(intervals))
+
+    async def fetchone(self) -> Optional[Row]:
+        return await self._run(self.cursor.fetchone)
+
+    async def fetchmany(self, size: Optional[int] = None) -> List[Row]:
+        """Fetch the next `size` rows (the cursor's arraysize if None)."""
+        return await self._run(self.cursor.fetchmany, size or self.arraysize)
+
+    async def fetchall(self) -> List[Row]:
+        return await self._run(self.cursor.fetchall)
+
+    async def fetchmany_arrow(self, size: Optional[int] = None) -> "pyarrow.Table":
+        """Fetch the next `size` rows (the cursor's arraysize if None) as a pyarrow Table."""
+        return await self._run(self.cursor.fetchmany_arrow, size or self.arraysize)
+
+    async def fetchall_arrow(self) -> "pyarrow.Table":
+        return await self._run(self.cursor.fetchall_arrow)
+
+    async def _iter_rows(self) -> AsyncIterator[Row]:
+        while True:
+            rows = await self.fetchmany()
+            if not rows:
+                return
+            for row in rows:
+                yield row
+
+    async def iter_arrow_batches(
+        self, size: Optional[int] = None
+    ) -> AsyncIterator["pyarrow.Table"]:
+        """
+        Iterate over the remaining rows of the active result set as pyarrow Tables of up
+        to `size` rows (the cursor's arraysize if None).
+        """
+        while True:
+            batch = await self.fetchmany_arrow(size)
+            if batch.num_rows == 0:
+                return
+            yield batch
+
+    async def cancel(self) -> None:
+        await self._run(self.cursor.cancel)
+
+    async def close(self) -> None:
+        await self._run(self.cursor.close)
+
+    async def _run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        return await self.connection._run(func, *args, **kwargs)
@@ -9,6 +9,7 @@ from databricks.sql.auth.authenticators import (
 )
 from databricks.sql.auth.common import AuthType, ClientContext
 from databricks.sql.auth.token_federation import TokenFederationProvider
+from databricks.sql.auth.token_refresher import DEFAULT_REFRESH_FRACTION
 
 
 def get_auth_provider(cfg: ClientContext, http_client):
@@ -26,6 +27,7 @@ def get_auth_provider(cfg: ClientContext, http_client):
                 http_client,
                 cfg.azure_tenant_id,
                 cfg.azure_workspace_resource_id,
+                refresh_fraction=cfg.token_refresh_fraction,
             )
         )
     elif cfg.auth_type in [AuthType.DATABRICKS_OAUTH.value, AuthType.AZURE_OAUTH.value]:
@@ -41,6 +43,7 @@ def get_auth_provider(cfg: ClientContext, http_client):
             cfg.oauth_scopes,
             http_client,
             cfg.auth_type,
+            refresh_fraction=cfg.token_refresh_fraction,
         )
     elif cfg.access_token is not None:
         base_provider = AccessTokenAuthProvider(cfg.access_token)
@@ -61,6 +64,7 @@ def get_auth_provider(cfg: ClientContext, http_client):
                 cfg.oauth_scopes,
                 http_client,
                 cfg.auth_type or AuthType.DATABRICKS_OAUTH.value,
+                refresh_fraction=cfg.token_refresh_fraction,
             )
         else:
             raise RuntimeError("No valid authentication settings!")
@@ -72,6 +76,7 @@ def get_auth_provider(cfg: ClientContext, http_client):
             external_provider=base_provider,
             http_client=http_client,
             identity_federation_client_id=cfg.identity_federation_client_id,
+            refresh_fraction=cfg.token_refresh_fraction,
         )
 
     return base_provider
@@ -132,5 +137,8 @@ def get_python_sql_connector_auth_provider(hostname: str, http_client, **kwargs)
         oauth_persistence=kwargs.get("experimental_oauth_persistence"),
         credentials_provider=kwargs.get("credentials_provider"),
         identity_federation_client_id=kwargs.get("identity_federation_client_id"),
+        token_refresh_fraction=kwargs.get(
+            "token_refresh_fraction", DEFAULT_REFRESH_FRACTION
+        ),
     )
     return get_auth_provider(cfg, http_client)
@@ -1,5 +1,4 @@
 import logging
-import jwt
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Tuple
 from urllib.parse import urlparse
@@ -17,6 +16,8 @@ def decode_token(access_token: str) -> Optional[Dict]:
     Returns:
         Decoded token claims or None if decoding fails
     """
+    import jwt
+
     try:
         return jwt.decode(access_token, options={"verify_signature": False})
     except Exception as e:
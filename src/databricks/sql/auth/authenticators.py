@@ -1,28 +1,30 @@
 import abc
 import logging
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING
 from databricks.sql.common.http import HttpHeader
-from databricks.sql.auth.oauth import (
-    OAuthManager,
-    RefreshableTokenSource,
-    ClientCredentialsTokenSource,
-)
-from databricks.sql.auth.endpoint import get_oauth_endpoints
 from databricks.sql.auth.common import (
     AuthType,
     get_effective_azure_login_app_id,
     get_azure_tenant_id_from_host,
 )
+from databricks.sql.auth.token_refresher import DEFAULT_REFRESH_FRACTION, TokenRefresher
 
 # Private API: this is an evolving interface and it will change in the future.
 # Please must not depend on it in your applications.
 from databricks.sql.experimental.oauth_persistence import OAuthToken, OAuthPersistence
 
+if TYPE_CHECKING:
+    from databricks.sql.auth.oauth import RefreshableTokenSource
+
 
 class AuthProvider:
     def add_headers(self, request_headers: Dict[str, str]):
         pass
 
+    def close(self):
+        """Stop refreshing credentials in the background, if the provider does."""
+        pass
+
 
 HeaderFactory = Callable[[], Dict[str, str]]
 
@@ -63,7 +65,12 @@ class DatabricksOAuthProvider(AuthProvider):
         scopes: List[str],
         http_client,
         auth_type: str = "databricks-oauth",
+        refresh_fraction: Optional[float] = DEFAULT_REFRESH_FRACTION,
     ):
+        # The OAuth stack is only imported by connections that use it
+        from databricks.sql.auth.endpoint import get_oauth_endpoints
+        from databricks.sql.auth.oauth import OAuthManager
+
         try:
             idp_endpoint = get_oauth_endpoints(hostname, auth_type == "azure-oauth")
             if not idp_endpoint:
@@ -86,7 +93,9 @@ class DatabricksOAuthProvider(AuthProvider):
             self._client_id = client_id
             self._access_token = None
             self._refresh_token = None
+            self.refresher = TokenRefresher(self._refresh_tokens, refresh_fraction)
             self._initial_get_token()
+            self.refresher.schedule(self._access_token_expiry())
         except Exception as e:
             logging.error(f"unexpected error", e, exc_info=True)
             raise e
@@ -95,6 +104,9 @@ class DatabricksOAuthProvider(AuthProvider):
         self._update_token_if_expired()
         request_headers["Authorization"] = f"Bearer {self._access_token}"
 
+    def close(self):
+        self.refresher.close()
+
     def _initial_get_token(self):
         try:
             if self._access_token is None or self._refresh_token is None:
@@ -135,19 +147,38 @@ class DatabricksOAuthProvider(AuthProvider):
             if not is_refreshed:
                 return
             else:
-                self._access_token = fresh_access_token
-                self._refresh_token = fresh_refresh_token
-
-                if self._oauth_persistence:
-                    token = OAuthToken(self._access_token, self._refresh_token)
-                    self._oauth_persistence.persist(self._hostname, token)
+                self._store_tokens(fresh_access_token, fresh_refresh_token)
+                self.refresher.schedule(self._access_token_expiry())
         except Exception as e:
             logging.error(f"unexpected error in oauth token update", e, exc_info=True)
             raise e
 
+    def _refresh_tokens(self) -> Optional[float]:
+        # Requests that find the token expired meanwhile share this refresh request
+        access_token, refresh_token = self.oauth_manager.refresh_access_token(
+            self._hostname, self._refresh_token
+        )
+        self._store_tokens(access_token, refresh_token)
+        return self._access_token_expiry()
+
+    def _store_tokens(self, access_token, refresh_token):
+        self._access_token = access_token
+        self._refresh_token = refresh_token
+
+        if self._oauth_persistence:
+            token = OAuthToken(self._access_token, self._refresh_token)
+            self._oauth_persistence.persist(self._hostname, token)
+
+    def _access_token_expiry(self) -> Optional[float]:
+        if not self._refresh_token:
+            # Without a refresh token, the access token cannot be refreshed
+            return None
+        return self.oauth_manager.access_token_expiry(self._access_token)
+
 
 class ExternalAuthProvider(AuthProvider):
     def __init__(self, credentials_provider: CredentialsProvider) -> None:
+        self._credentials_provider = credentials_provider
         self._header_factory = credentials_provider()
 
     def add_headers(self, request_headers: Dict[str, str]):
@@ -155,6 +186,14 @@ class ExternalAuthProvider(AuthProvider):
         for k, v in headers.items():
             request_headers[k] = v
 
+    def close(self):
+        # Only providers built by the connector are closed; one passed in by the
+        # caller may be shared with other connections
+        if isinstance(
+            self._credentials_provider, AzureServicePrincipalCredentialProvider
+        ):
+            self._credentials_provider.close()
+
 
 class AzureServicePrincipalCredentialProvider(CredentialsProvider):
     """
@@ -191,6 +230,7 @@ class AzureServicePrincipalCredentialProvider(CredentialsProvider):
         http_client,
         azure_tenant_id=None,
         azure_workspace_resource_id=None,
+        refresh_fraction: Optional[float] = DEFAULT_REFRESH_FRACTION,
     ):
         self.hostname = hostname
         self.azure_client_id = azure_client_id
@@ -200,18 +240,30 @@ class AzureServicePrincipalCredentialProvider(CredentialsProvider):
             hostname, http_client
         )
         self._http_client = http_client
+        self._refresh_fraction = refresh_fraction
+        self._token_sources: List["RefreshableTokenSource"] = []
 
     def auth_type(self) -> str:
         return AuthType.AZURE_SP_M2M.value
 
-    def get_token_source(self, resource: str) -> RefreshableTokenSource:
-        return ClientCredentialsTokenSource(
+    def get_token_source(self, resource: str) -> "RefreshableTokenSource":
+        from databricks.sql.auth.oauth import ClientCredentialsTokenSource
+
+        token_source = ClientCredentialsTokenSource(
             token_url=f"{self.AZURE_AAD_ENDPOINT}/{self.azure_tenant_id}/{self.AZURE_TOKEN_ENDPOINT}",
             client_id=self.azure_client_id,
             client_secret=self.azure_client_secret,
             http_client=self._http_client,
             extra_params={"resource": resource},
+            refresh_fraction=self._refresh_fraction,
         )
+        self._token_sources.append(token_source)
+        return token_source
+
+    def close(self):
+        """Stop refreshing the tokens of the token sources created so far."""
+        for token_source in self._token_sources:
+            token_source.close()
 
     def __call__(self, *args, **kwargs) -> HeaderFactory:
         inner = self.get_token_source(
@@ -3,6 +3,7 @@ import logging
 from typing import Optional, List
 from urllib.parse import urlparse
 from databricks.sql.auth.retry import DatabricksRetryPolicy
+from databricks.sql.auth.token_refresher import DEFAULT_REFRESH_FRACTION
 from databricks.sql.common.http import HttpMethod
 
 logger = logging.getLogger(__name__)
@@ -53,6 +54,8 @@ class ClientContext:
         pool_maxsize: Optional[int] = None,
         user_agent: Optional[str] = None,
         telemetry_circuit_breaker_enabled: Optional[bool] = True,
+        share_connection_pools: Optional[bool] = False,
+        token_refresh_fraction: Optional[float] = DEFAULT_REFRESH_FRACTION,
     ):
         self.hostname = hostname
         self.access_token = access_token
@@ -87,6 +90,8 @@ class ClientContext:
         self.pool_maxsize = pool_maxsize or 20
         self.user_agent = user_agent
         self.telemetry_circuit_breaker_enabled = bool(telemetry_circuit_breaker_enabled)
+        self.share_connection_pools = bool(share_connection_pools)
+        self.token_refresh_fraction = token_refresh_fraction
 
 
 def get_effective_azure_login_app_id(hostname) -> str:
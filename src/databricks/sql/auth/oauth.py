@@ -6,7 +6,7 @@ import secrets
 import webbrowser
 from datetime import datetime, timezone
 from http.server import HTTPServer
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import oauthlib.oauth2
 from oauthlib.oauth2.rfc6749.errors import OAuth2Error
@@ -14,6 +14,8 @@ from databricks.sql.common.http import HttpMethod, HttpHeader
 from databricks.sql.common.http import OAuthResponse
 from databricks.sql.auth.oauth_http_handler import OAuthHttpSingleRequestHandler
 from databricks.sql.auth.endpoint import OAuthEndpointCollection
+from databricks.sql.auth.token_refresher import DEFAULT_REFRESH_FRACTION, TokenRefresher
+from databricks.sql.common.single_flight import SingleFlight
 from abc import abstractmethod, ABC
 from urllib.parse import urlencode
 import jwt
@@ -21,6 +23,9 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# Tokens are refreshed this many seconds before they expire
+EXPIRY_BUFFER_SECONDS = 30
+
 
 class Token:
     """
@@ -36,19 +41,32 @@ class Token:
         self.access_token = access_token
         self.token_type = token_type
         self.refresh_token = refresh_token
-
-    def is_expired(self) -> bool:
-        try:
+        self._expires_at: Optional[float] = None
+        self._expiry_decoded = False
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        """
+        The `exp` claim of the access token in seconds since the epoch, or None if it
+        has none. The token is decoded on first access only.
+        """
+        if not self._expiry_decoded:
             decoded_token = jwt.decode(
                 self.access_token, options={"verify_signature": False}
             )
-            exp_time = decoded_token.get("exp")
-            current_time = time.time()
-            buffer_time = 30  # 30 seconds buffer
-            return exp_time is not None and (exp_time - buffer_time) <= current_time
+            self._expires_at = decoded_token.get("exp")
+            self._expiry_decoded = True
+        return self._expires_at
+
+    def is_expired(self) -> bool:
+        try:
+            exp_time = self.expires_at
         except Exception as e:
             logger.error("Failed to decode token: %s", e)
             raise e
+        return (
+            exp_time is not None and (exp_time - EXPIRY_BUFFER_SECONDS) <= time.time()
+        )
 
 
 class RefreshableTokenSource(ABC):
@@ -60,6 +78,10 @@ class RefreshableTokenSource(ABC):
     def refresh(self) -> Token:
         pass
 
+    def close(self) -> None:
+        """Stop refreshing the token in the background."""
+        pass
+
 
 class OAuthManager:
     def __init__(
@@ -74,6 +96,17 @@ class OAuthManager:
         self.redirect_port = None
         self.idp_endpoint = idp_endpoint
         self.http_client = http_client
+        # The last access token checked and its expiry, so that a token is decoded
+        # once rather than on every request
+        self._expiry_cache: Tuple[Optional[str], float] = (None, 0.0)
+        # Concurrent refreshes with the same refresh token share one request, and the
+        # last refresh token exchanged maps to the tokens it was exchanged for
+        self._refreshes = SingleFlight()
+        self._last_refresh: Tuple[Optional[str], Tuple[str, Optional[str]]] = (
+            None,
+            ("", None),
+        )
+        self.last_refresh_ms: Optional[float] = None
 
     @staticmethod
     def __token_urlsafe(nbytes=32):
@@ -221,32 +254,51 @@ class OAuthManager:
         )
         return access_token, refresh_token
 
+    @staticmethod
+    def _decode_expiry(access_token: str) -> float:
+        # This token has already been verified and we are just parsing it.
+        # If it has been tampered with, it will be rejected on the server side.
+        # This avoids having to fetch the public key from the issuer and perform
+        # an unnecessary signature verification.
+        access_token_payload = access_token.split(".")[1]
+        # add padding
+        access_token_payload = access_token_payload + "=" * (
+            -len(access_token_payload) % 4
+        )
+        decoded = json.loads(base64.standard_b64decode(access_token_payload))
+        return float(decoded["exp"])
+
+    def _access_token_expiry(self, access_token: str) -> float:
+        cached_token, expires_at = self._expiry_cache
+        if access_token != cached_token:
+            expires_at = self._decode_expiry(access_token)
+            self._expiry_cache = (access_token, expires_at)
+        return expires_at
+
+    def access_token_expiry(self, access_token: str) -> Optional[float]:
+        """Return when `access_token` expires in seconds since the epoch, or None if
+        it is not a JWT with an `exp` claim."""
+        try:
+            return self._access_token_expiry(access_token)
+        except Exception:
+            return None
+
     def check_and_refresh_access_token(
         self, hostname: str, access_token: str, refresh_token: str
     ):
-        now = datetime.now(tz=timezone.utc)
-        # If we can't decode an expiration time, this will be expired by default.
-        expiration_time = now
         try:
-            # This token has already been verified and we are just parsing it.
-            # If it has been tampered with, it will be rejected on the server side.
-            # This avoids having to fetch the public key from the issuer and perform
-            # an unnecessary signature verification.
-            access_token_payload = access_token.split(".")[1]
-            # add padding
-            access_token_payload = access_token_payload + "=" * (
-                -len(access_token_payload) % 4
-            )
-            decoded = json.loads(base64.standard_b64decode(access_token_payload))
-            expiration_time = datetime.fromtimestamp(decoded["exp"], tz=timezone.utc)
+            expires_at = self._access_token_expiry(access_token)
         except Exception as e:
             logger.error(e)
             raise e
-
-        if expiration_time > now:
+        now = time.time()
+        if expires_at - EXPIRY_BUFFER_SECONDS > now or (
+            expires_at > now and not refresh_token
+        ):
             # The access token is fine. Just return it.
             return access_token, refresh_token, False
 
+        expiration_time = datetime.fromtimestamp(expires_at, tz=timezone.utc)
         if not refresh_token:
             msg = f"OAuth access token expired on {expiration_time}."
             logger.error(msg)
@@ -254,14 +306,48 @@ class OAuthManager:
 
         # Try to refresh using the refresh token
         logger.debug(
-            f"Attempting to refresh OAuth access token that expired on {expiration_time}"
+            f"Attempting to refresh OAuth access token that expires on {expiration_time}"
         )
-        oauth_response = self.__send_refresh_token_request(hostname, refresh_token)
-        fresh_access_token, fresh_refresh_token = self.__get_tokens_from_response(
-            oauth_response
+        fresh_access_token, fresh_refresh_token = self.refresh_access_token(
+            hostname, refresh_token
         )
         return fresh_access_token, fresh_refresh_token, True
 
+    def refresh_access_token(
+        self, hostname: str, refresh_token: str
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Exchange `refresh_token` for a new access token and refresh token.
+
+        Concurrent calls with the same refresh token share one request. Calling again
+        with a refresh token already exchanged returns the tokens it was exchanged for
+        while they are fresh, as the server may not accept a refresh token twice.
+        """
+        exchanged, tokens = self._last_refresh
+        if exchanged == refresh_token:
+            expires_at = self.access_token_expiry(tokens[0])
+            if (
+                expires_at is not None
+                and expires_at - EXPIRY_BUFFER_SECONDS > time.time()
+            ):
+                return tokens
+
+        tokens, _ = self._refreshes.do(
+            refresh_token, lambda: self._exchange_refresh_token(hostname, refresh_token)
+        )
+        return tokens
+
+    def _exchange_refresh_token(
+        self, hostname: str, refresh_token: str
+    ) -> Tuple[str, Optional[str]]:
+        start = time.perf_counter()
+        oauth_response = self.__send_refresh_token_request(hostname, refresh_token)
+        tokens = self.__get_tokens_from_response(oauth_response)
+        self._last_refresh = (refresh_token, tokens)
+        self.last_refresh_ms = (time.perf_counter() - start) * 1000
+        logger.debug("Refreshed OAuth access token in %.1f ms", self.last_refresh_ms)
+        return tokens
+
     def get_tokens(self, hostname: str, scope=None):
         oauth_config = self.__fetch_well_known_config(hostname)
         # We are going to override oauth_config["authorization_endpoint"] use the
@@ -310,6 +396,7 @@ class ClientCredentialsTokenSource(RefreshableTokenSource):
         client_secret,
         http_client,
         extra_params: dict = {},
+        refresh_fraction: Optional[float] = DEFAULT_REFRESH_FRACTION,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
@@ -317,11 +404,31 @@ class ClientCredentialsTokenSource(RefreshableTokenSource):
         self.extra_params = extra_params
         self.token: Optional[Token] = None
         self._http_client = http_client
+        self.refresher = TokenRefresher(
+            self._refresh_token, refresh_fraction, name="client credentials"
+        )
 
     def get_token(self) -> Token:
-        if self.token is None or self.token.is_expired():
-            self.token = self.refresh()
-        return self.token
+        token = self.token
+        if token is None or token.is_expired():
+            self.refresher.refresh(needed=self._token_expired)
+            token = self.token
+        return token
+
+    def close(self) -> None:
+        self.refresher.close()
+
+    def _token_expired(self) -> bool:
+        return self.token is None or self.token.is_expired()
+
+    def _refresh_token(self) -> Optional[float]:
+        token = self.refresh()
+        self.token = token
+        try:
+            return token.expires_at
+        except Exception:
+            # Not a JWT, so it is refreshed once the token endpoint rejects it
+            return None
 
     def refresh(self) -> Token:
         logger.info("Refreshing OAuth token using client credentials flow")
@@ -106,6 +106,10 @@ class DatabricksRetryPolicy(Retry):
         self.force_dangerous_codes = force_dangerous_codes
         self.respect_server_retry_after_header = respect_server_retry_after_header
 
+        # These are set for each request by start_retry_timer() and command_type
+        self._retry_start_time: Optional[float] = None
+        self._command_type: Optional[CommandType] = None
+
         # the urllib3 kwargs are a mix of configuration (some of which we override)
         # and counters like `total` or `connect` which may change between successive retries
         # we only care about urllib3 kwargs that we alias, override, or add to in some way
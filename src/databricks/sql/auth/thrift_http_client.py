@@ -1,10 +1,13 @@
 import base64
+import copy
 import logging
 import urllib.parse
 from typing import Dict, Union, Optional
 
 import six
 import thrift
+import thrift.transport.THttpClient
+import thrift.transport.TTransport
 
 import ssl
 import warnings
@@ -15,14 +18,32 @@ from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, ProxyManager
 from urllib3.util import make_headers
 from databricks.sql.auth.retry import CommandType, DatabricksRetryPolicy
 from databricks.sql.types import SSLOptions
+from databricks.sql.common.connection_pools import (
+    shared_connection_pool,
+    shared_ssl_context,
+    ssl_options_key,
+)
 from databricks.sql.common.http_utils import (
     detect_and_parse_proxy,
 )
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from a response body at a time
+DEFAULT_READ_BUFFER_SIZE = 65536
+
+
+class THttpClient(
+    thrift.transport.THttpClient.THttpClient,
+    thrift.transport.TTransport.CReadableTransport,
+):
+    """
+    An HTTP transport for Thrift requests over a urllib3 connection pool.
+
+    Responses are read through a buffer, as a CReadableTransport, so that
+    TBinaryProtocolAccelerated can decode them with thrift's C extension.
+    """
 
-class THttpClient(thrift.transport.THttpClient.THttpClient):
     realhost: Optional[str]
     realport: Optional[int]
     proxy_uri: Optional[str]
@@ -37,9 +58,12 @@ class THttpClient(thrift.transport.THttpClient.THttpClient):
         ssl_options: Optional[SSLOptions] = None,
         max_connections: int = 1,
         retry_policy: Union[DatabricksRetryPolicy, int] = 0,
+        read_buffer_size: int = DEFAULT_READ_BUFFER_SIZE,
+        share_connection_pools: bool = False,
         **kwargs,
     ):
         self._ssl_options = ssl_options
+        self._share_connection_pools = share_connection_pools
 
         if port is not None:
             warnings.warn(
@@ -61,7 +85,12 @@ class THttpClient(thrift.transport.THttpClient.THttpClient):
                     # TODO: Not sure if those options are used anywhere - need to double-check
                     self.certfile = self._ssl_options.tls_client_cert_file
                     self.keyfile = self._ssl_options.tls_client_cert_key_file
-                    self.context = self._ssl_options.create_ssl_context()
+                    # Connections with equivalent options share one context
+                    self.context = shared_ssl_context(
+                        "thrift",
+                        self._ssl_options,
+                        self._ssl_options.create_ssl_context,
+                    )
             self.port = parsed.port
             self.host = parsed.hostname
             self.path = parsed.path
@@ -94,6 +123,8 @@ class THttpClient(thrift.transport.THttpClient.THttpClient):
         self.retry_policy = retry_policy
 
         self.__wbuf = BytesIO()
+        self.__rbuf = BytesIO()
+        self.__read_buffer_size = read_buffer_size
         self.__resp: Union[None, HTTPResponse] = None
         self.__timeout = None
         self.__custom_headers = None
@@ -120,6 +151,8 @@ class THttpClient(thrift.transport.THttpClient.THttpClient):
             pool_class = HTTPConnectionPool
         elif self.scheme == "https":
             pool_class = HTTPSConnectionPool
+            # The CA file and client certificate were loaded into the shared context
+            # once, rather than into a new context for every connection
             _pool_kwargs.update(
                 {
                     "cert_reqs": (
@@ -127,35 +160,85 @@ class THttpClient(thrift.transport.THttpClient.THttpClient):
                         if self._ssl_options.tls_verify
                         else ssl.CERT_NONE
                     ),
-                    "ca_certs": self._ssl_options.tls_trusted_ca_file,
-                    "cert_file": self._ssl_options.tls_client_cert_file,
-                    "key_file": self._ssl_options.tls_client_cert_key_file,
-                    "key_password": self._ssl_options.tls_client_cert_key_password,
+                    "ssl_context": self.context,
                 }
             )
 
+        if self._share_connection_pools:
+            key = (
+                "thrift",
+                self.scheme,
+                self.host,
+                self.port,
+                self.realhost,
+                self.realport,
+                self.proxy_uri,
+                self.proxy_auth and tuple(sorted(self.proxy_auth.items())),
+                self.scheme == "https" and ssl_options_key(self._ssl_options),
+                self.max_connections,
+            )
+            self.__pool = shared_connection_pool(
+                key, lambda: self._create_pool(pool_class, _pool_kwargs)
+            )
+        else:
+            self.__pool = self._create_pool(pool_class, _pool_kwargs)
+
+    def _create_pool(self, pool_class, pool_kwargs):
         if self.using_proxy():
             proxy_manager = ProxyManager(
                 self.proxy_uri,
                 num_pools=1,
                 proxy_headers=self.proxy_auth,
             )
-            self.__pool = proxy_manager.connection_from_host(
+            return proxy_manager.connection_from_host(
                 host=self.realhost,
                 port=self.realport,
                 scheme=self.scheme,
-                pool_kwargs=_pool_kwargs,
+                pool_kwargs=pool_kwargs,
             )
-        else:
-            self.__pool = pool_class(self.host, self.port, **_pool_kwargs)
+        return pool_class(self.host, self.port, **pool_kwargs)
+
+    def clone(self) -> "THttpClient":
+        """
+        Return a transport for another concurrent request. It shares this transport's
+        connection pool, headers, timeout and auth provider, but has its own request
+        buffer, response and retry policy. Call open() before cloning.
+        """
+        other = copy.copy(self)
+        other.__wbuf = BytesIO()
+        other.__rbuf = BytesIO()
+        other.__resp = None
+        if isinstance(self.retry_policy, DatabricksRetryPolicy):
+            other.retry_policy = self.retry_policy.new()
+        return other
 
     def close(self):
         self.__resp and self.__resp.drain_conn()
         self.__resp and self.__resp.release_conn()
         self.__resp = None
+        self.__rbuf = BytesIO()
 
     def read(self, sz):
-        return self.__resp.read(sz)
+        data = self.__rbuf.read(sz)
+        if data:
+            return data
+        self.__rbuf = BytesIO(self.__resp.read(max(sz, self.__read_buffer_size)))
+        return self.__rbuf.read(sz)
+
+    # CReadableTransport, used by the accelerated protocol to decode from the buffer
+    @property
+    def cstringio_buf(self):
+        return self.__rbuf
+
+    def cstringio_refill(self, partialread, reqlen):
+        data = partialread
+        while len(data) < reqlen:
+            chunk = self.__resp.read(max(reqlen - len(data), self.__read_buffer_size))
+            if not chunk:
+                raise EOFError()
+            data += chunk
+        self.__rbuf = BytesIO(data)
+        return self.__rbuf
 
     def isOpen(self):
         return self.__resp is not None
@@ -165,6 +248,8 @@ class THttpClient(thrift.transport.THttpClient.THttpClient):
         # Pull data out of buffer that will be sent in this request
         data = self.__wbuf.getvalue()
         self.__wbuf = BytesIO()
+        # Drop anything left unread from the previous response
+        self.__rbuf = BytesIO()
 
         # Header handling
 
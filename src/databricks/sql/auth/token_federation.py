@@ -5,6 +5,7 @@ from typing import Optional, Dict, Tuple
 from urllib.parse import urlencode
 
 from databricks.sql.auth.authenticators import AuthProvider
+from databricks.sql.auth.token_refresher import DEFAULT_REFRESH_FRACTION, TokenRefresher
 from databricks.sql.auth.auth_utils import (
     decode_token,
     is_same_host,
@@ -86,6 +87,7 @@ class TokenFederationProvider(AuthProvider):
         external_provider: AuthProvider,
         http_client,
         identity_federation_client_id: Optional[str] = None,
+        refresh_fraction: Optional[float] = DEFAULT_REFRESH_FRACTION,
     ):
         """
         Initialize the Token Federation Provider.
@@ -95,6 +97,8 @@ class TokenFederationProvider(AuthProvider):
             external_provider: The external authentication provider
             http_client: HTTP client for making requests (required)
             identity_federation_client_id: Optional client ID for token federation
+            refresh_fraction: Fraction of an exchanged token's lifetime after which it
+                is exchanged again in the background (None to disable)
         """
         if not http_client:
             raise ValueError("http_client is required for TokenFederationProvider")
@@ -106,34 +110,56 @@ class TokenFederationProvider(AuthProvider):
 
         self._cached_token: Optional[Token] = None
         self._external_headers: Dict[str, str] = {}
+        self.refresher = TokenRefresher(
+            self._refresh_token, refresh_fraction, name="federated"
+        )
 
     def add_headers(self, request_headers: Dict[str, str]):
         """Add authentication headers to the request."""
 
-        if self._cached_token and not self._cached_token.is_expired():
-            request_headers["Authorization"] = (
-                f"{self._cached_token.token_type} {self._cached_token.access_token}"
-            )
-            return
-
-        # Get the external headers first to check if we need token federation
-        self._external_headers = {}
-        self.external_provider.add_headers(self._external_headers)
+        token = self._cached_token
+        if token is None or token.is_expired():
+            # Concurrent requests share one refresh
+            self.refresher.refresh(needed=self._token_expired)
+            token = self._cached_token
 
         # If no Authorization header from external provider, pass through all headers
-        if "Authorization" not in self._external_headers:
+        if token is None:
             request_headers.update(self._external_headers)
             return
 
-        token = self._get_token()
         request_headers["Authorization"] = f"{token.token_type} {token.access_token}"
 
-    def _get_token(self) -> Token:
-        """Get or refresh the authentication token."""
-        # Check if cached token is still valid
-        if self._cached_token and not self._cached_token.is_expired():
-            return self._cached_token
+    def close(self):
+        self.refresher.close()
+        self.external_provider.close()
+
+    def _token_expired(self) -> bool:
+        return self._cached_token is None or self._cached_token.is_expired()
 
+    def _refresh_token(self) -> Optional[float]:
+        # Get the external headers first to check if we need token federation
+        external_headers: Dict[str, str] = {}
+        self.external_provider.add_headers(external_headers)
+        self._external_headers = external_headers
+
+        if "Authorization" not in external_headers:
+            self._cached_token = None
+            return None
+
+        token = self._fetch_token()
+        self._cached_token = token
+        if (
+            token.access_token
+            == self._extract_token_from_header(external_headers["Authorization"])[1]
+        ):
+            # The external provider keeps its own token fresh
+            return None
+        decoded = decode_token(token.access_token)
+        return decoded.get("exp") if decoded else None
+
+    def _fetch_token(self) -> Token:
+        """Get a token from the external headers, exchanging it if needed."""
         # Extract token from already-fetched headers
         auth_header = self._external_headers.get("Authorization", "")
         token_type, access_token = self._extract_token_from_header(auth_header)
@@ -141,16 +167,12 @@ class TokenFederationProvider(AuthProvider):
         # Check if token exchange is needed
         if self._should_exchange_token(access_token):
             try:
-                token = self._exchange_token(access_token)
-                self._cached_token = token
-                return token
+                return self._exchange_token(access_token)
             except Exception as e:
                 logger.warning("Token exchange failed, using external token: %s", e)
 
         # Use external token directly
-        token = Token(access_token, token_type)
-        self._cached_token = token
-        return token
+        return Token(access_token, token_type)
 
     def _should_exchange_token(self, access_token: str) -> bool:
         """Check if the token should be exchanged based on issuer."""
@@ -0,0 +1,157 @@
+"""
+Proactive refresh of OAuth tokens.
+
+Tokens used to be refreshed on a request thread once they had expired, so about once an
+hour a request waited for a round trip to the token endpoint, and requests made at that
+moment each sent a refresh of their own. A `TokenRefresher` refreshes its token from a
+background thread once `refresh_fraction` of the token's remaining lifetime has passed.
+Refreshes that overlap, whether started in the background or by requests that found the
+token expired, are collapsed into one. The duration of each refresh is recorded in
+`last_refresh_ms` and logged at debug level.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from databricks.sql.common.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_FRACTION = 0.8
+
+# Seconds below which the time left before a refresh is due is not worth a background
+# refresh; the next request refreshes the token instead once it has expired
+MIN_REFRESH_INTERVAL = 10.0
+
+
+class TokenRefresher:
+    def __init__(
+        self,
+        refresh: Callable[[], Optional[float]],
+        refresh_fraction: Optional[float] = DEFAULT_REFRESH_FRACTION,
+        name: str = "OAuth",
+    ):
+        """
+        Refresh a token in the background before it expires.
+
+        :param refresh: Fetches and stores a new token, and returns when it expires in
+            seconds since the epoch, or None if that is unknown.
+        :param refresh_fraction: Fraction of a token's remaining lifetime after which it
+            is refreshed in the background. None disables background refreshes.
+        :param name: Describes the token in log messages.
+        """
+        if refresh_fraction is not None and not 0 < refresh_fraction < 1:
+            raise ValueError(
+                "refresh_fraction must be between 0 and 1, got %s" % refresh_fraction
+            )
+        self.refresh_fraction = refresh_fraction
+        self.name = name
+        self.refreshes = 0
+        self.background_refreshes = 0
+        self.failed_refreshes = 0
+        self.last_refresh_ms: Optional[float] = None
+
+        self._refresh_token = refresh
+        self._single_flight = SingleFlight()
+        self._condition = threading.Condition()
+        self._due: Optional[float] = None
+        self._expires_at: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def coalesced_refreshes(self) -> int:
+        """Refreshes that waited for one already running instead of sending their own."""
+        return self._single_flight.shared
+
+    def refresh(self, needed: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Refresh the token in the calling thread, or wait for a refresh already running.
+
+        :param needed: Checked once no other refresh is running. The token is only
+            refreshed if it returns True, so that a thread that found the token expired
+            just before another thread refreshed it does not refresh it again.
+        """
+        self._single_flight.do(None, lambda: self._refresh(needed))
+
+    def schedule(self, expires_at: Optional[float]) -> None:
+        """
+        Refresh the token in the background once `refresh_fraction` of the time left
+        until `expires_at`, in seconds since the epoch, has passed.
+        """
+        if self.refresh_fraction is None or expires_at is None:
+            return
+        delay = (expires_at - time.time()) * self.refresh_fraction
+        with self._condition:
+            if self._closed:
+                return
+            self._expires_at = expires_at
+            if delay < MIN_REFRESH_INTERVAL:
+                self._due = None
+                return
+            self._due = time.monotonic() + delay
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="databricks-sql-token-refresher",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Stop refreshing in the background. A refresh in progress is not waited for."""
+        with self._condition:
+            self._closed = True
+            self._due = None
+            self._condition.notify_all()
+
+    def _refresh(self, needed: Optional[Callable[[], bool]]) -> None:
+        if needed is not None and not needed():
+            return
+
+        start = time.perf_counter()
+        try:
+            expires_at = self._refresh_token()
+        except Exception:
+            with self._condition:
+                self.failed_refreshes += 1
+            raise
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._condition:
+            self.refreshes += 1
+            self.last_refresh_ms = elapsed_ms
+        logger.debug("Refreshed %s token in %.1f ms", self.name, elapsed_ms)
+        self.schedule(expires_at)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._due is None or self._due > time.monotonic():
+                    if self._closed:
+                        return
+                    timeout = None
+                    if self._due is not None:
+                        timeout = min(
+                            self._due - time.monotonic(), threading.TIMEOUT_MAX
+                        )
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                self._due = None
+                expires_at = self._expires_at
+
+            try:
+                _, shared = self._single_flight.do(None, lambda: self._refresh(None))
+            except Exception as e:
+                logger.warning(
+                    "Background refresh of %s token failed: %s", self.name, e
+                )
+                # Try again later, while the current token is still valid
+                self.schedule(expires_at)
+            else:
+                if not shared:
+                    with self._condition:
+                        self.background_refreshes += 1
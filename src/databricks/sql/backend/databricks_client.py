@@ -6,8 +6,8 @@ from typing import Dict, List, Optional, Any, Union, TYPE_CHECKING
 if TYPE_CHECKING:
     from databricks.sql.client import Cursor
     from databricks.sql.result_set import ResultSet
+    from databricks.sql.thrift_api.TCLIService import ttypes
 
-from databricks.sql.thrift_api.TCLIService import ttypes
 from databricks.sql.backend.types import SessionId, CommandId, CommandState
 
 
@@ -22,6 +22,10 @@ class DatabricksClient(ABC):
     - Fetching metadata about catalogs, schemas, tables, and columns
     """
 
+    # Whether closing a session also releases all of its operations on the server, so
+    # that operations still open when a connection is closed need no request of their own
+    closes_operations_with_session: bool = False
+
     # == Connection and Session Management ==
     @abstractmethod
     def open_session(
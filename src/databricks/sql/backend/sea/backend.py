@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import time
+import warnings
 import re
 from typing import Any, Dict, Tuple, List, Optional, Union, TYPE_CHECKING, Set
 
@@ -38,6 +39,11 @@ from databricks.sql.backend.types import (
 from databricks.sql.exc import DatabaseError, ServerOperationError
 from databricks.sql.backend.sea.utils.http_client import SeaHttpClient
 from databricks.sql.types import SSLOptions
+from databricks.sql.common.polling import (
+    ExponentialBackoffPolling,
+    FixedIntervalPolling,
+    PollingStrategy,
+)
 
 from databricks.sql.backend.sea.models import (
     ExecuteStatementRequest,
@@ -54,6 +60,9 @@ from databricks.sql.backend.sea.models import (
 
 logger = logging.getLogger(__name__)
 
+# Value of the deprecated SeaDatabricksClient.POLL_INTERVAL_SECONDS
+_LEGACY_POLL_INTERVAL_SECONDS = 0.2
+
 
 def _filter_session_configuration(
     session_configuration: Optional[Dict[str, Any]],
@@ -118,8 +127,9 @@ class SeaDatabricksClient(DatabricksClient):
     CANCEL_STATEMENT_PATH_WITH_ID = STATEMENT_PATH + "/{}/cancel"
     CHUNK_PATH_WITH_ID_AND_INDEX = STATEMENT_PATH + "/{}/result/chunks/{}"
 
-    # SEA constants
-    POLL_INTERVAL_SECONDS = 0.2
+    # Deprecated: pass `polling_strategy` to `connect()` instead. A client or subclass
+    # that changes it still waits that many seconds between status polls.
+    POLL_INTERVAL_SECONDS = _LEGACY_POLL_INTERVAL_SECONDS
 
     def __init__(
         self,
@@ -168,6 +178,10 @@ class SeaDatabricksClient(DatabricksClient):
             "_use_arrow_native_complex_types", True
         )
 
+        self._polling_strategy: PollingStrategy = (
+            kwargs.get("polling_strategy") or ExponentialBackoffPolling()
+        )
+
         self.use_hybrid_disposition = kwargs.get("use_hybrid_disposition", False)
         self.use_cloud_fetch = kwargs.get("use_cloud_fetch", True)
 
@@ -439,6 +453,20 @@ class SeaDatabricksClient(DatabricksClient):
                 },
             )
 
+    def _status_polling_strategy(self) -> PollingStrategy:
+        interval = self.POLL_INTERVAL_SECONDS
+        if interval != _LEGACY_POLL_INTERVAL_SECONDS:
+            warnings.warn(
+                "SeaDatabricksClient.POLL_INTERVAL_SECONDS is deprecated, pass "
+                "polling_strategy=FixedIntervalPolling(...) to connect() instead",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+            return FixedIntervalPolling(
+                interval, long_poll_seconds=self._polling_strategy.long_poll_seconds
+            )
+        return self._polling_strategy
+
     def _wait_until_command_done(
         self, response: ExecuteStatementResponse
     ) -> Union[ExecuteStatementResponse, GetStatementResponse]:
@@ -449,12 +477,24 @@ class SeaDatabricksClient(DatabricksClient):
         final_response: Union[ExecuteStatementResponse, GetStatementResponse] = response
         command_id = CommandId.from_sea_statement_id(final_response.statement_id)
 
+        polling_strategy = self._status_polling_strategy()
+        intervals = polling_strategy.intervals()
+        long_poll_seconds = polling_strategy.long_poll_seconds
+        held_seconds = 0.0
         while final_response.status.state in [
             CommandState.PENDING,
             CommandState.RUNNING,
         ]:
-            time.sleep(self.POLL_INTERVAL_SECONDS)
-            final_response = self._poll_query(command_id)
+            # A long poll that was actually held open on the server already waited;
+            # otherwise (no long polling, or the server answered early) back off.
+            if long_poll_seconds is None or held_seconds < long_poll_seconds / 2:
+                time.sleep(next(intervals))
+            poll_start = time.monotonic()
+            final_response = self._poll_query(
+                command_id,
+                wait_timeout=f"{long_poll_seconds}s" if long_poll_seconds else None,
+            )
+            held_seconds = time.monotonic() - poll_start
 
         self._check_command_not_in_failed_or_closed_state(
             final_response.status, command_id
@@ -612,9 +652,16 @@ class SeaDatabricksClient(DatabricksClient):
             data=request.to_dict(),
         )
 
-    def _poll_query(self, command_id: CommandId) -> GetStatementResponse:
+    def _poll_query(
+        self, command_id: CommandId, wait_timeout: Optional[str] = None
+    ) -> GetStatementResponse:
         """
         Poll for the current command info.
+
+        Args:
+            command_id: Command identifier
+            wait_timeout: If set (e.g. "10s"), ask the server to hold the request for up
+                to this long while the command is still running
         """
 
         if command_id.backend_type != BackendType.SEA:
@@ -622,7 +669,9 @@ class SeaDatabricksClient(DatabricksClient):
 
         sea_statement_id = command_id.to_sea_statement_id()
 
-        request = GetStatementRequest(statement_id=sea_statement_id)
+        request = GetStatementRequest(
+            statement_id=sea_statement_id, wait_timeout=wait_timeout
+        )
         response_data = self._http_client._make_request(
             method="GET",
             path=self.STATEMENT_PATH_WITH_ID.format(sea_statement_id),
@@ -644,9 +693,12 @@ class SeaDatabricksClient(DatabricksClient):
 
         Raises:
             ValueError: If the command ID is invalid
+            ServerOperationError: If the command failed, with the server's error
+            DatabaseError: If the command was closed server side
         """
 
         response = self._poll_query(command_id)
+        self._check_command_not_in_failed_or_closed_state(response.status, command_id)
         return response.status.state
 
     def get_execution_result(
@@ -76,10 +76,14 @@ class GetStatementRequest:
     """Representation of a request to get information about a statement."""
 
     statement_id: str
+    wait_timeout: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the request to a dictionary for JSON serialization."""
-        return {"statement_id": self.statement_id}
+        result: Dict[str, Any] = {"statement_id": self.statement_id}
+        if self.wait_timeout:
+            result["wait_timeout"] = self.wait_timeout
+        return result
 
 
 @dataclass
@@ -26,10 +26,8 @@ from databricks.sql.utils import CloudFetchQueue, ArrowQueue
 
 try:
     import pyarrow
-    import pyarrow.compute as pc
 except ImportError:
     pyarrow = None
-    pc = None
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +131,8 @@ class ResultSetFilter:
         if table.num_rows == 0:
             return table
 
+        import pyarrow.compute as pc
+
         # Handle case-insensitive filtering by normalizing both column and allowed values
         if not case_sensitive:
             # Convert allowed values to uppercase
@@ -207,6 +207,18 @@ class SeaHttpClient:
         if isinstance(self.retry_policy, DatabricksRetryPolicy):
             self.retry_policy.start_retry_timer()
 
+    def _request_retry_policy(
+        self, command_type: CommandType
+    ) -> Union[DatabricksRetryPolicy, int]:
+        """Return a fresh copy of the retry policy for one request, with its command
+        type set and its retry timer started."""
+        if not isinstance(self.retry_policy, DatabricksRetryPolicy):
+            return self.retry_policy
+        retry_policy = self.retry_policy.new()
+        retry_policy.command_type = command_type
+        retry_policy.start_retry_timer()
+        return retry_policy
+
     def _get_auth_headers(self) -> Dict[str, str]:
         """Get authentication headers from the auth provider."""
         headers: Dict[str, str] = {}
@@ -242,10 +254,9 @@ class SeaHttpClient:
         if body:
             headers["Content-Length"] = str(len(body))
 
-        # Set command type for retry policy
+        # Retry state is per request so that concurrent requests don't share it
         command_type = self._get_command_type_from_path(path, method)
-        self.set_retry_command_type(command_type)
-        self.start_retry_timer()
+        retry_policy = self._request_retry_policy(command_type)
 
         logger.debug(f"Making {method} request to {path}")
 
@@ -259,7 +270,7 @@ class SeaHttpClient:
                 body=body,
                 headers=headers,
                 preload_content=False,
-                retries=self.retry_policy,
+                retries=retry_policy,
             ) as response:
                 # Handle successful responses
                 if 200 <= response.status < 300:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import errno
+import importlib
 import logging
 import math
 import time
 import threading
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
 from uuid import UUID
 
@@ -75,6 +77,8 @@ DATABRICKS_REASON_HEADER = "x-databricks-reason-phrase"
 
 TIMESTAMP_AS_STRING_CONFIG = "spark.thriftserver.arrowBasedRowSet.timestampAsString"
 DEFAULT_SOCKET_TIMEOUT = float(900)
+# Connections kept open to the server for concurrent requests from one connection's cursors
+DEFAULT_MAX_CONCURRENT_REQUESTS = 10
 
 # see Connection.__init__ for parameter descriptions.
 # - Min/Max avoids unsustainable configs (sane values are far more constrained)
@@ -88,9 +92,29 @@ _retry_policy = {  # (type, default, min, max)
 }
 
 
+def _thrift_protocol_class(accelerated: bool = True):
+    """
+    Return TBinaryProtocolAccelerated, which encodes and decodes structs with thrift's
+    `fastbinary` C extension, or the pure-Python TBinaryProtocol if the extension is not
+    available or `accelerated` is False.
+    """
+    if accelerated:
+        try:
+            importlib.import_module("thrift.protocol.fastbinary")
+            return thrift.protocol.TBinaryProtocol.TBinaryProtocolAccelerated
+        except ImportError:
+            logger.debug(
+                "thrift's fastbinary extension is not available, "
+                "falling back to the pure-Python protocol"
+            )
+    return thrift.protocol.TBinaryProtocol.TBinaryProtocol
+
+
 class ThriftDatabricksClient(DatabricksClient):
     CLOSED_OP_STATE = CommandState.CLOSED
     ERROR_OP_STATE = CommandState.FAILED
+    # CloseSession closes every operation of the session
+    closes_operations_with_session = True
 
     _retry_delay_min: float
     _retry_delay_max: float
@@ -145,6 +169,9 @@ class ThriftDatabricksClient(DatabricksClient):
         #  (defaults to None)
         # max_download_threads
         #  Number of threads for handling cloud fetch downloads. Defaults to 10
+        # _use_accelerated_thrift_protocol
+        #  Whether to encode and decode requests with thrift's C extension when it is
+        #  installed, rather than in Python. (defaults to True)
 
         logger.debug(
             "ThriftBackend.__init__(server_hostname=%s, port=%s, http_path=%s)"
@@ -201,6 +228,9 @@ class ThriftDatabricksClient(DatabricksClient):
         if proxy_auth_method:
             additional_transport_args["_proxy_auth_method"] = proxy_auth_method
 
+        if kwargs.get("_share_connection_pools"):
+            additional_transport_args["share_connection_pools"] = True
+
         _max_redirects: Union[None, int] = kwargs.get("_retry_max_redirects")
 
         if _max_redirects:
@@ -229,6 +259,8 @@ class ThriftDatabricksClient(DatabricksClient):
             auth_provider=self._auth_provider,
             uri_or_host=uri,
             ssl_options=self._ssl_options,
+            max_connections=kwargs.get("_pool_maxsize")
+            or DEFAULT_MAX_CONCURRENT_REQUESTS,
             **additional_transport_args,  # type: ignore
         )
 
@@ -237,8 +269,10 @@ class ThriftDatabricksClient(DatabricksClient):
         self._transport.setTimeout(timeout and (float(timeout) * 1000.0))
 
         self._transport.setCustomHeaders(dict(http_headers))
-        protocol = thrift.protocol.TBinaryProtocol.TBinaryProtocol(self._transport)
-        self._client = TCLIService.Client(protocol)
+        self._protocol_class = _thrift_protocol_class(
+            kwargs.get("_use_accelerated_thrift_protocol", True)
+        )
+        self._client = TCLIService.Client(self._protocol_class(self._transport))
 
         try:
             self._transport.open()
@@ -246,7 +280,11 @@ class ThriftDatabricksClient(DatabricksClient):
             self._transport.close()
             raise
 
-        self._request_lock = threading.RLock()
+        # Each in-flight request uses its own transport (and Thrift client over it), so
+        # cursors sharing this connection can make requests concurrently. Transports
+        # share one urllib3 connection pool and are reused once their request is done.
+        self._transports_lock = threading.Lock()
+        self._idle_transports = [(self._transport, self._client)]
         self._session_id_hex = None
 
     @property
@@ -359,6 +397,24 @@ class ThriftDatabricksClient(DatabricksClient):
         )
         time.sleep(error_info.retry_delay)
 
+    @contextmanager
+    def _borrow_transport(self):
+        """Yield a (transport, client) pair for one request attempt, creating a new one
+        if all existing pairs are in use by other threads."""
+        with self._transports_lock:
+            transport_and_client = (
+                self._idle_transports.pop() if self._idle_transports else None
+            )
+        if transport_and_client is None:
+            transport = self._transport.clone()
+            client = TCLIService.Client(self._protocol_class(transport))
+            transport_and_client = (transport, client)
+        try:
+            yield transport_and_client
+        finally:
+            with self._transports_lock:
+                self._idle_transports.append(transport_and_client)
+
     # FUTURE: Consider moving to https://github.com/litl/backoff or
     # https://github.com/jd/tenacity for retry logic.
     def make_request(self, method, request, retryable=True):
@@ -389,18 +445,18 @@ class ThriftDatabricksClient(DatabricksClient):
             delay = min(delay, self._retry_delay_max)
             return delay
 
-        def extract_retry_delay(attempt):
+        def extract_retry_delay(attempt, transport):
             # encapsulate retry checks, returns None || delay-in-secs
             # Retry IFF 429/503 code + Retry-After header set
-            http_code = getattr(self._transport, "code", None)
-            retry_after = getattr(self._transport, "headers", {}).get("Retry-After", 1)
+            http_code = getattr(transport, "code", None)
+            retry_after = getattr(transport, "headers", {}).get("Retry-After", 1)
             if http_code in [429, 503]:
                 # bound delay (seconds) by [min_delay*1.5^(attempt-1), max_delay]
                 return bound_retry_delay(attempt, int(retry_after))
             return None
 
-        def attempt_request(attempt):
-            # splits out lockable attempt, from delay & retry loop
+        def attempt_request(attempt, transport, client):
+            # splits out one attempt on a borrowed transport, from delay & retry loop
             # returns tuple: (method_return, delay_fn(), error, error_message)
             # - non-None method_return -> success, return and be done
             # - non-None retry_delay -> sleep delay before retry
@@ -416,10 +472,16 @@ class ThriftDatabricksClient(DatabricksClient):
                 # These three lines are no-ops if the v3 retry policy is not in use
                 if self.enable_v3_retries:
                     this_command_type = CommandType.get(this_method_name)
-                    self._transport.set_retry_command_type(this_command_type)
-                    self._transport.startRetryTimer()
-
-                response = method(request)
+                    transport.set_retry_command_type(this_command_type)
+                    transport.startRetryTimer()
+
+                # `method` is bound to the primary client; call it on the borrowed one
+                bound_method = (
+                    method
+                    if client is self._client
+                    else getattr(client, this_method_name)
+                )
+                response = bound_method(request)
 
                 # We need to call type(response) here because thrift doesn't implement __name__ attributes for thrift responses
                 logger.debug(
@@ -480,21 +542,21 @@ class ThriftDatabricksClient(DatabricksClient):
             except Exception as err:
                 logger.error("ThriftBackend.attempt_request: Exception: %s", err)
                 error = err
-                retry_delay = extract_retry_delay(attempt)
+                retry_delay = extract_retry_delay(attempt, transport)
                 error_message = (
                     ThriftDatabricksClient._extract_error_message_from_headers(
-                        getattr(self._transport, "headers", {})
+                        getattr(transport, "headers", {})
                     )
                 )
             finally:
                 # Calling `close()` here releases the active HTTP connection back to the pool
-                self._transport.close()
+                transport.close()
 
             return RequestErrorInfo(
                 error=error,
                 error_message=error_message,
                 retry_delay=retry_delay,
-                http_code=getattr(self._transport, "code", None),
+                http_code=getattr(transport, "code", None),
                 method=method.__name__,
                 request=request,
             )
@@ -509,11 +571,10 @@ class ThriftDatabricksClient(DatabricksClient):
 
         # use index-1 counting for logging/human consistency
         for attempt in range(1, max_attempts + 1):
-            # We have a lock here because .cancel can be called from a separate thread.
-            # We do not want threads to be simultaneously sharing the Thrift Transport
-            # because we use its state to determine retries
-            with self._request_lock:
-                response_or_error_info = attempt_request(attempt)
+            # Requests from other threads (e.g. .cancel, or other cursors) run on their
+            # own transports, since we use the transport's state to determine retries
+            with self._borrow_transport() as (transport, client):
+                response_or_error_info = attempt_request(attempt, transport, client)
             elapsed = get_elapsed()
 
             # conditions: success, non-retry-able, no-attempts-left, no-time-left, delay+retry
@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 import logging
 
 from databricks.sql.backend.utils.guid_utils import guid_to_hex_id
 from databricks.sql.telemetry.models.enums import StatementType
-from databricks.sql.thrift_api.TCLIService import ttypes
+
+if TYPE_CHECKING:
+    from databricks.sql.thrift_api.TCLIService import ttypes
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +38,7 @@ class CommandState(Enum):
 
     @classmethod
     def from_thrift_state(
-        cls, state: ttypes.TOperationState
+        cls, state: "ttypes.TOperationState"
     ) -> Optional["CommandState"]:
         """
         Convert a Thrift TOperationState to a normalized CommandState.
@@ -59,6 +61,7 @@ class CommandState(Enum):
             - CLOSED_STATE -> CLOSED
             - CANCELED_STATE -> CANCELLED
         """
+        from databricks.sql.thrift_api.TCLIService import ttypes
 
         if state in (
             ttypes.TOperationState.INITIALIZED_STATE,
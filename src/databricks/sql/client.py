@@ -1,16 +1,45 @@
 import time
-from typing import Dict, Tuple, List, Optional, Any, Union, Sequence, BinaryIO
-import pandas
+import threading
+from typing import (
+    Dict,
+    Tuple,
+    List,
+    Optional,
+    Any,
+    Callable,
+    Union,
+    Sequence,
+    Mapping,
+    BinaryIO,
+    Iterator,
+    TYPE_CHECKING,
+)
 
 try:
     import pyarrow
 except ImportError:
     pyarrow = None
+
+if TYPE_CHECKING:
+    import pandas
+
+    from databricks.sql.thrift_api.TCLIService.ttypes import TOpenSessionResp
+
+import copy
+import hashlib
+import io
+import itertools
 import json
 import os
 import decimal
+import re
+import sys
+import warnings
+import weakref
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
 from urllib.parse import urlparse
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from databricks.sql import __version__
 from databricks.sql import *
@@ -25,8 +54,6 @@ from databricks.sql.exc import (
     DatabaseError,
 )
 
-from databricks.sql.thrift_api.TCLIService import ttypes
-from databricks.sql.backend.thrift_backend import ThriftDatabricksClient
 from databricks.sql.backend.databricks_client import DatabricksClient
 from databricks.sql.utils import (
     ParamEscaper,
@@ -37,6 +64,9 @@ from databricks.sql.utils import (
     build_client_context,
     get_session_config_value,
     serialize_query_tags,
+    split_insert_values_operation,
+    named_markers,
+    rename_named_markers,
 )
 from databricks.sql.parameters.native import (
     DbsqlParameterBase,
@@ -48,8 +78,15 @@ from databricks.sql.parameters.native import (
     dbsql_parameter_from_primitive,
     ParameterApproach,
 )
+from databricks.sql.parameters.prepared import (
+    DEFAULT_PREPARED_OPERATION_CACHE_SIZE,
+    PreparedOperation,
+    PreparedOperationCache,
+    PreparedStatement,
+    parameter_structure,
+)
 
-from databricks.sql.result_set import ResultSet, ThriftResultSet
+from databricks.sql.result_set import ArrowTableResultSet, ResultSet, ThriftResultSet
 from databricks.sql.types import Row, SSLOptions
 from databricks.sql.auth.auth import get_python_sql_connector_auth_provider
 from databricks.sql.experimental.oauth_persistence import OAuthPersistence
@@ -59,13 +96,32 @@ from databricks.sql.backend.types import CommandId, BackendType, CommandState, S
 from databricks.sql.auth.common import ClientContext
 from databricks.sql.common.unified_http_client import UnifiedHttpClient
 from databricks.sql.common.http import HttpMethod
-
-from databricks.sql.thrift_api.TCLIService.ttypes import (
-    TOpenSessionResp,
-    TSparkParameter,
-    TOperationState,
+from databricks.sql.common.fanout import QueryResult
+from databricks.sql.common.polling import (
+    ExponentialBackoffPolling,
+    FixedIntervalPolling,
+    PollingStrategy,
 )
+from databricks.sql.common.single_flight import SingleFlight
+from databricks.sql.common.startup import StartupTimer
+from databricks.sql.common.feature_flag import FeatureFlagsContextFactory
+from databricks.sql.metadata_cache import MetadataCache
+from databricks.sql.result_cache import ResultCache
+from databricks.sql.operation_closer import DEFAULT_CLOSE_MAX_WORKERS, OperationCloser
+from databricks.sql.poller import DEFAULT_MAX_POLLS_PER_SECOND, StatusPoller
+from databricks.sql.common.transfer import (
+    FileTransferResult,
+    ProgressReader,
+    RangedDownload,
+    TransferProgress,
+    VolumeTransferReport,
+    get_stream_length,
+    is_transient_transfer_error,
+)
+
+from databricks.sql.telemetry.utils import BaseTelemetryClient
 from databricks.sql.telemetry.telemetry_client import (
+    NoopTelemetryClient,
     TelemetryHelper,
     TelemetryClientFactory,
 )
@@ -86,11 +142,145 @@ if pyarrow is None:
         "If you need these features, please run pip install pyarrow or pip install databricks-sql-connector[pyarrow] to install"
     )
 
+
+def __getattr__(name: str) -> Any:
+    # The Thrift backend is imported when the first Thrift session is opened, see
+    # databricks.sql.session. It can still be imported from here as before.
+    if name == "ThriftDatabricksClient":
+        from databricks.sql.backend.thrift_backend import ThriftDatabricksClient
+
+        return ThriftDatabricksClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 DEFAULT_RESULT_BUFFER_SIZE_BYTES = 104857600
 DEFAULT_ARRAY_SIZE = 100000
+# Upper bounds for a single multi-row INSERT built by Cursor.executemany
+DEFAULT_EXECUTEMANY_BATCH_MAX_PARAMETERS = 256
+DEFAULT_EXECUTEMANY_BATCH_MAX_BYTES = 1048576
+# In-memory size of the Arrow slice serialized into one Parquet part by Cursor.bulk_insert
+DEFAULT_BULK_INSERT_PART_BYTES = 134217728
+DEFAULT_BULK_INSERT_UPLOAD_WORKERS = 4
+# Cursor.put_files / Cursor.get_files
+DEFAULT_VOLUME_TRANSFER_WORKERS = 8
+DEFAULT_VOLUME_TRANSFER_MAX_ATTEMPTS = 3
+VOLUME_TRANSFER_RETRY_DELAY_SECONDS = 1
+# Connection.run_concurrently / Cursor.execute_all
+DEFAULT_RUN_CONCURRENTLY_MAX_CONCURRENCY = 8
 
 NO_NATIVE_PARAMS: List = []
 
+# Value of the deprecated Cursor.ASYNC_DEFAULT_POLLING_INTERVAL
+_LEGACY_ASYNC_POLLING_INTERVAL_SECONDS = 2
+
+# Statements that only read data, whose results may be shared or cached
+_READ_ONLY_STATEMENT_REGEX = re.compile(
+    r"^\s*(SELECT|WITH|VALUES|TABLE|SHOW|DESCRIBE|DESC)\b", re.IGNORECASE
+)
+_WRITE_KEYWORD_REGEX = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|CREATE|DROP|ALTER|TRUNCATE)\b", re.IGNORECASE
+)
+# Connection parameters that determine whose credentials a connection uses
+_CREDENTIAL_PARAMETERS = (
+    "access_token",
+    "auth_type",
+    "credentials_provider",
+    "experimental_oauth_persistence",
+    "oauth_client_id",
+    "azure_client_id",
+    "azure_client_secret",
+    "azure_tenant_id",
+    "azure_workspace_resource_id",
+    "identity_federation_client_id",
+    "_use_cert_as_auth",
+    "_tls_client_cert_file",
+    "http_headers",
+)
+_credential_object_ids: "weakref.WeakKeyDictionary[Any, int]" = (
+    weakref.WeakKeyDictionary()
+)
+_credential_object_counter = itertools.count()
+_credential_object_lock = threading.Lock()
+
+
+def _credential_object_id(value: Any) -> int:
+    # Unlike id(), never reused for another object, as keys may outlive connections
+    with _credential_object_lock:
+        try:
+            if value not in _credential_object_ids:
+                _credential_object_ids[value] = next(_credential_object_counter)
+            return _credential_object_ids[value]
+        except TypeError:
+            return id(value)
+
+
+def _quote_identifier(value) -> str:
+    """Quote `value` with backticks, doubling any backticks it contains."""
+    return "`%s`" % str(value).replace("`", "``")
+
+
+def _quote_table_name(name: str) -> str:
+    """
+    Quote each part of a dotted table name, e.g. main.sales.orders. A part that is
+    already quoted with backticks keeps its dots and doubled backticks; any other
+    backtick is taken literally.
+    """
+    parts: List[str] = []
+    part: List[str] = []
+    quoted = False
+    i = 0
+    while i < len(name):
+        char = name[i]
+        if char == "`" and quoted:
+            if name[i + 1 : i + 2] == "`":
+                part.append("`")
+                i += 1
+            else:
+                quoted = False
+        elif char == "`" and not part:
+            quoted = True
+        elif char == "." and not quoted:
+            parts.append("".join(part))
+            part = []
+        else:
+            part.append(char)
+        i += 1
+    parts.append("".join(part))
+    return ".".join(_quote_identifier(part) for part in parts)
+
+
+def _credentials_key(parameters: Dict[str, Any]) -> str:
+    """
+    Return a digest of the credentials in connection `parameters`, so that results are
+    only shared between connections that authenticate the same way. Objects such as a
+    credentials provider are told apart by identity.
+    """
+    credentials = []
+    for name in _CREDENTIAL_PARAMETERS:
+        value = parameters.get(name)
+        if not isinstance(value, (str, int, float, bool, list, tuple, type(None))):
+            value = (type(value).__qualname__, _credential_object_id(value))
+        credentials.append((name, value))
+    return hashlib.sha256(repr(credentials).encode("utf-8")).hexdigest()
+
+
+# Whitespace and comments that may precede a statement's first keyword
+_LEADING_COMMENTS = r"^(\s|--[^\n]*|/\*.*?\*/)*"
+# Statements that change the session's current catalog, schema or configuration. SET
+# AUTOCOMMIT, as run by Connection.autocommit, and SET without a value only read
+# settings or leave query results unchanged.
+_SESSION_STATE_STATEMENT_REGEX = re.compile(
+    _LEADING_COMMENTS
+    + r"(USE\b|RESET\b|SET\s+(?!AUTOCOMMIT\b)"
+    + r"((TIME\s+ZONE|CATALOG|SCHEMA|DATABASE)\b|[^=;]*=))",
+    re.IGNORECASE | re.DOTALL,
+)
+# Statements after which cached catalog, schema, table and column listings may be stale
+_DDL_STATEMENT_REGEX = re.compile(
+    _LEADING_COMMENTS + r"(CREATE|ALTER|DROP|UNDROP|COMMENT)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+
 # Transaction isolation level constants (extension to PEP 249)
 TRANSACTION_ISOLATION_LEVEL_REPEATABLE_READ = "REPEATABLE_READ"
 
@@ -178,6 +368,11 @@ class Connection:
                 Service-principal client ID for mandatory SP-wide workload identity
                 token exchange. Supported by both the default and kernel backends.
 
+            token_refresh_fraction: `float`, optional (default is 0.8)
+                Fraction of an OAuth token's lifetime after which it is refreshed in the
+                background, so that requests do not wait for the token endpoint. None
+                refreshes tokens only once they have expired.
+
             user_agent_entry: `str`, optional
                 A custom tag to append to the User-Agent header. This is typically used by partners to identify their applications.. If not specified, it will use the default user agent PyDatabricksSqlConnector
 
@@ -249,6 +444,55 @@ class Connection:
                 - rollback(): raises NotSupportedError
                 - autocommit setter: no-op (does nothing)
                 When False, transaction operations execute normally.
+            :param executemany_batch_max_parameters: `int`, optional (default is 256)
+                The maximum number of native parameters bound to one multi-row INSERT
+                statement when cursor.executemany() batches an `INSERT INTO ... VALUES` statement.
+            :param executemany_batch_max_bytes: `int`, optional (default is 1048576)
+                The approximate maximum size in bytes (statement text plus parameter values)
+                of one multi-row INSERT statement built by cursor.executemany().
+            :param prepared_operation_cache_size: `int`, optional (default is 1024)
+                Number of statements whose native parameter preparation (paramstyle
+                rewrite and binding setup) is cached for reuse by cursor.execute(). 0
+                disables the cache. See `databricks.sql.parameters.prepared`.
+            :param polling_strategy: `PollingStrategy`, optional
+                How long to wait between status polls of a running statement, e.g. in
+                cursor.get_async_execution_result(). Defaults to an ExponentialBackoffPolling
+                that starts at 50 ms and backs off to at most 2 s between polls.
+            :param max_status_polls_per_second: `float`, optional (default is 20)
+                Cap on the status polls per second sent by connection.status_poller, summed
+                over all statements it is waiting on.
+            :param deduplicate_queries: `bool` or `SingleFlight`, optional (default is False)
+                When enabled, concurrent cursor.execute() calls for the same read-only query
+                (same statement text, parameters, catalog, schema, session configuration and
+                credentials) share one execution, and each cursor gets its own view of the
+                result. The shared result is held in memory as a pyarrow Table. Queries on a
+                connection that has run a USE, SET or RESET statement are never shared. Pass
+                a SingleFlight instance to share deduplication between connections.
+            :param result_cache: `bool` or `ResultCache`, optional (default is None)
+                Cache the results of read-only queries run with cursor.execute(), so that
+                running the same query again within the cache's time to live returns the
+                cached result without contacting the server. True uses a ResultCache with
+                default settings. See `databricks.sql.result_cache`.
+            :param metadata_cache: `bool` or `MetadataCache`, optional (default is None)
+                Cache the results of cursor.catalogs(), schemas(), tables() and columns(),
+                keyed by their arguments, credentials and session configuration, and
+                share one request between concurrent identical calls. Calls bypass the
+                cache once USE, SET or RESET has run on this connection. The cache is
+                cleared after a CREATE, ALTER or DROP statement runs through this
+                connection. True uses a MetadataCache with
+                default settings. See `databricks.sql.metadata_cache`.
+            :param close_operations_in_background: `bool`, optional (default is True)
+                Release the server-side operation of a closed result set, e.g. the previous
+                statement's when cursor.execute() runs the next one, from a background
+                thread instead of waiting for the request to complete. Failures are
+                logged. Pending closes are handled by connection.close(), see close_timeout.
+            :param close_timeout: `float`, optional (default is None)
+                Deadline in seconds for releasing the operations of result sets still open
+                when connection.close() is called, after which the session is closed
+                regardless. None waits for all of them.
+            :param close_max_workers: `int`, optional (default is 8)
+                Number of operations released concurrently by connection.close(). The
+                Thrift backend releases them together with the session instead.
         """
 
         # Internal arguments in **kwargs:
@@ -318,27 +562,78 @@ class Connection:
         self.lz4_compression = kwargs.get("enable_query_result_lz4_compression", True)
         self.use_cloud_fetch = kwargs.get("use_cloud_fetch", True)
         self._cursors = []  # type: List[Cursor]
+        self._cursors_lock = threading.Lock()
+        # Set once a USE, SET or RESET statement has run through this connection, so
+        # that the session may no longer match the catalog, schema and configuration
+        # it was opened with
+        self._session_state_changed = False
+        self._credentials_key = _credentials_key(
+            {**kwargs, "http_headers": http_headers}
+        )
+        self._status_poller: Optional[StatusPoller] = None
+        self.close_timeout: Optional[float] = kwargs.get("close_timeout")
+        self.close_max_workers = kwargs.get(
+            "close_max_workers", DEFAULT_CLOSE_MAX_WORKERS
+        )
+        self.operation_closer: Optional[OperationCloser] = (
+            OperationCloser(self.close_max_workers)
+            if kwargs.get("close_operations_in_background", True)
+            else None
+        )
+        result_cache = kwargs.get("result_cache")
+        self.result_cache: Optional[ResultCache] = (
+            ResultCache() if result_cache is True else result_cache or None
+        )
+        metadata_cache = kwargs.get("metadata_cache")
+        self.metadata_cache: Optional[MetadataCache] = (
+            MetadataCache() if metadata_cache is True else metadata_cache or None
+        )
+        deduplicate_queries = kwargs.get("deduplicate_queries", False)
+        if isinstance(deduplicate_queries, SingleFlight):
+            self.single_flight: Optional[SingleFlight] = deduplicate_queries
+        else:
+            self.single_flight = SingleFlight() if deduplicate_queries else None
         self.telemetry_batch_size = kwargs.get(
             "telemetry_batch_size", TelemetryClientFactory.DEFAULT_BATCH_SIZE
         )
 
-        client_context = build_client_context(server_hostname, __version__, **kwargs)
-        self.http_client = UnifiedHttpClient(client_context)
+        self.force_enable_telemetry = kwargs.get("force_enable_telemetry", False)
+        self.enable_telemetry = kwargs.get("enable_telemetry", True)
+        # Telemetry stays off until the background startup has set it up
+        self.telemetry_enabled = False
+        self._telemetry_client: BaseTelemetryClient = NoopTelemetryClient()
+        self._telemetry_lock = threading.Lock()
+        self._telemetry_registered = False
+        self._telemetry_closed = False
+        self._startup_thread: Optional[threading.Thread] = None
+        self._startup_timer = StartupTimer()
+
+        with self._startup_timer.phase("http_client"):
+            client_context = build_client_context(
+                server_hostname, __version__, **kwargs
+            )
+            self.http_client = UnifiedHttpClient(client_context)
 
         try:
-            self.session = Session(
-                server_hostname,
-                http_path,
-                self.http_client,
-                http_headers,
-                session_configuration,
-                catalog,
-                schema,
-                _use_arrow_native_complex_types,
-                **kwargs,
-            )
-            self.session.open()
+            with self._startup_timer.phase("session_init"):
+                self.session = Session(
+                    server_hostname,
+                    http_path,
+                    self.http_client,
+                    http_headers,
+                    session_configuration,
+                    catalog,
+                    schema,
+                    _use_arrow_native_complex_types,
+                    **kwargs,
+                )
+            # Fetch the feature flags while the session is being opened
+            self._prefetch_feature_flags()
+            with self._startup_timer.phase("session_open"):
+                self.session.open()
         except Exception as e:
+            if hasattr(self, "session"):
+                FeatureFlagsContextFactory.discard_instance(self)
             # Respect user's telemetry preference even during connection failure
             enable_telemetry = kwargs.get("enable_telemetry", True)
             TelemetryClientFactory.connection_failure_log(
@@ -363,23 +658,22 @@ class Connection:
             "fetch_autocommit_from_server", False
         )
         self.ignore_transactions = ignore_transactions
-
-        self.force_enable_telemetry = kwargs.get("force_enable_telemetry", False)
-        self.enable_telemetry = kwargs.get("enable_telemetry", True)
-        self.telemetry_enabled = TelemetryHelper.is_telemetry_enabled(self)
-
-        TelemetryClientFactory.initialize_telemetry_client(
-            telemetry_enabled=self.telemetry_enabled,
-            session_id_hex=self.get_session_id_hex(),
-            auth_provider=self.session.auth_provider,
-            host_url=self.session.host,
-            batch_size=self.telemetry_batch_size,
-            client_context=client_context,
-            extra_headers=self.session.get_spog_headers(),
+        self.executemany_batch_max_parameters = kwargs.get(
+            "executemany_batch_max_parameters", DEFAULT_EXECUTEMANY_BATCH_MAX_PARAMETERS
         )
-
-        self._telemetry_client = TelemetryClientFactory.get_telemetry_client(
-            host_url=self.session.host
+        self.executemany_batch_max_bytes = kwargs.get(
+            "executemany_batch_max_bytes", DEFAULT_EXECUTEMANY_BATCH_MAX_BYTES
+        )
+        self.prepared_operations = PreparedOperationCache(
+            kwargs.get(
+                "prepared_operation_cache_size", DEFAULT_PREPARED_OPERATION_CACHE_SIZE
+            )
+        )
+        self.polling_strategy: PollingStrategy = (
+            kwargs.get("polling_strategy") or ExponentialBackoffPolling()
+        )
+        self.max_status_polls_per_second = kwargs.get(
+            "max_status_polls_per_second", DEFAULT_MAX_POLLS_PER_SECOND
         )
 
         # Determine proxy usage
@@ -429,11 +723,82 @@ class Connection:
             query_tags=get_session_config_value(session_configuration, "query_tags"),
         )
 
-        self._telemetry_client.export_initial_telemetry_log(
-            driver_connection_params=driver_connection_params,
-            user_agent=self.session.useragent_header,
-            session_id=self.get_session_id_hex(),
+        # Telemetry is set up in the background, once the feature flags are loaded
+        self._startup_thread = threading.Thread(
+            target=self._initialize_telemetry,
+            args=(client_context, driver_connection_params),
+            name="databricks-sql-connection-startup",
+            daemon=True,
         )
+        self._startup_thread.start()
+        logger.debug("Connection opened: %s", self._startup_timer.summary())
+
+    def _prefetch_feature_flags(self) -> None:
+        if not self.enable_telemetry or self.force_enable_telemetry:
+            return
+        try:
+            FeatureFlagsContextFactory.get_instance(self).prefetch()
+        except Exception as e:
+            logger.debug("Failed to start fetching feature flags: %s", e)
+
+    def _initialize_telemetry(
+        self,
+        client_context: ClientContext,
+        driver_connection_params: DriverConnectionParameters,
+    ) -> None:
+        """Check the telemetry feature flag and set up this connection's telemetry."""
+        try:
+            with self._startup_timer.phase("feature_flags"):
+                telemetry_enabled = TelemetryHelper.is_telemetry_enabled(self)
+        except Exception as e:
+            logger.debug("Failed to check the telemetry feature flag: %s", e)
+            telemetry_enabled = False
+
+        with self._startup_timer.phase("telemetry"):
+            with self._telemetry_lock:
+                if self._telemetry_closed:
+                    return
+                TelemetryClientFactory.initialize_telemetry_client(
+                    telemetry_enabled=telemetry_enabled,
+                    session_id_hex=self.get_session_id_hex(),
+                    auth_provider=self.session.auth_provider,
+                    host_url=self.session.host,
+                    batch_size=self.telemetry_batch_size,
+                    client_context=client_context,
+                    extra_headers=self.session.get_spog_headers(),
+                )
+                self._telemetry_registered = True
+                self.telemetry_enabled = telemetry_enabled
+                self._telemetry_client = TelemetryClientFactory.get_telemetry_client(
+                    host_url=self.session.host
+                )
+                # Exported under the lock, so that a racing close() cannot release the
+                # client before the initial log has been handed to it
+                self._telemetry_client.export_initial_telemetry_log(
+                    driver_connection_params=driver_connection_params,
+                    user_agent=self.session.useragent_header,
+                    session_id=self.get_session_id_hex(),
+                )
+        logger.debug("Connection startup: %s", self._startup_timer.summary())
+
+    def _await_background_startup(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the background startup work to finish; False if it is still running."""
+        thread = self._startup_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    @property
+    def startup_timings(self) -> Dict[str, float]:
+        """
+        Milliseconds taken by each phase of opening this connection.
+
+        `http_client`, `session_init` and `session_open` run before `connect()` returns.
+        `feature_flags` and `telemetry` run in the background afterwards and appear once
+        they have finished.
+        """
+        return self._startup_timer.timings
 
     def _set_use_inline_params_with_warning(self, value: Union[bool, str]):
         """Valid values are True, False, and "silent"
@@ -500,7 +865,7 @@ class Connection:
         return self.session.protocol_version
 
     @staticmethod
-    def get_protocol_version(openSessionResp: TOpenSessionResp):
+    def get_protocol_version(openSessionResp: "TOpenSessionResp"):
         """Get the protocol version from the OpenSessionResp object"""
         properties = (
             {"serverProtocolVersion": openSessionResp.serverProtocolVersion}
@@ -517,6 +882,194 @@ class Connection:
         """Return whether the connection is open by checking if the session is open."""
         return self.session.is_open
 
+    @property
+    def status_poller(self) -> StatusPoller:
+        """
+        A StatusPoller shared by this connection's cursors, started on first use.
+
+        `connection.status_poller.submit(cursor)` returns a Future for a statement started
+        with `cursor.execute_async()`, so that many statements can be awaited without a
+        thread or a polling loop each. See `databricks.sql.poller`.
+        """
+        with self._cursors_lock:
+            if self._status_poller is None:
+                self._status_poller = StatusPoller(
+                    max_polls_per_second=self.max_status_polls_per_second
+                )
+            return self._status_poller
+
+    def run_concurrently(
+        self,
+        queries: Sequence[Union[str, Tuple[str, Optional[TParameterCollection]]]],
+        max_concurrency: int = DEFAULT_RUN_CONCURRENTLY_MAX_CONCURRENCY,
+        timeout: Optional[float] = None,
+        ordered: bool = True,
+        as_arrow: bool = True,
+    ) -> Iterator[QueryResult]:
+        """
+        Run independent statements concurrently and yield their results.
+
+        Each statement is started with `execute_async()` on its own cursor, with up to
+        `max_concurrency` running at once, and waited on by `status_poller`. As each one
+        finishes, its result is fetched on the calling thread and its cursor is closed.
+        Statements are submitted once iteration starts.
+
+        :param queries: SQL strings, or `(sql, parameters)` tuples.
+        :param max_concurrency: Maximum number of statements running at the same time.
+        :param timeout: Seconds a statement may run, from submission until it finishes,
+            before it is cancelled on the server and reported as failed. None waits
+            indefinitely.
+        :param ordered: Yield results in the order of `queries` if True, or as soon as
+            each statement completes if False.
+        :param as_arrow: Fetch results as pyarrow Tables if True, or as lists of Rows.
+
+        :returns an iterator of QueryResult. A statement that fails or times out is
+            reported in its result's `error` attribute rather than raised.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                "max_concurrency must be at least 1, got %s" % max_concurrency
+            )
+
+        pending = [
+            (index, (query, None) if isinstance(query, str) else tuple(query))
+            for index, query in enumerate(queries)
+        ]
+        pending.reverse()
+        running: Dict[Future, Tuple[QueryResult, "Cursor", float]] = {}
+        finished: Dict[int, QueryResult] = {}
+        next_index = 0
+
+        def finish(result: QueryResult, cursor: "Cursor", started_at: float):
+            result.duration_seconds = time.monotonic() - started_at
+            cursor.close()
+            finished[result.index] = result
+
+        try:
+            while pending or running:
+                while pending and len(running) < max_concurrency:
+                    index, (operation, parameters) = pending.pop()
+                    result = QueryResult(index, operation, parameters)
+                    cursor = self.cursor()
+                    started_at = time.monotonic()
+                    try:
+                        cursor.execute_async(operation, parameters)
+                        result.query_id = cursor.query_id
+                        future = self.status_poller.submit(cursor)
+                    except Exception as e:
+                        result.error = e
+                        finish(result, cursor, started_at)
+                        continue
+                    running[future] = (result, cursor, started_at)
+
+                if running:
+                    wait_seconds = None
+                    if timeout is not None:
+                        # Statements whose result is already being collected can no
+                        # longer time out
+                        started = [
+                            started_at
+                            for future, (_, _, started_at) in running.items()
+                            if not future.running()
+                        ]
+                        if started:
+                            deadline = min(started) + timeout
+                            wait_seconds = max(deadline - time.monotonic(), 0)
+                    done, _ = wait_for_futures(
+                        running, timeout=wait_seconds, return_when=FIRST_COMPLETED
+                    )
+
+                    for future in done:
+                        result, cursor, started_at = running.pop(future)
+                        try:
+                            future.result()
+                            result.result = (
+                                cursor.fetchall_arrow()
+                                if as_arrow
+                                else cursor.fetchall()
+                            )
+                        except Exception as e:
+                            result.error = e
+                        finish(result, cursor, started_at)
+
+                    if timeout is not None:
+                        now = time.monotonic()
+                        for future, (result, cursor, started_at) in list(
+                            running.items()
+                        ):
+                            if now - started_at >= timeout and future.cancel():
+                                del running[future]
+                                self._cancel_quietly(cursor)
+                                result.error = OperationalError(
+                                    f"Query timed out after {timeout} seconds",
+                                    host_url=self.session.host,
+                                    session_id_hex=self.get_session_id_hex(),
+                                )
+                                finish(result, cursor, started_at)
+
+                if ordered:
+                    while next_index in finished:
+                        yield finished.pop(next_index)
+                        next_index += 1
+                else:
+                    for index in list(finished):
+                        yield finished.pop(index)
+        finally:
+            # The caller stopped iterating early, or an unexpected error was raised.
+            # Statements still pending, or whose result is being collected, are also
+            # cancelled on the server; finished ones only need their cursor closed.
+            for future, (_, cursor, _) in running.items():
+                if future.cancel() or not future.done():
+                    self._cancel_quietly(cursor)
+                try:
+                    cursor.close()
+                except Exception as e:
+                    logger.debug("Failed to close cursor %s: %s", cursor.query_id, e)
+
+    def revalidate_result_cache(self) -> int:
+        """
+        Drop the entries of this connection's result cache that were stored with
+        `cache_depends_on` and whose tables have changed since. The tables' current
+        versions are looked up through this connection, all in one batch.
+
+        :returns the number of entries dropped, 0 if the connection has no result cache.
+        """
+        if not isinstance(self.result_cache, ResultCache):
+            return 0
+        return self.result_cache.revalidate(self._fetch_table_versions)
+
+    def _fetch_table_versions(self, tables: List[str]) -> Dict[str, Optional[int]]:
+        """
+        Look up the current Delta version of each of `tables` with concurrent
+        `DESCRIBE HISTORY <table> LIMIT 1` statements. A table whose history cannot be
+        read maps to None.
+        """
+        versions: Dict[str, Optional[int]] = {}
+        for table, result in zip(
+            tables,
+            self.run_concurrently(
+                [
+                    "DESCRIBE HISTORY %s LIMIT 1" % _quote_table_name(table)
+                    for table in tables
+                ]
+            ),
+        ):
+            versions[table] = None
+            if not result.succeeded:
+                logger.debug(
+                    "Could not read the history of %s: %s", table, result.error
+                )
+            elif result.result.num_rows:
+                versions[table] = result.result.column("version")[0].as_py()
+        return versions
+
+    @staticmethod
+    def _cancel_quietly(cursor: "Cursor") -> None:
+        try:
+            cursor.cancel()
+        except Exception as e:
+            logger.debug("Failed to cancel statement %s: %s", cursor.query_id, e)
+
     def cursor(
         self,
         arraysize: int = DEFAULT_ARRAY_SIZE,
@@ -547,24 +1100,63 @@ class Connection:
             result_buffer_size_bytes=buffer_size_bytes,
             row_limit=row_limit,
         )
-        self._cursors.append(cursor)
+        with self._cursors_lock:
+            self._cursors.append(cursor)
         return cursor
 
-    def close(self) -> None:
-        """Close the underlying session and mark all associated cursors as closed."""
-        self._close()
+    def _forget_cursor(self, cursor: "Cursor") -> None:
+        # Closed cursors are dropped, so that a long-lived connection does not keep
+        # every cursor it ever opened
+        with self._cursors_lock:
+            try:
+                self._cursors.remove(cursor)
+            except ValueError:
+                pass
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Close the underlying session and mark all associated cursors as closed.
+
+        Operations of result sets still open are released concurrently, or together with
+        the session where the backend supports it, and the session is closed last.
+
+        :param timeout: Deadline in seconds for releasing open operations, after which
+            the session is closed regardless. Defaults to the connection's close_timeout.
+        """
+        self._close(timeout=timeout)
+
+    def _close(self, close_cursors=True, timeout: Optional[float] = None) -> None:
+        if self._status_poller is not None:
+            self._status_poller.close()
+
+        if self.operation_closer is None:
+            # Operations still open are released concurrently even if they are
+            # otherwise closed inline
+            self.operation_closer = OperationCloser(self.close_max_workers)
+        # Collect the operations of all cursors first, to close them together
+        self.operation_closer.hold()
 
-    def _close(self, close_cursors=True) -> None:
         if close_cursors:
-            for cursor in self._cursors:
+            with self._cursors_lock:
+                cursors = list(self._cursors)
+            for cursor in cursors:
                 cursor.close()
 
+        self.operation_closer.close(
+            timeout=self.close_timeout if timeout is None else timeout,
+            skip_pending=self.session.backend.closes_operations_with_session is True,
+        )
+
         try:
             self.session.close()
         except Exception as e:
             logger.error(f"Attempt to close session raised a local exception: {e}")
 
-        TelemetryClientFactory.close(host_url=self.session.host)
+        with self._telemetry_lock:
+            self._telemetry_closed = True
+            telemetry_registered = self._telemetry_registered
+        if telemetry_registered:
+            TelemetryClientFactory.close(host_url=self.session.host)
 
         # Close HTTP client that was created by this connection
         if self.http_client:
@@ -866,6 +1458,10 @@ class Connection:
 
 
 class Cursor:
+    # Deprecated: pass `polling_strategy` to `connect()` instead. A cursor or subclass
+    # that changes it still waits that many seconds between async status polls.
+    ASYNC_DEFAULT_POLLING_INTERVAL = _LEGACY_ASYNC_POLLING_INTERVAL_SECONDS
+
     def __init__(
         self,
         connection: Connection,
@@ -899,8 +1495,8 @@ class Cursor:
         self.active_command_id: Optional[CommandId] = None
         self.escaper = ParamEscaper()
         self.lastrowid = None
-
-        self.ASYNC_DEFAULT_POLLING_INTERVAL = 2
+        # Whether the statement started by execute_async() changes the schema
+        self._async_operation_is_ddl = False
 
     # The ideal return type for this method is perhaps Self, but that was not added until 3.11, and we support pre-3.11 pythons, currently.
     def __enter__(self) -> "Cursor":
@@ -1015,36 +1611,30 @@ class Cursor:
 
         return rendered_statement, NO_NATIVE_PARAMS
 
-    def _prepare_native_parameters(
+    def _prepared_operation(
         self,
-        stmt: str,
-        params: List[TDbsqlParameter],
-        param_structure: ParameterStructure,
-    ) -> Tuple[str, List[TSparkParameter]]:
-        """Return a statement and a list of native parameters to be passed to thrift_backend for execution
-
-        :stmt:
-            A string SQL query containing parameter markers of PEP-249 paramstyle `named`.
-            For example `:param`.
-
-        :params:
-            An iterable of parameter values to be sent natively. If passed as a Dict, the keys
-            must match the names of the markers included in :stmt:. If passed as a List, its length
-            must equal the count of parameter markers in :stmt:. In list form, any member of the list
-            can be wrapped in a DbsqlParameter class.
-
-        Returns a tuple of:
-            stmt: the passed statement` with the param markers replaced by literal rendered values
-            params: a list of TSparkParameters that will be passed in native mode
+        operation: Union[str, PreparedStatement],
+        structure: ParameterStructure,
+    ) -> PreparedOperation:
+        if isinstance(operation, PreparedStatement):
+            return operation.prepared_operation(structure)
+        prepared_operations = self.connection.prepared_operations
+        if isinstance(prepared_operations, PreparedOperationCache):
+            return prepared_operations.get(operation, structure)
+        return PreparedOperation(operation, structure)
+
+    def prepare(self, operation: str) -> PreparedStatement:
         """
+        Prepare `operation` for repeated execution on this cursor.
 
-        stmt = stmt
-        output = [
-            p.as_tspark_param(named=param_structure == ParameterStructure.NAMED)
-            for p in params
-        ]
+        The returned PreparedStatement rewrites the statement's parameter markers once,
+        and binds new parameters on each `execute(parameters)` or
+        `execute_async(parameters)` call. Nothing is sent to the server until then.
 
-        return stmt, output
+        :returns a PreparedStatement
+        """
+        self._check_not_closed()
+        return PreparedStatement(self, operation)
 
     def _close_and_clear_active_result_set(self):
         try:
@@ -1106,43 +1696,18 @@ class Cursor:
             )
 
         # For non-streaming operations, validate staging_allowed_local_path
-        if isinstance(staging_allowed_local_path, type(str())):
-            _staging_allowed_local_paths = [staging_allowed_local_path]
-        elif isinstance(staging_allowed_local_path, type(list())):
-            _staging_allowed_local_paths = staging_allowed_local_path
-        else:
-            raise ProgrammingError(
-                "You must provide at least one staging_allowed_local_path when initialising a connection to perform ingestion commands",
-                host_url=self.connection.session.host,
-                session_id_hex=self.connection.get_session_id_hex(),
-            )
-
-        abs_staging_allowed_local_paths = [
-            os.path.abspath(i) for i in _staging_allowed_local_paths
-        ]
+        abs_staging_allowed_local_paths = self._abs_staging_allowed_local_paths(
+            staging_allowed_local_path
+        )
 
         # Must set to None in cases where server response does not include localFile
         abs_localFile = None
 
-        # Default to not allow staging operations
-        allow_operation = False
         if getattr(row, "localFile", None):
             abs_localFile = os.path.abspath(row.localFile)
-            for abs_staging_allowed_local_path in abs_staging_allowed_local_paths:
-                # If the indicated local file matches at least one allowed base path, allow the operation
-                if (
-                    os.path.commonpath([abs_localFile, abs_staging_allowed_local_path])
-                    == abs_staging_allowed_local_path
-                ):
-                    allow_operation = True
-                else:
-                    continue
-            if not allow_operation:
-                raise ProgrammingError(
-                    "Local file operations are restricted to paths within the configured staging_allowed_local_path",
-                    host_url=self.connection.session.host,
-                    session_id_hex=self.connection.get_session_id_hex(),
-                )
+            self._check_staging_local_file_allowed(
+                abs_localFile, abs_staging_allowed_local_paths
+            )
 
         handler_args = {
             "presigned_url": row.presignedUrl,
@@ -1171,6 +1736,45 @@ class Cursor:
                 session_id_hex=self.connection.get_session_id_hex(),
             )
 
+    def _abs_staging_allowed_local_paths(
+        self, staging_allowed_local_path: Union[None, str, List[str]]
+    ) -> List[str]:
+        """Return staging_allowed_local_path as a list of absolute paths.
+
+        Raise an exception if no staging_allowed_local_path is configured.
+        """
+        if isinstance(staging_allowed_local_path, type(str())):
+            _staging_allowed_local_paths = [staging_allowed_local_path]
+        elif isinstance(staging_allowed_local_path, type(list())):
+            _staging_allowed_local_paths = staging_allowed_local_path
+        else:
+            raise ProgrammingError(
+                "You must provide at least one staging_allowed_local_path when initialising a connection to perform ingestion commands",
+                host_url=self.connection.session.host,
+                session_id_hex=self.connection.get_session_id_hex(),
+            )
+
+        return [os.path.abspath(i) for i in _staging_allowed_local_paths]
+
+    def _check_staging_local_file_allowed(
+        self, abs_local_file: str, abs_staging_allowed_local_paths: List[str]
+    ) -> None:
+        """Raise an exception if abs_local_file is not descended from one of the
+        allowed base paths."""
+        for abs_staging_allowed_local_path in abs_staging_allowed_local_paths:
+            # If the indicated local file matches at least one allowed base path, allow the operation
+            if (
+                os.path.commonpath([abs_local_file, abs_staging_allowed_local_path])
+                == abs_staging_allowed_local_path
+            ):
+                return
+
+        raise ProgrammingError(
+            "Local file operations are restricted to paths within the configured staging_allowed_local_path",
+            host_url=self.connection.session.host,
+            session_id_hex=self.connection.get_session_id_hex(),
+        )
+
     @log_latency(StatementType.SQL)
     def _handle_staging_put(
         self, presigned_url: str, local_file: str, headers: Optional[dict] = None
@@ -1188,11 +1792,33 @@ class Cursor:
             )
 
         with open(local_file, "rb") as fh:
-            r = self.connection.http_client.request(
-                HttpMethod.PUT, presigned_url, body=fh.read(), headers=headers
-            )
+            self._upload_staging_stream(presigned_url, fh, headers)
+
+    def _upload_staging_stream(
+        self, presigned_url: str, stream: BinaryIO, headers: Optional[dict] = None
+    ):
+        """PUT the remaining contents of `stream` to `presigned_url` without reading it
+        into memory.
+
+        When the size of the stream can be determined it is sent with a Content-Length
+        header, which presigned cloud storage URLs require. Otherwise urllib3 falls back
+        to chunked transfer encoding.
+        """
+        headers = dict(headers) if headers else {}
+        content_length = get_stream_length(stream)
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
+
+        progress = TransferProgress("PUT", presigned_url, total_bytes=content_length)
+        r = self.connection.http_client.request(
+            HttpMethod.PUT,
+            presigned_url,
+            body=ProgressReader(stream, progress),
+            headers=headers,
+        )
 
         self._handle_staging_http_response(r)
+        progress.log_completion()
 
     def _handle_staging_http_response(self, r):
 
@@ -1209,6 +1835,7 @@ class Cursor:
             error_text = r.data.decode() if r.data else ""
             raise OperationalError(
                 f"Staging operation over HTTP was unsuccessful: {r.status}-{error_text}",
+                {"http-code": r.status},
                 host_url=self.connection.session.host,
                 session_id_hex=self.connection.get_session_id_hex(),
             )
@@ -1245,19 +1872,16 @@ class Cursor:
                 session_id_hex=self.connection.get_session_id_hex(),
             )
 
-        r = self.connection.http_client.request(
-            HttpMethod.PUT, presigned_url, body=stream.read(), headers=headers
-        )
-
-        self._handle_staging_http_response(r)
+        self._upload_staging_stream(presigned_url, stream, headers)
 
     @log_latency(StatementType.SQL)
     def _handle_staging_get(
         self, local_file: str, presigned_url: str, headers: Optional[dict] = None
     ):
-        """Make an HTTP GET request, create a local file with the received data
+        """Make an HTTP GET request and stream the received data into a local file
 
-        Raise an exception if request fails. Returns no data.
+        Large objects are downloaded as parallel byte ranges when the server supports
+        them. Raise an exception if request fails. Returns no data.
         """
 
         if local_file is None:
@@ -1267,23 +1891,14 @@ class Cursor:
                 session_id_hex=self.connection.get_session_id_hex(),
             )
 
-        r = self.connection.http_client.request(
-            HttpMethod.GET, presigned_url, headers=headers
-        )
-
-        # response.ok verifies the status code is not between 400-600.
-        # Any 2xx or 3xx will evaluate r.ok == True
-        if r.status >= 400:
-            # Decode response data for error message
-            error_text = r.data.decode() if r.data else ""
-            raise OperationalError(
-                f"Staging operation over HTTP was unsuccessful: {r.status}-{error_text}",
-                host_url=self.connection.session.host,
-                session_id_hex=self.connection.get_session_id_hex(),
-            )
-
-        with open(local_file, "wb") as fp:
-            fp.write(r.data)
+        RangedDownload(
+            self.connection.http_client,
+            presigned_url,
+            local_file,
+            headers=headers,
+            host_url=self.connection.session.host,
+            session_id_hex=self.connection.get_session_id_hex(),
+        ).run()
 
     @log_latency(StatementType.SQL)
     def _handle_staging_remove(
@@ -1300,6 +1915,7 @@ class Cursor:
             error_text = r.data.decode() if r.data else ""
             raise OperationalError(
                 f"Staging operation over HTTP was unsuccessful: {r.status}-{error_text}",
+                {"http-code": r.status},
                 host_url=self.connection.session.host,
                 session_id_hex=self.connection.get_session_id_hex(),
             )
@@ -1307,11 +1923,14 @@ class Cursor:
     @log_latency(StatementType.QUERY)
     def execute(
         self,
-        operation: str,
+        operation: Union[str, PreparedStatement],
         parameters: Optional[TParameterCollection] = None,
         enforce_embedded_schema_correctness=False,
         input_stream: Optional[BinaryIO] = None,
         query_tags: Optional[Dict[str, Optional[str]]] = None,
+        cache_ttl: Optional[float] = None,
+        bypass_cache: bool = False,
+        cache_depends_on: Optional[Union[Sequence[str], Mapping[str, int]]] = None,
     ) -> "Cursor":
         """
         Execute a query and wait for execution to complete.
@@ -1345,6 +1964,15 @@ class Cursor:
         :param query_tags: Optional dictionary of query tags to apply for this query only.
             Tags are key-value pairs that can be used to identify and categorize queries.
             Example: {"team": "data-eng", "application": "etl"}
+        :param cache_ttl: Seconds to keep this query's result in the connection's
+            result_cache, instead of the cache's default time to live. 0 does not cache it.
+        :param bypass_cache: Run the query even if the result_cache holds its result, and
+            do not cache the new result.
+        :param cache_depends_on: The Delta tables the query reads, as a list of table
+            names whose current versions are looked up when the query runs, or as a
+            mapping of table names to the versions the caller knows it reads. The cached
+            result is then checked against the tables' versions on every lookup, and
+            unless `cache_ttl` is given it stays valid until one of them changes.
 
         :returns self
         """
@@ -1353,6 +1981,10 @@ class Cursor:
             "Cursor.execute(operation=%s, parameters=%s)", operation, parameters
         )
 
+        prepared_statement = None
+        if isinstance(operation, PreparedStatement):
+            prepared_statement, operation = operation, operation.operation
+
         param_approach = self._determine_parameter_approach(parameters)
         if param_approach == ParameterApproach.NONE:
             prepared_params = NO_NATIVE_PARAMS
@@ -1363,31 +1995,65 @@ class Cursor:
                 operation, parameters
             )
         elif param_approach == ParameterApproach.NATIVE:
-            normalized_parameters = self._normalize_tparametercollection(parameters)
-            param_structure = self._determine_parameter_structure(normalized_parameters)
-            transformed_operation = transform_paramstyle(
-                operation, normalized_parameters, param_structure
-            )
-            prepared_operation, prepared_params = self._prepare_native_parameters(
-                transformed_operation, normalized_parameters, param_structure
+            prepared = self._prepared_operation(
+                prepared_statement or operation, parameter_structure(parameters)
             )
+            prepared_operation = prepared.transformed
+            prepared_params = prepared.bind(parameters)
 
         self._check_not_closed()
         self._close_and_clear_active_result_set()
-        self.active_result_set = self.backend.execute_command(
-            operation=prepared_operation,
-            session_id=self.connection.session.session_id,
-            max_rows=self.arraysize,
-            max_bytes=self.buffer_size_bytes,
-            lz4_compression=self.connection.lz4_compression,
-            cursor=self,
-            use_cloud_fetch=self.connection.use_cloud_fetch,
-            parameters=prepared_params,
-            async_op=False,
-            enforce_embedded_schema_correctness=enforce_embedded_schema_correctness,
-            row_limit=self.row_limit,
-            query_tags=query_tags,
-        )
+        self._track_session_state(prepared_operation)
+
+        def execute_command() -> ResultSet:
+            return self.backend.execute_command(
+                operation=prepared_operation,
+                session_id=self.connection.session.session_id,
+                max_rows=self.arraysize,
+                max_bytes=self.buffer_size_bytes,
+                lz4_compression=self.connection.lz4_compression,
+                cursor=self,
+                use_cloud_fetch=self.connection.use_cloud_fetch,
+                parameters=prepared_params,
+                async_op=False,
+                enforce_embedded_schema_correctness=enforce_embedded_schema_correctness,
+                row_limit=self.row_limit,
+                query_tags=query_tags,
+            )
+
+        result_cache = None if bypass_cache else self.connection.result_cache
+        if not isinstance(result_cache, ResultCache):
+            result_cache = None
+        single_flight = self.connection.single_flight
+        if not isinstance(single_flight, SingleFlight):
+            single_flight = None
+
+        # After a USE, SET or RESET, the session may no longer match the catalog,
+        # schema and configuration in the key, so its results are not shared
+        if (
+            (result_cache is not None or single_flight is not None)
+            and input_stream is None
+            and not self.connection._session_state_changed
+            and self._is_read_only_query(prepared_operation)
+        ):
+            key = (
+                *self._session_key(),
+                prepared_operation,
+                tuple(repr(param) for param in prepared_params),
+                self.row_limit,
+                tuple(sorted(query_tags.items())) if query_tags else None,
+                enforce_embedded_schema_correctness,
+            )
+            self.active_result_set = self._execute_shared(
+                key,
+                execute_command,
+                single_flight,
+                result_cache,
+                cache_ttl,
+                cache_depends_on,
+            )
+        else:
+            self.active_result_set = execute_command()
 
         # Surface the affected-row count for DML (INSERT/UPDATE/DELETE/MERGE) as
         # cursor.rowcount instead of the hardcoded -1. num_modified_rows is None
@@ -1397,6 +2063,9 @@ class Cursor:
         if num_modified_rows is not None:
             self.rowcount = num_modified_rows
 
+        if _DDL_STATEMENT_REGEX.match(prepared_operation):
+            self._invalidate_metadata_cache()
+
         if self.active_result_set and self.active_result_set.is_staging_operation:
             self._handle_staging_operation(
                 staging_allowed_local_path=self.connection.staging_allowed_local_path,
@@ -1405,10 +2074,137 @@ class Cursor:
 
         return self
 
+    def _session_key(self) -> tuple:
+        """Identify the session a shared or cached result was produced by: where it
+        ran, as whom, and with which catalog, schema and configuration."""
+        session = self.connection.session
+        return (
+            session.host,
+            session.http_path,
+            self.connection._credentials_key,
+            session.catalog,
+            session.schema,
+            tuple(
+                sorted(
+                    (str(name), repr(value))
+                    for name, value in (session.session_configuration or {}).items()
+                )
+            ),
+        )
+
+    def _track_session_state(self, operation: str) -> None:
+        # Marked before the statement runs, as it may take effect even if it fails
+        if _SESSION_STATE_STATEMENT_REGEX.match(operation):
+            self.connection._session_state_changed = True
+
+    def _invalidate_metadata_cache(self) -> None:
+        metadata_cache = self.connection.metadata_cache
+        if isinstance(metadata_cache, MetadataCache):
+            logger.debug("Clearing the metadata cache after a DDL statement")
+            metadata_cache.invalidate()
+
+    @staticmethod
+    def _is_read_only_query(operation: str) -> bool:
+        return (
+            pyarrow is not None
+            and _READ_ONLY_STATEMENT_REGEX.match(operation) is not None
+            and _WRITE_KEYWORD_REGEX.search(operation) is None
+        )
+
+    def _execute_shared(
+        self,
+        key: tuple,
+        execute_command,
+        single_flight: Optional[SingleFlight],
+        result_cache: Optional[ResultCache],
+        cache_ttl: Optional[float],
+        cache_depends_on: Optional[Union[Sequence[str], Mapping[str, int]]] = None,
+    ) -> ResultSet:
+        """
+        Answer a read-only query from `result_cache` if it holds a live result for `key`.
+        Otherwise run `execute_command`, through `single_flight` if given so that
+        concurrent identical queries share one execution, fetch its result in full as a
+        pyarrow Table, and cache it. Every caller reads the table through its own
+        ArrowTableResultSet.
+
+        With `cache_depends_on`, the cached result is tied to the Delta versions of the
+        tables it reads. See `databricks.sql.result_cache`.
+        """
+        fetch_table_versions = self.connection._fetch_table_versions
+        if result_cache is not None:
+            cached = result_cache.get(key, fetch_table_versions)
+            if cached is not None:
+                table, description = cached
+                logger.debug("Answering query from the result cache")
+                self.active_command_id = None
+                return self._arrow_table_result_set(table, None, description)
+
+        def execute_and_fetch():
+            table_versions = None
+            if result_cache is not None and cache_depends_on:
+                if isinstance(cache_depends_on, Mapping):
+                    table_versions = dict(cache_depends_on)
+                else:
+                    # Looked up before the query runs, so that a table changing while it
+                    # runs makes the cached result stale rather than wrongly current
+                    table_versions = result_cache.current_table_versions(
+                        (
+                            [cache_depends_on]
+                            if isinstance(cache_depends_on, str)
+                            else cache_depends_on
+                        ),
+                        fetch_table_versions,
+                    )
+            result_set = execute_command()
+            try:
+                table = result_set.fetchall_arrow()
+            finally:
+                result_set.close()
+            if table_versions is not None and None in table_versions.values():
+                logger.debug(
+                    "Not caching a result whose table versions are unknown: %s",
+                    table_versions,
+                )
+            elif result_cache is not None:
+                result_cache.put(
+                    key,
+                    table,
+                    result_set.description,
+                    ttl=cache_ttl,
+                    table_versions=table_versions,
+                )
+            return table, result_set.command_id, result_set.description
+
+        if single_flight is None:
+            table, command_id, description = execute_and_fetch()
+        else:
+            (table, command_id, description), shared = single_flight.do(
+                key, execute_and_fetch
+            )
+            if shared:
+                logger.debug(
+                    "Sharing the result of concurrent identical query %s", command_id
+                )
+        self.active_command_id = command_id
+        return self._arrow_table_result_set(table, command_id, description)
+
+    def _arrow_table_result_set(
+        self, table, command_id: Optional[CommandId], description
+    ) -> ArrowTableResultSet:
+        return ArrowTableResultSet(
+            connection=self.connection,
+            backend=self.backend,
+            table=table,
+            command_id=command_id,
+            description=description,
+            arraysize=self.arraysize,
+            buffer_size_bytes=self.buffer_size_bytes,
+        )
+
     @log_latency(StatementType.QUERY)
     def execute_async(
         self,
-        operation: str,
+        operation: Union[str, PreparedStatement],
         parameters: Optional[TParameterCollection] = None,
         enforce_embedded_schema_correctness=False,
         query_tags: Optional[Dict[str, Optional[str]]] = None,
@@ -1425,6 +2221,10 @@ class Cursor:
         :return:
         """
 
+        prepared_statement = None
+        if isinstance(operation, PreparedStatement):
+            prepared_statement, operation = operation, operation.operation
+
         param_approach = self._determine_parameter_approach(parameters)
         if param_approach == ParameterApproach.NONE:
             prepared_params = NO_NATIVE_PARAMS
@@ -1435,17 +2235,15 @@ class Cursor:
                 operation, parameters
             )
         elif param_approach == ParameterApproach.NATIVE:
-            normalized_parameters = self._normalize_tparametercollection(parameters)
-            param_structure = self._determine_parameter_structure(normalized_parameters)
-            transformed_operation = transform_paramstyle(
-                operation, normalized_parameters, param_structure
-            )
-            prepared_operation, prepared_params = self._prepare_native_parameters(
-                transformed_operation, normalized_parameters, param_structure
+            prepared = self._prepared_operation(
+                prepared_statement or operation, parameter_structure(parameters)
             )
+            prepared_operation = prepared.transformed
+            prepared_params = prepared.bind(parameters)
 
         self._check_not_closed()
         self._close_and_clear_active_result_set()
+        self._track_session_state(prepared_operation)
         self.backend.execute_command(
             operation=prepared_operation,
             session_id=self.connection.session.session_id,
@@ -1460,6 +2258,9 @@ class Cursor:
             row_limit=self.row_limit,
             query_tags=query_tags,
         )
+        self._async_operation_is_ddl = (
+            _DDL_STATEMENT_REGEX.match(prepared_operation) is not None
+        )
 
         return self
 
@@ -1492,15 +2293,34 @@ class Cursor:
         """
         self._check_not_closed()
 
-        while self.is_query_pending():
-            # Poll after some default time
-            time.sleep(self.ASYNC_DEFAULT_POLLING_INTERVAL)
-
+        intervals = self._status_polling_strategy().intervals()
         operation_state = self.get_query_state()
+        while operation_state in [CommandState.PENDING, CommandState.RUNNING]:
+            time.sleep(next(intervals))
+            operation_state = self.get_query_state()
+
+        return self._collect_async_execution_result(operation_state)
+
+    def _status_polling_strategy(self) -> PollingStrategy:
+        interval = self.ASYNC_DEFAULT_POLLING_INTERVAL
+        if interval != _LEGACY_ASYNC_POLLING_INTERVAL_SECONDS:
+            warnings.warn(
+                "Cursor.ASYNC_DEFAULT_POLLING_INTERVAL is deprecated, pass "
+                "polling_strategy=FixedIntervalPolling(...) to connect() instead",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+            return FixedIntervalPolling(interval)
+        return self.connection.polling_strategy
+
+    def _collect_async_execution_result(self, operation_state: CommandState):
+        """Fetch the result of an async query that has reached `operation_state`."""
         if operation_state == CommandState.SUCCEEDED:
             self.active_result_set = self.backend.get_execution_result(
                 self.active_command_id, self
             )
+            if self._async_operation_is_ddl:
+                self._invalidate_metadata_cache()
 
             if self.active_result_set and self.active_result_set.is_staging_operation:
                 self._handle_staging_operation(
@@ -1524,8 +2344,13 @@ class Cursor:
         """
         Execute the operation once for every set of passed in parameters.
 
-        This will issue N sequential request to the database where N is the length of the provided sequence.
-        No optimizations of the query (like batching) will be performed.
+        When native parameters are used and the operation is a single-row
+        `INSERT INTO ... VALUES (...)` statement, the parameter sets are sent as
+        multi-row INSERT statements, each covering as many parameter sets as fit within
+        the connection's `executemany_batch_max_parameters` and `executemany_batch_max_bytes`.
+
+        Any other operation will issue N sequential requests to the database where N is
+        the length of the provided sequence.
 
         Only the final result set is retained.
 
@@ -1535,6 +2360,10 @@ class Cursor:
 
         :returns self
         """
+        seq_of_parameters = list(seq_of_parameters)
+        if self._executemany_as_batches(operation, seq_of_parameters, query_tags):
+            return self
+
         # Per PEP 249, rowcount after executemany reflects the total rows
         # affected across all parameter sets (or -1 when undeterminable). Each
         # execute() resets self.rowcount and sets it from its own statement, so
@@ -1544,15 +2373,415 @@ class Cursor:
         total_rowcount = -1
         for parameters in seq_of_parameters:
             self.execute(operation, parameters, query_tags=query_tags)
-            if self.rowcount >= 0:
-                total_rowcount = (
-                    self.rowcount
-                    if total_rowcount < 0
-                    else total_rowcount + self.rowcount
+            total_rowcount = self._accumulate_rowcount(total_rowcount)
+        self.rowcount = total_rowcount
+        return self
+
+    def _accumulate_rowcount(self, total_rowcount: int) -> int:
+        """Add the rowcount of the last executed statement to `total_rowcount`,
+        ignoring statements that did not report one."""
+        if self.rowcount < 0:
+            return total_rowcount
+        if total_rowcount < 0:
+            return self.rowcount
+        return total_rowcount + self.rowcount
+
+    def _executemany_as_batches(
+        self,
+        operation: str,
+        seq_of_parameters: List[TParameterCollection],
+        query_tags: Optional[Dict[str, Optional[str]]],
+    ) -> bool:
+        """Execute a single-row `INSERT INTO ... VALUES (...)` once per batch of
+        parameter sets instead of once per parameter set.
+
+        Each batch repeats the VALUES row once per parameter set. Named markers are
+        suffixed with the index of their parameter set (`:x` becomes `:x_0`, `:x_1`, ...)
+        and positional parameters are concatenated in order.
+
+        Returns False without executing anything if the operation or the parameter
+        sets cannot be batched, in which case the caller runs them one by one.
+        """
+
+        if len(seq_of_parameters) < 2 or any(
+            isinstance(parameters, str) or not isinstance(parameters, (dict, Sequence))
+            for parameters in seq_of_parameters
+        ):
+            return False
+        if (
+            self._determine_parameter_approach(seq_of_parameters[0])
+            != ParameterApproach.NATIVE
+        ):
+            return False
+
+        rows = [self._normalize_tparametercollection(p) for p in seq_of_parameters]
+        first_row = rows[0]
+        if not first_row or any(len(row) != len(first_row) for row in rows):
+            return False
+
+        param_structure = self._determine_parameter_structure(first_row)
+        if param_structure == ParameterStructure.NAMED:
+            names = {p.name for p in first_row}
+            if len(names) != len(first_row) or any(
+                {p.name for p in row} != names for row in rows
+            ):
+                return False
+            operation = transform_paramstyle(operation, first_row, param_structure)
+        elif any(p.name is not None for row in rows for p in row):
+            return False
+
+        split_operation = split_insert_values_operation(operation)
+        if split_operation is None:
+            return False
+        prefix, values_row = split_operation
+
+        if param_structure == ParameterStructure.NAMED:
+            if "?" in values_row or set(named_markers(values_row)) != names:
+                return False
+        elif named_markers(values_row) or values_row.count("?") != len(first_row):
+            return False
+
+        logger.debug(
+            "Cursor.executemany: batching %d parameter sets into multi-row INSERT statements",
+            len(rows),
+        )
+
+        max_parameters = self.connection.executemany_batch_max_parameters
+        max_bytes = self.connection.executemany_batch_max_bytes
+
+        total_rowcount = -1
+        batch_rows: List[str] = []
+        batch_params: List[TDbsqlParameter] = []
+        batch_bytes = len(prefix)
+
+        for index, row in enumerate(rows):
+            if param_structure == ParameterStructure.NAMED:
+                suffix = f"_{index}"
+                row_operation = rename_named_markers(values_row, suffix)
+                row_params = []
+                for p in row:
+                    renamed = copy.copy(p)
+                    renamed.name = f"{p.name}{suffix}"
+                    row_params.append(renamed)
+            else:
+                row_operation = values_row
+                row_params = row
+
+            row_bytes = len(row_operation) + 2
+            row_bytes += sum(len(str(p.value).encode("utf-8")) for p in row_params)
+
+            if batch_rows and (
+                len(batch_params) + len(row_params) > max_parameters
+                or batch_bytes + row_bytes > max_bytes
+            ):
+                self.execute(
+                    f"{prefix} {', '.join(batch_rows)}",
+                    batch_params,
+                    query_tags=query_tags,
                 )
+                total_rowcount = self._accumulate_rowcount(total_rowcount)
+                batch_rows, batch_params, batch_bytes = [], [], len(prefix)
+
+            batch_rows.append(row_operation)
+            batch_params.extend(row_params)
+            batch_bytes += row_bytes
+
+        self.execute(
+            f"{prefix} {', '.join(batch_rows)}", batch_params, query_tags=query_tags
+        )
+        total_rowcount = self._accumulate_rowcount(total_rowcount)
+
         self.rowcount = total_rowcount
+        return True
+
+    def bulk_insert(
+        self,
+        table_name: str,
+        data: Union["pyarrow.Table", "pyarrow.RecordBatch", "pandas.DataFrame"],
+        staging_volume_path: str,
+        max_part_bytes: int = DEFAULT_BULK_INSERT_PART_BYTES,
+        max_workers: int = DEFAULT_BULK_INSERT_UPLOAD_WORKERS,
+        cleanup: bool = True,
+    ) -> "Cursor":
+        """
+        Load a pyarrow Table or a pandas DataFrame into an existing table by staging it
+        as Parquet files in a Unity Catalog Volume and running `COPY INTO`.
+
+        The data is split into parts of roughly `max_part_bytes` of Arrow memory. Each
+        part is serialized to Parquet and uploaded with a streaming `PUT` on its own
+        cursor, with up to `max_workers` parts in flight, so at most `max_workers` parts
+        are held in memory at a time. Once every part is uploaded a single `COPY INTO`
+        loads them into `table_name`.
+
+        :param table_name: The target table. It is used verbatim in the `COPY INTO` statement,
+            so it must already be quoted if needed.
+        :param data: A pyarrow Table or RecordBatch, or a pandas DataFrame.
+        :param staging_volume_path: A Volume directory such as `/Volumes/catalog/schema/volume/tmp`.
+            The parts are written to a new, uniquely named sub-directory.
+        :param max_part_bytes: The approximate in-memory size of the rows in each Parquet part.
+        :param max_workers: The maximum number of parts uploaded concurrently.
+        :param cleanup: When True, the staged parts are removed after the load, whether or not it succeeds.
+
+        :returns self, holding the result of the `COPY INTO` statement. `rowcount` is the number
+            of rows loaded when the server reports it.
+        """
+        self._check_not_closed()
+
+        if pyarrow is None:
+            raise ProgrammingError(
+                "bulk_insert requires pyarrow. Install it with pip install pyarrow",
+                host_url=self.connection.session.host,
+                session_id_hex=self.connection.get_session_id_hex(),
+            )
+        import pyarrow.parquet as pq
+
+        # pandas is only imported on first use, and a DataFrame cannot exist without it
+        pandas = sys.modules.get("pandas")
+        if pandas is not None and isinstance(data, pandas.DataFrame):
+            table = pyarrow.Table.from_pandas(data, preserve_index=False)
+        elif isinstance(data, pyarrow.RecordBatch):
+            table = pyarrow.Table.from_batches([data])
+        elif isinstance(data, pyarrow.Table):
+            table = data
+        else:
+            raise ProgrammingError(
+                f"Unsupported data type for bulk_insert: {type(data)}. "
+                "Expected a pyarrow Table or RecordBatch, or a pandas DataFrame",
+                host_url=self.connection.session.host,
+                session_id_hex=self.connection.get_session_id_hex(),
+            )
+
+        if table.num_rows == 0:
+            self._close_and_clear_active_result_set()
+            self.rowcount = 0
+            return self
+
+        rows_per_part = max(1, table.num_rows * max_part_bytes // max(table.nbytes, 1))
+        offsets = range(0, table.num_rows, rows_per_part)
+        staging_dir = f"{staging_volume_path.rstrip('/')}/bulk_insert_{uuid4().hex}"
+        part_paths = [
+            f"{staging_dir}/part-{index:05d}.parquet" for index in range(len(offsets))
+        ]
+
+        def upload_part(offset: int, part_path: str) -> None:
+            buffer = io.BytesIO()
+            pq.write_table(table.slice(offset, rows_per_part), buffer)
+            buffer.seek(0)
+            with self.connection.cursor() as part_cursor:
+                part_cursor.execute(
+                    f"PUT '__input_stream__' INTO {self.escaper.escape_string(part_path)} OVERWRITE",
+                    input_stream=buffer,
+                )
+
+        logger.debug(
+            "Cursor.bulk_insert: staging %d rows as %d Parquet parts in %s",
+            table.num_rows,
+            len(part_paths),
+            staging_dir,
+        )
+
+        uploaded_paths: List[str] = []
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                futures = [
+                    executor.submit(upload_part, offset, part_path)
+                    for offset, part_path in zip(offsets, part_paths)
+                ]
+
+            # The executor waits for every upload, so all parts that made it to the
+            # Volume are known (and cleaned up) even if one of them failed.
+            upload_errors = []
+            for future, part_path in zip(futures, part_paths):
+                if future.exception() is None:
+                    uploaded_paths.append(part_path)
+                else:
+                    upload_errors.append(future.exception())
+            if upload_errors:
+                raise upload_errors[0]
+
+            self.execute(
+                f"COPY INTO {table_name} FROM {self.escaper.escape_string(staging_dir)} "
+                "FILEFORMAT = PARQUET"
+            )
+        finally:
+            if cleanup:
+                self._remove_staged_files(uploaded_paths)
+
         return self
 
+    def _remove_staged_files(self, paths: List[str]) -> None:
+        """Best-effort REMOVE of files staged in a Volume. Failures are logged, not raised."""
+        if not paths:
+            return
+        try:
+            with self.connection.cursor() as remove_cursor:
+                for path in paths:
+                    remove_cursor.execute(f"REMOVE {self.escaper.escape_string(path)}")
+        except Exception as e:
+            logger.warning(f"Failed to remove staged files from {paths[0]}: {e}")
+
+    def execute_all(
+        self,
+        queries: Sequence[Union[str, Tuple[str, Optional[TParameterCollection]]]],
+        max_concurrency: int = DEFAULT_RUN_CONCURRENTLY_MAX_CONCURRENCY,
+        timeout: Optional[float] = None,
+        as_arrow: bool = True,
+    ) -> List[QueryResult]:
+        """
+        Run independent statements concurrently, each on its own cursor of this cursor's
+        connection, and return their results in the order of `queries`.
+
+        See Connection.run_concurrently for the parameters. A statement that fails or
+        times out is reported in its result's `error` attribute rather than raised.
+        """
+        self._check_not_closed()
+        return list(
+            self.connection.run_concurrently(
+                queries,
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+                ordered=True,
+                as_arrow=as_arrow,
+            )
+        )
+
+    def put_files(
+        self,
+        mapping: Dict[str, str],
+        overwrite: bool = False,
+        max_workers: int = DEFAULT_VOLUME_TRANSFER_WORKERS,
+        max_attempts: int = DEFAULT_VOLUME_TRANSFER_MAX_ATTEMPTS,
+    ) -> VolumeTransferReport:
+        """
+        Upload many local files to a Unity Catalog Volume concurrently.
+
+        Each file is uploaded with its own `PUT` statement on its own cursor, with up to
+        `max_workers` files in flight. A file whose upload fails transiently (a network
+        error, or an HTTP 429 or 5xx response) is retried up to `max_attempts` times in
+        total; other failures, such as a 403 or 404, are not retried.
+
+        :param mapping: Local file paths mapped to their destination Volume paths, e.g.
+            `{"/data/a.csv": "/Volumes/catalog/schema/volume/a.csv"}`.
+        :param overwrite: Whether existing Volume files may be overwritten.
+
+        Every local file must be within the connection's staging_allowed_local_path;
+        otherwise a ProgrammingError is raised before anything is uploaded.
+
+        :returns a VolumeTransferReport. Failed files are listed in its `failed` attribute
+            rather than raised.
+        """
+        overwrite_clause = " OVERWRITE" if overwrite else ""
+        transfers = [
+            (
+                local_file,
+                volume_path,
+                local_file,
+                f"PUT {self.escaper.escape_string(local_file)} INTO "
+                f"{self.escaper.escape_string(volume_path)}{overwrite_clause}",
+            )
+            for local_file, volume_path in mapping.items()
+        ]
+        return self._transfer_files(transfers, max_workers, max_attempts)
+
+    def get_files(
+        self,
+        mapping: Dict[str, str],
+        max_workers: int = DEFAULT_VOLUME_TRANSFER_WORKERS,
+        max_attempts: int = DEFAULT_VOLUME_TRANSFER_MAX_ATTEMPTS,
+    ) -> VolumeTransferReport:
+        """
+        Download many files from a Unity Catalog Volume concurrently.
+
+        Each file is downloaded with its own `GET` statement on its own cursor, with up to
+        `max_workers` files in flight. A file whose download fails transiently (a network
+        error, or an HTTP 429 or 5xx response) is retried up to `max_attempts` times in
+        total; other failures, such as a 403 or 404, are not retried.
+
+        :param mapping: Volume paths mapped to their destination local file paths, e.g.
+            `{"/Volumes/catalog/schema/volume/a.csv": "/data/a.csv"}`.
+
+        Every local file must be within the connection's staging_allowed_local_path;
+        otherwise a ProgrammingError is raised before anything is downloaded.
+
+        :returns a VolumeTransferReport. Failed files are listed in its `failed` attribute
+            rather than raised.
+        """
+        transfers = [
+            (
+                volume_path,
+                local_file,
+                local_file,
+                f"GET {self.escaper.escape_string(volume_path)} TO "
+                f"{self.escaper.escape_string(local_file)}",
+            )
+            for volume_path, local_file in mapping.items()
+        ]
+        return self._transfer_files(transfers, max_workers, max_attempts)
+
+    def _transfer_files(
+        self,
+        transfers: List[Tuple[str, str, str, str]],
+        max_workers: int,
+        max_attempts: int,
+    ) -> VolumeTransferReport:
+        """Run (source, destination, local_file, statement) staging transfers on a
+        bounded worker pool and collect a report."""
+        self._check_not_closed()
+
+        abs_staging_allowed_local_paths = self._abs_staging_allowed_local_paths(
+            self.connection.staging_allowed_local_path
+        )
+        for _, _, local_file, _ in transfers:
+            self._check_staging_local_file_allowed(
+                os.path.abspath(local_file), abs_staging_allowed_local_paths
+            )
+
+        def transfer(source: str, destination: str, local_file: str, operation: str):
+            result = FileTransferResult(source=source, destination=destination)
+            start_time = time.monotonic()
+            while True:
+                result.attempts += 1
+                try:
+                    with self.connection.cursor() as file_cursor:
+                        file_cursor.execute(operation)
+                    result.error = None
+                    result.bytes_transferred = os.path.getsize(local_file)
+                    break
+                except Exception as e:
+                    result.error = e
+                    transient = is_transient_transfer_error(e)
+                    if not transient or result.attempts >= max_attempts:
+                        break
+                    logger.debug(
+                        "Volume transfer of %s failed (attempt %d of %d): %s",
+                        source,
+                        result.attempts,
+                        max_attempts,
+                        e,
+                    )
+                    time.sleep(
+                        VOLUME_TRANSFER_RETRY_DELAY_SECONDS * 2 ** (result.attempts - 1)
+                    )
+            result.duration_seconds = time.monotonic() - start_time
+            return result
+
+        start_time = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [executor.submit(transfer, *t) for t in transfers]
+        report = VolumeTransferReport(
+            results=[future.result() for future in futures],
+            duration_seconds=time.monotonic() - start_time,
+        )
+
+        logger.info(
+            "Volume transfer completed: %d of %d files, %d bytes in %.3fs",
+            len(report.succeeded),
+            len(report.results),
+            report.bytes_transferred,
+            report.duration_seconds,
+        )
+        return report
+
     @log_latency(StatementType.METADATA)
     def catalogs(self) -> "Cursor":
         """
@@ -1562,11 +2791,15 @@ class Cursor:
         """
         self._check_not_closed()
         self._close_and_clear_active_result_set()
-        self.active_result_set = self.backend.get_catalogs(
-            session_id=self.connection.session.session_id,
-            max_rows=self.arraysize,
-            max_bytes=self.buffer_size_bytes,
-            cursor=self,
+        self.active_result_set = self._metadata_result_set(
+            "get_catalogs",
+            (),
+            lambda: self.backend.get_catalogs(
+                session_id=self.connection.session.session_id,
+                max_rows=self.arraysize,
+                max_bytes=self.buffer_size_bytes,
+                cursor=self,
+            ),
         )
         return self
 
@@ -1582,13 +2815,17 @@ class Cursor:
         """
         self._check_not_closed()
         self._close_and_clear_active_result_set()
-        self.active_result_set = self.backend.get_schemas(
-            session_id=self.connection.session.session_id,
-            max_rows=self.arraysize,
-            max_bytes=self.buffer_size_bytes,
-            cursor=self,
-            catalog_name=catalog_name,
-            schema_name=schema_name,
+        self.active_result_set = self._metadata_result_set(
+            "get_schemas",
+            (("catalog_name", catalog_name), ("schema_name", schema_name)),
+            lambda: self.backend.get_schemas(
+                session_id=self.connection.session.session_id,
+                max_rows=self.arraysize,
+                max_bytes=self.buffer_size_bytes,
+                cursor=self,
+                catalog_name=catalog_name,
+                schema_name=schema_name,
+            ),
         )
         return self
 
@@ -1609,15 +2846,27 @@ class Cursor:
         self._check_not_closed()
         self._close_and_clear_active_result_set()
 
-        self.active_result_set = self.backend.get_tables(
-            session_id=self.connection.session.session_id,
-            max_rows=self.arraysize,
-            max_bytes=self.buffer_size_bytes,
-            cursor=self,
-            catalog_name=catalog_name,
-            schema_name=schema_name,
-            table_name=table_name,
-            table_types=table_types,
+        self.active_result_set = self._metadata_result_set(
+            "get_tables",
+            (
+                ("catalog_name", catalog_name),
+                ("schema_name", schema_name),
+                ("table_name", table_name),
+                (
+                    "table_types",
+                    tuple(table_types) if table_types is not None else None,
+                ),
+            ),
+            lambda: self.backend.get_tables(
+                session_id=self.connection.session.session_id,
+                max_rows=self.arraysize,
+                max_bytes=self.buffer_size_bytes,
+                cursor=self,
+                catalog_name=catalog_name,
+                schema_name=schema_name,
+                table_name=table_name,
+                table_types=table_types,
+            ),
         )
         return self
 
@@ -1643,18 +2892,60 @@ class Cursor:
         self._check_not_closed()
         self._close_and_clear_active_result_set()
 
-        self.active_result_set = self.backend.get_columns(
-            session_id=self.connection.session.session_id,
-            max_rows=self.arraysize,
-            max_bytes=self.buffer_size_bytes,
-            cursor=self,
-            catalog_name=catalog_name,
-            schema_name=schema_name,
-            table_name=table_name,
-            column_name=column_name,
+        self.active_result_set = self._metadata_result_set(
+            "get_columns",
+            (
+                ("catalog_name", catalog_name),
+                ("schema_name", schema_name),
+                ("table_name", table_name),
+                ("column_name", column_name),
+            ),
+            lambda: self.backend.get_columns(
+                session_id=self.connection.session.session_id,
+                max_rows=self.arraysize,
+                max_bytes=self.buffer_size_bytes,
+                cursor=self,
+                catalog_name=catalog_name,
+                schema_name=schema_name,
+                table_name=table_name,
+                column_name=column_name,
+            ),
         )
         return self
 
+    def _metadata_result_set(
+        self,
+        operation: str,
+        arguments: Tuple[Tuple[str, Any], ...],
+        fetch: Callable[[], ResultSet],
+    ) -> ResultSet:
+        """
+        Run the metadata call `fetch`, or answer it from the connection's metadata_cache
+        if that holds the result of an identical call. A result fetched for the cache is
+        read in full as a pyarrow Table.
+        """
+        metadata_cache = self.connection.metadata_cache
+        if not isinstance(metadata_cache, MetadataCache) or pyarrow is None:
+            return fetch()
+        # After a USE, SET or RESET, calls without explicit names may list a different
+        # catalog or schema than the key records
+        if self.connection._session_state_changed:
+            return fetch()
+
+        def fetch_table():
+            result_set = fetch()
+            try:
+                table = result_set.fetchall_arrow()
+            finally:
+                result_set.close()
+            return table, result_set.description
+
+        # The arguments stay last: MetadataCache.invalidate() matches on them
+        key = (*self._session_key(), operation, arguments)
+        self.active_command_id = None
+        table, description = metadata_cache.get_or_fetch(key, fetch_table)
+        return self._arrow_table_result_set(table, self.active_command_id, description)
+
     def fetchall(self) -> List[Row]:
         """
         Fetch all (remaining) rows of a query result, returning them as a sequence of sequences.
@@ -1770,6 +3061,7 @@ class Cursor:
         self.active_command_id = None
         if self.active_result_set:
             self._close_and_clear_active_result_set()
+        self.connection._forget_cursor(self)
 
     @property
     def query_id(self) -> Optional[str]:
@@ -0,0 +1,118 @@
+"""
+Process-wide sharing of TLS contexts and HTTP connection pools between connections.
+
+Every connection used to build its own `ssl.SSLContext`, loading the CA bundle and
+client certificate again, and its own urllib3 pools, so that no keep-alive connection
+outlived the `Connection` that opened it. Contexts are now shared by all connections
+with equivalent `SSLOptions`. With `_share_connection_pools=True`, connections to the
+same host through the same proxy with the same TLS configuration also share their
+connection pools, so a new `Connection` reuses the keep-alive sockets that earlier ones
+left open instead of connecting and completing a TLS handshake again.
+
+Both registries are bounded. A pool dropped from the registry is not closed, as
+connections may still be using it; its sockets are released once none refers to it.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from ssl import SSLContext
+from typing import Any, Callable, Hashable, Optional, Tuple, TypeVar
+
+from databricks.sql.types import SSLOptions
+
+T = TypeVar("T")
+
+DEFAULT_MAX_SSL_CONTEXTS = 32
+DEFAULT_MAX_CONNECTION_POOLS = 32
+
+
+class SharedRegistry:
+    """
+    A thread-safe map from keys to objects created on first use, which keeps the
+    `max_size` most recently used ones.
+
+    Attributes:
+        created (int): Objects created because their key was not in the registry.
+        reused (int): Lookups answered with an object already in the registry.
+    """
+
+    def __init__(self, max_size: int):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1, got %s" % max_size)
+        self.max_size = max_size
+        self.created = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable, create: Callable[[], T]) -> T:
+        """Return the object for `key`, calling `create()` to make it if there is none."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.reused += 1
+                return self._entries[key]
+
+            value = create()
+            self._entries[key] = value
+            self.created += 1
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+ssl_contexts = SharedRegistry(DEFAULT_MAX_SSL_CONTEXTS)
+connection_pools = SharedRegistry(DEFAULT_MAX_CONNECTION_POOLS)
+
+
+def _file_key(path: Optional[str]) -> Tuple[Optional[str], Optional[float]]:
+    # The modification time is part of the key, so that a rotated file is loaded again
+    if not path:
+        return path, None
+    try:
+        return path, os.stat(path).st_mtime
+    except (OSError, TypeError, ValueError):
+        return path, None
+
+
+def ssl_options_key(ssl_options: SSLOptions) -> Tuple:
+    """Return a key equal for `SSLOptions` that would create equivalent contexts."""
+    return (
+        ssl_options.tls_verify,
+        ssl_options.tls_verify_hostname,
+        _file_key(ssl_options.tls_trusted_ca_file),
+        _file_key(ssl_options.tls_client_cert_file),
+        _file_key(ssl_options.tls_client_cert_key_file),
+        ssl_options.tls_client_cert_key_password,
+    )
+
+
+def shared_ssl_context(
+    kind: str, ssl_options: SSLOptions, create: Callable[[], SSLContext]
+) -> SSLContext:
+    """
+    Return the process-wide context of `kind` for `ssl_options`, calling `create()` to
+    make it on first use. `kind` tells apart contexts built differently from the same
+    options.
+    """
+    return ssl_contexts.get((kind,) + ssl_options_key(ssl_options), create)
+
+
+def shared_connection_pool(key: Hashable, create: Callable[[], T]) -> T:
+    """Return the process-wide pool for `key`, calling `create()` to make it on first use."""
+    return connection_pools.get(key, create)
+
+
+def clear() -> None:
+    """Forget all shared contexts and pools. Connections using them are unaffected."""
+    ssl_contexts.clear()
+    connection_pools.clear()
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class QueryResult:
+    """
+    Outcome of one statement run by Connection.run_concurrently / Cursor.execute_all.
+
+    Attributes:
+        index (int): Position of the statement in the submitted list.
+        operation (str): The SQL statement.
+        parameters: The parameters it was executed with, if any.
+        result: The fetched result, a pyarrow Table or a list of Rows, or None if the
+            statement failed.
+        query_id (Optional[str]): The statement's server-side id, once it was submitted.
+        duration_seconds (float): Wall-clock time from submission until the result was
+            fetched or the statement failed.
+        error (Optional[Exception]): Why the statement failed or timed out, or None.
+    """
+
+    index: int
+    operation: str
+    parameters: Any = None
+    result: Any = None
+    query_id: Optional[str] = None
+    duration_seconds: float = 0.0
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
@@ -2,7 +2,7 @@ import json
 import threading
 import time
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Dict, Optional, List, Any, TYPE_CHECKING
 
 from databricks.sql.common.http import HttpMethod
@@ -47,7 +47,9 @@ class FeatureFlagsContext:
     """
     Manages fetching and caching of server-side feature flags for a connection.
 
-    1. The very first check for any flag is a synchronous, BLOCKING operation.
+    1. The very first check for any flag is a synchronous, BLOCKING operation,
+       unless `prefetch()` has already started loading the flags in the background,
+       in which case it waits for that fetch instead.
     2. Subsequent refreshes (triggered near TTL expiry) are done asynchronously
        in the background, returning stale data until the refresh completes.
     """
@@ -65,6 +67,8 @@ class FeatureFlagsContext:
         self._flags: Optional[Dict[str, str]] = None
         self._ttl_seconds: int = DEFAULT_TTL_SECONDS
         self._last_refresh_time: float = 0
+        self._initial_fetch: Optional[Future] = None
+        self._initial_fetch_checked = False
 
         endpoint_suffix = FEATURE_FLAGS_ENDPOINT_SUFFIX_FORMAT.format(__version__)
         self._feature_flag_endpoint = (
@@ -85,19 +89,34 @@ class FeatureFlagsContext:
         )
         return time.monotonic() > refresh_threshold
 
+    def prefetch(self) -> None:
+        """Starts loading the flags in the background if they have not been loaded yet."""
+        with self._lock:
+            if self._flags is None and self._initial_fetch is None:
+                self._initial_fetch = self._executor.submit(self._refresh_flags)
+
     def get_flag_value(self, name: str, default_value: Any) -> Any:
         """
         Checks if a feature is enabled.
         - BLOCKS on the first call until flags are fetched.
         - Returns cached values on subsequent calls, triggering non-blocking refreshes if needed.
         """
+        with self._lock:
+            initial_fetch = self._initial_fetch
+            # The first check after prefetch() uses its result even if the fetch failed
+            first_check = initial_fetch is not None and not self._initial_fetch_checked
+            self._initial_fetch_checked = True
+        if initial_fetch is not None:
+            # Wait outside the lock, which the fetch takes to update the cache
+            wait([initial_fetch])
+
         with self._lock:
             # If cache has never been loaded, perform a synchronous, blocking fetch.
             if self._flags is None:
                 self._refresh_flags()
 
             # If a proactive background refresh is needed, start one. This is non-blocking.
-            elif self._is_refresh_needed():
+            elif not first_check and self._is_refresh_needed():
                 # We don't check for an in-flight refresh; the executor queues the task, which is safe.
                 self._executor.submit(self._refresh_flags)
 
@@ -185,8 +204,24 @@ class FeatureFlagsContextFactory:
             key = connection.session.host
             if key in cls._context_map:
                 cls._context_map.pop(key, None)
+            cls._shutdown_executor_if_unused()
+
+    @classmethod
+    def discard_instance(cls, connection: "Connection"):
+        """Removes the context created for a connection that failed to open, so that it
+        does not keep the connection's auth provider, HTTP client and failed flags for
+        later connections to the host. A context created by another connection is kept.
+        """
+        with cls._lock:
+            key = connection.session.host
+            context = cls._context_map.get(key)
+            if context is not None and context._connection is connection:
+                cls._context_map.pop(key)
+            cls._shutdown_executor_if_unused()
 
-            # If this was the last active context, clean up the thread pool.
-            if not cls._context_map and cls._executor is not None:
-                cls._executor.shutdown(wait=False)
-                cls._executor = None
+    @classmethod
+    def _shutdown_executor_if_unused(cls):
+        # If no context is left, clean up the thread pool.
+        if not cls._context_map and cls._executor is not None:
+            cls._executor.shutdown(wait=False)
+            cls._executor = None
@@ -0,0 +1,109 @@
+"""
+Status polling strategies for statements that are waited on by polling their state.
+
+A strategy decides how long to wait before each status poll. Pass one to
+`databricks.sql.connect(..., polling_strategy=...)` to change how `Cursor.get_async_execution_result`,
+the asyncio cursor and the SEA backend wait for statements to finish.
+"""
+
+import itertools
+import random
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+
+DEFAULT_POLL_INITIAL_INTERVAL_SECONDS = 0.05
+DEFAULT_POLL_MAX_INTERVAL_SECONDS = 2.0
+DEFAULT_POLL_MULTIPLIER = 2.0
+DEFAULT_POLL_JITTER = 0.2
+# The SEA API accepts a wait_timeout of 0 (no wait) or 5 to 50 seconds
+MIN_LONG_POLL_SECONDS = 5
+MAX_LONG_POLL_SECONDS = 50
+
+
+def _check_long_poll_seconds(long_poll_seconds: Optional[int]) -> None:
+    if long_poll_seconds is None or long_poll_seconds == 0:
+        return
+    if (
+        int(long_poll_seconds) != long_poll_seconds
+        or not MIN_LONG_POLL_SECONDS <= long_poll_seconds <= MAX_LONG_POLL_SECONDS
+    ):
+        raise ValueError(
+            "long_poll_seconds must be a whole number of seconds from %s to %s, got %s"
+            % (MIN_LONG_POLL_SECONDS, MAX_LONG_POLL_SECONDS, long_poll_seconds)
+        )
+
+
+class PollingStrategy(ABC):
+    """
+    Decides how long to wait between status polls of a running statement.
+
+    `long_poll_seconds`, if set, asks backends that support it (SEA) to hold each status
+    request open on the server for up to that many seconds while the statement is still
+    running, so that completion is seen as soon as it happens with few requests. It must
+    be from 5 to 50 seconds; 0 or None disables long polling.
+    """
+
+    long_poll_seconds: Optional[int] = None
+
+    @abstractmethod
+    def intervals(self) -> Iterator[float]:
+        """
+        Return an iterator over the delays, in seconds, before each successive status
+        poll. A new iterator is requested for every statement that is waited on.
+        """
+        raise NotImplementedError
+
+
+class FixedIntervalPolling(PollingStrategy):
+    def __init__(self, interval: float, long_poll_seconds: Optional[int] = None):
+        """Wait the same `interval` seconds before every poll."""
+        if interval < 0:
+            raise ValueError("interval must be >= 0, got %s" % interval)
+        _check_long_poll_seconds(long_poll_seconds)
+        self.interval = interval
+        self.long_poll_seconds = long_poll_seconds
+
+    def intervals(self) -> Iterator[float]:
+        return itertools.repeat(self.interval)
+
+
+class ExponentialBackoffPolling(PollingStrategy):
+    def __init__(
+        self,
+        initial_interval: float = DEFAULT_POLL_INITIAL_INTERVAL_SECONDS,
+        max_interval: float = DEFAULT_POLL_MAX_INTERVAL_SECONDS,
+        multiplier: float = DEFAULT_POLL_MULTIPLIER,
+        jitter: float = DEFAULT_POLL_JITTER,
+        long_poll_seconds: Optional[int] = None,
+    ):
+        """
+        Poll quickly at first, then back off exponentially up to a cap.
+
+        The n-th delay is `initial_interval * multiplier ** n`, capped at `max_interval`,
+        and then scaled by a random factor in `[1 - jitter, 1 + jitter]` (still capped
+        at `max_interval`). Short statements are therefore seen to finish within tens of
+        milliseconds, while long ones are polled at most once every `max_interval` seconds.
+        The jitter keeps many statements started together from polling in lockstep.
+        """
+        if initial_interval <= 0 or max_interval < initial_interval:
+            raise ValueError(
+                "Expected 0 < initial_interval <= max_interval, got %s and %s"
+                % (initial_interval, max_interval)
+            )
+        if multiplier < 1:
+            raise ValueError("multiplier must be >= 1, got %s" % multiplier)
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1), got %s" % jitter)
+        _check_long_poll_seconds(long_poll_seconds)
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.long_poll_seconds = long_poll_seconds
+
+    def intervals(self) -> Iterator[float]:
+        interval = self.initial_interval
+        while True:
+            jittered = interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            yield min(jittered, self.max_interval)
+            interval = min(interval * self.multiplier, self.max_interval)
@@ -0,0 +1,37 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class StartupTimer:
+    """
+    Records how long each phase of opening a connection took, in milliseconds.
+
+    Phases on the critical path of `connect()` and phases run in the background after it
+    returns are recorded alike, so that `timings` shows where connect latency goes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the body of the `with` block as phase `name`, also if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self._timings[name] = elapsed_ms
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Milliseconds taken by each phase completed so far, in completion order."""
+        with self._lock:
+            return dict(self._timings)
+
+    def summary(self) -> str:
+        return ", ".join(f"{name} {ms:.1f} ms" for name, ms in self.timings.items())
@@ -0,0 +1,490 @@
+import io
+import logging
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from databricks.sql.common.http import HttpMethod
+from databricks.sql.exc import (
+    CursorAlreadyClosedError,
+    MaxRetryDurationError,
+    NonRecoverableNetworkError,
+    OperationalError,
+    RequestError,
+    SessionAlreadyClosedError,
+    UnsafeToRetryError,
+)
+
+logger = logging.getLogger(__name__)
+
+# Emit a DEBUG progress line every time this many more bytes have been transferred
+PROGRESS_LOG_INTERVAL_BYTES = 64 * 1024 * 1024
+
+# Ranged staging GET downloads
+DOWNLOAD_PART_BYTES = 64 * 1024 * 1024
+DOWNLOAD_MAX_WORKERS = 4
+DOWNLOAD_MAX_ATTEMPTS_PER_RANGE = 3
+STREAM_CHUNK_BYTES = 1024 * 1024
+
+_CONTENT_RANGE_REGEX = re.compile(r"^bytes\s+(\d+)-(\d+)/(\d+)$")
+
+_NON_RECOVERABLE_REQUEST_ERRORS = (
+    CursorAlreadyClosedError,
+    MaxRetryDurationError,
+    NonRecoverableNetworkError,
+    SessionAlreadyClosedError,
+    UnsafeToRetryError,
+)
+
+
+def get_stream_length(stream: BinaryIO) -> Optional[int]:
+    """
+    Return the number of bytes left to read from `stream`, or None if it cannot be
+    determined without consuming the stream (e.g. pipes and sockets).
+    """
+    try:
+        position = stream.tell()
+        if hasattr(stream, "fileno"):
+            try:
+                return max(os.fstat(stream.fileno()).st_size - position, 0)
+            except (OSError, io.UnsupportedOperation):
+                pass
+        end = stream.seek(0, io.SEEK_END)
+        stream.seek(position)
+        return max(end - position, 0)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def is_transient_transfer_error(error: Exception) -> bool:
+    """
+    Whether a failed staging transfer is worth attempting again: connection and read
+    errors, and HTTP 429 and 5xx responses. Client errors such as 403 and 404, and the
+    request errors the connector already gave up retrying, fail straight away.
+    """
+    if not isinstance(error, OperationalError) or isinstance(
+        error, _NON_RECOVERABLE_REQUEST_ERRORS
+    ):
+        return False
+    http_code = error.context.get("http-code")
+    if http_code is None:
+        return True
+    return http_code == 429 or (http_code >= 500 and http_code != 501)
+
+
+class TransferProgress:
+    """
+    Tracks the bytes moved by a single staging transfer and logs progress and throughput.
+
+    Throughput is reported in the same format as CloudFetch downloads: an INFO line with
+    the speed in MB/s when the transfer completes, and a WARNING when it falls below
+    `min_speed_mbps`.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        url: str,
+        total_bytes: Optional[int] = None,
+        min_speed_mbps: float = 0.1,
+    ):
+        self.operation = operation
+        # Presigned URLs carry credentials in the query string, never log them
+        self.url_endpoint = url.split("?")[0]
+        self.total_bytes = total_bytes
+        self.min_speed_mbps = min_speed_mbps
+        self.bytes_transferred = 0
+        self._next_log_at = PROGRESS_LOG_INTERVAL_BYTES
+        self._start_time = time.monotonic()
+
+    def update(self, num_bytes: int) -> None:
+        self.bytes_transferred += num_bytes
+        if self.bytes_transferred >= self._next_log_at:
+            self._next_log_at += PROGRESS_LOG_INTERVAL_BYTES
+            logger.debug(
+                "Staging %s in progress: %d of %s bytes to %s",
+                self.operation,
+                self.bytes_transferred,
+                self.total_bytes if self.total_bytes is not None else "unknown",
+                self.url_endpoint,
+            )
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self._start_time
+
+    def log_completion(self) -> None:
+        """Log the throughput of the finished transfer at INFO/WARN levels."""
+        duration_seconds = max(self.elapsed_seconds, 1e-6)
+        speed_mbps = (float(self.bytes_transferred) / (1024 * 1024)) / duration_seconds
+
+        logger.info(
+            "Staging %s completed: %.4f MB/s, %d bytes in %.3fs to %s",
+            self.operation,
+            speed_mbps,
+            self.bytes_transferred,
+            duration_seconds,
+            self.url_endpoint,
+        )
+
+        # Tiny transfers are dominated by request latency, so only warn on real payloads
+        if (
+            self.bytes_transferred >= PROGRESS_LOG_INTERVAL_BYTES
+            and speed_mbps < self.min_speed_mbps
+        ):
+            logger.warning(
+                "Staging %s slower than threshold: %.4f MB/s (threshold: %.1f MB/s) to %s",
+                self.operation,
+                speed_mbps,
+                self.min_speed_mbps,
+                self.url_endpoint,
+            )
+
+
+class ProgressReader(io.RawIOBase):
+    """
+    Read-only file-like wrapper that reports every read to a TransferProgress.
+
+    It is passed to urllib3 as a request body, so the payload is streamed from the
+    wrapped file or stream instead of being loaded into memory. `seek` and `tell` are
+    delegated so urllib3 can rewind the body when it retries a request.
+    """
+
+    def __init__(self, stream: BinaryIO, progress: TransferProgress):
+        super().__init__()
+        self._stream = stream
+        self._progress = progress
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        if data:
+            self._progress.update(len(data))
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seekable(self) -> bool:
+        return hasattr(self._stream, "seekable") and self._stream.seekable()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+
+def parse_content_range(value: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    """Parse a `Content-Range: bytes <start>-<end>/<total>` header value.
+
+    Returns None if the header is missing or the total size is unknown (`*`).
+    """
+    if not value:
+        return None
+    match = _CONTENT_RANGE_REGEX.match(value.strip())
+    if match is None:
+        return None
+    start, end, total = (int(group) for group in match.groups())
+    return start, end, total
+
+
+class RangedDownload:
+    """
+    Downloads a presigned URL to a local file without buffering it in memory.
+
+    The first request asks for the first `part_size` bytes. If the server answers with
+    `206 Partial Content` and the total size, the file is preallocated and the remaining
+    byte ranges are fetched by up to `max_workers` threads, each writing its range in
+    place with `os.pwrite`. A range whose body is cut off is resumed from the last byte
+    written, up to `max_attempts` times. If the server ignores the `Range` header, or
+    `os.pwrite` is unavailable, the body is streamed to the file sequentially. The
+    object is downloaded to a temporary file in the same directory, which replaces
+    `local_file` only once the download has succeeded.
+
+    HTTP errors are raised as OperationalError, built with `error_kwargs` (e.g. host_url
+    and session_id_hex) so they carry the same context as other staging errors.
+    """
+
+    def __init__(
+        self,
+        http_client,
+        url: str,
+        local_file: str,
+        headers: Optional[Dict[str, str]] = None,
+        part_size: int = DOWNLOAD_PART_BYTES,
+        max_workers: int = DOWNLOAD_MAX_WORKERS,
+        max_attempts: int = DOWNLOAD_MAX_ATTEMPTS_PER_RANGE,
+        **error_kwargs,
+    ):
+        self._http_client = http_client
+        self._url = url
+        self._local_file = local_file
+        self._headers = dict(headers) if headers else {}
+        self._part_size = max(1, part_size)
+        self._max_workers = max(1, max_workers)
+        self._max_attempts = max(1, max_attempts)
+        self._error_kwargs = error_kwargs
+        self.progress = TransferProgress("GET", url)
+
+    def run(self) -> TransferProgress:
+        # Download next to the destination and move it into place only once complete,
+        # so that a failed download leaves an existing file untouched
+        directory, name = os.path.split(os.path.abspath(self._local_file))
+        temp_file = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.part")
+        try:
+            with open(temp_file, "xb") as fp:
+                if hasattr(os, "pwrite"):
+                    self._download_ranges(fp)
+                else:
+                    self._download_sequentially(fp, self._headers)
+            os.replace(temp_file, self._local_file)
+        except BaseException:
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+            raise
+
+        self.progress.log_completion()
+        return self.progress
+
+    def _raise_http_error(self, status: int, error_text: str):
+        raise OperationalError(
+            f"Staging operation over HTTP was unsuccessful: {status}-{error_text}",
+            {"http-code": status},
+            **self._error_kwargs,
+        )
+
+    def _stream_to(self, response, write) -> Optional[OSError]:
+        """Pass each chunk of the response body to `write`, which returns the number of
+        bytes it wrote.
+
+        An OSError from `write` (e.g. a full disk) is returned rather than raised. The
+        caller raises it once the request context has exited, so that it is not
+        reported and retried as a failed request.
+        """
+        for chunk in response.stream(STREAM_CHUNK_BYTES):
+            try:
+                self.progress.update(write(chunk))
+            except OSError as e:
+                return e
+        return None
+
+    def _download_sequentially(self, fp, headers: Dict[str, str]):
+        error = None
+        write_error = None
+        with self._http_client.request_context(
+            HttpMethod.GET, self._url, headers=headers, preload_content=False
+        ) as response:
+            if response.status >= 400:
+                error = (
+                    response.status,
+                    response.data.decode() if response.data else "",
+                )
+            else:
+                write_error = self._stream_to(response, fp.write)
+        if write_error is not None:
+            raise write_error
+        if error:
+            self._raise_http_error(*error)
+
+    def _download_ranges(self, fp):
+        fd = fp.fileno()
+        first_end = self._part_size - 1
+        headers = {**self._headers, "Range": f"bytes=0-{first_end}"}
+
+        written = 0
+
+        def write(chunk: bytes) -> int:
+            nonlocal written
+            os.pwrite(fd, chunk, written)
+            written += len(chunk)
+            return len(chunk)
+
+        error = None
+        write_error = None
+        total_size = None
+        whole_body = False
+        try:
+            with self._http_client.request_context(
+                HttpMethod.GET, self._url, headers=headers, preload_content=False
+            ) as response:
+                content_range = (
+                    parse_content_range(response.headers.get("Content-Range"))
+                    if response.status == 206
+                    else None
+                )
+                if response.status == 416:
+                    # Zero-byte objects cannot satisfy any range
+                    pass
+                elif response.status >= 400:
+                    error = (
+                        response.status,
+                        response.data.decode() if response.data else "",
+                    )
+                elif content_range is None:
+                    # The server ignored the Range header and is sending the whole body
+                    whole_body = True
+                    write_error = self._stream_to(response, fp.write)
+                else:
+                    total_size = content_range[2]
+                    try:
+                        os.ftruncate(fd, total_size)
+                    except OSError as e:
+                        write_error = e
+                    else:
+                        write_error = self._stream_to(response, write)
+        except RequestError as e:
+            if total_size is None or not is_transient_transfer_error(e):
+                raise
+            logger.debug(
+                "Staging GET: first range interrupted after %d bytes, resuming", written
+            )
+
+        if write_error is not None:
+            raise write_error
+        if error:
+            self._raise_http_error(*error)
+        if whole_body:
+            return
+        if total_size is None:
+            self._download_sequentially(fp, self._headers)
+            return
+
+        self.progress.total_bytes = total_size
+        first_end = min(first_end, total_size - 1)
+        if written <= first_end:
+            self._download_range(fd, written, first_end)
+
+        ranges = [
+            (start, min(start + self._part_size, total_size) - 1)
+            for start in range(first_end + 1, total_size, self._part_size)
+        ]
+        if not ranges:
+            return
+
+        logger.debug(
+            "Staging GET: downloading %d bytes in %d ranges with up to %d workers",
+            total_size,
+            len(ranges) + 1,
+            self._max_workers,
+        )
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [
+                executor.submit(self._download_range, fd, start, end)
+                for start, end in ranges
+            ]
+        for future in futures:
+            future.result()
+
+    def _download_range(self, fd: int, start: int, end: int):
+        """Write bytes `start..end` (inclusive) of the object at the same file offsets,
+        resuming from the last written byte if the response is cut off."""
+        offset = start
+
+        def write(chunk: bytes) -> int:
+            nonlocal offset
+            chunk = chunk[: end + 1 - offset]
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+            return len(chunk)
+
+        attempt = 0
+        while offset <= end:
+            error = None
+            write_error = None
+            try:
+                with self._http_client.request_context(
+                    HttpMethod.GET,
+                    self._url,
+                    headers={**self._headers, "Range": f"bytes={offset}-{end}"},
+                    preload_content=False,
+                ) as response:
+                    if response.status != 206:
+                        error = (
+                            response.status,
+                            response.data.decode() if response.data else "",
+                        )
+                    else:
+                        write_error = self._stream_to(response, write)
+            except RequestError as e:
+                attempt += 1
+                if attempt >= self._max_attempts or not is_transient_transfer_error(e):
+                    raise
+                logger.debug(
+                    "Staging GET: range %d-%d failed at offset %d (attempt %d of %d): %s",
+                    start,
+                    end,
+                    offset,
+                    attempt,
+                    self._max_attempts,
+                    e,
+                )
+                continue
+
+            if write_error is not None:
+                raise write_error
+            if error:
+                self._raise_http_error(*error)
+            if offset <= end:
+                attempt += 1
+                if attempt >= self._max_attempts:
+                    raise OperationalError(
+                        f"Staging GET of bytes {start}-{end} ended early at byte {offset}",
+                        **self._error_kwargs,
+                    )
+
+
+@dataclass
+class FileTransferResult:
+    """
+    Outcome of one file in a multi-file Volume transfer.
+
+    Attributes:
+        source (str): The local file (PUT) or Volume path (GET) that was read.
+        destination (str): The Volume path (PUT) or local file (GET) that was written.
+        attempts (int): Number of times the transfer was attempted.
+        bytes_transferred (Optional[int]): Size of the local file, if the transfer succeeded.
+        duration_seconds (float): Wall-clock time spent on this file, including retries.
+        error (Optional[Exception]): The final error, or None if the transfer succeeded.
+    """
+
+    source: str
+    destination: str
+    attempts: int = 0
+    bytes_transferred: Optional[int] = None
+    duration_seconds: float = 0.0
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class VolumeTransferReport:
+    """Aggregated outcome of Cursor.put_files / Cursor.get_files, in input order."""
+
+    results: List[FileTransferResult] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> List[FileTransferResult]:
+        return [r for r in self.results if r.succeeded]
+
+    @property
+    def failed(self) -> List[FileTransferResult]:
+        return [r for r in self.results if not r.succeeded]
+
+    @property
+    def bytes_transferred(self) -> int:
+        return sum(r.bytes_transferred or 0 for r in self.results)
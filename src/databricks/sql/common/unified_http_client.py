@@ -21,6 +21,11 @@ except ImportError:
 from databricks.sql.auth.retry import DatabricksRetryPolicy, CommandType
 from databricks.sql.exc import RequestError
 from databricks.sql.common.http import HttpMethod
+from databricks.sql.common.connection_pools import (
+    shared_connection_pool,
+    shared_ssl_context,
+    ssl_options_key,
+)
 from databricks.sql.common.http_utils import (
     detect_and_parse_proxy,
 )
@@ -97,35 +102,12 @@ class UnifiedHttpClient:
     def _setup_pool_managers(self):
         """Set up both direct and proxy pool managers for per-request proxy decisions."""
 
-        # SSL context setup
+        # Connections with equivalent options share one context
         ssl_context = None
         if self.config.ssl_options:
-            ssl_context = ssl.create_default_context()
-
-            # Configure SSL verification
-            if not self.config.ssl_options.tls_verify:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-            elif not self.config.ssl_options.tls_verify_hostname:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_REQUIRED
-
-            # Load custom CA file if specified
-            if self.config.ssl_options.tls_trusted_ca_file:
-                ssl_context.load_verify_locations(
-                    self.config.ssl_options.tls_trusted_ca_file
-                )
-
-            # Load client certificate if specified
-            if (
-                self.config.ssl_options.tls_client_cert_file
-                and self.config.ssl_options.tls_client_cert_key_file
-            ):
-                ssl_context.load_cert_chain(
-                    self.config.ssl_options.tls_client_cert_file,
-                    self.config.ssl_options.tls_client_cert_key_file,
-                    self.config.ssl_options.tls_client_cert_key_password,
-                )
+            ssl_context = shared_ssl_context(
+                "unified", self.config.ssl_options, self._create_ssl_context
+            )
 
         # Create retry policy
         self._retry_policy = DatabricksRetryPolicy(
@@ -158,8 +140,23 @@ class UnifiedHttpClient:
             "ssl_context": ssl_context,
         }
 
+        # With shared pools, managers are keyed by everything they were created with.
+        # Retries are passed with each request, as each client has its own policy.
+        self._shared_pools = (
+            getattr(self.config, "share_connection_pools", False) is True
+        )
+        pool_key = (
+            "unified",
+            self.config.ssl_options and ssl_options_key(self.config.ssl_options),
+            self.config.pool_connections,
+            self.config.pool_maxsize,
+            self.config.socket_timeout,
+        )
+
         # Always create a direct pool manager
-        self._direct_pool_manager = PoolManager(**pool_kwargs)
+        self._direct_pool_manager = self._pool_manager(
+            pool_key + ("direct",), lambda: PoolManager(**pool_kwargs)
+        )
 
         # Detect system proxy configuration
         # We use 'https' as default scheme since most requests will be HTTPS
@@ -183,8 +180,16 @@ class UnifiedHttpClient:
                 self._proxy_auth = proxy_auth
 
                 # Create proxy pool manager
-                self._proxy_pool_manager = ProxyManager(
-                    proxy_url, proxy_headers=proxy_auth, **pool_kwargs
+                self._proxy_pool_manager = self._pool_manager(
+                    pool_key
+                    + (
+                        "proxy",
+                        proxy_url,
+                        proxy_auth and tuple(sorted(proxy_auth.items())),
+                    ),
+                    lambda: ProxyManager(
+                        proxy_url, proxy_headers=proxy_auth, **pool_kwargs
+                    ),
                 )
                 logger.debug("Initialized with proxy support: %s", proxy_url)
             else:
@@ -196,6 +201,36 @@ class UnifiedHttpClient:
             logger.debug("Error detecting system proxy configuration: %s", e)
             self._proxy_pool_manager = None
 
+    def _create_ssl_context(self) -> ssl.SSLContext:
+        ssl_options = self.config.ssl_options
+        ssl_context = ssl.create_default_context()
+
+        # Configure SSL verification
+        if not ssl_options.tls_verify:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        elif not ssl_options.tls_verify_hostname:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_REQUIRED
+
+        # Load custom CA file if specified
+        if ssl_options.tls_trusted_ca_file:
+            ssl_context.load_verify_locations(ssl_options.tls_trusted_ca_file)
+
+        # Load client certificate if specified
+        if ssl_options.tls_client_cert_file and ssl_options.tls_client_cert_key_file:
+            ssl_context.load_cert_chain(
+                ssl_options.tls_client_cert_file,
+                ssl_options.tls_client_cert_key_file,
+                ssl_options.tls_client_cert_key_password,
+            )
+        return ssl_context
+
+    def _pool_manager(self, key, create):
+        if self._shared_pools:
+            return shared_connection_pool(key, create)
+        return create()
+
     def _should_use_proxy(self, target_host: str) -> bool:
         """
         Determine if a request to the target host should use proxy.
@@ -254,13 +289,17 @@ class UnifiedHttpClient:
 
         return request_headers
 
-    def _prepare_retry_policy(self):
-        """Set up the retry policy for the current request."""
-        if isinstance(self._retry_policy, DatabricksRetryPolicy):
-            # Set command type for HTTP requests to OTHER (not database commands)
-            self._retry_policy.command_type = CommandType.OTHER
-            # Start the retry timer for duration-based retry limits
-            self._retry_policy.start_retry_timer()
+    def _request_retry_policy(self):
+        """Return a fresh copy of the retry policy for one request, so that concurrent
+        requests do not share its command type and retry timer."""
+        if not isinstance(self._retry_policy, DatabricksRetryPolicy):
+            return self._retry_policy
+        retry_policy = self._retry_policy.new()
+        # Set command type for HTTP requests to OTHER (not database commands)
+        retry_policy.command_type = CommandType.OTHER
+        # Start the retry timer for duration-based retry limits
+        retry_policy.start_retry_timer()
+        return retry_policy
 
     @contextmanager
     def request_context(
@@ -288,9 +327,6 @@ class UnifiedHttpClient:
 
         request_headers = self._prepare_headers(headers)
 
-        # Prepare retry policy for this request
-        self._prepare_retry_policy()
-
         # Select appropriate pool manager based on target URL
         pool_manager = self._get_pool_manager_for_url(url)
 
@@ -304,6 +340,9 @@ class UnifiedHttpClient:
 
         response = None
 
+        if "retries" not in kwargs:
+            kwargs["retries"] = self._request_retry_policy()
+
         try:
             response = pool_manager.request(
                 method=method.value, url=url, headers=request_headers, **kwargs
@@ -363,7 +402,12 @@ class UnifiedHttpClient:
         return self._proxy_uri
 
     def close(self):
-        """Close the underlying connection pools."""
+        """Close the underlying connection pools, unless they are shared."""
+        if self._shared_pools:
+            # Other clients may be using them
+            self._direct_pool_manager = None
+            self._proxy_pool_manager = None
+            return
         if self._direct_pool_manager:
             self._direct_pool_manager.clear()
             self._direct_pool_manager = None
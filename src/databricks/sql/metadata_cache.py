@@ -0,0 +1,225 @@
+"""
+Client-side cache of metadata operation results.
+
+With `databricks.sql.connect(..., metadata_cache=MetadataCache())`, the results of
+`cursor.catalogs()`, `cursor.schemas()`, `cursor.tables()` and `cursor.columns()` are
+kept as pyarrow Tables, keyed by the call's arguments, and repeated calls within the
+cache's time to live are answered without contacting the server:
+
+```python
+from databricks.sql.metadata_cache import MetadataCache
+
+cache = MetadataCache(ttl=120, max_entries=4096)
+with sql.connect(server_hostname, http_path, access_token, metadata_cache=cache) as connection:
+    with connection.cursor() as cursor:
+        cursor.columns(catalog_name="main", schema_name="sales")
+        cursor.columns(catalog_name="main", schema_name="sales")  # from the cache
+        cache.invalidate(catalog_name="main")
+```
+
+Entries are also keyed by the connection's host, credentials, session configuration
+and initial catalog and schema, so a cache may be passed to several connections; calls
+on a connection that has run `USE`, `SET` or `RESET` bypass the cache.
+
+Concurrent calls with the same arguments share one request to the server. A `CREATE`,
+`ALTER` or `DROP` statement run through a connection using the cache clears it once the
+statement has finished, and `invalidate()` drops entries explicitly. Changes made by
+other clients are seen once entries expire.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+from databricks.sql.common.single_flight import SingleFlight
+
+DEFAULT_METADATA_CACHE_TTL_SECONDS = 60
+DEFAULT_METADATA_CACHE_MAX_ENTRIES = 1024
+DEFAULT_METADATA_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class MetadataCacheMetrics:
+    """
+    A snapshot of a MetadataCache's contents and cumulative counters.
+
+    Attributes:
+        hits (int): Calls answered from the cache.
+        misses (int): Calls that found no live entry and were sent to the server.
+        coalesced (int): Misses answered by a concurrent request with the same arguments.
+        evictions (int): Entries dropped to stay within the size bounds.
+        expirations (int): Entries dropped because their time to live ran out.
+        invalidations (int): Entries dropped by `invalidate()` or a DDL statement.
+        entries (int): Entries currently cached.
+        bytes (int): Size of the tables currently cached.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class _Entry:
+    def __init__(self, value: Tuple[Any, List[Tuple]], expires_at: float, size: int):
+        # A `(pyarrow.Table, description)` pair
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class MetadataCache:
+    def __init__(
+        self,
+        ttl: float = DEFAULT_METADATA_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_METADATA_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_METADATA_CACHE_MAX_BYTES,
+    ):
+        """
+        A thread-safe, size-bounded cache of metadata operation results.
+
+        :param ttl: Seconds a result stays valid.
+        :param max_entries: Upper bound on the number of cached results. The least
+            recently used result is dropped first.
+        :param max_bytes: Upper bound on the total size of the cached results.
+        """
+        if max_entries < 0 or max_bytes < 0:
+            raise ValueError("Cache size bounds must be >= 0")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        # Bumped by every invalidation, so that a result fetched across one is not cached
+        self._generation = 0
+        self._single_flight = SingleFlight()
+        self._metrics = MetadataCacheMetrics()
+
+    def get_or_fetch(
+        self, key: Hashable, fetch: Callable[[], Tuple[Any, List[Tuple]]]
+    ) -> Tuple[Any, List[Tuple]]:
+        """
+        Return the cached `(table, description)` for `key`, calling `fetch` to get and
+        cache it on a miss. Concurrent misses for the same key share one `fetch` call.
+
+        `key` is a tuple whose last element holds the call's `(argument, value)` pairs,
+        as built by the cursor, so that `invalidate()` can match entries by name.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._metrics.expirations += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._metrics.hits += 1
+                return entry.value
+            self._metrics.misses += 1
+
+        def fetch_and_cache():
+            with self._lock:
+                generation = self._generation
+            value = fetch()
+            self._put(key, value, generation)
+            return value
+
+        value, shared = self._single_flight.do(key, fetch_and_cache)
+        if shared:
+            with self._lock:
+                self._metrics.coalesced += 1
+        return value
+
+    def invalidate(
+        self, catalog_name: Optional[str] = None, schema_name: Optional[str] = None
+    ) -> int:
+        """
+        Drop cached results that may list objects in the given catalog or schema. With
+        no arguments, drop every result.
+
+        Names are compared case-insensitively. Results of calls that did not name a
+        catalog or schema, or named one with a `%` or `_` wildcard, are always dropped.
+
+        :returns the number of entries dropped.
+        """
+        with self._lock:
+            self._generation += 1
+            keys = [
+                key
+                for key in self._entries
+                if self._may_list(key[-1], catalog_name, schema_name)
+            ]
+            for key in keys:
+                self._remove(key)
+            self._metrics.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry without counting it as an invalidation."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def metrics(self) -> MetadataCacheMetrics:
+        """Return a snapshot of the cache's size and counters."""
+        with self._lock:
+            self._metrics.entries = len(self._entries)
+            self._metrics.bytes = self._bytes
+            return MetadataCacheMetrics(**vars(self._metrics))
+
+    def _put(
+        self, key: Hashable, value: Tuple[Any, List[Tuple]], generation: int
+    ) -> None:
+        if self.ttl <= 0:
+            return
+        table = value[0]
+        entry = _Entry(value, time.monotonic() + self.ttl, getattr(table, "nbytes", 0))
+        with self._lock:
+            if generation != self._generation:
+                # Invalidated while it was being fetched, so it may already be stale
+                return
+            self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._metrics.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    @staticmethod
+    def _may_list(
+        arguments: Tuple[Tuple[str, Any], ...],
+        catalog_name: Optional[str],
+        schema_name: Optional[str],
+    ) -> bool:
+        values = dict(arguments)
+
+        def matches(argument: str, name: Optional[str]) -> bool:
+            value = values.get(argument)
+            return (
+                name is None
+                or value is None
+                or "%" in value
+                or "_" in value
+                or value.lower() == name.lower()
+            )
+
+        return matches("catalog_name", catalog_name) and matches(
+            "schema_name", schema_name
+        )
@@ -0,0 +1,200 @@
+"""
+Background closing of finished statements.
+
+Closing a result set releases its operation on the server with a CloseOperation request.
+`cursor.execute()` closes the cursor's previous result set before it runs the next
+statement, so sending that request inline adds a full round trip to every statement. An
+`OperationCloser` sends it from a background thread instead, one request at a time, and
+logs rather than raises any error it fails with.
+
+Operations whose results were returned in full with the ExecuteStatement response are
+closed by the server in the same response, and need no request at all.
+
+Each connection has its own closer. When the connection is closed, the closes still
+pending are sent concurrently, at most `max_workers` at a time and within an optional
+deadline, before the session is closed. Backends whose servers release all of a
+session's operations when the session is closed skip them instead.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Deque, List, Optional, Tuple
+
+from databricks.sql.exc import CursorAlreadyClosedError, RequestError
+
+if TYPE_CHECKING:
+    from databricks.sql.backend.databricks_client import DatabricksClient
+    from databricks.sql.backend.types import CommandId
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLOSE_MAX_WORKERS = 8
+
+
+class OperationCloser:
+    def __init__(self, max_workers: int = DEFAULT_CLOSE_MAX_WORKERS):
+        """
+        Close operations on the server from one background thread, started on first use.
+
+        :param max_workers: Number of operations closed at once by `close()`.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1, got %s" % max_workers)
+        self.max_workers = max_workers
+        self.closed_operations = 0
+        self.failed_operations = 0
+        self.skipped_operations = 0
+
+        self._condition = threading.Condition()
+        self._pending: Deque[Tuple["DatabricksClient", "CommandId"]] = deque()
+        self._in_flight = 0
+        self._thread: Optional[threading.Thread] = None
+        self._holding = False
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of operations waiting to be closed, including one being closed."""
+        with self._condition:
+            return len(self._pending) + self._in_flight
+
+    def submit(self, backend: "DatabricksClient", command_id: "CommandId") -> None:
+        """
+        Close the operation `command_id` with `backend.close_command()` in the background.
+
+        Once the closer has been closed, the operation is closed in the calling thread.
+        """
+        with self._condition:
+            if not self._closed:
+                self._pending.append((backend, command_id))
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run,
+                        name="databricks-sql-operation-closer",
+                        daemon=True,
+                    )
+                    self._thread.start()
+                self._condition.notify_all()
+                return
+        self._close_operation(backend, command_id)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every submitted operation has been closed.
+
+        Returns False if some are still pending after `timeout` seconds.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._in_flight, timeout
+            )
+
+    def hold(self) -> None:
+        """
+        Stop sending closes in the background. Operations submitted from now on are kept
+        until `close()`, which sends them all at once or skips them.
+        """
+        with self._condition:
+            self._holding = True
+
+    def close(
+        self, timeout: Optional[float] = None, skip_pending: bool = False
+    ) -> bool:
+        """
+        Close the operations still pending and stop the background thread.
+
+        Pending operations are closed concurrently, at most `max_workers` at a time. With
+        `skip_pending`, they are dropped instead, for when closing the session releases
+        them on the server anyway. Returns False if some closes had not completed
+        within `timeout` seconds; they are abandoned and logged.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._closed = True
+            pending, self._pending = list(self._pending), deque()
+            thread = self._thread
+            self._condition.notify_all()
+
+        completed = True
+        if pending and skip_pending:
+            with self._condition:
+                self.skipped_operations += len(pending)
+            logger.debug(
+                "Skipping %s operation closes, released with the session", len(pending)
+            )
+        elif pending:
+            completed = self._close_concurrently(pending, deadline)
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(_remaining(deadline))
+            completed = completed and not thread.is_alive()
+        if not completed:
+            logger.warning(
+                "Closing operations did not complete within %s seconds", timeout
+            )
+        return completed
+
+    def _close_concurrently(
+        self,
+        pending: List[Tuple["DatabricksClient", "CommandId"]],
+        deadline: Optional[float],
+    ) -> bool:
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending)),
+            thread_name_prefix="databricks-sql-operation-closer",
+        )
+        try:
+            futures = [
+                executor.submit(self._close_operation, backend, command_id)
+                for backend, command_id in pending
+            ]
+            _, not_done = wait(futures, timeout=_remaining(deadline))
+            return not not_done
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending or self._holding:
+                    if self._closed:
+                        return
+                    self._condition.wait()
+                backend, command_id = self._pending.popleft()
+                self._in_flight += 1
+
+            self._close_operation(backend, command_id)
+
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _close_operation(
+        self, backend: "DatabricksClient", command_id: "CommandId"
+    ) -> None:
+        try:
+            backend.close_command(command_id)
+        except RequestError as e:
+            if len(e.args) > 1 and isinstance(e.args[1], CursorAlreadyClosedError):
+                logger.info("Operation was canceled by a prior request")
+                return
+            self._record_failure(command_id, e)
+        except Exception as e:
+            self._record_failure(command_id, e)
+        else:
+            with self._condition:
+                self.closed_operations += 1
+
+    def _record_failure(self, command_id: "CommandId", error: Exception) -> None:
+        with self._condition:
+            self.failed_operations += 1
+        logger.warning("Failed to close operation %s: %s", command_id, error)
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
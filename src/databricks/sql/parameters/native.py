@@ -1,20 +1,40 @@
+from __future__ import annotations
+
 import datetime
 import decimal
+import sys
 from enum import Enum, auto
-from typing import Optional, Sequence, Any
+from typing import TYPE_CHECKING, Optional, Sequence, Any
 
 from databricks.sql.exc import NotSupportedError
-from databricks.sql.thrift_api.TCLIService.ttypes import (
-    TSparkParameter,
-    TSparkParameterValue,
-    TSparkParameterValueArg,
-)
+from databricks.sql.thrift_api import load_ttypes
+
+if TYPE_CHECKING:
+    from databricks.sql.thrift_api.TCLIService.ttypes import (
+        TSparkParameter,
+        TSparkParameterValue,
+        TSparkParameterValueArg,
+    )
 
 import datetime
 import decimal
 from enum import Enum, auto
 from typing import Dict, List, Union
 
+_THRIFT_PARAMETER_TYPES = (
+    "TSparkParameter",
+    "TSparkParameterValue",
+    "TSparkParameterValueArg",
+)
+
+
+def __getattr__(name: str) -> Any:
+    # The Thrift parameter types can still be imported from this module, but are only
+    # loaded when first asked for
+    if name in _THRIFT_PARAMETER_TYPES:
+        return getattr(load_ttypes(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class ParameterApproach(Enum):
     INLINE = 1
@@ -98,7 +118,9 @@ class DbsqlParameterBase:
     def as_tspark_param(self, named: bool) -> TSparkParameter:
         """Returns a TSparkParameter object that can be passed to the DBR thrift server."""
 
-        tsp = TSparkParameter(value=self._tspark_param_value(), type=self._cast_expr())
+        tsp = load_ttypes().TSparkParameter(
+            value=self._tspark_param_value(), type=self._cast_expr()
+        )
 
         if named:
             tsp.name = self.name
@@ -108,11 +130,13 @@ class DbsqlParameterBase:
         return tsp
 
     def _tspark_param_value(self):
-        return TSparkParameterValue(stringValue=str(self.value))
+        return load_ttypes().TSparkParameterValue(stringValue=str(self.value))
 
     def _tspark_value_arg(self):
         """Returns a TSparkParameterValueArg object that can be passed to the DBR thrift server."""
-        return TSparkParameterValueArg(value=str(self.value), type=self._cast_expr())
+        return load_ttypes().TSparkParameterValueArg(
+            value=str(self.value), type=self._cast_expr()
+        )
 
     def _cast_expr(self):
         return self.CAST_EXPR
@@ -451,6 +475,8 @@ class ArrayParameter(DbsqlParameterBase):
         """
         :value:
             The value to bind for this parameter. This will be casted to a ARRAY.
+            A numpy array or pyarrow Array of booleans, integers, floats or strings is
+            accepted as well.
         :name:
             If None, your query must contain a `?` marker. Like:
 
@@ -465,13 +491,39 @@ class ArrayParameter(DbsqlParameterBase):
             The `name` argument to this function would be `my_param`.
         """
         self.name = name
-        self.value = [dbsql_parameter_from_primitive(val) for val in value]
+        elements = array_like_to_list(value)
+        self._elements = list(value) if elements is None else elements
+        self._parameters: Optional[List["TDbsqlParameter"]] = None
+        self._value_args = _encode_homogeneous_elements(self._elements)
+        if self._value_args is None:
+            self._parameters = [
+                dbsql_parameter_from_primitive(val) for val in self._elements
+            ]
+
+    @property
+    def value(self) -> List["TDbsqlParameter"]:
+        # Only built when asked for if the elements could be encoded in bulk
+        if self._parameters is None:
+            self._parameters = [
+                dbsql_parameter_from_primitive(val) for val in self._elements
+            ]
+        return self._parameters
+
+    @value.setter
+    def value(self, value: List["TDbsqlParameter"]) -> None:
+        self._parameters = list(value)
+        self._value_args = None
+
+    def _tspark_arguments(self) -> List[TSparkParameterValueArg]:
+        if self._value_args is not None:
+            return self._value_args
+        return [val._tspark_value_arg() for val in self.value]
 
     def as_tspark_param(self, named: bool = False) -> TSparkParameter:
         """Returns a TSparkParameter object that can be passed to the DBR thrift server."""
 
-        tsp = TSparkParameter(type=self._cast_expr())
-        tsp.arguments = [val._tspark_value_arg() for val in self.value]
+        tsp = load_ttypes().TSparkParameter(type=self._cast_expr())
+        tsp.arguments = self._tspark_arguments()
 
         if named:
             tsp.name = self.name
@@ -482,10 +534,17 @@ class ArrayParameter(DbsqlParameterBase):
 
     def _tspark_value_arg(self):
         """Returns a TSparkParameterValueArg object that can be passed to the DBR thrift server."""
-        tva = TSparkParameterValueArg(type=self._cast_expr())
-        tva.arguments = [val._tspark_value_arg() for val in self.value]
+        tva = load_ttypes().TSparkParameterValueArg(type=self._cast_expr())
+        tva.arguments = self._tspark_arguments()
         return tva
 
+    def __eq__(self, other):
+        return (
+            isinstance(other, self.__class__)
+            and self.name == other.name
+            and self._tspark_arguments() == other._tspark_arguments()
+        )
+
     CAST_EXPR = DatabricksSupportedType.ARRAY.name
 
 
@@ -510,17 +569,47 @@ class MapParameter(DbsqlParameterBase):
             The `name` argument to this function would be `my_param`.
         """
         self.name = name
-        self.value = [
+        self._items = list(value.items())
+        self._parameters: Optional[List["TDbsqlParameter"]] = None
+        self._value_args = None
+        keys = _encode_homogeneous_elements([key for key, _ in self._items])
+        values = _encode_homogeneous_elements([val for _, val in self._items])
+        if keys is not None and values is not None:
+            self._value_args = [None] * (2 * len(self._items))
+            self._value_args[0::2] = keys
+            self._value_args[1::2] = values
+        else:
+            self._parameters = self._flattened_parameters()
+
+    def _flattened_parameters(self) -> List["TDbsqlParameter"]:
+        return [
             dbsql_parameter_from_primitive(item)
-            for key, val in value.items()
+            for key, val in self._items
             for item in (key, val)
         ]
 
+    @property
+    def value(self) -> List["TDbsqlParameter"]:
+        # Only built when asked for if the keys and values could be encoded in bulk
+        if self._parameters is None:
+            self._parameters = self._flattened_parameters()
+        return self._parameters
+
+    @value.setter
+    def value(self, value: List["TDbsqlParameter"]) -> None:
+        self._parameters = list(value)
+        self._value_args = None
+
+    def _tspark_arguments(self) -> List[TSparkParameterValueArg]:
+        if self._value_args is not None:
+            return self._value_args
+        return [val._tspark_value_arg() for val in self.value]
+
     def as_tspark_param(self, named: bool = False) -> TSparkParameter:
         """Returns a TSparkParameter object that can be passed to the DBR thrift server."""
 
-        tsp = TSparkParameter(type=self._cast_expr())
-        tsp.arguments = [val._tspark_value_arg() for val in self.value]
+        tsp = load_ttypes().TSparkParameter(type=self._cast_expr())
+        tsp.arguments = self._tspark_arguments()
         if named:
             tsp.name = self.name
             tsp.ordinal = False
@@ -530,10 +619,17 @@ class MapParameter(DbsqlParameterBase):
 
     def _tspark_value_arg(self):
         """Returns a TSparkParameterValueArg object that can be passed to the DBR thrift server."""
-        tva = TSparkParameterValueArg(type=self._cast_expr())
-        tva.arguments = [val._tspark_value_arg() for val in self.value]
+        tva = load_ttypes().TSparkParameterValueArg(type=self._cast_expr())
+        tva.arguments = self._tspark_arguments()
         return tva
 
+    def __eq__(self, other):
+        return (
+            isinstance(other, self.__class__)
+            and self.name == other.name
+            and self._tspark_arguments() == other._tspark_arguments()
+        )
+
     CAST_EXPR = DatabricksSupportedType.MAP.name
 
 
@@ -623,6 +719,80 @@ class DecimalParameter(DbsqlParameterBase):
         return self.CAST_EXPR.format(overall, after)
 
 
+_INT_MIN, _INT_MAX = -2147483648, 2147483647
+
+# numpy dtype kinds whose tolist() gives the bool, int, float or str that
+# dbsql_parameter_from_primitive would infer for each element
+_NUMPY_LIST_KINDS = frozenset("biufU")
+
+
+def array_like_to_list(value: Any) -> Optional[list]:
+    """Return the elements of a numpy array or pyarrow Array as a list, or None if
+    `value` is neither.
+
+    Neither library is imported here: a value can only be one of their arrays if the
+    library has already been imported by the caller.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(value, numpy.ndarray) and value.ndim > 0:
+        if value.dtype.kind not in _NUMPY_LIST_KINDS:
+            raise NotSupportedError(
+                f"Could not infer parameter type from numpy array of dtype {value.dtype}. "
+                "Convert it to a list of supported Python values."
+            )
+        return value.tolist()
+    pyarrow = sys.modules.get("pyarrow")
+    if pyarrow is not None and isinstance(value, (pyarrow.Array, pyarrow.ChunkedArray)):
+        return value.to_pylist()
+    return None
+
+
+def _encode_homogeneous_elements(
+    elements: list,
+) -> Optional[List[TSparkParameterValueArg]]:
+    """Encode a list whose elements are all bools, all ints, all floats or all strs.
+
+    The element type is checked once for the whole list, and the result is the same as
+    calling `dbsql_parameter_from_primitive(element)._tspark_value_arg()` for each
+    element. Returns None for any other list, which must be encoded element by element.
+    """
+    element_types = set(map(type, elements))
+    if len(element_types) != 1:
+        return None
+    (element_type,) = element_types
+    TSparkParameterValueArg = load_ttypes().TSparkParameterValueArg
+
+    if element_type is str:
+        cast_expr = DatabricksSupportedType.STRING.name
+        strings = elements
+    elif element_type is int:
+        strings = list(map(str, elements))
+        if min(elements) < _INT_MIN or max(elements) > _INT_MAX:
+            # BIGINT is only inferred for the elements that need it
+            return [
+                TSparkParameterValueArg(
+                    value=string,
+                    type=(
+                        DatabricksSupportedType.INT.name
+                        if _INT_MIN <= element <= _INT_MAX
+                        else DatabricksSupportedType.BIGINT.name
+                    ),
+                )
+                for element, string in zip(elements, strings)
+            ]
+        cast_expr = DatabricksSupportedType.INT.name
+    elif element_type is float:
+        cast_expr = DatabricksSupportedType.DOUBLE.name
+        strings = list(map(str, elements))
+    elif element_type is bool:
+        cast_expr = DatabricksSupportedType.BOOLEAN.name
+        strings = list(map(str, elements))
+    else:
+        return None
+
+    return [TSparkParameterValueArg(value=string, type=cast_expr) for string in strings]
+
+
 def dbsql_parameter_from_int(value: int, name: Optional[str] = None):
     """Returns IntegerParameter unless the passed int() requires a BIGINT.
 
@@ -672,11 +842,15 @@ def dbsql_parameter_from_primitive(
         return ArrayParameter(value=value, name=name)
     elif value is None:
         return VoidParameter(value=value, name=name)
-    else:
+
+    # numpy and pyarrow arrays are not Sequences
+    elements = array_like_to_list(value)
+    if elements is None:
         raise NotSupportedError(
             f"Could not infer parameter type from value: {value} - {type(value)} \n"
             "Please specify the type explicitly."
         )
+    return ArrayParameter(value=elements, name=name)
 
 
 TDbsqlParameter = Union[
@@ -0,0 +1,224 @@
+"""
+Reuse of the parts of native parameter preparation that depend only on the statement.
+
+`Cursor.execute()` looks up each statement it runs with native parameters in its
+connection's `PreparedOperationCache`, so that a statement template run repeatedly is
+only rewritten from `pyformat` to `named` paramstyle once. Parameter values are then
+bound straight to `TSparkParameter`s, without building intermediate parameter objects
+for common Python types. `cursor.prepare(sql)` returns a `PreparedStatement` that holds
+on to its preparation rather than looking it up on every execution:
+
+```python
+statement = cursor.prepare("SELECT * FROM orders WHERE id = :id")
+for order_id in order_ids:
+    statement.execute({"id": order_id})
+    rows = cursor.fetchall()
+```
+"""
+
+from __future__ import annotations
+
+import datetime
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from databricks.sql.parameters.native import (
+    DatabricksSupportedType,
+    DbsqlParameterBase,
+    ParameterStructure,
+    TParameterCollection,
+    dbsql_parameter_from_primitive,
+)
+from databricks.sql.thrift_api import load_ttypes
+from databricks.sql.utils import transform_paramstyle
+
+if TYPE_CHECKING:
+    from databricks.sql.client import Cursor
+    from databricks.sql.thrift_api.TCLIService.ttypes import TSparkParameter
+
+DEFAULT_PREPARED_OPERATION_CACHE_SIZE = 1024
+
+_INT_MIN, _INT_MAX = -2147483648, 2147483647
+
+
+def _string_binder(
+    cast_expr: str,
+) -> Callable[[Any, Optional[str], bool], TSparkParameter]:
+    def bind(value: Any, name: Optional[str], named: bool) -> TSparkParameter:
+        ttypes = load_ttypes()
+        return ttypes.TSparkParameter(
+            ordinal=not named,
+            name=name if named else None,
+            type=cast_expr,
+            value=ttypes.TSparkParameterValue(stringValue=str(value)),
+        )
+
+    return bind
+
+
+def _bind_int(value: int, name: Optional[str], named: bool) -> TSparkParameter:
+    ttypes = load_ttypes()
+    return ttypes.TSparkParameter(
+        ordinal=not named,
+        name=name if named else None,
+        type=(
+            DatabricksSupportedType.INT.name
+            if _INT_MIN <= value <= _INT_MAX
+            else DatabricksSupportedType.BIGINT.name
+        ),
+        value=ttypes.TSparkParameterValue(stringValue=str(value)),
+    )
+
+
+def _bind_none(value: None, name: Optional[str], named: bool) -> TSparkParameter:
+    return load_ttypes().TSparkParameter(
+        ordinal=not named,
+        name=name if named else None,
+        type=DatabricksSupportedType.VOID.name,
+    )
+
+
+# Builds the same TSparkParameter as dbsql_parameter_from_primitive(value).as_tspark_param()
+# for values of exactly these types. Subclasses, such as numpy or pandas scalars, and
+# other types take the general path.
+_BINDERS: Dict[type, Callable[[Any, Optional[str], bool], TSparkParameter]] = {
+    bool: _string_binder(DatabricksSupportedType.BOOLEAN.name),
+    int: _bind_int,
+    str: _string_binder(DatabricksSupportedType.STRING.name),
+    float: _string_binder(DatabricksSupportedType.DOUBLE.name),
+    datetime.datetime: _string_binder(DatabricksSupportedType.TIMESTAMP.name),
+    datetime.date: _string_binder(DatabricksSupportedType.DATE.name),
+    type(None): _bind_none,
+}
+
+
+def _bind_primitive(value: Any, name: Optional[str], named: bool) -> TSparkParameter:
+    binder = _BINDERS.get(type(value))
+    if binder is not None:
+        return binder(value, name, named)
+    return dbsql_parameter_from_primitive(value=value, name=name).as_tspark_param(
+        named=named
+    )
+
+
+def parameter_structure(parameters: TParameterCollection) -> ParameterStructure:
+    """Return whether `parameters` are bound by name or by position."""
+    if isinstance(parameters, dict):
+        return ParameterStructure.NAMED
+    if all(
+        isinstance(p, DbsqlParameterBase) and p.name is not None for p in parameters
+    ):
+        return ParameterStructure.NAMED
+    return ParameterStructure.POSITIONAL
+
+
+class PreparedOperation:
+    """
+    A statement rewritten for one parameter structure, and a binder for its values.
+
+    Attributes:
+        operation (str): The statement as given.
+        structure (ParameterStructure): Whether parameters are bound by name or position.
+        transformed (str): The statement with `%(name)s` markers rewritten as `:name`.
+    """
+
+    __slots__ = ("operation", "structure", "transformed")
+
+    def __init__(self, operation: str, structure: ParameterStructure):
+        self.operation = operation
+        self.structure = structure
+        # The paramstyle rewrite depends on the statement text alone
+        self.transformed = transform_paramstyle(operation, [], structure)
+
+    def bind(self, parameters: TParameterCollection) -> List[TSparkParameter]:
+        """Return the TSparkParameters to send with this statement for `parameters`."""
+        named = self.structure == ParameterStructure.NAMED
+        if isinstance(parameters, dict):
+            return [
+                _bind_primitive(value, name, named)
+                for name, value in parameters.items()
+            ]
+        return [
+            (
+                p.as_tspark_param(named=named)
+                if isinstance(p, DbsqlParameterBase)
+                else _bind_primitive(p, None, named)
+            )
+            for p in parameters
+        ]
+
+
+class PreparedOperationCache:
+    def __init__(self, max_size: int = DEFAULT_PREPARED_OPERATION_CACHE_SIZE):
+        """
+        A thread-safe LRU cache of PreparedOperations.
+
+        :param max_size: Maximum number of statements kept. 0 disables caching.
+        """
+        if max_size < 0:
+            raise ValueError("max_size must be >= 0")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: (
+            "OrderedDict[Tuple[str, ParameterStructure], PreparedOperation]"
+        ) = OrderedDict()
+
+    def get(self, operation: str, structure: ParameterStructure) -> PreparedOperation:
+        """Return the PreparedOperation for `operation`, preparing it on a miss."""
+        key = (operation, structure)
+        with self._lock:
+            prepared = self._entries.get(key)
+            if prepared is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return prepared
+            self.misses += 1
+
+        prepared = PreparedOperation(operation, structure)
+        if self.max_size:
+            with self._lock:
+                self._entries[key] = prepared
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return prepared
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PreparedStatement:
+    """
+    A statement prepared with `cursor.prepare(sql)`, to be executed repeatedly on that
+    cursor with different parameters.
+    """
+
+    def __init__(self, cursor: "Cursor", operation: str):
+        self.cursor = cursor
+        self.operation = operation
+        self._prepared: Dict[ParameterStructure, PreparedOperation] = {}
+
+    def prepared_operation(self, structure: ParameterStructure) -> PreparedOperation:
+        prepared = self._prepared.get(structure)
+        if prepared is None:
+            prepared = self._prepared[structure] = PreparedOperation(
+                self.operation, structure
+            )
+        return prepared
+
+    def execute(
+        self, parameters: Optional[TParameterCollection] = None, **kwargs
+    ) -> "Cursor":
+        """Run the statement with `parameters`, as `cursor.execute()` would."""
+        return self.cursor.execute(self, parameters, **kwargs)
+
+    def execute_async(
+        self, parameters: Optional[TParameterCollection] = None, **kwargs
+    ) -> "Cursor":
+        """Start the statement with `parameters`, as `cursor.execute_async()` would."""
+        return self.cursor.execute_async(self, parameters, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"PreparedStatement({self.operation!r})"
@@ -0,0 +1,232 @@
+"""
+Shared status polling for many statements executed with `Cursor.execute_async`.
+
+Waiting on each statement with `cursor.get_async_execution_result()` ties up a thread per
+statement and sends status polls with no regard for how many other statements are being
+polled. A `StatusPoller` instead polls every pending statement from a single background
+thread, spacing each statement's polls with its polling strategy and capping the total
+number of polls per second, and completes a `concurrent.futures.Future` per statement:
+
+```python
+cursors = []
+for query in queries:
+    cursor = connection.cursor()
+    cursor.execute_async(query)
+    cursors.append(cursor)
+
+futures = [connection.status_poller.submit(cursor) for cursor in cursors]
+for future in concurrent.futures.as_completed(futures):
+    print(future.result().fetchall())
+```
+
+Each future resolves to its cursor once the statement has finished and its result is
+ready to fetch. Fetching the first result batch, or running a staging transfer, happens on
+a small pool of collector threads, so that one slow result does not hold up the status
+polls of other statements. asyncio code can await `asyncio.wrap_future(future)`. One
+poller may be shared by cursors of different connections, e.g.
+`ConnectionPool.status_poller`.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+from databricks.sql.backend.types import CommandState
+from databricks.sql.common.polling import PollingStrategy
+from databricks.sql.exc import InterfaceError, ProgrammingError
+
+if TYPE_CHECKING:
+    from databricks.sql.client import Cursor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_POLLS_PER_SECOND = 20
+DEFAULT_MAX_COLLECT_WORKERS = 4
+
+
+class _PendingStatement:
+    def __init__(self, cursor: "Cursor", future: Future, intervals: Iterator[float]):
+        self.cursor = cursor
+        self.future = future
+        self.intervals = intervals
+
+
+class StatusPoller:
+    def __init__(
+        self,
+        polling_strategy: Optional[PollingStrategy] = None,
+        max_polls_per_second: float = DEFAULT_MAX_POLLS_PER_SECOND,
+        max_collect_workers: int = DEFAULT_MAX_COLLECT_WORKERS,
+    ):
+        """
+        Poll the status of submitted statements from one background thread.
+
+        :param polling_strategy: How long to wait between polls of one statement. Defaults
+            to the `polling_strategy` of each cursor's connection.
+        :param max_polls_per_second: Cap on status polls sent per second, summed over all
+            pending statements. When more statements are due than the cap allows, each
+            statement is simply polled less often.
+        :param max_collect_workers: Threads that fetch the results of finished
+            statements, off the polling thread.
+        """
+        if max_polls_per_second <= 0:
+            raise ValueError(
+                "max_polls_per_second must be > 0, got %s" % max_polls_per_second
+            )
+        if max_collect_workers < 1:
+            raise ValueError(
+                "max_collect_workers must be at least 1, got %s" % max_collect_workers
+            )
+        self.polling_strategy = polling_strategy
+        self.max_polls_per_second = max_polls_per_second
+        self.max_collect_workers = max_collect_workers
+        self.polls = 0
+
+        self._condition = threading.Condition()
+        self._schedule: List[Tuple[float, int, _PendingStatement]] = []
+        self._sequence = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._collector: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of statements still being polled."""
+        with self._condition:
+            return len(self._schedule)
+
+    def submit(self, cursor: "Cursor") -> Future:
+        """
+        Poll the statement last started with `cursor.execute_async()` until it finishes.
+
+        Returns a Future that resolves to `cursor`, with the result ready to fetch, or to
+        the error the statement failed with. Cancelling the future before it completes
+        cancels the statement.
+        """
+        if cursor.active_command_id is None:
+            raise ProgrammingError(
+                "No statement to wait for, call execute_async first",
+                host_url=cursor.connection.session.host,
+                session_id_hex=cursor.connection.get_session_id_hex(),
+            )
+        strategy = self.polling_strategy or cursor.connection.polling_strategy
+        pending = _PendingStatement(cursor, Future(), strategy.intervals())
+
+        with self._condition:
+            if self._closed:
+                raise InterfaceError("Cannot submit to a closed StatusPoller")
+            self._schedule_poll(pending, time.monotonic() + next(pending.intervals))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="databricks-sql-status-poller", daemon=True
+                )
+                self._thread.start()
+        return pending.future
+
+    def close(self) -> None:
+        """
+        Stop polling. Futures of statements still pending are cancelled; the statements
+        themselves keep running on the server. Results already being fetched still
+        complete their futures.
+        """
+        with self._condition:
+            self._closed = True
+            schedule, self._schedule = self._schedule, []
+            thread = self._thread
+            self._condition.notify_all()
+        for _, _, pending in schedule:
+            pending.future.cancel()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self._condition:
+            collector = self._collector
+        if collector is not None:
+            collector.shutdown(wait=False)
+
+    def _schedule_poll(self, pending: _PendingStatement, due: float) -> None:
+        heapq.heappush(self._schedule, (due, next(self._sequence), pending))
+        self._condition.notify()
+
+    def _run(self) -> None:
+        spacing = 1.0 / self.max_polls_per_second
+        next_poll_allowed = 0.0
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        return
+                    if not self._schedule:
+                        self._condition.wait()
+                        continue
+                    due = max(self._schedule[0][0], next_poll_allowed)
+                    now = time.monotonic()
+                    if due <= now:
+                        break
+                    self._condition.wait(due - now)
+                _, _, pending = heapq.heappop(self._schedule)
+
+            next_poll_allowed = time.monotonic() + spacing
+            self._poll(pending)
+
+    def _poll(self, pending: _PendingStatement) -> None:
+        cursor, future = pending.cursor, pending.future
+        if future.cancelled():
+            # A cursor closed by whoever cancelled the future has already been dealt with
+            if cursor.open:
+                self._cancel_statement(cursor)
+            return
+
+        try:
+            state = cursor.get_query_state()
+        except Exception as e:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(e)
+            return
+        self.polls += 1
+
+        if state in [CommandState.PENDING, CommandState.RUNNING]:
+            with self._condition:
+                if not self._closed:
+                    due = time.monotonic() + next(pending.intervals)
+                    self._schedule_poll(pending, due)
+                    return
+            future.cancel()
+            return
+
+        if not future.set_running_or_notify_cancel():
+            self._cancel_statement(cursor)
+            return
+        with self._condition:
+            if self._collector is None:
+                self._collector = ThreadPoolExecutor(
+                    max_workers=self.max_collect_workers,
+                    thread_name_prefix="databricks-sql-result-collector",
+                )
+            collector = self._collector
+        try:
+            collector.submit(self._collect, cursor, future, state)
+        except RuntimeError as e:
+            # The poller was closed from this thread
+            future.set_exception(e)
+
+    @staticmethod
+    def _collect(cursor: "Cursor", future: Future, state: CommandState) -> None:
+        try:
+            cursor._collect_async_execution_result(state)
+        except Exception as e:
+            future.set_exception(e)
+            return
+        future.set_result(cursor)
+
+    @staticmethod
+    def _cancel_statement(cursor: "Cursor") -> None:
+        try:
+            cursor.cancel()
+        except Exception as e:
+            logger.debug(
+                "Failed to cancel statement after its future was cancelled: %s", e
+            )
@@ -0,0 +1,436 @@
+"""
+Connection pooling.
+
+Opening a `Connection` creates an HTTP client, opens a server session and starts
+telemetry, which takes a few hundred milliseconds. `ConnectionPool` keeps open connections
+around so that short-lived units of work can borrow one instead:
+
+```python
+from databricks.sql.pool import ConnectionPool
+
+pool = ConnectionPool(server_hostname, http_path, access_token, max_size=8)
+
+with pool.connection() as connection:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+```
+
+Like any other `Connection`, a borrowed connection may be shared by several threads,
+each with its own cursors, but it must only be returned once they are all done with it.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from databricks.sql.client import Connection, _quote_identifier
+from databricks.sql.common.single_flight import SingleFlight
+from databricks.sql.exc import InterfaceError, OperationalError
+from databricks.sql.metadata_cache import MetadataCache
+from databricks.sql.result_cache import ResultCache
+from databricks.sql.poller import DEFAULT_MAX_POLLS_PER_SECOND, StatusPoller
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_MAX_SIZE = 10
+DEFAULT_POOL_MAX_LIFETIME_SECONDS = 3600
+DEFAULT_POOL_IDLE_TIMEOUT_SECONDS = 600
+DEFAULT_POOL_CHECKOUT_TIMEOUT_SECONDS = 30
+DEFAULT_POOL_VALIDATION_QUERY = "SELECT 1"
+DEFAULT_POOL_VALIDATION_INTERVAL_SECONDS = 30
+
+
+@dataclass
+class PoolMetrics:
+    """
+    A snapshot of a ConnectionPool's state and cumulative counters.
+
+    Attributes:
+        size (int): Open connections, idle plus checked out.
+        idle (int): Connections waiting in the pool.
+        in_use (int): Connections currently checked out.
+        waiting (int): Threads currently waiting for a connection.
+        checkouts (int): Successful checkouts so far.
+        connections_created (int): Connections opened by the pool so far.
+        connections_discarded (int): Connections closed by the pool so far (expired,
+            idle, failed validation or reset, or returned closed).
+        validation_failures (int): Connections that failed validation on checkout.
+        checkout_timeouts (int): Checkouts that gave up waiting for a connection.
+        total_wait_seconds (float): Time spent in checkout, summed over all checkouts.
+        max_wait_seconds (float): Longest time spent in a single checkout.
+    """
+
+    size: int = 0
+    idle: int = 0
+    in_use: int = 0
+    waiting: int = 0
+    checkouts: int = 0
+    connections_created: int = 0
+    connections_discarded: int = 0
+    validation_failures: int = 0
+    checkout_timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+
+class _PooledConnection:
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        server_hostname: str,
+        http_path: str,
+        access_token: Optional[str] = None,
+        min_size: int = 0,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        max_lifetime: Optional[float] = DEFAULT_POOL_MAX_LIFETIME_SECONDS,
+        idle_timeout: Optional[float] = DEFAULT_POOL_IDLE_TIMEOUT_SECONDS,
+        checkout_timeout: Optional[float] = DEFAULT_POOL_CHECKOUT_TIMEOUT_SECONDS,
+        validation_query: Optional[str] = DEFAULT_POOL_VALIDATION_QUERY,
+        validation_interval: float = DEFAULT_POOL_VALIDATION_INTERVAL_SECONDS,
+        reset_on_return: bool = True,
+        **kwargs,
+    ) -> None:
+        """
+        A thread-safe pool of connections to one Databricks SQL endpoint.
+
+        Connections are opened with `server_hostname`, `http_path`, `access_token` and
+        `**kwargs`, exactly as `databricks.sql.connect` would open them. With
+        `deduplicate_queries=True`, `result_cache=True` or `metadata_cache=True`, queries
+        are deduplicated or cached across all of the pool's connections rather than per
+        connection.
+
+        Parameters:
+            :param min_size: Connections opened up front and kept open even when idle.
+            :param max_size: Maximum number of open connections. Checkouts beyond this
+                wait for a connection to be returned.
+            :param max_lifetime: Seconds after which a connection is closed rather than
+                reused, or None to keep connections indefinitely.
+            :param idle_timeout: Seconds a connection may sit unused in the pool before it
+                is closed, as long as at least `min_size` remain, or None to never close
+                idle connections.
+            :param checkout_timeout: Seconds `checkout()` waits for a connection before
+                raising OperationalError, or None to wait indefinitely.
+            :param validation_query: Statement run on a connection before it is handed
+                out, to check that its session is still alive. A connection that fails
+                it is closed and replaced. None disables validation.
+            :param validation_interval: Connections used within this many seconds are
+                handed out without validation.
+            :param reset_on_return: Whether to reset the session when a connection is
+                returned. This rolls back an open transaction and closes its cursors.
+                If a `USE`, `SET` or `RESET` statement ran on the connection, it also
+                runs `RESET` and re-applies the connection's session configuration,
+                catalog and schema. A connection whose reset fails is closed.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1, got %s" % max_size)
+        if not 0 <= min_size <= max_size:
+            raise ValueError(
+                "min_size must be between 0 and max_size (%s), got %s"
+                % (max_size, min_size)
+            )
+
+        self.server_hostname = server_hostname
+        self.http_path = http_path
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.validation_query = validation_query
+        self.validation_interval = validation_interval
+        self.reset_on_return = reset_on_return
+        self._access_token = access_token
+        if kwargs.get("deduplicate_queries") is True:
+            # Identical queries on different pooled connections share one execution
+            kwargs["deduplicate_queries"] = SingleFlight()
+        if kwargs.get("result_cache") is True:
+            kwargs["result_cache"] = ResultCache()
+        if kwargs.get("metadata_cache") is True:
+            kwargs["metadata_cache"] = MetadataCache()
+        self._connect_kwargs = kwargs
+
+        self._condition = threading.Condition()
+        self._idle: List[_PooledConnection] = []
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._size = 0
+        self._closed = False
+        self._metrics = PoolMetrics()
+        self._status_poller: Optional[StatusPoller] = None
+
+        try:
+            for _ in range(min_size):
+                with self._condition:
+                    self._size += 1
+                self._idle.append(self._open_connection())
+        except Exception:
+            # Do not leave the sessions already opened behind
+            self.close()
+            raise
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Connection]:
+        """Check out a connection for the duration of a `with` block."""
+        connection = self.checkout(timeout)
+        try:
+            yield connection
+        finally:
+            self.checkin(connection)
+
+    def checkout(self, timeout: Optional[float] = None) -> Connection:
+        """
+        Borrow a connection from the pool, opening a new one if none is idle and the pool
+        is below `max_size`. Return it with `checkin()` when done.
+
+        :param timeout: Seconds to wait for a connection, overriding `checkout_timeout`.
+
+        Raises OperationalError if no connection becomes available in time and
+        InterfaceError if the pool is closed.
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        start_time = time.monotonic()
+        deadline = None if timeout is None else start_time + timeout
+
+        while True:
+            pooled = self._acquire(deadline)
+            if pooled is None:
+                pooled = self._open_connection()
+            elif not self._validate(pooled):
+                continue
+
+            waited = time.monotonic() - start_time
+            with self._condition:
+                self._in_use[id(pooled.connection)] = pooled
+                self._metrics.checkouts += 1
+                self._metrics.total_wait_seconds += waited
+                self._metrics.max_wait_seconds = max(
+                    self._metrics.max_wait_seconds, waited
+                )
+            return pooled.connection
+
+    def checkin(self, connection: Connection) -> None:
+        """Return a connection obtained from `checkout()` to the pool."""
+        with self._condition:
+            pooled = self._in_use.pop(id(connection), None)
+        if pooled is None:
+            raise ValueError("Connection was not checked out from this pool")
+
+        if not connection.open or self._closed or self._expired(pooled):
+            self._discard(pooled)
+            return
+
+        try:
+            self._reset(connection)
+        except Exception as e:
+            logger.warning("Discarding pooled connection that failed to reset: %s", e)
+            self._discard(pooled)
+            return
+
+        pooled.last_used_at = time.monotonic()
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    @property
+    def status_poller(self) -> StatusPoller:
+        """
+        A StatusPoller shared by cursors of all the pool's connections, so that statements
+        started with `execute_async()` on different connections are polled by one thread
+        under one poll rate cap. Wait for a statement's future before returning its
+        connection to the pool, since the cursor is closed on return.
+        """
+        with self._condition:
+            if self._status_poller is None:
+                self._status_poller = StatusPoller(
+                    max_polls_per_second=self._connect_kwargs.get(
+                        "max_status_polls_per_second", DEFAULT_MAX_POLLS_PER_SECOND
+                    )
+                )
+            return self._status_poller
+
+    def close(self) -> None:
+        """
+        Close all idle connections and stop handing out new ones. Connections still
+        checked out are closed when they are returned.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            status_poller, self._status_poller = self._status_poller, None
+            self._condition.notify_all()
+        if status_poller is not None:
+            status_poller.close()
+        for pooled in idle:
+            self._discard(pooled)
+
+    def metrics(self) -> PoolMetrics:
+        """Return a snapshot of the pool's size and counters."""
+        with self._condition:
+            self._metrics.size = self._size
+            self._metrics.idle = len(self._idle)
+            self._metrics.in_use = len(self._in_use)
+            return PoolMetrics(**vars(self._metrics))
+
+    def _acquire(self, deadline: Optional[float]) -> Optional[_PooledConnection]:
+        """
+        Take an idle connection, or reserve room for a new one (returning None), waiting
+        until `deadline` if the pool is at `max_size`.
+        """
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise InterfaceError("Cannot check out from a closed pool")
+                evicted = self._evict_idle()
+                if not evicted:
+                    if self._idle:
+                        # Most recently used first, so that surplus connections age out
+                        return self._idle.pop()
+                    if self._size < self.max_size:
+                        self._size += 1
+                        return None
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        self._metrics.checkout_timeouts += 1
+                        raise OperationalError(
+                            "Timed out waiting for a connection from the pool "
+                            f"(max_size={self.max_size})"
+                        )
+                    self._metrics.waiting += 1
+                    try:
+                        self._condition.wait(remaining)
+                    finally:
+                        self._metrics.waiting -= 1
+                    continue
+
+            # Close evicted connections outside the lock, then look again
+            for pooled in evicted:
+                self._discard(pooled)
+
+    def _evict_idle(self) -> List[_PooledConnection]:
+        """Remove expired connections and, above `min_size`, idle ones. Call with the
+        lock held; the caller closes the returned connections."""
+        now = time.monotonic()
+        evicted = []
+        for pooled in list(self._idle):
+            idle_too_long = (
+                self.idle_timeout is not None
+                and now - pooled.last_used_at > self.idle_timeout
+                and self._size - len(evicted) > self.min_size
+            )
+            if idle_too_long or self._expired(pooled, now):
+                self._idle.remove(pooled)
+                evicted.append(pooled)
+        return evicted
+
+    def _expired(self, pooled: _PooledConnection, now: Optional[float] = None) -> bool:
+        if self.max_lifetime is None:
+            return False
+        now = time.monotonic() if now is None else now
+        return now - pooled.created_at > self.max_lifetime
+
+    def _open_connection(self) -> _PooledConnection:
+        """Open a connection for a slot already counted in `_size`."""
+        try:
+            connection = Connection(
+                self.server_hostname,
+                self.http_path,
+                self._access_token,
+                **self._connect_kwargs,
+            )
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._metrics.connections_created += 1
+        return _PooledConnection(connection)
+
+    def _discard(self, pooled: _PooledConnection) -> None:
+        try:
+            if pooled.connection.open:
+                pooled.connection.close()
+        except Exception as e:
+            logger.debug("Closing a discarded pooled connection raised: %s", e)
+        with self._condition:
+            self._size -= 1
+            self._metrics.connections_discarded += 1
+            self._condition.notify()
+
+    def _validate(self, pooled: _PooledConnection) -> bool:
+        """Check an idle connection before handing it out, discarding it if it fails."""
+        if not pooled.connection.open:
+            self._discard(pooled)
+            return False
+        if (
+            self.validation_query is None
+            or time.monotonic() - pooled.last_used_at < self.validation_interval
+        ):
+            return True
+        try:
+            with pooled.connection.cursor() as cursor:
+                cursor.execute(self.validation_query)
+                cursor.fetchall()
+            return True
+        except Exception as e:
+            logger.info("Discarding pooled connection that failed validation: %s", e)
+            with self._condition:
+                self._metrics.validation_failures += 1
+            self._discard(pooled)
+            return False
+
+    def _reset(self, connection: Connection) -> None:
+        with connection._cursors_lock:
+            cursors, connection._cursors = connection._cursors, []
+        for cursor in cursors:
+            cursor.close()
+
+        if not self.reset_on_return:
+            return
+
+        if not connection.ignore_transactions and not connection.autocommit:
+            connection.rollback()
+            connection.autocommit = True
+
+        # Only a USE, SET or RESET statement can have moved the session away from the
+        # configuration, catalog and schema it was opened with
+        if not connection._session_state_changed:
+            return
+
+        session = connection.session
+        statements = ["RESET"]
+        for key, value in (session.session_configuration or {}).items():
+            statements.append(
+                f"SET {_quote_identifier(key)} = {_quote_identifier(value)}"
+            )
+        if session.catalog:
+            statements.append(f"USE CATALOG {_quote_identifier(session.catalog)}")
+        if session.schema:
+            statements.append(f"USE SCHEMA {_quote_identifier(session.schema)}")
+
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+        with connection._cursors_lock:
+            connection._cursors.clear()
+        connection._session_state_changed = False
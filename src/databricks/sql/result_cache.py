@@ -0,0 +1,445 @@
+"""
+Client-side cache of query results.
+
+With `databricks.sql.connect(..., result_cache=ResultCache())`, the result of a read-only
+query run with `cursor.execute()` is kept as Arrow IPC, and running the same query again
+(same statement text, parameters, catalog, schema, session configuration, query tags and
+credentials) within its time to live is answered from the cache without contacting the
+server:
+
+```python
+from databricks.sql.result_cache import ResultCache
+
+cache = ResultCache(max_memory_bytes=512 * 1024 * 1024, ttl=600, disk_path="/tmp/dbsql")
+with sql.connect(server_hostname, http_path, access_token, result_cache=cache) as connection:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT * FROM sales WHERE region = :region", {"region": "EU"})
+        cursor.execute("SELECT * FROM sales", cache_ttl=60)  # cache for one minute
+        cursor.execute("SELECT * FROM sales", bypass_cache=True)  # always run it
+```
+
+A result can also be tied to the versions of the Delta tables it was read from, with
+`cache_depends_on`. Such an entry does not expire by default; instead, each lookup
+compares the versions it recorded with the tables' current versions, read with
+`DESCRIBE HISTORY <table> LIMIT 1`, and drops the entry once any of them has changed:
+
+```python
+# Versions looked up when the query runs
+cursor.execute("SELECT * FROM main.sales.orders", cache_depends_on=["main.sales.orders"])
+# Versions the caller already knows
+cursor.execute(query, cache_depends_on={"main.sales.orders": 42})
+```
+
+Current versions are remembered for `version_check_interval` seconds, and the versions a
+lookup is missing are fetched together, concurrently, so that lookups of many entries
+share a few metadata queries. `connection.revalidate_result_cache()` checks every such
+entry at once.
+
+Entries are kept in memory, least recently used first out, up to `max_memory_bytes`.
+With `disk_path`, entries pushed out of memory are written to disk as Arrow IPC streams
+and memory-mapped when read.
+
+Once a `USE`, `SET` or `RESET` statement has run on a connection, its session may no longer
+match the catalog, schema and configuration it was opened with, so its queries neither
+use nor fill the cache. A `ConnectionPool` restores the session when such a connection is
+returned.
+
+A cache may be shared between connections. Entries are keyed by a digest of each
+connection's credential parameters, such as its access token or credentials provider, so
+connections with different parameters do not see each other's results. The parameters do
+not always identify the principal, though: two connections opened with the same OAuth
+parameters may have signed in as different users. Only share a cache between connections
+that run as the same principal.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESULT_CACHE_MAX_MEMORY_BYTES = 256 * 1024 * 1024
+DEFAULT_RESULT_CACHE_MAX_DISK_BYTES = 1024 * 1024 * 1024
+DEFAULT_RESULT_CACHE_TTL_SECONDS = 300
+DEFAULT_VERSION_CHECK_INTERVAL_SECONDS = 1.0
+
+# Given table names, returns each one's current Delta version, or None if it is unknown
+TableVersionFetcher = Callable[[List[str]], Mapping[str, Optional[int]]]
+
+
+@dataclass
+class ResultCacheMetrics:
+    """
+    A snapshot of a ResultCache's contents and cumulative counters.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        disk_hits (int): Hits answered from the disk tier, included in `hits`.
+        misses (int): Lookups that found no live entry.
+        evictions (int): Entries dropped from a tier to stay within its size bound.
+        expirations (int): Entries dropped because their time to live ran out.
+        invalidations (int): Entries dropped because a table they were read from changed.
+        version_checks (int): Batches of table version lookups sent to the server.
+        memory_entries (int): Entries currently in memory.
+        memory_bytes (int): Size of the entries currently in memory.
+        disk_entries (int): Entries currently on disk.
+        disk_bytes (int): Size of the entries currently on disk.
+    """
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    version_checks: int = 0
+    memory_entries: int = 0
+    memory_bytes: int = 0
+    disk_entries: int = 0
+    disk_bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Entry:
+    def __init__(
+        self,
+        description: List[Tuple],
+        expires_at: float,
+        size: int,
+        table_versions: Optional[Dict[str, int]] = None,
+    ):
+        self.description = description
+        self.expires_at = expires_at
+        self.size = size
+        # The Delta table versions the result was read from, checked on every lookup
+        self.table_versions = table_versions
+        # An Arrow IPC stream in memory, or the path of a file holding it on disk
+        self.buffer: Optional["pyarrow.Buffer"] = None
+        self.path: Optional[str] = None
+
+
+class ResultCache:
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_RESULT_CACHE_MAX_MEMORY_BYTES,
+        ttl: float = DEFAULT_RESULT_CACHE_TTL_SECONDS,
+        disk_path: Optional[str] = None,
+        max_disk_bytes: int = DEFAULT_RESULT_CACHE_MAX_DISK_BYTES,
+        version_check_interval: float = DEFAULT_VERSION_CHECK_INTERVAL_SECONDS,
+    ):
+        """
+        A thread-safe, size-bounded cache of query results stored as Arrow IPC.
+
+        :param max_memory_bytes: Upper bound on the size of the results held in memory.
+        :param ttl: Seconds a result stays valid, unless a different `cache_ttl` is given
+            to `cursor.execute()`.
+        :param disk_path: Directory for a second tier that holds results pushed out of
+            memory. Results read from it are memory-mapped rather than loaded. None keeps
+            results in memory only.
+        :param max_disk_bytes: Upper bound on the size of the results held on disk.
+        :param version_check_interval: Seconds a table's current Delta version is trusted
+            before it is looked up again, when validating entries that depend on it.
+        """
+        if pyarrow is None:
+            raise ImportError("ResultCache requires pyarrow to be installed")
+        if max_memory_bytes < 0 or max_disk_bytes < 0:
+            raise ValueError("Cache size bounds must be >= 0")
+
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl = ttl
+        self.disk_path = disk_path
+        self.version_check_interval = version_check_interval
+        if disk_path is not None:
+            os.makedirs(disk_path, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._disk: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._metrics = ResultCacheMetrics()
+        # Table name -> (current version, monotonic time it was looked up)
+        self._table_versions: Dict[str, Tuple[Optional[int], float]] = {}
+
+    @staticmethod
+    def _digest(key: Hashable) -> str:
+        return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        key: Hashable,
+        fetch_table_versions: Optional[TableVersionFetcher] = None,
+    ) -> Optional[Tuple["pyarrow.Table", List[Tuple]]]:
+        """
+        Return the cached `(table, description)` for `key`, or None.
+
+        :param fetch_table_versions: Looks up current Delta table versions, to validate an
+            entry stored with `table_versions`. Without it, such entries are not returned.
+        """
+        digest = self._digest(key)
+        with self._lock:
+            entry, tier = self._find(digest)
+            if entry is None:
+                self._metrics.misses += 1
+                return None
+            recorded = entry.table_versions
+
+        if recorded:
+            if fetch_table_versions is None:
+                with self._lock:
+                    self._metrics.misses += 1
+                return None
+            current = self.current_table_versions(recorded, fetch_table_versions)
+            if not self._versions_match(recorded, current):
+                with self._lock:
+                    if tier.get(digest) is entry:
+                        self._remove(digest, tier)
+                        self._metrics.invalidations += 1
+                    self._metrics.misses += 1
+                return None
+
+        with self._lock:
+            if tier.get(digest) is not entry:
+                # Replaced, moved to disk or dropped while its versions were checked
+                self._metrics.misses += 1
+                return None
+            # Reading an IPC stream from a buffer or memory map does not copy the data,
+            # so this is cheap enough to do under the lock
+            if entry.buffer is not None:
+                table = pyarrow.ipc.open_stream(entry.buffer).read_all()
+            else:
+                table = pyarrow.ipc.open_stream(
+                    pyarrow.memory_map(entry.path)
+                ).read_all()
+                self._metrics.disk_hits += 1
+            tier.move_to_end(digest)
+            self._metrics.hits += 1
+            return table, entry.description
+
+    def put(
+        self,
+        key: Hashable,
+        table: "pyarrow.Table",
+        description: List[Tuple],
+        ttl: Optional[float] = None,
+        table_versions: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        """
+        Cache `table` and its column `description` under `key` for `ttl` seconds.
+
+        :param table_versions: The Delta version of each table the result was read from.
+            The entry is dropped once any of these tables has a newer version, and does
+            not expire unless `ttl` is given.
+        """
+        if ttl is None:
+            ttl = float("inf") if table_versions else self.ttl
+        if ttl <= 0:
+            return
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        buffer = sink.getvalue()
+
+        entry = _Entry(
+            description,
+            time.monotonic() + ttl,
+            buffer.size,
+            dict(table_versions) if table_versions else None,
+        )
+        entry.buffer = buffer
+        digest = self._digest(key)
+        with self._lock:
+            self._remove(digest, self._memory)
+            self._remove(digest, self._disk)
+            self._memory[digest] = entry
+            self._memory_bytes += entry.size
+            demoted = self._shrink_memory()
+
+        for demoted_digest, demoted_entry in demoted:
+            self._write_to_disk(demoted_digest, demoted_entry)
+
+    def current_table_versions(
+        self, tables: Iterable[str], fetch_table_versions: TableVersionFetcher
+    ) -> Dict[str, Optional[int]]:
+        """
+        Return the current Delta version of each of `tables`, or None where it is unknown.
+
+        Versions looked up less than `version_check_interval` seconds ago are reused. The
+        rest are passed to `fetch_table_versions` in a single call.
+        """
+        tables = list(dict.fromkeys(tables))
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                table
+                for table in tables
+                if table not in self._table_versions
+                or self._table_versions[table][1] + self.version_check_interval <= now
+            ]
+        if stale:
+            fetched = fetch_table_versions(stale)
+            with self._lock:
+                self._metrics.version_checks += 1
+                for table in stale:
+                    self._table_versions[table] = (fetched.get(table), now)
+        with self._lock:
+            return {table: self._table_versions[table][0] for table in tables}
+
+    def revalidate(self, fetch_table_versions: TableVersionFetcher) -> int:
+        """
+        Check every entry stored with `table_versions` against its tables' current
+        versions, looked up in one batch, and drop those that are out of date.
+        `Connection.revalidate_result_cache()` calls this with a fetcher that reads the
+        versions through the connection.
+
+        :returns the number of entries dropped.
+        """
+        with self._lock:
+            versioned = [
+                (digest, entry, tier)
+                for tier in (self._memory, self._disk)
+                for digest, entry in tier.items()
+                if entry.table_versions
+            ]
+        if not versioned:
+            return 0
+
+        current = self.current_table_versions(
+            (table for _, entry, _ in versioned for table in entry.table_versions),
+            fetch_table_versions,
+        )
+        dropped = 0
+        with self._lock:
+            for digest, entry, tier in versioned:
+                if not self._versions_match(entry.table_versions, current):
+                    if tier.get(digest) is entry:
+                        self._remove(digest, tier)
+                        self._metrics.invalidations += 1
+                        dropped += 1
+        return dropped
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the entry for `key`, if any."""
+        digest = self._digest(key)
+        with self._lock:
+            self._remove(digest, self._memory)
+            self._remove(digest, self._disk)
+
+    def clear(self) -> None:
+        """Drop every entry, deleting the disk tier's files."""
+        with self._lock:
+            for digest in list(self._memory):
+                self._remove(digest, self._memory)
+            for digest in list(self._disk):
+                self._remove(digest, self._disk)
+            self._table_versions.clear()
+
+    def metrics(self) -> ResultCacheMetrics:
+        """Return a snapshot of the cache's size and counters."""
+        with self._lock:
+            self._metrics.memory_entries = len(self._memory)
+            self._metrics.memory_bytes = self._memory_bytes
+            self._metrics.disk_entries = len(self._disk)
+            self._metrics.disk_bytes = self._disk_bytes
+            return ResultCacheMetrics(**vars(self._metrics))
+
+    def _find(self, digest: str) -> Tuple[Optional[_Entry], "OrderedDict[str, _Entry]"]:
+        """Return the live entry for `digest` and its tier, dropping it if expired."""
+        entry, tier = self._memory.get(digest), self._memory
+        if entry is None:
+            entry, tier = self._disk.get(digest), self._disk
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(digest, tier)
+            self._metrics.expirations += 1
+            entry = None
+        return entry, tier
+
+    @staticmethod
+    def _versions_match(
+        recorded: Mapping[str, int], current: Mapping[str, Optional[int]]
+    ) -> bool:
+        return all(
+            current.get(table) is not None and current[table] == version
+            for table, version in recorded.items()
+        )
+
+    def _remove(self, digest: str, tier: "OrderedDict[str, _Entry]") -> None:
+        entry = tier.pop(digest, None)
+        if entry is None:
+            return
+        if tier is self._memory:
+            self._memory_bytes -= entry.size
+        else:
+            self._disk_bytes -= entry.size
+            self._delete_file(entry.path)
+
+    def _shrink_memory(self) -> List[Tuple[str, _Entry]]:
+        """
+        Drop least recently used entries until memory is within its bound, returning
+        those that should move to the disk tier.
+        """
+        demoted = []
+        while self._memory_bytes > self.max_memory_bytes and self._memory:
+            digest, entry = self._memory.popitem(last=False)
+            self._memory_bytes -= entry.size
+            if self.disk_path is not None and entry.size <= self.max_disk_bytes:
+                demoted.append((digest, entry))
+            else:
+                self._metrics.evictions += 1
+        return demoted
+
+    def _write_to_disk(self, digest: str, entry: _Entry) -> None:
+        path = os.path.join(
+            self.disk_path, "dbsql-result-%s-%s.arrow" % (digest, uuid.uuid4().hex)
+        )
+        try:
+            with open(path, "wb") as f:
+                f.write(entry.buffer)
+        except OSError as e:
+            logger.warning("Could not move a cached result to disk: %s", e)
+            self._delete_file(path)
+            with self._lock:
+                self._metrics.evictions += 1
+            return
+
+        on_disk = _Entry(
+            entry.description, entry.expires_at, entry.size, entry.table_versions
+        )
+        on_disk.path = path
+        with self._lock:
+            if digest in self._memory or digest in self._disk:
+                # Cached again while it was being written
+                self._delete_file(path)
+                return
+            self._disk[digest] = on_disk
+            self._disk_bytes += on_disk.size
+            while self._disk_bytes > self.max_disk_bytes and self._disk:
+                evicted_digest = next(iter(self._disk))
+                self._remove(evicted_digest, self._disk)
+                self._metrics.evictions += 1
+
+    @staticmethod
+    def _delete_file(path: Optional[str]) -> None:
+        if path is None:
+            return
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.debug("Could not delete cached result file %s: %s", path, e)
@@ -4,7 +4,6 @@ from abc import ABC, abstractmethod
 from typing import List, Optional, TYPE_CHECKING, Tuple
 
 import logging
-import pandas
 
 try:
     import pyarrow
@@ -17,7 +16,9 @@ if TYPE_CHECKING:
 from databricks.sql.backend.databricks_client import DatabricksClient
 from databricks.sql.types import Row
 from databricks.sql.exc import RequestError, CursorAlreadyClosedError
+from databricks.sql.operation_closer import OperationCloser
 from databricks.sql.utils import (
+    ArrowQueue,
     ColumnTable,
     ColumnQueue,
     concat_table_chunks,
@@ -103,6 +104,8 @@ class ResultSet(ABC):
                 ResultRow(*[v.as_py() for v in r]) for r in zip(*table.itercolumns())
             ]
 
+        import pandas
+
         # Need to use nullable types, as otherwise type can change when there are missing values.
         # See https://arrow.apache.org/docs/python/pandas.html#nullable-types
         # NOTE: This api is epxerimental https://pandas.pydata.org/pandas-docs/stable/user_guide/integer_na.html
@@ -172,6 +175,7 @@ class ResultSet(ABC):
 
         If the connection has not been closed, and the result set has not already
         been closed on the server for some other reason, issue a request to the server to close it.
+        When the connection has an operation closer, the request is sent in the background.
         """
         try:
             if self.results is not None:
@@ -184,7 +188,11 @@ class ResultSet(ABC):
                 and not self.has_been_closed_server_side
                 and self.connection.open
             ):
-                self.backend.close_command(self.command_id)
+                operation_closer = getattr(self.connection, "operation_closer", None)
+                if isinstance(operation_closer, OperationCloser):
+                    operation_closer.submit(self.backend, self.command_id)
+                else:
+                    self.backend.close_command(self.command_id)
         except RequestError as e:
             if isinstance(e.args[1], CursorAlreadyClosedError):
                 logger.info("Operation was canceled by a prior request")
@@ -471,3 +479,60 @@ class ThriftResultSet(ResultSet):
             (column.name, map_col_type(column.datatype), None, None, None, None, None)
             for column in table_schema_message.columns
         ]
+
+
+class ArrowTableResultSet(ResultSet):
+    """
+    ResultSet over a result that has already been fetched into a pyarrow Table.
+
+    Fetching only moves this result set's own position in the table, so several
+    ArrowTableResultSets can read the same table independently. The statement that
+    produced the table is already closed on the server.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        backend: DatabricksClient,
+        table: "pyarrow.Table",
+        command_id: CommandId,
+        description: List[Tuple],
+        arraysize: int = 10000,
+        buffer_size_bytes: int = 104857600,
+        num_modified_rows: Optional[int] = None,
+    ):
+        super().__init__(
+            connection=connection,
+            backend=backend,
+            arraysize=arraysize,
+            buffer_size_bytes=buffer_size_bytes,
+            command_id=command_id,
+            status=CommandState.SUCCEEDED,
+            has_been_closed_server_side=True,
+            has_more_rows=False,
+            results_queue=ArrowQueue(table, table.num_rows),
+            description=description,
+            num_modified_rows=num_modified_rows,
+        )
+
+    def fetchmany_arrow(self, size: int) -> "pyarrow.Table":
+        if size < 0:
+            raise ValueError("size argument for fetchmany is %s but must be >= 0", size)
+        results = self.results.next_n_rows(size)
+        self._next_row_index += results.num_rows
+        return results
+
+    def fetchall_arrow(self) -> "pyarrow.Table":
+        results = self.results.remaining_rows()
+        self._next_row_index += results.num_rows
+        return results
+
+    def fetchone(self) -> Optional[Row]:
+        res = self._convert_arrow_table(self.fetchmany_arrow(1))
+        return res[0] if res else None
+
+    def fetchmany(self, size: int) -> List[Row]:
+        return self._convert_arrow_table(self.fetchmany_arrow(size))
+
+    def fetchall(self) -> List[Row]:
+        return self._convert_arrow_table(self.fetchall_arrow())
@@ -1,8 +1,9 @@
 import logging
 import re
+import sys
 from typing import Dict, Tuple, List, Optional, Any, Type
 
-from databricks.sql.thrift_api.TCLIService import ttypes
+from databricks.sql.thrift_api import load_ttypes
 from databricks.sql.types import SSLOptions
 from databricks.sql.auth.auth import get_python_sql_connector_auth_provider
 from databricks.sql.auth.authenticators import AccessTokenAuthProvider
@@ -10,8 +11,6 @@ from databricks.sql.auth.common import ClientContext
 from databricks.sql.exc import SessionAlreadyClosedError, DatabaseError, RequestError
 from databricks.sql import __version__
 from databricks.sql import USER_AGENT_NAME
-from databricks.sql.backend.thrift_backend import ThriftDatabricksClient
-from databricks.sql.backend.sea.backend import SeaDatabricksClient
 from databricks.sql.backend.databricks_client import DatabricksClient
 from databricks.sql.backend.types import SessionId, BackendType
 from databricks.sql.common.unified_http_client import UnifiedHttpClient
@@ -20,6 +19,18 @@ from databricks.sql.common.agent import detect as detect_agent
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    # The Thrift backend and its generated types are imported when the first Thrift
+    # session is opened, while `session.ThriftDatabricksClient` still resolves as if it
+    # had been imported here
+    if name == "ThriftDatabricksClient":
+        from databricks.sql.backend.thrift_backend import ThriftDatabricksClient
+
+        globals()[name] = ThriftDatabricksClient
+        return ThriftDatabricksClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class Session:
     def __init__(
         self,
@@ -220,11 +231,16 @@ class Session:
 
         databricks_client_class: Type[DatabricksClient]
         if self.use_sea:
+            from databricks.sql.backend.sea.backend import SeaDatabricksClient
+
             logger.debug("Creating SEA backend client")
             databricks_client_class = SeaDatabricksClient
         else:
             logger.debug("Creating Thrift backend client")
-            databricks_client_class = ThriftDatabricksClient
+            # Looked up on the module so that the backend is imported on first use
+            databricks_client_class = getattr(
+                sys.modules[__name__], "ThriftDatabricksClient"
+            )
 
         common_args = {
             "server_hostname": server_hostname,
@@ -328,6 +344,7 @@ class Session:
 
     @staticmethod
     def server_parameterized_queries_enabled(protocolVersion):
+        ttypes = load_ttypes()
         if (
             protocolVersion
             and protocolVersion >= ttypes.TProtocolVersion.SPARK_CLI_SERVICE_PROTOCOL_V8
@@ -394,3 +411,6 @@ class Session:
             logger.error("Attempt to close session raised a local exception: %s", e)
 
         self.is_open = False
+        if self.auth_provider is not None:
+            # Stops refreshing tokens in the background
+            self.auth_provider.close()
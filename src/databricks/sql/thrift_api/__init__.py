@@ -0,0 +1,20 @@
+from types import ModuleType
+from typing import Optional
+
+_ttypes: Optional[ModuleType] = None
+
+
+def load_ttypes() -> ModuleType:
+    """
+    Return the generated `TCLIService.ttypes` module, importing it on first use.
+
+    The module takes a few hundred milliseconds to import, so code outside the Thrift
+    backend that builds or reads Thrift structs calls this instead of importing it at
+    module level. Once imported, the call costs no more than a global lookup.
+    """
+    global _ttypes
+    if _ttypes is None:
+        from databricks.sql.thrift_api.TCLIService import ttypes
+
+        _ttypes = ttypes
+    return _ttypes
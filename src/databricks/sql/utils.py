@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple, Union, Sequence
+from typing import Any, Dict, List, Optional, Tuple, Union, Sequence, TYPE_CHECKING
 
 from dateutil import parser
 import datetime
@@ -21,15 +21,21 @@ except ImportError:
 from databricks.sql import OperationalError
 from databricks.sql.exc import ProgrammingError
 from databricks.sql.cloudfetch.download_manager import ResultFileDownloadManager
-from databricks.sql.thrift_api.TCLIService.ttypes import (
-    TRowSet,
-    TSparkArrowResultLink,
-    TSparkRowSetType,
-)
 from databricks.sql.types import SSLOptions
 from databricks.sql.backend.types import CommandId
 from databricks.sql.telemetry.models.event import StatementType
-from databricks.sql.parameters.native import ParameterStructure, TDbsqlParameter
+from databricks.sql.parameters.native import (
+    ParameterStructure,
+    TDbsqlParameter,
+    array_like_to_list,
+)
+
+if TYPE_CHECKING:
+    from databricks.sql.thrift_api.TCLIService.ttypes import (
+        TRowSet,
+        TSparkArrowResultLink,
+        TSparkRowSetType,
+    )
 
 import logging
 
@@ -98,6 +104,7 @@ class ThriftResultSetQueueFactory(ABC):
         Returns:
             ResultSetQueue
         """
+        from databricks.sql.thrift_api.TCLIService.ttypes import TSparkRowSetType
 
         if row_set_type == TSparkRowSetType.ARROW_BASED_SET:
             arrow_table, n_valid_rows = convert_arrow_based_set_to_arrow_table(
@@ -567,10 +574,39 @@ class ParamEscaper:
         return "'{}'".format(item.replace("\\", "\\\\").replace("'", "\\'"))
 
     def escape_sequence(self, item):
+        escaped = self._escape_homogeneous_sequence(item)
+        if escaped is not None:
+            return "ARRAY(" + escaped + ")"
         l = map(self.escape_item, item)
         l = list(map(str, l))
         return "ARRAY(" + ",".join(l) + ")"
 
+    def _escape_homogeneous_sequence(self, item) -> Optional[str]:
+        """Escape a sequence whose elements are all strs, or all ints, floats or bools,
+        with one pass over the whole sequence rather than one escape_item call per
+        element. Returns None for any other sequence, or if a subclass changes how
+        elements are escaped.
+        """
+        if (
+            type(self).escape_item is not ParamEscaper.escape_item
+            or type(self).escape_string is not ParamEscaper.escape_string
+            or type(self).escape_number is not ParamEscaper.escape_number
+        ):
+            return None
+        element_types = set(map(type, item))
+        if not element_types:
+            return None
+        if element_types <= {int, float, bool}:
+            return ",".join(map(str, item))
+        if element_types == {str}:
+            # Escape all the strings at once, joined by a character that none contains
+            joined = "\x00".join(item)
+            if joined.count("\x00") != len(item) - 1:
+                return None
+            joined = joined.replace("\\", "\\\\").replace("'", "\\'")
+            return "'" + joined.replace("\x00", "','") + "'"
+        return None
+
     def escape_mapping(self, item):
         l = map(
             self.escape_item,
@@ -604,8 +640,10 @@ class ParamEscaper:
             return self.escape_sequence(item)
         elif isinstance(item, Mapping):
             return self.escape_mapping(item)
-        else:
-            raise ProgrammingError("Unsupported object {}".format(item))
+        elements = array_like_to_list(item)
+        if elements is not None:
+            return self.escape_sequence(elements)
+        raise ProgrammingError("Unsupported object {}".format(item))
 
 
 def inject_parameters(operation: str, parameters: Dict[str, str]):
@@ -702,6 +740,79 @@ def transform_paramstyle(
     return output
 
 
+# Matches a single-row `INSERT INTO <target> VALUES (<row>)` statement. The row
+# group is validated separately by _is_single_parenthesized_group.
+_INSERT_VALUES_REGEX = re.compile(
+    r"^\s*(INSERT\s+INTO\s+.+?\s+VALUES)\s*(\(.*\))\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+# A `:name` marker that is neither part of a `::` cast nor preceded by a word
+# character (e.g. a timestamp literal like `12:30`).
+_NAMED_MARKER_REGEX = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+# Quotes and comments make marker detection ambiguous, so rows containing them
+# are never rewritten.
+_UNSAFE_VALUES_ROW_REGEX = re.compile(r"['\"`]|--|/\*")
+
+
+def _is_single_parenthesized_group(text: str) -> bool:
+    """Return True if `text` is one balanced `( ... )` group, e.g. `(?, ?)` but
+    not `(?), (?)`."""
+    depth = 0
+    for i, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0 and i != len(text) - 1:
+                return False
+        if depth < 0:
+            return False
+    return depth == 0
+
+
+def split_insert_values_operation(operation: str) -> Optional[Tuple[str, str]]:
+    """Split a single-row `INSERT INTO ... VALUES (...)` statement into its prefix and
+    its VALUES row, so that the row can be repeated to build a multi-row statement.
+
+    ```
+    "INSERT INTO t (a, b) VALUES (:a, :b)"
+    ```
+
+    Yields
+
+    ```
+    ("INSERT INTO t (a, b) VALUES", "(:a, :b)")
+    ```
+
+    Returns None for any other statement shape, for rows that contain quotes or
+    comments, and for statements with parameter markers outside the VALUES row.
+    """
+
+    match = _INSERT_VALUES_REGEX.match(operation)
+    if match is None:
+        return None
+
+    prefix, row = match.group(1), match.group(2)
+    if not _is_single_parenthesized_group(row):
+        return None
+    if _UNSAFE_VALUES_ROW_REGEX.search(row):
+        return None
+    if "?" in prefix or _NAMED_MARKER_REGEX.search(prefix):
+        return None
+
+    return prefix, row
+
+
+def named_markers(operation: str) -> List[str]:
+    """Return the names of all `:name` parameter markers in `operation`, in order."""
+    return _NAMED_MARKER_REGEX.findall(operation)
+
+
+def rename_named_markers(operation: str, suffix: str) -> str:
+    """Append `suffix` to the name of every `:name` parameter marker in `operation`."""
+    return _NAMED_MARKER_REGEX.sub(lambda m: f":{m.group(1)}{suffix}", operation)
+
+
 def create_arrow_table_from_arrow_file(
     file_bytes: bytes, description
 ) -> "pyarrow.Table":
@@ -1007,4 +1118,5 @@ def build_client_context(server_hostname: str, version: str, **kwargs):
         telemetry_circuit_breaker_enabled=kwargs.get(
             "_telemetry_circuit_breaker_enabled"
         ),
+        share_connection_pools=kwargs.get("_share_connection_pools"),
     )
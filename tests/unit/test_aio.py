@@ -0,0 +1,233 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+import databricks.sql.aio as aio
+from databricks.sql.auth.authenticators import AuthProvider
+from databricks.sql.backend.sea.backend import SeaDatabricksClient
+from databricks.sql.backend.types import CommandId, CommandState
+from databricks.sql.client import Cursor
+from databricks.sql.common.polling import (
+    ExponentialBackoffPolling,
+    FixedIntervalPolling,
+)
+from databricks.sql.exc import OperationalError, ServerOperationError
+from databricks.sql.types import SSLOptions
+
+
+def make_cursor(states, rows=()):
+    """A sync Cursor stand-in whose query moves through `states` one poll at a time."""
+    cursor = Mock()
+    cursor.arraysize = 2
+    cursor.get_query_state.side_effect = list(states)
+    remaining = list(rows)
+
+    def fetchmany(size):
+        batch = remaining[:size]
+        del remaining[:size]
+        return batch
+
+    cursor.fetchmany.side_effect = fetchmany
+    return cursor
+
+
+def make_connection(cursor, polling_strategy=FixedIntervalPolling(0)):
+    connection = MagicMock()
+    connection.polling_strategy = polling_strategy
+    connection.cursor.return_value = cursor
+    return aio.AsyncConnection(connection)
+
+
+class TestAsyncCursor:
+    def test_execute_polls_until_done_then_collects_result(self):
+        cursor = make_cursor(
+            [CommandState.PENDING, CommandState.RUNNING, CommandState.SUCCEEDED]
+        )
+        connection = make_connection(cursor)
+
+        async def run():
+            async_cursor = connection.cursor()
+            assert await async_cursor.execute("SELECT 1") is async_cursor
+
+        asyncio.run(run())
+
+        cursor.execute_async.assert_called_once()
+        assert cursor.execute_async.call_args[0] == ("SELECT 1", None)
+        assert cursor.get_query_state.call_count == 3
+        cursor._collect_async_execution_result.assert_called_once_with(
+            CommandState.SUCCEEDED
+        )
+
+    def test_polls_follow_the_connection_polling_strategy(self):
+        cursor = make_cursor([CommandState.RUNNING] * 8 + [CommandState.SUCCEEDED])
+        connection = make_connection(
+            cursor,
+            ExponentialBackoffPolling(initial_interval=0.1, max_interval=2, jitter=0),
+        )
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        async def run():
+            with patch.object(aio.asyncio, "sleep", fake_sleep):
+                await connection.cursor().execute("SELECT 1")
+
+        asyncio.run(run())
+
+        assert sleeps == [0.1, 0.2, 0.4, 0.8, 1.6, 2.0, 2.0, 2.0]
+
+    def test_polling_does_not_hold_a_thread(self):
+        """Many queries waiting on the server share a single executor thread."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        cursors = [
+            make_cursor([CommandState.RUNNING, CommandState.SUCCEEDED])
+            for _ in range(50)
+        ]
+        connection = MagicMock()
+        connection.polling_strategy = FixedIntervalPolling(0.01)
+        connection.cursor.side_effect = cursors
+        async_connection = aio.AsyncConnection(connection, executor=executor)
+
+        async def run():
+            await asyncio.gather(
+                *(async_connection.cursor().execute("SELECT 1") for _ in cursors)
+            )
+
+        asyncio.run(run())
+        executor.shutdown()
+
+        for cursor in cursors:
+            cursor._collect_async_execution_result.assert_called_once()
+
+    def test_failed_query_raises(self):
+        cursor = make_cursor([CommandState.FAILED])
+        cursor._collect_async_execution_result.side_effect = OperationalError(
+            "get_execution_result failed"
+        )
+        connection = make_connection(cursor)
+
+        with pytest.raises(OperationalError):
+            asyncio.run(connection.cursor().execute("SELECT 1"))
+
+    @patch("databricks.sql.backend.sea.backend.SeaHttpClient")
+    def test_failed_sea_query_raises_the_server_error(self, http_client_class):
+        http_client = http_client_class.return_value
+        http_client._make_request.return_value = {
+            "statement_id": "statement-1",
+            "status": {
+                "state": "FAILED",
+                "error": {"message": "Table not found", "error_code": "42P01"},
+            },
+        }
+        backend = SeaDatabricksClient(
+            server_hostname="test-server.databricks.com",
+            port=443,
+            http_path="/sql/warehouses/abc123",
+            http_headers=[],
+            auth_provider=AuthProvider(),
+            ssl_options=SSLOptions(),
+        )
+        cursor = Cursor(MagicMock(), backend)
+
+        def execute_async(*args, **kwargs):
+            cursor.active_command_id = CommandId.from_sea_statement_id("statement-1")
+
+        connection = make_connection(cursor)
+        with patch.object(cursor, "execute_async", side_effect=execute_async):
+            with pytest.raises(ServerOperationError) as excinfo:
+                asyncio.run(connection.cursor().execute("SELECT * FROM missing"))
+
+        assert "42P01 - Table not found" in str(excinfo.value)
+
+    def test_cancelling_the_task_cancels_the_query(self):
+        cursor = make_cursor([CommandState.RUNNING] * 1000)
+        cancelled = threading.Event()
+        cursor.cancel.side_effect = lambda: cancelled.set()
+        connection = make_connection(cursor, FixedIntervalPolling(0.01))
+
+        async def run():
+            task = asyncio.ensure_future(connection.cursor().execute("SELECT 1"))
+            while cursor.get_query_state.call_count == 0:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        assert cancelled.wait(5)
+        cursor._collect_async_execution_result.assert_not_called()
+
+    def test_async_iteration_over_rows(self):
+        rows = [(i,) for i in range(5)]
+        connection = make_connection(make_cursor([], rows=rows))
+
+        async def run():
+            return [row async for row in connection.cursor()]
+
+        assert asyncio.run(run()) == rows
+
+    @pytest.mark.skipif(pyarrow is None, reason="PyArrow is not installed")
+    def test_iter_arrow_batches(self):
+        cursor = make_cursor([])
+        cursor.fetchmany_arrow.side_effect = [
+            pyarrow.table({"a": [1, 2]}),
+            pyarrow.table({"a": [3]}),
+            pyarrow.table({"a": pyarrow.array([], pyarrow.int64())}),
+        ]
+        connection = make_connection(cursor)
+
+        async def run():
+            return [b async for b in connection.cursor().iter_arrow_batches(size=2)]
+
+        batches = asyncio.run(run())
+
+        assert [b.num_rows for b in batches] == [2, 1]
+        cursor.fetchmany_arrow.assert_called_with(2)
+
+    def test_close_closes_cursor_and_connection(self):
+        cursor = make_cursor([])
+        connection = make_connection(cursor)
+
+        async def run():
+            async with connection:
+                async with connection.cursor():
+                    pass
+
+        asyncio.run(run())
+
+        cursor.close.assert_called_once()
+        connection.connection.close.assert_called_once()
+
+
+class TestConnect:
+    @patch("databricks.sql.aio.Connection")
+    def test_connect_opens_connection_off_the_event_loop(self, mock_connection):
+        loop_thread = []
+
+        def open_connection(*args, **kwargs):
+            loop_thread.append(threading.current_thread())
+            return Mock()
+
+        mock_connection.side_effect = open_connection
+
+        async def run():
+            return await aio.connect("host", "/path", "token", catalog="main")
+
+        connection = asyncio.run(run())
+
+        assert isinstance(connection, aio.AsyncConnection)
+        mock_connection.assert_called_once_with(
+            "host", "/path", "token", catalog="main"
+        )
+        assert loop_thread[0] is not threading.main_thread()
@@ -327,3 +327,66 @@ class TestAzureServicePrincipalCredentialProvider:
                 headers["X-Databricks-Azure-SP-Management-Token"]
                 == test_token.access_token
             )
+
+
+def make_jwt(expires_in):
+    payload = {"sub": "user123", "exp": int(time.time()) + expires_in}
+    return jwt.encode(payload, "mysecret-of-at-least-32-bytes-long", algorithm="HS256")
+
+
+class TestTokenExpiry:
+    @pytest.fixture
+    def oauth_manager(self):
+        return OAuthManager(
+            port_range=[8020],
+            client_id="client_id",
+            idp_endpoint=MagicMock(),
+            http_client=MagicMock(),
+        )
+
+    def test_token_is_decoded_once(self):
+        token = Token(make_jwt(3600), "Bearer", "refresh_token")
+
+        with patch("databricks.sql.auth.oauth.jwt.decode", wraps=jwt.decode) as decode:
+            for _ in range(3):
+                assert not token.is_expired()
+
+        decode.assert_called_once()
+
+    def test_token_within_the_buffer_is_expired(self):
+        assert Token(make_jwt(10), "Bearer", None).is_expired()
+        assert not Token(jwt.encode({"sub": "x"}, "k"), "Bearer", None).is_expired()
+
+    def test_access_token_is_decoded_once(self, oauth_manager):
+        access_token = make_jwt(3600)
+
+        with patch.object(
+            OAuthManager, "_decode_expiry", wraps=OAuthManager._decode_expiry
+        ) as decode:
+            for _ in range(3):
+                assert oauth_manager.check_and_refresh_access_token(
+                    "foo", access_token, "refresh_token"
+                ) == (access_token, "refresh_token", False)
+            oauth_manager.check_and_refresh_access_token(
+                "foo", make_jwt(7200), "refresh_token"
+            )
+
+        assert decode.call_count == 2
+
+    def test_token_within_the_buffer_is_refreshed(self, oauth_manager):
+        access_token = make_jwt(10)
+        oauth_manager._OAuthManager__send_refresh_token_request = MagicMock(
+            return_value={"access_token": "fresh", "refresh_token": "fresh_refresh"}
+        )
+
+        assert oauth_manager.check_and_refresh_access_token(
+            "foo", access_token, "refresh_token"
+        ) == ("fresh", "fresh_refresh", True)
+        # Without a refresh token, it is used until it expires
+        assert oauth_manager.check_and_refresh_access_token(
+            "foo", access_token, None
+        ) == (access_token, None, False)
+
+    def test_expired_token_without_refresh_token_raises(self, oauth_manager):
+        with pytest.raises(RuntimeError, match="expired"):
+            oauth_manager.check_and_refresh_access_token("foo", make_jwt(-10), None)
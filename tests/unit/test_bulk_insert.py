@@ -0,0 +1,114 @@
+import io
+from unittest.mock import Mock, MagicMock
+
+import pandas
+import pytest
+
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+except ImportError:
+    pyarrow = None
+
+import databricks.sql.client as client
+
+
+@pytest.mark.skipif(pyarrow is None, reason="PyArrow is not installed")
+class TestBulkInsert:
+    """Unit tests for Cursor.bulk_insert staging-based loads."""
+
+    @pytest.fixture
+    def connection(self):
+        connection = Mock()
+        connection.staged_parts = {}
+        connection.part_cursor_statements = []
+
+        def new_cursor():
+            part_cursor = MagicMock()
+            part_cursor.__enter__.return_value = part_cursor
+
+            def execute(operation, input_stream=None):
+                connection.part_cursor_statements.append(operation)
+                if input_stream is not None:
+                    connection.staged_parts[operation] = pq.read_table(
+                        io.BytesIO(input_stream.read())
+                    )
+
+            part_cursor.execute.side_effect = execute
+            return part_cursor
+
+        connection.cursor.side_effect = new_cursor
+        return connection
+
+    @pytest.fixture
+    def cursor(self, connection):
+        cursor = client.Cursor(connection=connection, backend=Mock())
+        cursor.execute = Mock(return_value=cursor)
+        return cursor
+
+    def test_bulk_insert_uploads_parts_and_copies(self, cursor, connection):
+        table = pyarrow.table({"a": list(range(1000)), "b": ["x"] * 1000})
+
+        cursor.bulk_insert(
+            "main.default.t",
+            table,
+            "/Volumes/main/default/vol/tmp/",
+            max_part_bytes=table.nbytes // 4,
+        )
+
+        puts = [s for s in connection.part_cursor_statements if s.startswith("PUT")]
+        assert len(puts) == 4
+        assert pyarrow.concat_tables(
+            connection.staged_parts[s] for s in sorted(puts)
+        ).equals(table)
+
+        copy_statement = cursor.execute.call_args[0][0]
+        assert copy_statement.startswith(
+            "COPY INTO main.default.t FROM '/Volumes/main/default/vol/tmp/bulk_insert_"
+        )
+        assert copy_statement.endswith("' FILEFORMAT = PARQUET")
+
+        removes = [
+            s for s in connection.part_cursor_statements if s.startswith("REMOVE")
+        ]
+        assert len(removes) == 4
+
+    def test_bulk_insert_accepts_pandas(self, cursor, connection):
+        df = pandas.DataFrame({"a": [1, 2, 3]})
+
+        cursor.bulk_insert("t", df, "/Volumes/c/s/v", cleanup=False)
+
+        assert list(connection.staged_parts.values())[0].column("a").to_pylist() == [
+            1,
+            2,
+            3,
+        ]
+        assert not [
+            s for s in connection.part_cursor_statements if s.startswith("REMOVE")
+        ]
+
+    def test_bulk_insert_cleans_up_when_copy_fails(self, cursor, connection):
+        cursor.execute.side_effect = client.DatabaseError("COPY INTO failed")
+
+        with pytest.raises(client.DatabaseError):
+            cursor.bulk_insert("t", pyarrow.table({"a": [1]}), "/Volumes/c/s/v")
+
+        removes = [
+            s for s in connection.part_cursor_statements if s.startswith("REMOVE")
+        ]
+        assert len(removes) == 1
+
+    def test_bulk_insert_empty_table_is_noop(self, cursor, connection):
+        cursor.bulk_insert(
+            "t",
+            pyarrow.table({"a": pyarrow.array([], pyarrow.int64())}),
+            "/Volumes/c/s/v",
+        )
+
+        assert cursor.rowcount == 0
+        connection.cursor.assert_not_called()
+        cursor.execute.assert_not_called()
+
+    def test_bulk_insert_rejects_unsupported_data(self, cursor):
+        with pytest.raises(client.ProgrammingError):
+            cursor.bulk_insert("t", [(1, 2)], "/Volumes/c/s/v")
@@ -588,6 +588,107 @@ class ClientTestSuite(unittest.TestCase):
 
         self.assertEqual(cursor.rowcount, -1)
 
+    def _batching_cursor(self, result_sets, max_parameters=256, max_bytes=1048576):
+        mock_backend = ThriftDatabricksClientMockFactory.new()
+        mock_backend.execute_command.side_effect = result_sets
+        connection = Mock(
+            use_inline_params=False,
+            executemany_batch_max_parameters=max_parameters,
+            executemany_batch_max_bytes=max_bytes,
+        )
+        return client.Cursor(connection, mock_backend), mock_backend
+
+    def _dml_result_set(self, num_modified_rows):
+        rs = Mock()
+        rs.is_staging_operation = False
+        rs.num_modified_rows = num_modified_rows
+        return rs
+
+    def test_executemany_batches_named_insert_values(self):
+        cursor, mock_backend = self._batching_cursor([self._dml_result_set(3)])
+
+        cursor.executemany(
+            "INSERT INTO t (a, b) VALUES (:a, :b)",
+            seq_of_parameters=[{"a": i, "b": str(i)} for i in range(3)],
+        )
+
+        self.assertEqual(mock_backend.execute_command.call_count, 1)
+        call_kwargs = mock_backend.execute_command.call_args[1]
+        self.assertEqual(
+            call_kwargs["operation"],
+            "INSERT INTO t (a, b) VALUES (:a_0, :b_0), (:a_1, :b_1), (:a_2, :b_2)",
+        )
+        self.assertEqual(
+            [(p.name, p.value.stringValue) for p in call_kwargs["parameters"]],
+            [("a_0", "0"), ("b_0", "0"), ("a_1", "1"), ("b_1", "1")]
+            + [("a_2", "2"), ("b_2", "2")],
+        )
+        self.assertEqual(cursor.rowcount, 3)
+
+    def test_executemany_batches_positional_insert_values(self):
+        cursor, mock_backend = self._batching_cursor([self._dml_result_set(2)])
+
+        cursor.executemany("INSERT INTO t VALUES (?, ?)", [[1, "x"], [2, "y"]])
+
+        call_kwargs = mock_backend.execute_command.call_args[1]
+        self.assertEqual(
+            call_kwargs["operation"], "INSERT INTO t VALUES (?, ?), (?, ?)"
+        )
+        self.assertEqual(
+            [p.value.stringValue for p in call_kwargs["parameters"]],
+            ["1", "x", "2", "y"],
+        )
+        self.assertTrue(all(p.ordinal for p in call_kwargs["parameters"]))
+
+    def test_executemany_splits_batches_and_sums_rowcount(self):
+        cursor, mock_backend = self._batching_cursor(
+            [self._dml_result_set(n) for n in (2, 2, 1)], max_parameters=4
+        )
+
+        cursor.executemany(
+            "INSERT INTO t VALUES (:a, :b)",
+            [{"a": i, "b": i} for i in range(5)],
+        )
+
+        operations = [
+            c[1]["operation"] for c in mock_backend.execute_command.call_args_list
+        ]
+        self.assertEqual(
+            operations,
+            [
+                "INSERT INTO t VALUES (:a_0, :b_0), (:a_1, :b_1)",
+                "INSERT INTO t VALUES (:a_2, :b_2), (:a_3, :b_3)",
+                "INSERT INTO t VALUES (:a_4, :b_4)",
+            ],
+        )
+        self.assertEqual(cursor.rowcount, 5)
+
+    def test_executemany_batches_respect_byte_limit(self):
+        cursor, mock_backend = self._batching_cursor(
+            [self._dml_result_set(1) for _ in range(3)], max_bytes=60
+        )
+
+        cursor.executemany("INSERT INTO t VALUES (?)", [["x" * 20]] * 3)
+
+        self.assertEqual(mock_backend.execute_command.call_count, 3)
+        self.assertEqual(cursor.rowcount, 3)
+
+    def test_executemany_falls_back_for_unsupported_statements(self):
+        cases = [
+            ("UPDATE t SET a = :a", [{"a": 1}, {"a": 2}]),
+            ("INSERT INTO t VALUES (:a, 'x')", [{"a": 1}, {"a": 2}]),
+            ("INSERT INTO t VALUES (:a)", [{"a": 1}, {"b": 2}]),
+            ("INSERT INTO t VALUES (?)", [[1], [2, 3]]),
+        ]
+        for operation, seq_of_parameters in cases:
+            cursor, mock_backend = self._batching_cursor(
+                [self._dml_result_set(1) for _ in seq_of_parameters]
+            )
+            cursor.executemany(operation, seq_of_parameters)
+            self.assertEqual(
+                mock_backend.execute_command.call_count, len(seq_of_parameters)
+            )
+
     def test_setinputsizes_a_noop(self):
         cursor = client.Cursor(Mock(), Mock())
         cursor.setinputsizes(1)
@@ -691,6 +792,19 @@ class ClientTestSuite(unittest.TestCase):
         self.assertEqual(instance.close_session.call_count, 0)
         cursor.close()
 
+    @patch("%s.session.ThriftDatabricksClient" % PACKAGE_NAME)
+    def test_closed_cursors_are_released_by_the_connection(self, mock_client_class):
+        connection = databricks.sql.connect(**self.DUMMY_CONNECTION_ARGS)
+        kept = connection.cursor()
+
+        for _ in range(100):
+            with connection.cursor():
+                pass
+
+        self.assertEqual(connection._cursors, [kept])
+        connection.close()
+        self.assertFalse(kept.open)
+
     @patch("%s.backend.types.ExecuteResponse" % PACKAGE_NAME)
     @patch("%s.client.Cursor._handle_staging_operation" % PACKAGE_NAME)
     @patch("%s.session.ThriftDatabricksClient" % PACKAGE_NAME)
@@ -0,0 +1,184 @@
+import os
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from databricks.sql.auth.authenticators import AuthProvider
+from databricks.sql.auth.common import ClientContext
+from databricks.sql.auth.retry import CommandType
+from databricks.sql.auth.thrift_http_client import THttpClient
+from databricks.sql.backend.thrift_backend import ThriftDatabricksClient
+from databricks.sql.common import connection_pools
+from databricks.sql.common.connection_pools import SharedRegistry, ssl_options_key
+from databricks.sql.common.http import HttpMethod
+from databricks.sql.common.unified_http_client import UnifiedHttpClient
+from databricks.sql.types import SSLOptions
+
+
+@pytest.fixture(autouse=True)
+def clear_shared():
+    connection_pools.clear()
+    yield
+    connection_pools.clear()
+
+
+def make_transport(uri="https://foo/path", ssl_options=None, **kwargs):
+    transport = THttpClient(
+        auth_provider=AuthProvider(),
+        uri_or_host=uri,
+        ssl_options=ssl_options or SSLOptions(),
+        **kwargs,
+    )
+    transport.open()
+    return transport
+
+
+def make_http_client(**kwargs):
+    return UnifiedHttpClient(
+        ClientContext(hostname="https://foo", ssl_options=SSLOptions(), **kwargs)
+    )
+
+
+class TestSharedRegistry:
+    def test_objects_are_created_once_per_key(self):
+        registry = SharedRegistry(max_size=4)
+        create = Mock(side_effect=lambda: object())
+
+        first = registry.get("a", create)
+
+        assert registry.get("a", create) is first
+        assert registry.get("b", create) is not first
+        assert create.call_count == 2
+        assert (registry.created, registry.reused) == (2, 1)
+
+    def test_least_recently_used_objects_are_dropped(self):
+        registry = SharedRegistry(max_size=2)
+        a = registry.get("a", object)
+        registry.get("b", object)
+        registry.get("a", object)
+
+        registry.get("c", object)
+
+        assert len(registry) == 2
+        assert registry.get("a", object) is a
+        assert registry.created == 3
+
+    def test_max_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            SharedRegistry(max_size=0)
+
+
+class TestSslOptionsKey:
+    def test_equal_options_have_equal_keys(self):
+        assert ssl_options_key(SSLOptions(tls_verify_hostname=False)) == (
+            ssl_options_key(SSLOptions(tls_verify_hostname=False))
+        )
+        assert ssl_options_key(SSLOptions()) != ssl_options_key(
+            SSLOptions(tls_verify=False)
+        )
+
+    def test_rotated_files_change_the_key(self, tmp_path):
+        ca_file = tmp_path / "ca.pem"
+        ca_file.write_text("old")
+        key = ssl_options_key(SSLOptions(tls_trusted_ca_file=str(ca_file)))
+
+        os.utime(ca_file, (0, 0))
+
+        assert ssl_options_key(SSLOptions(tls_trusted_ca_file=str(ca_file))) != key
+
+
+class TestThriftTransport:
+    def test_transports_share_the_ssl_context(self):
+        first = make_transport()
+        second = make_transport("https://bar/path")
+
+        assert first.context is second.context
+        assert first._THttpClient__pool.conn_kw["ssl_context"] is first.context
+        assert len(connection_pools.ssl_contexts) == 1
+
+    def test_different_options_have_their_own_context(self):
+        first = make_transport()
+        second = make_transport(ssl_options=SSLOptions(tls_verify=False))
+
+        assert first.context is not second.context
+        assert second.context.verify_mode == 0  # ssl.CERT_NONE
+
+    def test_pools_are_not_shared_by_default(self):
+        first = make_transport()
+        second = make_transport()
+
+        assert first._THttpClient__pool is not second._THttpClient__pool
+
+    def test_pools_are_shared_by_equivalent_transports(self):
+        first = make_transport(share_connection_pools=True, max_connections=4)
+        second = make_transport(share_connection_pools=True, max_connections=4)
+        other_host = make_transport(
+            "https://bar/path", share_connection_pools=True, max_connections=4
+        )
+
+        assert first._THttpClient__pool is second._THttpClient__pool
+        assert other_host._THttpClient__pool is not first._THttpClient__pool
+
+    def test_backend_passes_the_connection_parameter(self):
+        backend = ThriftDatabricksClient(
+            "foobar",
+            443,
+            "path",
+            [],
+            auth_provider=AuthProvider(),
+            ssl_options=SSLOptions(),
+            http_client=MagicMock(),
+            _share_connection_pools=True,
+        )
+
+        assert backend._transport._share_connection_pools
+
+
+class TestUnifiedHttpClient:
+    def test_clients_share_the_ssl_context(self):
+        first = make_http_client()
+        second = make_http_client()
+
+        assert (
+            first._direct_pool_manager.connection_pool_kw["ssl_context"]
+            is second._direct_pool_manager.connection_pool_kw["ssl_context"]
+        )
+        assert first._direct_pool_manager is not second._direct_pool_manager
+
+    def test_pool_managers_are_shared_when_enabled(self):
+        first = make_http_client(share_connection_pools=True)
+        second = make_http_client(share_connection_pools=True)
+        pool_manager = first._direct_pool_manager
+
+        assert second._direct_pool_manager is pool_manager
+        first.close()
+        # Closing one client leaves the shared pools to the other
+        assert second._direct_pool_manager is pool_manager
+        assert first._direct_pool_manager is None
+
+    def test_requests_use_the_clients_retry_policy(self):
+        make_http_client(share_connection_pools=True, retry_stop_after_attempts_count=2)
+        second = make_http_client(
+            share_connection_pools=True, retry_stop_after_attempts_count=7
+        )
+        pool_manager = second._direct_pool_manager = Mock()
+
+        second.request(HttpMethod.GET, "https://foo/api")
+
+        _, kwargs = pool_manager.request.call_args
+        assert kwargs["retries"].stop_after_attempts_count == 7
+
+    def test_each_request_gets_its_own_retry_state(self):
+        http_client = make_http_client()
+        pool_manager = http_client._direct_pool_manager = Mock()
+
+        http_client.request(HttpMethod.GET, "https://foo/a")
+        http_client.request(HttpMethod.GET, "https://foo/b")
+
+        first, second = (
+            c.kwargs["retries"] for c in pool_manager.request.call_args_list
+        )
+        assert first is not second
+        assert first is not http_client._retry_policy
+        assert first.command_type == CommandType.OTHER
+        assert http_client._retry_policy._retry_start_time is None
@@ -0,0 +1,199 @@
+import itertools
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+import databricks.sql
+from databricks.sql.backend.types import CommandState
+from databricks.sql.common.polling import FixedIntervalPolling
+from databricks.sql.exc import OperationalError
+
+
+class FakeCursors:
+    """Hands out cursor stand-ins whose statements finish after a per-query number of polls."""
+
+    def __init__(self, connection, polls_by_query):
+        self.connection = connection
+        self.polls_by_query = polls_by_query
+        self.cursors = []
+        self.running = 0
+        self.max_running = 0
+        # Result collection of these queries waits until `release` is set
+        self.blocking = set()
+        self.collecting = threading.Event()
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        cursor = Mock()
+        cursor.connection = self.connection
+        cursor.open = True
+        cursor.query_id = "query-%d" % len(self.cursors)
+
+        def execute_async(operation, parameters=None):
+            polls = self.polls_by_query[operation]
+            states = itertools.chain(
+                itertools.repeat(CommandState.RUNNING, polls),
+                itertools.repeat(CommandState.SUCCEEDED),
+            )
+            cursor.get_query_state.side_effect = lambda: next(states)
+            if operation in self.blocking:
+                cursor._collect_async_execution_result.side_effect = (
+                    lambda state: self.collecting.set() or self.release.wait(5)
+                )
+            cursor.fetchall_arrow.return_value = "arrow:" + operation
+            cursor.fetchall.return_value = ["row:" + operation]
+            with self._lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+
+        def close():
+            if cursor.open:
+                cursor.open = False
+                with self._lock:
+                    self.running -= 1
+
+        cursor.execute_async.side_effect = execute_async
+        cursor.close.side_effect = close
+        self.cursors.append(cursor)
+        return cursor
+
+
+@pytest.fixture
+def connection():
+    with patch("databricks.sql.session.ThriftDatabricksClient"):
+        connection = databricks.sql.connect(
+            server_hostname="foo",
+            http_path="dummy_path",
+            access_token="tok",
+            enable_telemetry=False,
+            polling_strategy=FixedIntervalPolling(0.001),
+            max_status_polls_per_second=10000,
+        )
+        yield connection
+        connection.close()
+
+
+def fake_cursors(connection, polls_by_query):
+    cursors = FakeCursors(connection, polls_by_query)
+    connection.cursor = cursors
+    return cursors
+
+
+class TestRunConcurrently:
+    def test_results_are_yielded_in_order(self, connection):
+        cursors = fake_cursors(connection, {"slow": 30, "fast": 0, "medium": 5})
+
+        results = list(
+            connection.run_concurrently(["slow", ("fast", {"x": 1}), "medium"])
+        )
+
+        assert [r.operation for r in results] == ["slow", "fast", "medium"]
+        assert [r.result for r in results] == [
+            "arrow:slow",
+            "arrow:fast",
+            "arrow:medium",
+        ]
+        assert all(r.succeeded for r in results)
+        assert results[1].parameters == {"x": 1}
+        cursors.cursors[1].execute_async.assert_called_once_with("fast", {"x": 1})
+        assert all(not c.open for c in cursors.cursors)
+
+    def test_results_as_completed(self, connection):
+        fake_cursors(connection, {"slow": 200, "fast": 0})
+
+        results = connection.run_concurrently(["slow", "fast"], ordered=False)
+
+        assert [r.operation for r in results] == ["fast", "slow"]
+
+    def test_rows_instead_of_arrow(self, connection):
+        fake_cursors(connection, {"q": 0})
+
+        (result,) = connection.run_concurrently(["q"], as_arrow=False)
+
+        assert result.result == ["row:q"]
+
+    def test_concurrency_is_limited(self, connection):
+        queries = ["q%d" % i for i in range(10)]
+        cursors = fake_cursors(connection, {q: 3 for q in queries})
+
+        results = list(connection.run_concurrently(queries, max_concurrency=3))
+
+        assert len(results) == 10
+        assert cursors.max_running == 3
+
+    def test_timed_out_query_is_cancelled(self, connection):
+        cursors = fake_cursors(connection, {"stuck": 10**9, "fast": 0})
+
+        stuck, fast = connection.run_concurrently(["stuck", "fast"], timeout=0.2)
+
+        assert isinstance(stuck.error, OperationalError)
+        assert "timed out" in str(stuck.error)
+        assert stuck.query_id == "query-0"
+        cursors.cursors[0].cancel.assert_called_once()
+        assert not cursors.cursors[0].open
+        assert fast.succeeded
+
+    def test_failures_are_reported_per_query(self, connection):
+        cursors = fake_cursors(connection, {"bad": 0, "good": 0, "unsubmittable": 0})
+        cursor_factory = connection.cursor
+
+        def cursor():
+            cursor = cursor_factory()
+            if len(cursors.cursors) == 1:
+                cursor._collect_async_execution_result.side_effect = OperationalError(
+                    "get_execution_result failed"
+                )
+            if len(cursors.cursors) == 3:
+                cursor.execute_async.side_effect = OperationalError("rejected")
+            return cursor
+
+        connection.cursor = cursor
+
+        bad, good, unsubmittable = connection.run_concurrently(
+            ["bad", "good", "unsubmittable"]
+        )
+
+        assert isinstance(bad.error, OperationalError)
+        assert good.succeeded
+        assert str(unsubmittable.error) == "rejected"
+        assert unsubmittable.query_id is None
+
+    def test_abandoned_iteration_cancels_running_queries(self, connection):
+        cursors = fake_cursors(connection, {"fast": 0, "stuck": 10**9})
+
+        results = connection.run_concurrently(["fast", "stuck"])
+        assert next(results).operation == "fast"
+        results.close()
+
+        cursors.cursors[1].cancel.assert_called_once()
+        assert not cursors.cursors[1].open
+
+    def test_abandoned_iteration_closes_queries_being_collected(self, connection):
+        cursors = fake_cursors(connection, {"fast": 0, "collecting": 0})
+        cursors.blocking.add("collecting")
+
+        results = connection.run_concurrently(["fast", "collecting"], ordered=False)
+        assert next(results).operation == "fast"
+        assert cursors.collecting.wait(5)
+        results.close()
+        cursors.release.set()
+
+        collecting = cursors.cursors[1]
+        collecting.cancel.assert_called_once()
+        assert not collecting.open
+
+    def test_invalid_concurrency(self, connection):
+        with pytest.raises(ValueError):
+            list(connection.run_concurrently(["q"], max_concurrency=0))
+
+
+class TestExecuteAll:
+    def test_execute_all_returns_results_in_order(self, connection):
+        cursor = databricks.sql.client.Cursor(connection, Mock())
+        fake_cursors(connection, {"a": 3, "b": 0})
+
+        results = cursor.execute_all(["a", "b"], max_concurrency=2)
+
+        assert [r.result for r in results] == ["arrow:a", "arrow:b"]
@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import databricks.sql
+
+# Modules that importing the connector must not load. Each is imported on first use.
+DEFERRED_MODULES = [
+    "pandas",
+    "pyarrow.compute",
+    "databricks.sql.thrift_api.TCLIService.ttypes",
+    "databricks.sql.thrift_api.TCLIService.TCLIService",
+    "databricks.sql.backend.thrift_backend",
+    "databricks.sql.backend.sea.backend",
+    "databricks.sql.auth.oauth",
+    "oauthlib",
+    "jwt",
+]
+
+# Cumulative time to `import databricks.sql.client`, best of RUNS cold interpreters.
+# Importing pandas or the Thrift types eagerly again takes it well over the budget.
+IMPORT_TIME_BUDGET_MS = float(
+    os.environ.get("DATABRICKS_SQL_IMPORT_TIME_BUDGET_MS", 750)
+)
+RUNS = 3
+
+# Wall-clock assertions are flaky on slow or shared runners, so they are opt-in
+run_benchmarks = pytest.mark.skipif(
+    not os.environ.get("DATABRICKS_SQL_RUN_BENCHMARKS"),
+    reason="Set DATABRICKS_SQL_RUN_BENCHMARKS=1 to run benchmarks",
+)
+
+
+def import_times(module):
+    """
+    Import `module` in a new interpreter with `-X importtime`, returning the self and
+    cumulative import time, in microseconds, of every module it loaded.
+    """
+    source_root = str(Path(databricks.sql.__file__).parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [source_root, env.get("PYTHONPATH")])
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+@pytest.fixture(scope="module")
+def client_import_times():
+    return import_times("databricks.sql.client")
+
+
+class TestImportTime:
+    @pytest.mark.parametrize("module", DEFERRED_MODULES)
+    def test_module_is_imported_on_first_use(self, client_import_times, module):
+        assert "databricks.sql.client" in client_import_times
+        assert module not in client_import_times
+
+    def test_package_import_does_not_import_the_client(self):
+        times = import_times("databricks.sql")
+
+        assert "databricks.sql" in times
+        assert "databricks.sql.client" not in times
+
+    @run_benchmarks
+    def test_import_time_is_within_budget(self, client_import_times):
+        best_ms = (
+            min(
+                [client_import_times["databricks.sql.client"][1]]
+                + [
+                    import_times("databricks.sql.client")["databricks.sql.client"][1]
+                    for _ in range(RUNS - 1)
+                ]
+            )
+            / 1000
+        )
+
+        assert best_ms <= IMPORT_TIME_BUDGET_MS, (
+            f"import databricks.sql.client took {best_ms:.0f} ms, over the "
+            f"{IMPORT_TIME_BUDGET_MS:.0f} ms budget"
+        )
+
+    @run_benchmarks
+    def test_report_slowest_imports(self, client_import_times):
+        """
+        Print the modules that take longest to import with the connector.
+        ( Run with -s to see the results. )
+        """
+        slowest = sorted(
+            client_import_times.items(), key=lambda item: item[1][0], reverse=True
+        )
+        total_us = client_import_times["databricks.sql.client"][1]
+        print(f"\nimport databricks.sql.client: {total_us / 1000:.0f} ms")
+        for name, (self_us, cumulative_us) in slowest[:20]:
+            print(
+                f"{self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms  {name}"
+            )
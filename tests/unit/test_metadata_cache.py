@@ -0,0 +1,266 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+import databricks.sql
+from databricks.sql.backend.types import CommandState
+from databricks.sql.metadata_cache import MetadataCache
+
+DESCRIPTION = [("TABLE_NAME", "string", None, None, None, None, None)]
+
+
+def key(**arguments):
+    return ("host", "get_tables", tuple(sorted(arguments.items())))
+
+
+def value(n=1):
+    return pyarrow.table({"TABLE_NAME": ["t%d" % i for i in range(n)]}), DESCRIPTION
+
+
+pytestmark = pytest.mark.skipif(pyarrow is None, reason="PyArrow is not installed")
+
+
+class TestMetadataCache:
+    def test_repeated_call_is_answered_from_the_cache(self):
+        cache = MetadataCache()
+        fetch = Mock(return_value=value())
+
+        first = cache.get_or_fetch(key(catalog_name="main"), fetch)
+        second = cache.get_or_fetch(key(catalog_name="main"), fetch)
+        cache.get_or_fetch(key(catalog_name="other"), fetch)
+
+        assert first is second
+        assert fetch.call_count == 2
+        metrics = cache.metrics()
+        assert (metrics.hits, metrics.misses, metrics.entries) == (1, 2, 2)
+
+    @patch("databricks.sql.metadata_cache.time.monotonic")
+    def test_entries_expire(self, mock_monotonic):
+        mock_monotonic.return_value = 1000
+        cache = MetadataCache(ttl=60)
+        fetch = Mock(return_value=value())
+        cache.get_or_fetch(key(), fetch)
+
+        mock_monotonic.return_value = 1060
+        cache.get_or_fetch(key(), fetch)
+
+        assert fetch.call_count == 2
+        assert cache.metrics().expirations == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = MetadataCache(max_entries=2)
+        fetch = Mock(return_value=value())
+        cache.get_or_fetch(key(schema_name="a"), fetch)
+        cache.get_or_fetch(key(schema_name="b"), fetch)
+        cache.get_or_fetch(key(schema_name="a"), fetch)
+
+        cache.get_or_fetch(key(schema_name="c"), fetch)
+        cache.get_or_fetch(key(schema_name="a"), fetch)
+
+        assert fetch.call_count == 3
+        assert cache.metrics().evictions == 1
+
+    def test_size_in_bytes_is_bounded(self):
+        table, _ = value(100)
+        cache = MetadataCache(max_bytes=table.nbytes)
+
+        cache.get_or_fetch(key(schema_name="a"), lambda: value(100))
+        cache.get_or_fetch(key(schema_name="b"), lambda: value(100))
+
+        metrics = cache.metrics()
+        assert (metrics.entries, metrics.bytes) == (1, table.nbytes)
+
+    def test_concurrent_misses_share_one_fetch(self):
+        cache = MetadataCache()
+        release = threading.Event()
+        fetch = Mock(side_effect=lambda: release.wait() and value())
+        threads = [
+            threading.Thread(target=cache.get_or_fetch, args=(key(), fetch))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while cache._single_flight.shared < 3:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        fetch.assert_called_once()
+        assert cache.metrics().coalesced == 3
+
+    def test_invalidate_by_catalog_and_schema(self):
+        cache = MetadataCache()
+        keys = [
+            key(),
+            key(catalog_name="main", schema_name="sales"),
+            key(catalog_name="MAIN", schema_name="hr"),
+            key(catalog_name="other", schema_name="sales"),
+            key(catalog_name="ma%", schema_name="sales"),
+        ]
+        for k in keys:
+            cache.get_or_fetch(k, value)
+
+        assert cache.invalidate(catalog_name="main", schema_name="sales") == 3
+        assert cache.invalidate(catalog_name="main") == 1
+        assert cache.invalidate() == 1
+        assert cache.metrics().invalidations == 5
+
+    def test_result_fetched_across_an_invalidation_is_not_cached(self):
+        cache = MetadataCache()
+
+        def fetch():
+            cache.invalidate()
+            return value()
+
+        cache.get_or_fetch(key(), fetch)
+
+        assert cache.metrics().entries == 0
+
+
+class TestCursorMetadataCache:
+    @pytest.fixture
+    def backend(self):
+        with patch("databricks.sql.session.ThriftDatabricksClient") as client_class:
+            backend = client_class.return_value
+
+            def metadata_result_set(**kwargs):
+                result_set = Mock()
+                result_set.fetchall_arrow.return_value = value(2)[0]
+                result_set.description = DESCRIPTION
+                return result_set
+
+            for method in ("get_catalogs", "get_schemas", "get_tables", "get_columns"):
+                getattr(backend, method).side_effect = metadata_result_set
+            backend.execute_command.return_value = Mock(
+                is_staging_operation=False, num_modified_rows=None
+            )
+            backend.get_execution_result.return_value = Mock(is_staging_operation=False)
+            yield backend
+
+    @pytest.fixture
+    def connection(self, backend):
+        return databricks.sql.connect(
+            server_hostname="foo",
+            http_path="dummy_path",
+            access_token="tok",
+            enable_telemetry=False,
+            metadata_cache=True,
+            _disable_pandas=True,
+        )
+
+    def test_repeated_metadata_calls_are_cached(self, backend, connection):
+        cursor = connection.cursor()
+
+        for _ in range(2):
+            cursor.catalogs()
+            cursor.schemas(catalog_name="main")
+            cursor.tables(catalog_name="main", table_types=["TABLE"])
+            rows = cursor.columns(catalog_name="main", table_name="t").fetchall()
+
+        assert [row.TABLE_NAME for row in rows] == ["t0", "t1"]
+        for method in ("get_catalogs", "get_schemas", "get_tables", "get_columns"):
+            assert getattr(backend, method).call_count == 1
+        assert connection.metadata_cache.metrics().hits == 4
+
+    def test_different_arguments_miss(self, backend, connection):
+        cursor = connection.cursor()
+        cursor.tables(catalog_name="main", table_types=["TABLE"])
+        cursor.tables(catalog_name="main", table_types=["VIEW"])
+
+        assert backend.get_tables.call_count == 2
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "CREATE TABLE t (a INT)",
+            "  alter table t add column b int",
+            "DROP VIEW v",
+            "-- drop the old view\n/* nightly */ DROP VIEW v",
+        ],
+    )
+    def test_ddl_clears_the_cache(self, backend, connection, statement):
+        cursor = connection.cursor()
+        cursor.tables(catalog_name="main")
+
+        cursor.execute(statement)
+        cursor.tables(catalog_name="main")
+
+        assert backend.get_tables.call_count == 2
+
+    def test_other_statements_keep_the_cache(self, backend, connection):
+        cursor = connection.cursor()
+        cursor.tables(catalog_name="main")
+
+        cursor.execute("INSERT INTO t VALUES (1)")
+        cursor.tables(catalog_name="main")
+
+        assert backend.get_tables.call_count == 1
+
+    def test_async_ddl_clears_the_cache_when_it_finishes(self, backend, connection):
+        cursor = connection.cursor()
+        cursor.tables(catalog_name="main")
+        cursor.execute_async("DROP TABLE t")
+        cursor.active_command_id = Mock()
+
+        cursor.tables(catalog_name="main")
+        assert backend.get_tables.call_count == 1
+        cursor._collect_async_execution_result(CommandState.SUCCEEDED)
+        cursor.tables(catalog_name="main")
+
+        assert backend.get_tables.call_count == 2
+
+    def test_metadata_calls_are_not_cached_by_default(self, backend):
+        connection = databricks.sql.connect(
+            server_hostname="foo",
+            http_path="dummy_path",
+            access_token="tok",
+            enable_telemetry=False,
+        )
+        cursor = connection.cursor()
+        cursor.catalogs()
+        cursor.catalogs()
+
+        assert backend.get_catalogs.call_count == 2
+
+    @pytest.mark.parametrize("statement", ["USE CATALOG other", "SET x = 1"])
+    def test_calls_bypass_the_cache_after_session_state_changes(
+        self, backend, connection, statement
+    ):
+        cursor = connection.cursor()
+        cursor.schemas()
+
+        cursor.execute(statement)
+        cursor.schemas()
+        cursor.schemas()
+
+        assert backend.get_schemas.call_count == 3
+
+    def test_shared_cache_is_keyed_by_credentials(self, backend):
+        cache = MetadataCache()
+
+        def schemas(access_token):
+            connection = databricks.sql.connect(
+                server_hostname="foo",
+                http_path="dummy_path",
+                access_token=access_token,
+                enable_telemetry=False,
+                metadata_cache=cache,
+                _disable_pandas=True,
+            )
+            connection.cursor().schemas()
+
+        schemas("alice")
+        schemas("bob")
+        schemas("alice")
+
+        assert backend.get_schemas.call_count == 2
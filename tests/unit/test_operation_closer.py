@@ -0,0 +1,341 @@
+import logging
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+import databricks.sql
+from databricks.sql.backend.types import CommandState
+from databricks.sql.exc import CursorAlreadyClosedError, RequestError
+from databricks.sql.operation_closer import OperationCloser
+from databricks.sql.result_set import ThriftResultSet
+
+
+@pytest.fixture
+def closer():
+    closer = OperationCloser()
+    yield closer
+    closer.close()
+
+
+def make_result_set(connection, backend, command_id, closed_server_side=False):
+    execute_response = Mock(
+        command_id=command_id,
+        status=CommandState.SUCCEEDED,
+        has_been_closed_server_side=closed_server_side,
+        is_staging_operation=False,
+    )
+    backend.fetch_results.return_value = (Mock(), False, 0)
+    return ThriftResultSet(
+        connection=connection,
+        execute_response=execute_response,
+        thrift_client=backend,
+    )
+
+
+class TestOperationCloser:
+    def test_operations_are_closed_in_the_background(self, closer):
+        backend = Mock()
+        release = threading.Event()
+        backend.close_command.side_effect = lambda command_id: release.wait(5)
+
+        closer.submit(backend, "op-1")
+        closer.submit(backend, "op-2")
+
+        # submit() returned while the first close is still waiting on the server
+        assert closer.pending == 2
+        release.set()
+        assert closer.flush(timeout=5)
+        assert [c.args for c in backend.close_command.call_args_list] == [
+            ("op-1",),
+            ("op-2",),
+        ]
+        assert closer.closed_operations == 2
+        assert closer.pending == 0
+
+    def test_flush_times_out_while_closes_are_pending(self, closer):
+        backend = Mock()
+        release = threading.Event()
+        backend.close_command.side_effect = lambda command_id: release.wait(5)
+
+        closer.submit(backend, "op")
+
+        assert not closer.flush(timeout=0.01)
+        release.set()
+        assert closer.flush(timeout=5)
+
+    def test_errors_are_logged_not_raised(self, closer, caplog):
+        backend = Mock()
+        backend.close_command.side_effect = [
+            RequestError("boom"),
+            RequestError("gone", None, None, CursorAlreadyClosedError("closed")),
+            None,
+        ]
+
+        with caplog.at_level(logging.INFO, logger="databricks.sql.operation_closer"):
+            for command_id in ["op-1", "op-2", "op-3"]:
+                closer.submit(backend, command_id)
+            assert closer.flush(timeout=5)
+
+        assert closer.closed_operations == 1
+        assert closer.failed_operations == 1
+        assert "Failed to close operation op-1" in caplog.text
+        assert "canceled by a prior request" in caplog.text
+
+    def test_close_sends_pending_closes(self):
+        closer = OperationCloser()
+        backend = Mock()
+        for i in range(5):
+            closer.submit(backend, i)
+
+        closer.close()
+
+        assert backend.close_command.call_count == 5
+
+    def test_submit_after_close_closes_inline(self):
+        closer = OperationCloser()
+        closer.close()
+        backend = Mock()
+
+        closer.submit(backend, "op")
+
+        backend.close_command.assert_called_once_with("op")
+
+    def test_close_sends_pending_closes_concurrently(self):
+        closer = OperationCloser(max_workers=4)
+        backend = Mock()
+        # The four pending closes only complete if they are sent at the same time
+        started, release = threading.Event(), threading.Event()
+        barrier = threading.Barrier(4, action=release.set, timeout=5)
+
+        def close_command(command_id):
+            if command_id == "in-flight":
+                started.set()
+                release.wait(5)
+            else:
+                barrier.wait()
+
+        backend.close_command.side_effect = close_command
+
+        closer.submit(backend, "in-flight")
+        assert started.wait(5)
+        for i in range(4):
+            closer.submit(backend, i)
+
+        assert closer.close(timeout=5)
+        assert closer.closed_operations == 5
+        assert closer.failed_operations == 0
+
+    def test_close_gives_up_after_the_deadline(self):
+        closer = OperationCloser(max_workers=2)
+        backend = Mock()
+        release = threading.Event()
+        backend.close_command.side_effect = lambda command_id: release.wait(5)
+        for i in range(4):
+            closer.submit(backend, i)
+
+        start = time.monotonic()
+        completed = closer.close(timeout=0.05)
+        elapsed = time.monotonic() - start
+        release.set()
+
+        assert not completed
+        assert elapsed < 1
+
+    def test_close_can_skip_pending_closes(self):
+        closer = OperationCloser()
+        backend = Mock()
+        release = threading.Event()
+        backend.close_command.side_effect = lambda command_id: release.wait(5)
+        for i in range(4):
+            closer.submit(backend, i)
+        threading.Timer(0.05, release.set).start()
+
+        assert closer.close(skip_pending=True)
+
+        # Only the close already in flight was sent
+        backend.close_command.assert_called_once_with(0)
+        assert closer.skipped_operations == 3
+
+    def test_held_operations_wait_for_close(self):
+        closer = OperationCloser()
+        backend = Mock()
+        closer.submit(backend, "sent")
+        assert closer.flush(timeout=5)
+
+        closer.hold()
+        closer.submit(backend, "held")
+
+        assert not closer.flush(timeout=0.05)
+        backend.close_command.assert_called_once_with("sent")
+        assert closer.close()
+        assert backend.close_command.call_count == 2
+
+    def test_max_workers_must_be_positive(self):
+        with pytest.raises(ValueError):
+            OperationCloser(max_workers=0)
+
+
+class TestResultSetClose:
+    def test_result_set_close_uses_the_connections_closer(self, closer):
+        backend = Mock()
+        result_set = make_result_set(Mock(operation_closer=closer), backend, "op")
+
+        with patch.object(closer, "submit") as submit:
+            result_set.close()
+
+        submit.assert_called_once_with(backend, "op")
+        backend.close_command.assert_not_called()
+        assert result_set.has_been_closed_server_side
+        assert result_set.status == CommandState.CLOSED
+
+    def test_result_closed_with_direct_results_sends_no_request(self, closer):
+        backend = Mock()
+        result_set = make_result_set(
+            Mock(operation_closer=closer), backend, "op", closed_server_side=True
+        )
+
+        with patch.object(closer, "submit") as submit:
+            result_set.close()
+
+        submit.assert_not_called()
+        backend.close_command.assert_not_called()
+
+
+class TestConnectionOperationCloser:
+    CONNECTION_ARGS = {
+        "server_hostname": "foo",
+        "http_path": "dummy_path",
+        "access_token": "tok",
+        "enable_telemetry": False,
+    }
+
+    def execute_twice(self, backend, **kwargs):
+        connection = databricks.sql.connect(**self.CONNECTION_ARGS, **kwargs)
+        cursor = connection.cursor()
+        first = make_result_set(connection, backend, "first")
+        backend.execute_command.side_effect = [
+            first,
+            Mock(
+                **{
+                    "is_staging_operation": False,
+                    "num_modified_rows": None,
+                }
+            ),
+        ]
+        cursor.execute("SELECT 1")
+        cursor.execute("SELECT 2")
+        return connection
+
+    @patch("databricks.sql.session.ThriftDatabricksClient")
+    def test_execute_does_not_wait_for_the_previous_close(self, client_class):
+        backend = client_class.return_value
+        release = threading.Event()
+        backend.close_command.side_effect = lambda command_id: release.wait(5)
+
+        connection = self.execute_twice(backend)
+
+        # The second statement ran while closing the first one was still in flight
+        assert backend.execute_command.call_count == 2
+        assert connection.operation_closer.pending == 1
+
+        release.set()
+        connection.close()
+        backend.close_command.assert_called_once_with("first")
+        assert connection.operation_closer.pending == 0
+
+    @patch("databricks.sql.session.ThriftDatabricksClient")
+    def test_pending_closes_are_sent_before_the_session_is_closed(self, client_class):
+        backend = client_class.return_value
+        calls = []
+        backend.close_command.side_effect = lambda command_id: calls.append(
+            "close_command"
+        )
+        backend.close_session.side_effect = lambda session_id: calls.append(
+            "close_session"
+        )
+
+        self.execute_twice(backend).close()
+
+        assert calls[:2] == ["close_command", "close_session"]
+
+    @patch("databricks.sql.session.ThriftDatabricksClient")
+    def test_background_closing_can_be_disabled(self, client_class):
+        backend = client_class.return_value
+
+        connection = self.execute_twice(backend, close_operations_in_background=False)
+
+        assert connection.operation_closer is None
+        backend.close_command.assert_called_once_with("first")
+        connection.close()
+
+
+class TestConnectionTeardown:
+    CONNECTION_ARGS = TestConnectionOperationCloser.CONNECTION_ARGS
+
+    def open_cursors(self, backend, count, **kwargs):
+        connection = databricks.sql.connect(**self.CONNECTION_ARGS, **kwargs)
+        for i in range(count):
+            cursor = connection.cursor()
+            cursor.active_result_set = make_result_set(connection, backend, i)
+        return connection
+
+    @patch("databricks.sql.session.ThriftDatabricksClient")
+    def test_operations_are_closed_concurrently_before_the_session(self, client_class):
+        backend = client_class.return_value
+        barrier = threading.Barrier(8, timeout=5)
+        closed = []
+        backend.close_command.side_effect = lambda command_id: closed.append(
+            barrier.wait()
+        )
+        backend.close_session.side_effect = lambda session_id: closed.append("session")
+        connection = self.open_cursors(backend, 16, close_max_workers=8)
+
+        connection.close()
+
+        assert len(closed) == 17
+        assert closed[-1] == "session"
+        assert connection.operation_closer.closed_operations == 16
+
+    @patch("databricks.sql.session.ThriftDatabricksClient")
+    def test_operations_released_with_the_session_are_not_closed(self, client_class):
+        backend = client_class.return_value
+        backend.closes_operations_with_session = True
+        connection = self.open_cursors(backend, 16)
+
+        connection.close()
+
+        backend.close_command.assert_not_called()
+        backend.close_session.assert_called_once()
+        assert connection.operation_closer.skipped_operations == 16
+
+    @patch("databricks.sql.session.ThriftDatabricksClient")
+    def test_session_is_closed_when_the_deadline_passes(self, client_class):
+        backend = client_class.return_value
+        release = threading.Event()
+        backend.close_command.side_effect = lambda command_id: release.wait(5)
+        connection = self.open_cursors(backend, 4)
+
+        start = time.monotonic()
+        connection.close(timeout=0.05)
+        elapsed = time.monotonic() - start
+        release.set()
+
+        assert elapsed < 1
+        backend.close_session.assert_called_once()
+
+    @patch("databricks.sql.session.ThriftDatabricksClient")
+    def test_operations_are_closed_concurrently_without_background_closing(
+        self, client_class
+    ):
+        backend = client_class.return_value
+        barrier = threading.Barrier(4, timeout=5)
+        backend.close_command.side_effect = lambda command_id: barrier.wait()
+        connection = self.open_cursors(
+            backend, 4, close_operations_in_background=False, close_max_workers=4
+        )
+
+        connection.close()
+
+        assert connection.operation_closer.closed_operations == 4
@@ -8,6 +8,9 @@ from databricks.sql.utils import (
     inject_parameters,
     transform_paramstyle,
     ParameterStructure,
+    split_insert_values_operation,
+    named_markers,
+    rename_named_markers,
 )
 
 pe = ParamEscaper()
@@ -137,6 +140,36 @@ class TestIndividualFormatters(object):
 
         assert pe.escape_sequence(INPUT) == OUTPUT
 
+    @pytest.mark.parametrize(
+        "items",
+        [
+            [1, 2**40, -3],
+            [True, False],
+            [1, 2.5, True],
+            ["it's", "a\\b", "", "x,y"],
+            ["a", 1],
+            ["a\x00b", "c"],
+        ],
+    )
+    def test_escape_sequence_matches_escaping_each_element(self, items):
+        expected = "ARRAY(" + ",".join(str(pe.escape_item(i)) for i in items) + ")"
+
+        assert pe.escape_sequence(items) == expected
+
+    def test_escape_sequence_respects_subclass_escaping(self):
+        class UpperEscaper(ParamEscaper):
+            def escape_string(self, item):
+                return "'{}'".format(item.upper())
+
+        assert UpperEscaper().escape_sequence(["a", "b"]) == "ARRAY('A','B')"
+
+    def test_escape_numpy_and_pyarrow_arrays(self):
+        numpy = pytest.importorskip("numpy")
+        pyarrow = pytest.importorskip("pyarrow")
+
+        assert pe.escape_item(numpy.array([1, 2, 3])) == "ARRAY(1,2,3)"
+        assert pe.escape_item(pyarrow.array(["a", "b'"])) == "ARRAY('a','b\\'')"
+
     def test_escape_map_string_int(self):
         INPUT = {"a": 1, "b": 2}
         OUTPUT = "MAP('a',1,'b',2)"
@@ -247,3 +280,38 @@ class TestInlineToNativeTransformer(object):
             query, _params, param_structure=ParameterStructure.NAMED
         )
         assert output == expected
+
+
+class TestInsertValuesSplitter(object):
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        (
+            ("INSERT INTO t VALUES (?, ?)", ("INSERT INTO t VALUES", "(?, ?)")),
+            (
+                "insert into cat.sch.t (a, b) values (:a, :b);",
+                ("insert into cat.sch.t (a, b) values", "(:a, :b)"),
+            ),
+            (
+                "INSERT INTO t VALUES (:a, named_struct('x', :b))",
+                None,
+            ),
+            (
+                "INSERT INTO t VALUES (:a, CAST(:b AS INT))",
+                ("INSERT INTO t VALUES", "(:a, CAST(:b AS INT))"),
+            ),
+            ("INSERT INTO t VALUES (?), (?)", None),
+            ("INSERT OVERWRITE t VALUES (?)", None),
+            ("INSERT INTO t SELECT ? FROM s", None),
+            ("INSERT INTO t VALUES (?) -- comment", None),
+            ("INSERT INTO t PARTITION (p = ?) VALUES (?)", None),
+            ("SELECT (?)", None),
+        ),
+    )
+    def test_split_insert_values_operation(self, query, expected):
+        assert split_insert_values_operation(query) == expected
+
+    def test_named_markers_skip_casts(self):
+        assert named_markers("(:a, :b::INT, :c_1)") == ["a", "b", "c_1"]
+
+    def test_rename_named_markers(self):
+        assert rename_named_markers("(:a, :b::INT)", "_3") == "(:a_3, :b_3::INT)"
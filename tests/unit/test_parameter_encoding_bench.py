@@ -0,0 +1,98 @@
+import os
+import time
+
+import pytest
+
+from databricks.sql.parameters.native import (
+    ArrayParameter,
+    dbsql_parameter_from_primitive,
+)
+from databricks.sql.utils import ParamEscaper
+
+
+@pytest.mark.skipif(
+    not os.environ.get("DATABRICKS_SQL_RUN_BENCHMARKS"),
+    reason="Set DATABRICKS_SQL_RUN_BENCHMARKS=1 to run benchmarks",
+)
+class TestParameterEncodingBenchmark:
+    """
+    Micro benchmark of encoding large ARRAY parameters and inline IN-lists, reporting
+    the cost per element of the bulk encoders against encoding element by element.
+    ( Not included in regular test runs. Run with -s to see the results. )
+    """
+
+    N = 50_000
+    REPEAT = 5
+
+    @classmethod
+    def per_element_ns(cls, func):
+        best = float("inf")
+        for _ in range(cls.REPEAT):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best / cls.N * 1e9
+
+    def report(self, label, before, after):
+        print(
+            f"{label:>28}: {before:7.0f} ns/element before, {after:7.0f} after"
+            f" ({before / after:.1f}x)"
+        )
+
+    @pytest.mark.parametrize(
+        "label, values",
+        [
+            ("ints", list(range(N))),
+            ("strings", [f"customer-{i}" for i in range(N)]),
+            ("floats", [i / 7 for i in range(N)]),
+        ],
+    )
+    def test_native_array_parameter(self, label, values):
+        def element_by_element():
+            tsp = ArrayParameter([]).as_tspark_param()
+            tsp.arguments = [
+                dbsql_parameter_from_primitive(v)._tspark_value_arg() for v in values
+            ]
+
+        def bulk():
+            ArrayParameter(values).as_tspark_param()
+
+        self.report(
+            "ArrayParameter " + label,
+            self.per_element_ns(element_by_element),
+            self.per_element_ns(bulk),
+        )
+
+    def test_native_array_parameter_from_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        values = numpy.arange(self.N)
+
+        self.report(
+            "ArrayParameter numpy ints",
+            self.per_element_ns(
+                lambda: [
+                    dbsql_parameter_from_primitive(int(v))._tspark_value_arg()
+                    for v in values
+                ]
+            ),
+            self.per_element_ns(lambda: ArrayParameter(values).as_tspark_param()),
+        )
+
+    @pytest.mark.parametrize(
+        "label, values",
+        [
+            ("ints", list(range(N))),
+            ("strings", [f"it's {i}" for i in range(N)]),
+        ],
+    )
+    def test_inline_in_list(self, label, values):
+        escaper = ParamEscaper()
+
+        def element_by_element():
+            "ARRAY(" + ",".join(map(str, map(escaper.escape_item, values))) + ")"
+
+        self.report(
+            "inline " + label,
+            self.per_element_ns(element_by_element),
+            self.per_element_ns(lambda: escaper.escape_sequence(values)),
+        )
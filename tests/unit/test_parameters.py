@@ -25,6 +25,7 @@ from databricks.sql.parameters import (
     ArrayParameter,
 )
 from databricks.sql.backend.types import SessionId
+from databricks.sql.exc import NotSupportedError
 from databricks.sql.parameters.native import (
     TDbsqlParameter,
     TSparkParameter,
@@ -311,3 +312,75 @@ class TestDbsqlParameter:
 
         inferred_type = dbsql_parameter_from_primitive(prim.value)
         assert isinstance(inferred_type, _type)
+
+
+def _element_by_element(value):
+    """The payload ArrayParameter built before elements were encoded in bulk."""
+    return [dbsql_parameter_from_primitive(v)._tspark_value_arg() for v in value]
+
+
+class TestBulkEncoding:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            [1, 2, 3],
+            [1, 2**31, -(2**31) - 1, 0],
+            ["a", "b", ""],
+            [1.5, -0.0, float("inf")],
+            [True, False],
+            [1, "a", None],
+            [[1, 2], [3]],
+            [Decimal("1.5"), Decimal("10.25")],
+            [],
+        ],
+    )
+    def test_array_payload_matches_element_by_element(self, value):
+        p = ArrayParameter(value)
+
+        assert p.as_tspark_param().arguments == _element_by_element(value)
+        assert p.value == [dbsql_parameter_from_primitive(v) for v in value]
+
+    def test_map_payload_matches_element_by_element(self):
+        value = {"a": 1, "b": 2**40}
+        flattened = [item for pair in value.items() for item in pair]
+
+        assert MapParameter(value).as_tspark_param().arguments == _element_by_element(
+            flattened
+        )
+
+    def test_unsupported_element_is_rejected_up_front(self):
+        with pytest.raises(NotSupportedError):
+            ArrayParameter([object()])
+
+    def test_arrays_compare_by_payload(self):
+        assert ArrayParameter([1, 2], name="a") == ArrayParameter((1, 2), name="a")
+        assert ArrayParameter([1, 2], name="a") != ArrayParameter([1, 2], name="b")
+        assert ArrayParameter([1, 2]) != ArrayParameter([1, "2"])
+
+    def test_numpy_arrays(self):
+        numpy = pytest.importorskip("numpy")
+
+        for value in (
+            numpy.arange(5),
+            numpy.array([0.5, 1.5]),
+            numpy.array(["x", "y"]),
+            numpy.array([True, False]),
+        ):
+            p = dbsql_parameter_from_primitive(value)
+            assert isinstance(p, ArrayParameter)
+            assert p.as_tspark_param().arguments == _element_by_element(value.tolist())
+
+        with pytest.raises(NotSupportedError):
+            dbsql_parameter_from_primitive(numpy.array(["2024-01-01"], "datetime64[D]"))
+
+    def test_pyarrow_arrays(self):
+        pyarrow = pytest.importorskip("pyarrow")
+
+        for value in (
+            pyarrow.array([1, 2**40]),
+            pyarrow.chunked_array([["a"], ["b", None]]),
+        ):
+            p = dbsql_parameter_from_primitive(value)
+            assert p.as_tspark_param().arguments == _element_by_element(
+                value.to_pylist()
+            )
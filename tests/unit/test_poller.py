@@ -0,0 +1,165 @@
+import threading
+import time
+from concurrent.futures import CancelledError, wait
+from unittest.mock import Mock, patch
+
+import pytest
+
+import databricks.sql
+from databricks.sql.backend.types import CommandState
+from databricks.sql.common.polling import FixedIntervalPolling
+from databricks.sql.exc import InterfaceError, OperationalError, ProgrammingError
+from databricks.sql.poller import StatusPoller
+
+
+def make_cursor(states, interval=0):
+    """An executed cursor whose statement moves through `states` one poll at a time."""
+    cursor = Mock()
+    cursor.connection.polling_strategy = FixedIntervalPolling(interval)
+    cursor.get_query_state.side_effect = list(states)
+    return cursor
+
+
+@pytest.fixture
+def poller():
+    poller = StatusPoller(max_polls_per_second=1000)
+    yield poller
+    poller.close()
+
+
+class TestStatusPoller:
+    def test_futures_resolve_to_cursors_with_results(self, poller):
+        cursors = [
+            make_cursor([CommandState.RUNNING] * i + [CommandState.SUCCEEDED])
+            for i in range(10)
+        ]
+
+        futures = [poller.submit(cursor) for cursor in cursors]
+
+        assert [f.result(timeout=5) for f in futures] == cursors
+        for i, cursor in enumerate(cursors):
+            assert cursor.get_query_state.call_count == i + 1
+            cursor._collect_async_execution_result.assert_called_once_with(
+                CommandState.SUCCEEDED
+            )
+        assert poller.polls == sum(range(1, 11))
+        assert poller.pending == 0
+
+    def test_failed_statement_fails_its_future(self, poller):
+        cursor = make_cursor([CommandState.FAILED])
+        cursor._collect_async_execution_result.side_effect = OperationalError(
+            "get_execution_result failed"
+        )
+
+        with pytest.raises(OperationalError):
+            poller.submit(cursor).result(timeout=5)
+
+    def test_poll_error_fails_only_its_future(self, poller):
+        broken = make_cursor([])
+        broken.get_query_state.side_effect = OperationalError("gone")
+        healthy = make_cursor([CommandState.SUCCEEDED])
+
+        broken_future, healthy_future = poller.submit(broken), poller.submit(healthy)
+
+        with pytest.raises(OperationalError):
+            broken_future.result(timeout=5)
+        assert healthy_future.result(timeout=5) is healthy
+
+    def test_slow_result_does_not_hold_up_other_polls(self, poller):
+        release = threading.Event()
+        slow = make_cursor([CommandState.SUCCEEDED])
+        slow._collect_async_execution_result.side_effect = lambda state: release.wait(5)
+        other = make_cursor([CommandState.RUNNING] * 3 + [CommandState.SUCCEEDED])
+
+        slow_future = poller.submit(slow)
+        other_future = poller.submit(other)
+
+        assert other_future.result(timeout=2) is other
+        assert slow_future.running()
+        release.set()
+        assert slow_future.result(timeout=5) is slow
+
+    def test_aggregate_poll_rate_is_capped(self):
+        poller = StatusPoller(max_polls_per_second=200)
+        cursors = [
+            make_cursor([CommandState.RUNNING, CommandState.SUCCEEDED])
+            for _ in range(20)
+        ]
+
+        start = time.monotonic()
+        wait([poller.submit(cursor) for cursor in cursors], timeout=5)
+        elapsed = time.monotonic() - start
+        poller.close()
+
+        # 40 polls spaced at least 5 ms apart
+        assert poller.polls == 40
+        assert elapsed >= 39 / 200
+
+    def test_each_statement_uses_its_connection_strategy(self, poller):
+        slow = make_cursor([CommandState.RUNNING] * 100, interval=60)
+        fast = make_cursor([CommandState.RUNNING, CommandState.SUCCEEDED])
+
+        poller.submit(slow)
+        poller.submit(fast).result(timeout=5)
+
+        slow.get_query_state.assert_not_called()
+        assert poller.pending == 1
+
+    def test_cancelling_the_future_cancels_the_statement(self, poller):
+        cursor = make_cursor([CommandState.RUNNING] * 1000, interval=0.01)
+        cancelled = threading.Event()
+        cursor.cancel.side_effect = lambda: cancelled.set()
+
+        future = poller.submit(cursor)
+        assert future.cancel()
+
+        assert cancelled.wait(5)
+        cursor._collect_async_execution_result.assert_not_called()
+
+    def test_submit_requires_an_executed_statement(self, poller):
+        cursor = make_cursor([])
+        cursor.active_command_id = None
+
+        with pytest.raises(ProgrammingError):
+            poller.submit(cursor)
+
+    def test_close_cancels_pending_futures(self):
+        poller = StatusPoller()
+        future = poller.submit(make_cursor([CommandState.RUNNING] * 10, interval=60))
+
+        poller.close()
+
+        with pytest.raises(CancelledError):
+            future.result(timeout=5)
+        with pytest.raises(InterfaceError):
+            poller.submit(make_cursor([]))
+
+    def test_invalid_collect_workers(self):
+        with pytest.raises(ValueError):
+            StatusPoller(max_collect_workers=0)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            StatusPoller(max_polls_per_second=0)
+
+
+class TestConnectionStatusPoller:
+    @patch("databricks.sql.session.ThriftDatabricksClient")
+    def test_connection_poller_is_shared_and_closed_with_connection(
+        self, mock_client_class
+    ):
+        connection = databricks.sql.connect(
+            server_hostname="foo",
+            http_path="dummy_path",
+            access_token="tok",
+            enable_telemetry=False,
+            max_status_polls_per_second=5,
+        )
+
+        poller = connection.status_poller
+        assert connection.status_poller is poller
+        assert poller.max_polls_per_second == 5
+
+        connection.close()
+        with pytest.raises(InterfaceError):
+            poller.submit(make_cursor([]))
@@ -0,0 +1,242 @@
+import itertools
+from unittest.mock import Mock, patch
+
+import pytest
+
+import databricks.sql.client as client
+from databricks.sql.auth.authenticators import AuthProvider
+from databricks.sql.backend.sea.backend import SeaDatabricksClient
+from databricks.sql.backend.sea.models.responses import ExecuteStatementResponse
+from databricks.sql.backend.types import CommandState
+from databricks.sql.common.polling import (
+    ExponentialBackoffPolling,
+    FixedIntervalPolling,
+)
+from databricks.sql.types import SSLOptions
+
+
+def first(strategy, n):
+    return list(itertools.islice(strategy.intervals(), n))
+
+
+class TestExponentialBackoffPolling:
+    def test_backs_off_to_the_cap(self):
+        strategy = ExponentialBackoffPolling(
+            initial_interval=0.05, max_interval=1, jitter=0
+        )
+
+        assert first(strategy, 7) == [0.05, 0.1, 0.2, 0.4, 0.8, 1, 1]
+
+    def test_jitter_stays_within_bounds_and_cap(self):
+        strategy = ExponentialBackoffPolling(
+            initial_interval=0.1, max_interval=0.4, jitter=0.5
+        )
+
+        for _ in range(100):
+            delays = first(strategy, 5)
+            assert 0.05 <= delays[0] <= 0.15
+            assert 0.1 <= delays[1] <= 0.3
+            assert all(d <= 0.4 for d in delays)
+
+    def test_each_statement_gets_a_fresh_sequence(self):
+        strategy = ExponentialBackoffPolling(jitter=0)
+
+        assert first(strategy, 3) == first(strategy, 3)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"initial_interval": 0},
+            {"initial_interval": 3, "max_interval": 2},
+            {"multiplier": 0.5},
+            {"jitter": 1},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            ExponentialBackoffPolling(**kwargs)
+
+
+class TestLongPollSeconds:
+    @pytest.mark.parametrize("long_poll_seconds", [None, 0, 5, 30, 50])
+    def test_accepted_values(self, long_poll_seconds):
+        for strategy in (
+            FixedIntervalPolling(1, long_poll_seconds=long_poll_seconds),
+            ExponentialBackoffPolling(long_poll_seconds=long_poll_seconds),
+        ):
+            assert strategy.long_poll_seconds == long_poll_seconds
+
+    @pytest.mark.parametrize("long_poll_seconds", [1, 4, 51, 300, 7.5, -5])
+    def test_values_rejected_by_sea(self, long_poll_seconds):
+        with pytest.raises(ValueError):
+            FixedIntervalPolling(1, long_poll_seconds=long_poll_seconds)
+        with pytest.raises(ValueError):
+            ExponentialBackoffPolling(long_poll_seconds=long_poll_seconds)
+
+
+class TestFixedIntervalPolling:
+    def test_constant_interval(self):
+        assert first(FixedIntervalPolling(0.5), 3) == [0.5, 0.5, 0.5]
+
+    def test_negative_interval_is_rejected(self):
+        with pytest.raises(ValueError):
+            FixedIntervalPolling(-1)
+
+
+class TestCursorAsyncPolling:
+    @patch("databricks.sql.client.time.sleep")
+    def test_get_async_execution_result_follows_the_strategy(self, mock_sleep):
+        connection = Mock()
+        connection.polling_strategy = ExponentialBackoffPolling(
+            initial_interval=0.05, jitter=0
+        )
+        cursor = client.Cursor(connection=connection, backend=Mock())
+        cursor.active_command_id = Mock()
+        cursor.backend.get_query_state.side_effect = [
+            CommandState.PENDING,
+            CommandState.RUNNING,
+            CommandState.RUNNING,
+            CommandState.SUCCEEDED,
+        ]
+        cursor.backend.get_execution_result.return_value.is_staging_operation = False
+
+        cursor.get_async_execution_result()
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.05, 0.1, 0.2]
+        # One status request per poll, none repeated after the query finished
+        assert cursor.backend.get_query_state.call_count == 4
+        cursor.backend.get_execution_result.assert_called_once()
+
+    @patch("databricks.sql.client.time.sleep")
+    def test_deprecated_polling_interval_is_still_honoured(self, mock_sleep):
+        connection = Mock()
+        connection.polling_strategy = ExponentialBackoffPolling()
+        cursor = client.Cursor(connection=connection, backend=Mock())
+        cursor.active_command_id = Mock()
+        cursor.backend.get_query_state.side_effect = [
+            CommandState.RUNNING,
+            CommandState.RUNNING,
+            CommandState.SUCCEEDED,
+        ]
+        cursor.backend.get_execution_result.return_value.is_staging_operation = False
+        assert client.Cursor.ASYNC_DEFAULT_POLLING_INTERVAL == 2
+
+        cursor.ASYNC_DEFAULT_POLLING_INTERVAL = 0.5
+        with pytest.warns(DeprecationWarning):
+            cursor.get_async_execution_result()
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 0.5]
+
+    def test_default_strategy_polls_fast_first(self):
+        strategy = ExponentialBackoffPolling()
+
+        assert first(strategy, 1)[0] < 0.1
+        assert max(first(strategy, 20)) <= 2.0
+
+
+class TestSeaPolling:
+    @pytest.fixture
+    def make_sea_client(self):
+        def make(polling_strategy):
+            with patch("databricks.sql.backend.sea.backend.SeaHttpClient"):
+                return SeaDatabricksClient(
+                    server_hostname="test-server.databricks.com",
+                    port=443,
+                    http_path="/sql/warehouses/abc123",
+                    http_headers=[],
+                    auth_provider=AuthProvider(),
+                    ssl_options=SSLOptions(),
+                    polling_strategy=polling_strategy,
+                )
+
+        return make
+
+    @staticmethod
+    def response(state):
+        return {"statement_id": "stmt-1", "status": {"state": state}}
+
+    @patch("databricks.sql.backend.sea.backend.time.sleep")
+    def test_wait_follows_the_strategy(self, mock_sleep, make_sea_client):
+        sea_client = make_sea_client(
+            ExponentialBackoffPolling(initial_interval=0.05, jitter=0)
+        )
+        sea_client._http_client._make_request.side_effect = [
+            self.response("RUNNING"),
+            self.response("SUCCEEDED"),
+        ]
+
+        final = sea_client._wait_until_command_done(
+            ExecuteStatementResponse.from_dict(self.response("PENDING"))
+        )
+
+        assert final.status.state == CommandState.SUCCEEDED
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.05, 0.1]
+        request_data = sea_client._http_client._make_request.call_args.kwargs["data"]
+        assert "wait_timeout" not in request_data
+
+    @patch("databricks.sql.backend.sea.backend.time.monotonic")
+    @patch("databricks.sql.backend.sea.backend.time.sleep")
+    def test_long_polls_replace_client_side_sleeps(
+        self, mock_sleep, mock_monotonic, make_sea_client
+    ):
+        sea_client = make_sea_client(
+            ExponentialBackoffPolling(jitter=0, long_poll_seconds=10)
+        )
+        # Each status request is held for 10s by the server
+        mock_monotonic.side_effect = itertools.count(step=10)
+        sea_client._http_client._make_request.side_effect = [
+            self.response("RUNNING"),
+            self.response("RUNNING"),
+            self.response("SUCCEEDED"),
+        ]
+
+        sea_client._wait_until_command_done(
+            ExecuteStatementResponse.from_dict(self.response("RUNNING"))
+        )
+
+        # Only the first poll, right after submission, is preceded by a sleep
+        assert mock_sleep.call_count == 1
+        for call in sea_client._http_client._make_request.call_args_list:
+            assert call.kwargs["data"]["wait_timeout"] == "10s"
+
+    @patch("databricks.sql.backend.sea.backend.time.monotonic")
+    @patch("databricks.sql.backend.sea.backend.time.sleep")
+    def test_backs_off_when_server_does_not_hold_long_polls(
+        self, mock_sleep, mock_monotonic, make_sea_client
+    ):
+        sea_client = make_sea_client(
+            ExponentialBackoffPolling(jitter=0, long_poll_seconds=10)
+        )
+        mock_monotonic.side_effect = itertools.count(step=0.01)
+        sea_client._http_client._make_request.side_effect = [
+            self.response("RUNNING"),
+            self.response("RUNNING"),
+            self.response("SUCCEEDED"),
+        ]
+
+        sea_client._wait_until_command_done(
+            ExecuteStatementResponse.from_dict(self.response("RUNNING"))
+        )
+
+        assert mock_sleep.call_count == 3
+
+    @patch("databricks.sql.backend.sea.backend.time.sleep")
+    def test_deprecated_poll_interval_is_still_honoured(
+        self, mock_sleep, make_sea_client
+    ):
+        sea_client = make_sea_client(ExponentialBackoffPolling(long_poll_seconds=10))
+        sea_client._http_client._make_request.side_effect = [
+            self.response("RUNNING"),
+            self.response("SUCCEEDED"),
+        ]
+        assert SeaDatabricksClient.POLL_INTERVAL_SECONDS == 0.2
+
+        with patch.object(SeaDatabricksClient, "POLL_INTERVAL_SECONDS", 0.01):
+            with pytest.warns(DeprecationWarning):
+                sea_client._wait_until_command_done(
+                    ExecuteStatementResponse.from_dict(self.response("PENDING"))
+                )
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.01, 0.01]
+        request_data = sea_client._http_client._make_request.call_args.kwargs["data"]
+        assert request_data["wait_timeout"] == "10s"
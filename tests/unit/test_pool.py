@@ -0,0 +1,343 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import databricks.sql
+
+from databricks.sql.common.single_flight import SingleFlight
+from databricks.sql.exc import InterfaceError, OperationalError
+from databricks.sql.pool import ConnectionPool
+from databricks.sql.metadata_cache import MetadataCache
+from databricks.sql.result_cache import ResultCache
+
+
+def make_connection(*args, **kwargs):
+    connection = MagicMock()
+    connection.open = True
+    connection.ignore_transactions = True
+    connection._cursors = []
+    connection._session_state_changed = False
+    connection.session.session_configuration = None
+    connection.session.catalog = None
+    connection.session.schema = None
+    connection.statements = []
+
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    cursor.execute.side_effect = lambda statement: connection.statements.append(
+        statement
+    )
+    connection.cursor.return_value = cursor
+    return connection
+
+
+@pytest.fixture
+def mock_connection():
+    with patch("databricks.sql.pool.Connection") as mock_connection:
+        mock_connection.side_effect = make_connection
+        yield mock_connection
+
+
+class TestConnectionPool:
+    def test_connections_are_reused(self, mock_connection):
+        pool = ConnectionPool("host", "/path", "token", catalog="main")
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        assert first is second
+        mock_connection.assert_called_once_with(
+            "host", "/path", "token", catalog="main"
+        )
+        metrics = pool.metrics()
+        assert metrics.checkouts == 2
+        assert metrics.connections_created == 1
+        assert (metrics.size, metrics.idle, metrics.in_use) == (1, 1, 0)
+
+    def test_min_size_opens_connections_up_front(self, mock_connection):
+        pool = ConnectionPool("host", "/path", min_size=3)
+
+        assert mock_connection.call_count == 3
+        assert pool.metrics().idle == 3
+
+    def test_connections_opened_up_front_are_closed_if_one_fails(self, mock_connection):
+        opened = [make_connection(), make_connection()]
+        mock_connection.side_effect = opened + [OperationalError("unreachable")]
+
+        with pytest.raises(OperationalError, match="unreachable"):
+            ConnectionPool("host", "/path", min_size=3)
+
+        for connection in opened:
+            connection.close.assert_called_once()
+
+    def test_invalid_sizes_are_rejected(self, mock_connection):
+        with pytest.raises(ValueError):
+            ConnectionPool("host", "/path", max_size=0)
+        with pytest.raises(ValueError):
+            ConnectionPool("host", "/path", min_size=3, max_size=2)
+
+    def test_checkout_waits_for_checkin_at_max_size(self, mock_connection):
+        pool = ConnectionPool("host", "/path", max_size=1)
+        held = pool.checkout()
+
+        def release():
+            time.sleep(0.1)
+            pool.checkin(held)
+
+        threading.Thread(target=release).start()
+        assert pool.checkout(timeout=5) is held
+        assert pool.metrics().max_wait_seconds >= 0.05
+
+    def test_checkout_times_out(self, mock_connection):
+        pool = ConnectionPool("host", "/path", max_size=1)
+        pool.checkout()
+
+        with pytest.raises(OperationalError, match="Timed out"):
+            pool.checkout(timeout=0.01)
+        assert pool.metrics().checkout_timeouts == 1
+
+    def test_stale_connection_is_validated_and_replaced(self, mock_connection):
+        pool = ConnectionPool("host", "/path", validation_interval=0)
+        with pool.connection() as broken:
+            pass
+        broken.cursor.return_value.execute.side_effect = OperationalError("gone")
+
+        with pool.connection() as replacement:
+            pass
+
+        assert replacement is not broken
+        broken.close.assert_called_once()
+        metrics = pool.metrics()
+        assert metrics.validation_failures == 1
+        assert metrics.connections_discarded == 1
+
+    def test_recently_used_connection_is_not_validated(self, mock_connection):
+        pool = ConnectionPool("host", "/path", validation_interval=60)
+        with pool.connection() as connection:
+            pass
+        with pool.connection():
+            pass
+
+        assert "SELECT 1" not in connection.statements
+
+    def test_expired_connection_is_not_reused(self, mock_connection):
+        pool = ConnectionPool("host", "/path", max_lifetime=0.01)
+        with pool.connection() as first:
+            time.sleep(0.02)
+
+        with pool.connection() as second:
+            pass
+
+        assert second is not first
+        first.close.assert_called_once()
+
+    def test_idle_connections_above_min_size_are_evicted(self, mock_connection):
+        pool = ConnectionPool("host", "/path", min_size=1, idle_timeout=0.01)
+        extra = [pool.checkout(), pool.checkout()]
+        for connection in extra:
+            pool.checkin(connection)
+        time.sleep(0.02)
+
+        with pool.connection():
+            pass
+
+        assert pool.metrics().size == 1
+        assert sum(c.close.call_count for c in extra) == 1
+
+    def test_session_is_reset_on_return(self, mock_connection):
+        pool = ConnectionPool("host", "/path")
+        connection = pool.checkout()
+        connection.session.session_configuration = {"ansi_mode": "false"}
+        connection.session.catalog = "main"
+        connection.session.schema = "default"
+        connection._session_state_changed = True
+        user_cursor = MagicMock()
+        connection._cursors.append(user_cursor)
+
+        pool.checkin(connection)
+
+        user_cursor.close.assert_called_once()
+        assert connection.statements == [
+            "RESET",
+            "SET `ansi_mode` = `false`",
+            "USE CATALOG `main`",
+            "USE SCHEMA `default`",
+        ]
+        assert connection._session_state_changed is False
+
+    def test_unchanged_session_is_not_reset(self, mock_connection):
+        pool = ConnectionPool("host", "/path")
+        connection = pool.checkout()
+        connection.session.catalog = "main"
+        user_cursor = MagicMock()
+        connection._cursors.append(user_cursor)
+
+        pool.checkin(connection)
+
+        user_cursor.close.assert_called_once()
+        assert connection.statements == []
+
+    def test_reset_statements_escape_backticks(self, mock_connection):
+        pool = ConnectionPool("host", "/path")
+        connection = pool.checkout()
+        connection.session.session_configuration = {"time_zone": "a`b"}
+        connection.session.catalog = "we`ird"
+        connection._session_state_changed = True
+
+        pool.checkin(connection)
+
+        assert connection.statements == [
+            "RESET",
+            "SET `time_zone` = `a``b`",
+            "USE CATALOG `we``ird`",
+        ]
+
+    def test_open_transaction_is_rolled_back_on_return(self, mock_connection):
+        pool = ConnectionPool("host", "/path")
+        connection = pool.checkout()
+        connection.ignore_transactions = False
+        connection.autocommit = False
+
+        pool.checkin(connection)
+
+        connection.rollback.assert_called_once()
+        assert connection.autocommit is True
+
+    def test_connection_that_fails_reset_is_discarded(self, mock_connection):
+        pool = ConnectionPool("host", "/path")
+        connection = pool.checkout()
+        connection._session_state_changed = True
+        connection.cursor.return_value.execute.side_effect = OperationalError("gone")
+
+        pool.checkin(connection)
+
+        connection.close.assert_called_once()
+        assert pool.metrics().size == 0
+
+    def test_closed_connection_is_discarded_on_return(self, mock_connection):
+        pool = ConnectionPool("host", "/path")
+        with pool.connection() as connection:
+            connection.open = False
+
+        assert pool.metrics().size == 0
+
+    def test_checkin_of_foreign_connection_is_rejected(self, mock_connection):
+        pool = ConnectionPool("host", "/path")
+
+        with pytest.raises(ValueError):
+            pool.checkin(make_connection())
+
+    def test_close(self, mock_connection):
+        pool = ConnectionPool("host", "/path")
+        idle, in_use = pool.checkout(), pool.checkout()
+        pool.checkin(idle)
+
+        pool.close()
+
+        idle.close.assert_called_once()
+        with pytest.raises(InterfaceError):
+            pool.checkout()
+        pool.checkin(in_use)
+        in_use.close.assert_called_once()
+        assert pool.metrics().size == 0
+
+    def test_status_poller_is_shared_and_closed_with_pool(self, mock_connection):
+        pool = ConnectionPool("host", "/path", max_status_polls_per_second=5)
+
+        poller = pool.status_poller
+        assert pool.status_poller is poller
+        assert poller.max_polls_per_second == 5
+
+        pool.close()
+        with pytest.raises(InterfaceError):
+            poller.submit(MagicMock())
+
+    def test_query_deduplication_is_shared_by_pooled_connections(self, mock_connection):
+        pool = ConnectionPool("host", "/path", deduplicate_queries=True)
+        pool.checkout(), pool.checkout()
+
+        first, second = (
+            c.kwargs["deduplicate_queries"] for c in mock_connection.call_args_list
+        )
+        assert isinstance(first, SingleFlight)
+        assert first is second
+
+    def test_result_cache_is_shared_by_pooled_connections(self, mock_connection):
+        pool = ConnectionPool("host", "/path", result_cache=True)
+        pool.checkout(), pool.checkout()
+
+        first, second = (
+            c.kwargs["result_cache"] for c in mock_connection.call_args_list
+        )
+        assert isinstance(first, ResultCache)
+        assert first is second
+
+    def test_metadata_cache_is_shared_by_pooled_connections(self, mock_connection):
+        pool = ConnectionPool("host", "/path", metadata_cache=True)
+        pool.checkout(), pool.checkout()
+
+        first, second = (
+            c.kwargs["metadata_cache"] for c in mock_connection.call_args_list
+        )
+        assert isinstance(first, MetadataCache)
+        assert first is second
+
+
+class TestSessionStateTracking:
+    @pytest.fixture
+    def connection(self):
+        with patch("databricks.sql.session.ThriftDatabricksClient") as client_class:
+            result_set = client_class.return_value.execute_command.return_value
+            result_set.is_staging_operation = False
+            result_set.num_modified_rows = None
+            yield databricks.sql.connect(
+                server_hostname="foo",
+                http_path="dummy_path",
+                access_token="tok",
+                enable_telemetry=False,
+            )
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "USE SCHEMA other",
+            "set time_zone = 'UTC'",
+            "RESET",
+            "-- switch\n  USE CATALOG c",
+            "/* config */ SET ansi_mode = false",
+            "SET TIME ZONE 'America/Los_Angeles'",
+            "SET CATALOG other",
+            "SET VARIABLE v = 1",
+        ],
+    )
+    def test_statements_that_change_the_session(self, connection, statement):
+        connection.cursor().execute(statement)
+
+        assert connection._session_state_changed is True
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "SELECT 1",
+            "INSERT INTO t VALUES (1)",
+            "SELECT * FROM reset",
+            "SET",
+            "SET ansi_mode",
+            "SET AUTOCOMMIT = FALSE",
+            "SET AUTOCOMMIT",
+        ],
+    )
+    def test_other_statements(self, connection, statement):
+        connection.cursor().execute(statement)
+        connection.cursor().execute_async(statement)
+
+        assert connection._session_state_changed is False
+
+    def test_statements_run_asynchronously(self, connection):
+        connection.cursor().execute_async("USE SCHEMA other")
+
+        assert connection._session_state_changed is True
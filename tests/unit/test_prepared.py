@@ -0,0 +1,167 @@
+import datetime
+import decimal
+from unittest.mock import patch
+
+import pytest
+
+import databricks.sql
+from databricks.sql.parameters import IntegerParameter, StringParameter
+from databricks.sql.parameters.native import (
+    ParameterStructure,
+    dbsql_parameter_from_primitive,
+)
+from databricks.sql.parameters.prepared import (
+    PreparedOperation,
+    PreparedOperationCache,
+    PreparedStatement,
+    parameter_structure,
+)
+
+VALUES = [
+    True,
+    0,
+    -128,
+    2**31 - 1,
+    2**31,
+    -(2**31) - 1,
+    "text",
+    1.5,
+    None,
+    datetime.date(2024, 1, 2),
+    datetime.datetime(2024, 1, 2, 3, 4, 5),
+    decimal.Decimal("12.345"),
+    [1, 2, 3],
+    {"k": "v"},
+]
+
+
+class TestPreparedOperation:
+    @pytest.mark.parametrize("value", VALUES)
+    def test_binding_matches_parameter_objects(self, value):
+        named = PreparedOperation("SELECT :p", ParameterStructure.NAMED)
+        positional = PreparedOperation("SELECT ?", ParameterStructure.POSITIONAL)
+
+        assert named.bind({"p": value}) == [
+            dbsql_parameter_from_primitive(value, name="p").as_tspark_param(named=True)
+        ]
+        assert positional.bind([value]) == [
+            dbsql_parameter_from_primitive(value).as_tspark_param(named=False)
+        ]
+
+    def test_parameter_objects_are_bound_as_given(self):
+        prepared = PreparedOperation("SELECT :a, :b", ParameterStructure.NAMED)
+        parameters = [IntegerParameter(1, name="a"), StringParameter("x", name="b")]
+
+        assert prepared.bind(parameters) == [
+            p.as_tspark_param(named=True) for p in parameters
+        ]
+
+    def test_pyformat_markers_are_rewritten(self):
+        prepared = PreparedOperation(
+            "SELECT %(a)s, %(b)s, %(a)s", ParameterStructure.NAMED
+        )
+
+        assert prepared.transformed == "SELECT :a, :b, :a"
+
+    @pytest.mark.parametrize(
+        "parameters, structure",
+        [
+            ({"a": 1}, ParameterStructure.NAMED),
+            ([1, 2], ParameterStructure.POSITIONAL),
+            ([IntegerParameter(1, name="a")], ParameterStructure.NAMED),
+            ([IntegerParameter(1, name="a"), 2], ParameterStructure.POSITIONAL),
+        ],
+    )
+    def test_parameter_structure(self, parameters, structure):
+        assert parameter_structure(parameters) == structure
+
+
+class TestPreparedOperationCache:
+    def test_repeated_statement_is_prepared_once(self):
+        cache = PreparedOperationCache()
+
+        first = cache.get("SELECT :a", ParameterStructure.NAMED)
+        second = cache.get("SELECT :a", ParameterStructure.NAMED)
+        other = cache.get("SELECT :a", ParameterStructure.POSITIONAL)
+
+        assert first is second
+        assert other is not first
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_least_recently_used_statement_is_dropped(self):
+        cache = PreparedOperationCache(max_size=2)
+        a = cache.get("a", ParameterStructure.NAMED)
+        cache.get("b", ParameterStructure.NAMED)
+        cache.get("a", ParameterStructure.NAMED)
+        cache.get("c", ParameterStructure.NAMED)
+
+        assert len(cache) == 2
+        assert cache.get("a", ParameterStructure.NAMED) is a
+        assert cache.misses == 3
+
+    def test_zero_size_disables_caching(self):
+        cache = PreparedOperationCache(max_size=0)
+        cache.get("a", ParameterStructure.NAMED)
+
+        assert len(cache) == 0
+
+
+class TestCursorPrepare:
+    @pytest.fixture
+    def backend(self):
+        with patch("databricks.sql.session.ThriftDatabricksClient") as client_class:
+            backend = client_class.return_value
+            backend.execute_command.return_value.is_staging_operation = False
+            backend.execute_command.return_value.num_modified_rows = None
+            yield backend
+
+    @pytest.fixture
+    def connection(self, backend):
+        return databricks.sql.connect(
+            server_hostname="foo",
+            http_path="dummy_path",
+            access_token="tok",
+            enable_telemetry=False,
+        )
+
+    def test_repeated_execute_reuses_the_preparation(self, backend, connection):
+        cursor = connection.cursor()
+        with patch(
+            "databricks.sql.parameters.prepared.transform_paramstyle",
+            side_effect=lambda operation, *_: operation.replace("%(a)s", ":a"),
+        ) as transform:
+            for i in range(3):
+                cursor.execute("SELECT %(a)s", {"a": i})
+
+        transform.assert_called_once()
+        kwargs = backend.execute_command.call_args.kwargs
+        assert kwargs["operation"] == "SELECT :a"
+        assert kwargs["parameters"] == [
+            IntegerParameter(2, name="a").as_tspark_param(named=True)
+        ]
+
+    def test_prepared_statement_executes_with_new_parameters(self, backend, connection):
+        cursor = connection.cursor()
+        statement = cursor.prepare("SELECT * FROM t WHERE a = ? AND b = ?")
+
+        assert isinstance(statement, PreparedStatement)
+        assert statement.execute([1, "x"]) is cursor
+        statement.execute_async([2, "y"])
+
+        calls = backend.execute_command.call_args_list
+        assert [c.kwargs["async_op"] for c in calls] == [False, True]
+        assert all(
+            c.kwargs["operation"] == "SELECT * FROM t WHERE a = ? AND b = ?"
+            for c in calls
+        )
+        assert calls[1].kwargs["parameters"] == [
+            dbsql_parameter_from_primitive(v).as_tspark_param(named=False)
+            for v in (2, "y")
+        ]
+        # The statement holds its own preparation rather than using the shared cache
+        assert len(connection.prepared_operations) == 0
+
+    def test_prepared_statement_without_parameters(self, backend, connection):
+        connection.cursor().prepare("SELECT 1").execute()
+
+        assert backend.execute_command.call_args.kwargs["operation"] == "SELECT 1"
@@ -0,0 +1,441 @@
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+import databricks.sql
+from databricks.sql.common.fanout import QueryResult
+from databricks.sql.exc import ServerOperationError
+from databricks.sql.result_cache import ResultCache
+
+pytestmark = pytest.mark.skipif(pyarrow is None, reason="PyArrow is not installed")
+
+DESCRIPTION = [("a", "int", None, None, None, None, None)]
+
+
+def make_table(n):
+    return pyarrow.table({"a": list(range(n))})
+
+
+def ipc_size(table):
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+class TestResultCache:
+    def test_round_trip_and_metrics(self):
+        cache = ResultCache()
+        table = make_table(10)
+
+        assert cache.get("key") is None
+        cache.put("key", table, DESCRIPTION)
+        cached_table, description = cache.get("key")
+
+        assert cached_table == table
+        assert description == DESCRIPTION
+        metrics = cache.metrics()
+        assert (metrics.hits, metrics.misses) == (1, 1)
+        assert metrics.memory_entries == 1
+        assert metrics.memory_bytes == ipc_size(table)
+        assert metrics.hit_ratio == 0.5
+
+    @patch("databricks.sql.result_cache.time.monotonic")
+    def test_entries_expire(self, mock_monotonic):
+        mock_monotonic.return_value = 1000
+        cache = ResultCache(ttl=60)
+        cache.put("default", make_table(1), DESCRIPTION)
+        cache.put("short", make_table(1), DESCRIPTION, ttl=10)
+
+        mock_monotonic.return_value = 1030
+        assert cache.get("short") is None
+        assert cache.get("default") is not None
+
+        mock_monotonic.return_value = 1060
+        assert cache.get("default") is None
+        assert cache.metrics().expirations == 2
+
+    def test_zero_ttl_is_not_cached(self):
+        cache = ResultCache()
+        cache.put("key", make_table(1), DESCRIPTION, ttl=0)
+
+        assert cache.get("key") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        table = make_table(100)
+        cache = ResultCache(max_memory_bytes=2 * ipc_size(table))
+        cache.put("a", table, DESCRIPTION)
+        cache.put("b", table, DESCRIPTION)
+        cache.get("a")
+
+        cache.put("c", table, DESCRIPTION)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.metrics().evictions == 1
+
+    def test_entries_pushed_out_of_memory_move_to_disk(self, tmp_path):
+        table = make_table(1000)
+        cache = ResultCache(max_memory_bytes=0, disk_path=str(tmp_path))
+
+        cache.put("key", table, DESCRIPTION)
+
+        metrics = cache.metrics()
+        assert (metrics.memory_entries, metrics.disk_entries) == (0, 1)
+        assert len(os.listdir(tmp_path)) == 1
+        cached_table, description = cache.get("key")
+        assert cached_table == table
+        assert description == DESCRIPTION
+        assert cache.metrics().disk_hits == 1
+
+        cache.clear()
+        assert os.listdir(tmp_path) == []
+
+    def test_disk_tier_is_bounded(self, tmp_path):
+        table = make_table(1000)
+        cache = ResultCache(
+            max_memory_bytes=0,
+            disk_path=str(tmp_path),
+            max_disk_bytes=ipc_size(table),
+        )
+
+        cache.put("a", table, DESCRIPTION)
+        cache.put("b", table, DESCRIPTION)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert len(os.listdir(tmp_path)) == 1
+        assert cache.metrics().evictions == 1
+
+    def test_invalidate(self, tmp_path):
+        cache = ResultCache(max_memory_bytes=0, disk_path=str(tmp_path))
+        cache.put("key", make_table(1), DESCRIPTION)
+
+        cache.invalidate("key")
+
+        assert cache.get("key") is None
+        assert os.listdir(tmp_path) == []
+
+
+class FakeTableVersions:
+    """Stands in for the server's DESCRIBE HISTORY, recording each batch looked up."""
+
+    def __init__(self, **versions):
+        self.versions = versions
+        self.batches = []
+
+    def __call__(self, tables):
+        self.batches.append(sorted(tables))
+        return {table: self.versions.get(table) for table in tables}
+
+
+class TestTableVersionValidation:
+    def test_entry_is_valid_until_a_table_changes(self):
+        versions = FakeTableVersions(t=1, u=7)
+        cache = ResultCache(version_check_interval=0)
+        cache.put("key", make_table(1), DESCRIPTION, table_versions={"t": 1, "u": 7})
+
+        assert cache.get("key", versions) is not None
+        versions.versions["u"] = 8
+        assert cache.get("key", versions) is None
+        assert cache.get("key", versions) is None
+
+        metrics = cache.metrics()
+        assert metrics.invalidations == 1
+        assert metrics.memory_entries == 0
+        assert versions.batches == [["t", "u"], ["t", "u"]]
+
+    @patch("databricks.sql.result_cache.time.monotonic")
+    def test_versioned_entries_do_not_expire_by_default(self, mock_monotonic):
+        mock_monotonic.return_value = 1000
+        versions = FakeTableVersions(t=1)
+        cache = ResultCache(ttl=60)
+        cache.put("key", make_table(1), DESCRIPTION, table_versions={"t": 1})
+        cache.put("short", make_table(1), DESCRIPTION, ttl=10, table_versions={"t": 1})
+
+        mock_monotonic.return_value = 10**6
+        assert cache.get("key", versions) is not None
+        assert cache.get("short", versions) is None
+
+    def test_versioned_entry_needs_a_version_lookup(self):
+        cache = ResultCache()
+        cache.put("key", make_table(1), DESCRIPTION, table_versions={"t": 1})
+
+        assert cache.get("key") is None
+        assert cache.metrics().memory_entries == 1
+
+    def test_unknown_current_version_invalidates(self):
+        cache = ResultCache()
+        cache.put("key", make_table(1), DESCRIPTION, table_versions={"t": 1})
+
+        assert cache.get("key", FakeTableVersions()) is None
+        assert cache.metrics().invalidations == 1
+
+    @patch("databricks.sql.result_cache.time.monotonic")
+    def test_recent_versions_are_reused(self, mock_monotonic):
+        mock_monotonic.return_value = 1000
+        versions = FakeTableVersions(t=1, u=1)
+        cache = ResultCache(version_check_interval=5)
+        cache.put("a", make_table(1), DESCRIPTION, table_versions={"t": 1})
+        cache.put("b", make_table(1), DESCRIPTION, table_versions={"t": 1, "u": 1})
+
+        assert cache.get("a", versions) is not None
+        assert cache.get("b", versions) is not None
+        assert versions.batches == [["t"], ["u"]]
+
+        mock_monotonic.return_value = 1005
+        assert cache.get("b", versions) is not None
+        assert versions.batches[-1] == ["t", "u"]
+        assert cache.metrics().version_checks == 3
+
+    def test_revalidate_checks_all_entries_in_one_batch(self, tmp_path):
+        versions = FakeTableVersions(t=2, u=1, v=1)
+        cache = ResultCache(
+            max_memory_bytes=ipc_size(make_table(1)), disk_path=str(tmp_path)
+        )
+        cache.put("t", make_table(1), DESCRIPTION, table_versions={"t": 1})
+        cache.put("tu", make_table(1), DESCRIPTION, table_versions={"t": 2, "u": 1})
+        cache.put("v", make_table(1), DESCRIPTION, table_versions={"v": 0})
+        cache.put("plain", make_table(1), DESCRIPTION)
+
+        assert cache.revalidate(versions) == 2
+
+        assert versions.batches == [["t", "u", "v"]]
+        assert cache.get("tu", versions) is not None
+        assert cache.get("plain") is not None
+        metrics = cache.metrics()
+        assert metrics.memory_entries + metrics.disk_entries == 2
+        assert len(os.listdir(tmp_path)) == metrics.disk_entries
+
+
+class TestCursorResultCache:
+    QUERY = "SELECT * FROM t WHERE a = :a"
+
+    @pytest.fixture
+    def backend(self):
+        with patch("databricks.sql.session.ThriftDatabricksClient") as client_class:
+            backend = client_class.return_value
+
+            def execute_command(**kwargs):
+                result_set = Mock()
+                result_set.fetchall_arrow.return_value = make_table(3)
+                result_set.description = DESCRIPTION
+                result_set.is_staging_operation = False
+                result_set.num_modified_rows = None
+                return result_set
+
+            backend.execute_command.side_effect = execute_command
+            yield backend
+
+    @pytest.fixture
+    def connection(self, backend):
+        return databricks.sql.connect(
+            server_hostname="foo",
+            http_path="dummy_path",
+            access_token="tok",
+            enable_telemetry=False,
+            result_cache=True,
+            _disable_pandas=True,
+        )
+
+    def test_repeated_query_is_answered_from_the_cache(self, backend, connection):
+        cursor = connection.cursor()
+        cursor.execute(self.QUERY, {"a": 1})
+        first = cursor.fetchall()
+        backend.reset_mock()
+
+        cursor.execute(self.QUERY, {"a": 1})
+
+        assert cursor.fetchall() == first
+        assert cursor.query_id is None
+        # No execute, fetch or close request reached the server
+        assert backend.method_calls == []
+        assert connection.result_cache.metrics().hits == 1
+
+    def test_different_parameters_miss(self, backend, connection):
+        cursor = connection.cursor()
+        cursor.execute(self.QUERY, {"a": 1})
+        cursor.execute(self.QUERY, {"a": 2})
+
+        assert backend.execute_command.call_count == 2
+
+    def test_bypass_and_zero_ttl_run_the_query(self, backend, connection):
+        cursor = connection.cursor()
+        cursor.execute(self.QUERY, {"a": 1}, cache_ttl=0)
+        cursor.execute(self.QUERY, {"a": 1})
+        cursor.execute(self.QUERY, {"a": 1}, bypass_cache=True)
+
+        assert backend.execute_command.call_count == 3
+        assert connection.result_cache.metrics().hits == 0
+
+    def test_statements_that_write_are_not_cached(self, backend, connection):
+        cursor = connection.cursor()
+        cursor.execute("INSERT INTO t VALUES (1)")
+        cursor.execute("INSERT INTO t VALUES (1)")
+
+        assert backend.execute_command.call_count == 2
+        assert connection.result_cache.metrics().memory_entries == 0
+
+    def test_result_depending_on_tables_is_cached_until_they_change(
+        self, backend, connection
+    ):
+        versions = FakeTableVersions(**{"main.s.t": 3})
+        connection._fetch_table_versions = versions
+        connection.result_cache.version_check_interval = 0
+        cursor = connection.cursor()
+
+        for _ in range(3):
+            cursor.execute("SELECT * FROM main.s.t", cache_depends_on=["main.s.t"])
+        assert backend.execute_command.call_count == 1
+
+        versions.versions["main.s.t"] = 4
+        cursor.execute("SELECT * FROM main.s.t", cache_depends_on=["main.s.t"])
+
+        assert backend.execute_command.call_count == 2
+        assert connection.result_cache.metrics().invalidations == 1
+
+    def test_declared_table_versions(self, backend, connection):
+        versions = FakeTableVersions(t=5)
+        connection._fetch_table_versions = versions
+        cursor = connection.cursor()
+
+        cursor.execute("SELECT * FROM t", cache_depends_on={"t": 4})
+        # Versions are only looked up to validate, not when declared
+        assert versions.batches == []
+        cursor.execute("SELECT * FROM t", cache_depends_on={"t": 5})
+        cursor.execute("SELECT * FROM t", cache_depends_on={"t": 5})
+
+        assert backend.execute_command.call_count == 2
+
+    def test_result_is_not_cached_if_a_version_is_unknown(self, backend, connection):
+        connection._fetch_table_versions = FakeTableVersions()
+        cursor = connection.cursor()
+
+        cursor.execute("SELECT * FROM t", cache_depends_on="t")
+
+        assert connection.result_cache.metrics().memory_entries == 0
+
+    @pytest.mark.parametrize(
+        "statement", ["USE SCHEMA other", "SET time_zone = 'UTC'", "RESET"]
+    )
+    def test_cache_is_bypassed_after_use_set_or_reset(
+        self, backend, connection, statement
+    ):
+        cursor = connection.cursor()
+        cursor.execute("SELECT * FROM t")
+
+        cursor.execute(statement)
+        cursor.execute("SELECT * FROM t")
+        cursor.execute("SELECT * FROM t")
+
+        assert backend.execute_command.call_count == 4
+        assert connection.result_cache.metrics().hits == 0
+        assert connection.result_cache.metrics().memory_entries == 1
+
+    def test_cache_still_works_after_autocommit_is_used(self, backend, connection):
+        connection._fetch_autocommit_from_server = True
+        cursor = connection.cursor()
+        cursor.execute("SELECT * FROM t")
+
+        with patch("databricks.sql.client.Cursor.fetchone", return_value=["true"]):
+            assert connection.autocommit is True
+        connection.autocommit = False
+        cursor.execute("SELECT * FROM t")
+
+        assert connection.result_cache.metrics().hits == 1
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            {"access_token": "another principal"},
+            {"session_configuration": {"time_zone": "UTC"}},
+        ],
+    )
+    def test_shared_cache_is_keyed_by_credentials_and_configuration(
+        self, backend, connection, other
+    ):
+        other_connection = databricks.sql.connect(
+            server_hostname="foo",
+            http_path="dummy_path",
+            enable_telemetry=False,
+            result_cache=connection.result_cache,
+            _disable_pandas=True,
+            **{"access_token": "tok", **other},
+        )
+
+        connection.cursor().execute("SELECT * FROM t")
+        other_connection.cursor().execute("SELECT * FROM t")
+
+        assert backend.execute_command.call_count == 2
+        assert connection.result_cache.metrics().hits == 0
+
+    def test_connection_revalidates_its_result_cache(self, backend, connection):
+        results = iter(
+            [
+                [QueryResult(0, "", result=pyarrow.table({"version": [1]}))],
+                [QueryResult(0, "", result=pyarrow.table({"version": [2]}))],
+            ]
+        )
+        connection.run_concurrently = Mock(side_effect=lambda statements: next(results))
+        cursor = connection.cursor()
+        cursor.execute("SELECT * FROM main.s.t", cache_depends_on=["main.s.t"])
+        connection.result_cache.version_check_interval = 0
+
+        assert connection.revalidate_result_cache() == 1
+
+        assert connection.result_cache.metrics().memory_entries == 0
+        connection.run_concurrently.assert_called_with(
+            ["DESCRIBE HISTORY `main`.`s`.`t` LIMIT 1"]
+        )
+
+    def test_revalidating_without_a_result_cache(self, backend):
+        connection = databricks.sql.connect(
+            server_hostname="foo",
+            http_path="dummy_path",
+            access_token="tok",
+            enable_telemetry=False,
+        )
+
+        assert connection.revalidate_result_cache() == 0
+
+    def test_versions_are_read_from_table_history(self, connection):
+        results = [
+            QueryResult(0, "", result=pyarrow.table({"version": [12]})),
+            QueryResult(1, "", error=ServerOperationError("TABLE_OR_VIEW_NOT_FOUND")),
+        ]
+        connection.run_concurrently = Mock(return_value=iter(results))
+
+        versions = connection._fetch_table_versions(["a.b.c", "missing"])
+
+        assert versions == {"a.b.c": 12, "missing": None}
+        connection.run_concurrently.assert_called_once_with(
+            [
+                "DESCRIBE HISTORY `a`.`b`.`c` LIMIT 1",
+                "DESCRIBE HISTORY `missing` LIMIT 1",
+            ]
+        )
+
+    @pytest.mark.parametrize(
+        "table, quoted",
+        [
+            ("main.my-schema.t", "`main`.`my-schema`.`t`"),
+            ("main.s.`odd.name`", "`main`.`s`.`odd.name`"),
+            ("`we``ird`", "`we``ird`"),
+            ("t LIMIT 1; DROP TABLE x --", "`t LIMIT 1; DROP TABLE x --`"),
+            ("a`b", "`a``b`"),
+        ],
+    )
+    def test_table_names_are_quoted(self, connection, table, quoted):
+        connection.run_concurrently = Mock(return_value=iter([]))
+
+        connection._fetch_table_versions([table])
+
+        connection.run_concurrently.assert_called_once_with(
+            ["DESCRIBE HISTORY %s LIMIT 1" % quoted]
+        )
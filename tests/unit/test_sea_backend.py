@@ -707,6 +707,24 @@ class TestSeaBackend:
             )
         assert "Command failed" in str(excinfo.value)
 
+    def test_get_query_state_raises_the_server_error(
+        self, sea_client, mock_http_client, sea_command_id
+    ):
+        mock_http_client._make_request.return_value = {
+            "statement_id": "test-statement-123",
+            "status": {
+                "state": "FAILED",
+                "error": {
+                    "message": "Table not found",
+                    "error_code": "TABLE_OR_VIEW_NOT_FOUND",
+                },
+            },
+        }
+
+        with pytest.raises(ServerOperationError) as excinfo:
+            sea_client.get_query_state(sea_command_id)
+        assert "TABLE_OR_VIEW_NOT_FOUND - Table not found" in str(excinfo.value)
+
     def test_extract_description_from_manifest(self, sea_client):
         """Test _extract_description_from_manifest."""
         manifest_obj = MagicMock()
@@ -1,6 +1,6 @@
 import json
 import unittest
-from unittest.mock import patch, Mock, MagicMock
+from unittest.mock import ANY, patch, Mock, MagicMock
 import pytest
 
 from databricks.sql.backend.sea.utils.http_client import SeaHttpClient
@@ -155,7 +155,7 @@ class TestSeaHttpClient:
                 "Authorization": "Bearer test-token",
             },
             preload_content=False,
-            retries=sea_http_client.retry_policy,
+            retries=ANY,
         )
 
         # Check the result
@@ -178,9 +178,15 @@ class TestSeaHttpClient:
                 "Content-Length": str(len(expected_body)),
             },
             preload_content=False,
-            retries=sea_http_client.retry_policy,
+            retries=ANY,
         )
 
+        # Each request carries its own retry state
+        retries = sea_http_client._pool.request.call_args.kwargs["retries"]
+        assert retries is not sea_http_client.retry_policy
+        assert retries.command_type == CommandType.EXECUTE_STATEMENT
+        assert sea_http_client.retry_policy.command_type is None
+
     @patch(
         "databricks.sql.backend.sea.utils.http_client.SeaHttpClient._get_auth_headers"
     )
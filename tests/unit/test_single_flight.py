@@ -0,0 +1,260 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+import databricks.sql
+from databricks.sql.common.single_flight import SingleFlight
+from databricks.sql.result_set import ArrowTableResultSet
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for condition"
+        time.sleep(0.001)
+
+
+def run_in_threads(n, target):
+    results = [None] * n
+    errors = [None] * n
+
+    def run(i):
+        try:
+            results[i] = target(i)
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        func = Mock(side_effect=lambda: release.wait() and "value")
+
+        threads, results, _ = run_in_threads(5, lambda i: single_flight.do("key", func))
+        wait_until(lambda: single_flight.shared == 4)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        func.assert_called_once()
+        assert sorted(shared for _, shared in results) == [False] + [True] * 4
+        assert all(value == "value" for value, _ in results)
+        assert single_flight.executions == 1
+
+    def test_error_is_raised_to_every_caller(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def fail():
+            release.wait()
+            raise ValueError("boom")
+
+        threads, _, errors = run_in_threads(3, lambda i: single_flight.do("key", fail))
+        wait_until(lambda: single_flight.shared == 2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert all(isinstance(e, ValueError) for e in errors)
+
+    def test_nothing_is_cached_after_the_call_returns(self):
+        single_flight = SingleFlight()
+        func = Mock(return_value=1)
+
+        single_flight.do("key", func)
+        single_flight.do("key", func)
+        single_flight.do("other", func)
+
+        assert func.call_count == 3
+        assert single_flight.shared == 0
+
+
+@pytest.mark.skipif(pyarrow is None, reason="PyArrow is not installed")
+class TestArrowTableResultSet:
+    def test_fetches_read_the_table_independently(self):
+        table = pyarrow.table({"a": [1, 2, 3]})
+        connection = Mock(disable_pandas=True)
+        first, second = (
+            ArrowTableResultSet(connection, Mock(), table, Mock(), [("a", "int")])
+            for _ in range(2)
+        )
+
+        assert first.fetchone() == (1,)
+        assert [tuple(r) for r in first.fetchmany(5)] == [(2,), (3,)]
+        assert first.fetchall() == []
+        assert second.fetchall_arrow() == table
+        assert second.rownumber == 3
+
+
+@pytest.mark.skipif(pyarrow is None, reason="PyArrow is not installed")
+class TestCursorDeduplication:
+    QUERY = "SELECT * FROM t WHERE a = :a"
+
+    @pytest.fixture
+    def backend(self):
+        with patch("databricks.sql.session.ThriftDatabricksClient") as client_class:
+            backend = client_class.return_value
+            backend.release = threading.Event()
+            backend.release.set()
+
+            def execute_command(**kwargs):
+                if kwargs["operation"].startswith("SELECT"):
+                    backend.release.wait()
+                result_set = Mock()
+                result_set.fetchall_arrow.return_value = pyarrow.table({"a": [1, 2, 3]})
+                result_set.description = [("a", "int", None, None, None, None, None)]
+                result_set.command_id = Mock()
+                result_set.is_staging_operation = False
+                result_set.num_modified_rows = None
+                return result_set
+
+            backend.execute_command.side_effect = execute_command
+            yield backend
+
+    def connect(self, **kwargs):
+        return databricks.sql.connect(
+            server_hostname="foo",
+            http_path="dummy_path",
+            enable_telemetry=False,
+            **{"access_token": "tok", **kwargs},
+        )
+
+    def run_overlapping(self, backend, first_cursor, second_cursor, between=None):
+        """Run QUERY on both cursors, the second starting while the first runs."""
+        backend.release.clear()
+        threads = [
+            threading.Thread(target=lambda: first_cursor.execute(self.QUERY, {"a": 1}))
+        ]
+        threads[0].start()
+        wait_until(lambda: backend.execute_command.call_count >= 1)
+        if between is not None:
+            between()
+        threads.append(
+            threading.Thread(target=lambda: second_cursor.execute(self.QUERY, {"a": 1}))
+        )
+        threads[1].start()
+        time.sleep(0.1)
+        backend.release.set()
+        for thread in threads:
+            thread.join()
+
+    def test_concurrent_identical_queries_share_one_execution(self, backend):
+        connection = self.connect(deduplicate_queries=True)
+        cursors = [connection.cursor() for _ in range(4)]
+        backend.release.clear()
+
+        threads, _, errors = run_in_threads(
+            4, lambda i: cursors[i].execute(self.QUERY, {"a": 1})
+        )
+        wait_until(lambda: connection.single_flight.shared == 3)
+        backend.release.set()
+        for thread in threads:
+            thread.join()
+
+        assert errors == [None] * 4
+        backend.execute_command.assert_called_once()
+        # Every cursor reads the shared result independently
+        assert cursors[0].fetchmany_arrow(2).num_rows == 2
+        for cursor in cursors:
+            assert cursor.fetchall_arrow().num_rows in (1, 3)
+        assert len({cursor.query_id for cursor in cursors}) == 1
+
+    def test_different_parameters_are_not_shared(self, backend):
+        connection = self.connect(deduplicate_queries=True)
+        backend.release.clear()
+
+        threads, _, _ = run_in_threads(
+            2, lambda i: connection.cursor().execute(self.QUERY, {"a": i})
+        )
+        wait_until(lambda: backend.execute_command.call_count == 2)
+        backend.release.set()
+        for thread in threads:
+            thread.join()
+
+        assert connection.single_flight.shared == 0
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "INSERT INTO t VALUES (1)",
+            "WITH s AS (SELECT 1) INSERT INTO t SELECT * FROM s",
+            "CREATE TABLE t AS SELECT 1",
+        ],
+    )
+    def test_statements_that_write_are_never_shared(self, backend, statement):
+        connection = self.connect(deduplicate_queries=True)
+
+        connection.cursor().execute(statement)
+
+        assert connection.single_flight.executions == 0
+
+    def test_deduplication_is_off_by_default(self, backend):
+        connection = self.connect()
+
+        connection.cursor().execute(self.QUERY, {"a": 1})
+
+        assert connection.single_flight is None
+
+    def test_single_flight_can_be_shared_between_connections(self, backend):
+        single_flight = SingleFlight()
+        first = self.connect(deduplicate_queries=single_flight)
+        second = self.connect(deduplicate_queries=single_flight)
+
+        assert first.single_flight is second.single_flight is single_flight
+
+    @pytest.mark.parametrize(
+        "statement", ["USE SCHEMA other", "SET time_zone = 'America/New_York'"]
+    )
+    def test_queries_after_use_or_set_are_not_shared(self, backend, statement):
+        connection = self.connect(deduplicate_queries=True)
+
+        self.run_overlapping(
+            backend,
+            connection.cursor(),
+            connection.cursor(),
+            between=lambda: connection.cursor().execute(statement),
+        )
+
+        assert connection.single_flight.shared == 0
+        assert backend.execute_command.call_count == 3
+
+    def test_connections_with_the_same_credentials_share(self, backend):
+        single_flight = SingleFlight()
+        first = self.connect(deduplicate_queries=single_flight)
+        second = self.connect(deduplicate_queries=single_flight)
+
+        self.run_overlapping(backend, first.cursor(), second.cursor())
+
+        assert single_flight.shared == 1
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            {"access_token": "another principal"},
+            {"session_configuration": {"time_zone": "UTC"}},
+        ],
+    )
+    def test_connections_with_other_credentials_or_configuration_do_not_share(
+        self, backend, other
+    ):
+        single_flight = SingleFlight()
+        first = self.connect(deduplicate_queries=single_flight)
+        second = self.connect(deduplicate_queries=single_flight, **other)
+
+        self.run_overlapping(backend, first.cursor(), second.cursor())
+
+        assert single_flight.shared == 0
+        assert backend.execute_command.call_count == 2
@@ -86,9 +86,9 @@ class TestStreamingPut:
             # Check positional arguments: (method, url, body=..., headers=...)
             assert call_args[0][0].value == "PUT"  # First positional arg is method
             assert call_args[0][1] == presigned_url  # Second positional arg is url
-            # Check keyword arguments
-            assert call_args[1]["body"] == b"test data"
-            assert call_args[1]["headers"] == headers
+            # Check keyword arguments: the body is streamed with a known length
+            assert call_args[1]["body"].read() == b"test data"
+            assert call_args[1]["headers"] == {**headers, "Content-Length": "9"}
 
     def test_handle_staging_put_stream_http_error(self, cursor):
         """Test streaming PUT operation with HTTP error."""
@@ -111,3 +111,49 @@ class TestStreamingPut:
 
             # Check for the actual error message format
             assert "500" in str(excinfo.value)
+
+    def test_handle_staging_put_streams_local_file(self, cursor, tmp_path):
+        """PUT from a local file streams it from the file handle with its size."""
+
+        local_file = tmp_path / "data.bin"
+        local_file.write_bytes(b"x" * 1024)
+
+        def consume_body(method, url, body=None, headers=None):
+            assert not isinstance(body, bytes)
+            assert body.read() == b"x" * 1024
+            response = MagicMock()
+            response.status = 200
+            return response
+
+        cursor.connection.http_client.request.side_effect = consume_body
+        cursor._handle_staging_put(
+            presigned_url="https://example.com/upload", local_file=str(local_file)
+        )
+
+        headers = cursor.connection.http_client.request.call_args[1]["headers"]
+        assert headers["Content-Length"] == "1024"
+
+    def test_handle_staging_put_stream_unknown_length_is_chunked(self, cursor):
+        """Streams whose size is unknown are sent without a Content-Length header."""
+
+        class UnsizedStream(io.RawIOBase):
+            def __init__(self):
+                self._data = io.BytesIO(b"chunk")
+
+            def readable(self):
+                return True
+
+            def read(self, size=-1):
+                return self._data.read(size)
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        cursor.connection.http_client.request.return_value = mock_response
+
+        cursor._handle_staging_put_stream(
+            presigned_url="https://example.com/upload", stream=UnsizedStream()
+        )
+
+        call_args = cursor.connection.http_client.request.call_args
+        assert "Content-Length" not in call_args[1]["headers"]
+        assert call_args[1]["body"].read() == b"chunk"
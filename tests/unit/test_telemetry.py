@@ -1,3 +1,4 @@
+import threading
 import uuid
 import pytest
 from unittest.mock import patch, MagicMock
@@ -14,7 +15,11 @@ from databricks.sql.common.feature_flag import (
     FeatureFlagsContextFactory,
     FeatureFlagsContext,
 )
-from databricks.sql.telemetry.models.enums import AuthMech, AuthFlow, DatabricksClientType
+from databricks.sql.telemetry.models.enums import (
+    AuthMech,
+    AuthFlow,
+    DatabricksClientType,
+)
 from databricks.sql.telemetry.models.event import (
     TelemetryEvent,
     DriverConnectionParameters,
@@ -31,6 +36,7 @@ from databricks.sql.auth.authenticators import (
 )
 from databricks.sql.auth.token_federation import TokenFederationProvider
 from databricks import sql
+from databricks.sql.exc import RequestError
 
 
 @pytest.fixture
@@ -236,7 +242,9 @@ class TestTelemetryHelper:
         oauth._refresh_token = None
         fed = self._make_real_federation(oauth)
         assert TelemetryHelper.get_auth_mechanism(fed) == AuthMech.OAUTH
-        assert TelemetryHelper.get_auth_flow(fed) == AuthFlow.BROWSER_BASED_AUTHENTICATION
+        assert (
+            TelemetryHelper.get_auth_flow(fed) == AuthFlow.BROWSER_BASED_AUTHENTICATION
+        )
 
     def test_token_federation_unwraps_oauth_passthrough(self):
         oauth = MagicMock(spec=DatabricksOAuthProvider)
@@ -252,7 +260,9 @@ class TestTelemetryHelper:
         params = DriverConnectionParameters(
             http_path="/sql/1.0/warehouses/abc",
             mode=DatabricksClientType.THRIFT,
-            host_info=HostDetails(host_url="https://example.cloud.databricks.com", port=443),
+            host_info=HostDetails(
+                host_url="https://example.cloud.databricks.com", port=443
+            ),
             auth_mech=TelemetryHelper.get_auth_mechanism(fed),
             auth_flow=TelemetryHelper.get_auth_flow(fed),
         )
@@ -475,6 +485,7 @@ class TestTelemetryFeatureFlag:
             enable_telemetry=True,
         )
 
+        conn._await_background_startup()
         assert conn.telemetry_enabled is True
         mock_http_request.assert_called_once()
         client = TelemetryClientFactory.get_telemetry_client("test-host")
@@ -506,6 +517,7 @@ class TestTelemetryFeatureFlag:
             enable_telemetry=True,
         )
 
+        conn._await_background_startup()
         assert conn.telemetry_enabled is False
         mock_http_request.assert_called_once()
         client = TelemetryClientFactory.get_telemetry_client("test-host")
@@ -537,19 +549,195 @@ class TestTelemetryFeatureFlag:
             enable_telemetry=True,
         )
 
+        conn._await_background_startup()
         assert conn.telemetry_enabled is False
         mock_http_request.assert_called_once()
         client = TelemetryClientFactory.get_telemetry_client("test-host")
         assert isinstance(client, NoopTelemetryClient)
 
 
+@patch("databricks.sql.client.Session")
+class TestBackgroundStartup:
+    """Tests that connect() only waits for the session to open."""
+
+    def teardown_method(self):
+        TelemetryClientFactory._clients.clear()
+        FeatureFlagsContextFactory._context_map.clear()
+
+    def _mock_session(self, MockSession, flag_request):
+        mock_session_instance = MockSession.return_value
+        mock_session_instance.guid_hex = "test-session-startup"
+        mock_session_instance.host = "test-host"
+        mock_session_instance.auth_provider = AccessTokenAuthProvider("token")
+        mock_session_instance.is_open = False
+        mock_session_instance.http_client.request = flag_request
+        return mock_session_instance
+
+    def _flag_response(self, enabled):
+        response = MagicMock()
+        response.status = 200
+        response.data = json.dumps(
+            {
+                "flags": [
+                    {
+                        "name": TelemetryHelper.TELEMETRY_FEATURE_FLAG_NAME,
+                        "value": str(enabled).lower(),
+                    }
+                ],
+                "ttl_seconds": 3600,
+            }
+        ).encode()
+        return response
+
+    def _connect(self, **kwargs):
+        return sql.client.Connection(
+            server_hostname="test",
+            http_path="test",
+            access_token="test",
+            **kwargs,
+        )
+
+    def test_connect_does_not_wait_for_feature_flags(self, MockSession):
+        release = threading.Event()
+        flag_request = MagicMock(
+            side_effect=lambda *args, **kwargs: release.wait(5)
+            and self._flag_response(True)
+        )
+        self._mock_session(MockSession, flag_request)
+
+        conn = self._connect(enable_telemetry=True)
+
+        # Telemetry is off until the flags have loaded
+        assert conn.telemetry_enabled is False
+        assert "session_open" in conn.startup_timings
+        assert "telemetry" not in conn.startup_timings
+
+        release.set()
+        assert conn._await_background_startup(timeout=5)
+        assert conn.telemetry_enabled is True
+        assert isinstance(
+            TelemetryClientFactory.get_telemetry_client("test-host"), TelemetryClient
+        )
+        assert set(conn.startup_timings) == {
+            "http_client",
+            "session_init",
+            "session_open",
+            "feature_flags",
+            "telemetry",
+        }
+        flag_request.assert_called_once()
+
+    def test_feature_flags_are_fetched_while_the_session_opens(self, MockSession):
+        flag_fetched = threading.Event()
+        flag_request = MagicMock(
+            side_effect=lambda *args, **kwargs: flag_fetched.set()
+            or self._flag_response(False)
+        )
+        mock_session_instance = self._mock_session(MockSession, flag_request)
+        mock_session_instance.open.side_effect = lambda: flag_fetched.wait(5)
+
+        conn = self._connect(enable_telemetry=True)
+
+        assert flag_fetched.is_set()
+        assert conn._await_background_startup(timeout=5)
+        assert conn.telemetry_enabled is False
+        flag_request.assert_called_once()
+
+    def test_failed_connect_does_not_keep_its_feature_flags(self, MockSession):
+        mock_session_instance = self._mock_session(
+            MockSession, MagicMock(side_effect=lambda *args, **kwargs: None)
+        )
+        mock_session_instance.open.side_effect = RequestError("invalid token")
+
+        with patch.object(TelemetryClientFactory, "connection_failure_log"):
+            with pytest.raises(RequestError):
+                self._connect(enable_telemetry=True)
+
+        assert "test-host" not in FeatureFlagsContextFactory._context_map
+
+    def test_failed_connect_keeps_another_connections_feature_flags(self, MockSession):
+        self._mock_session(
+            MockSession, MagicMock(return_value=self._flag_response(False))
+        )
+        conn = self._connect(enable_telemetry=True)
+        context = FeatureFlagsContextFactory._context_map["test-host"]
+        MockSession.return_value.open.side_effect = RequestError("invalid token")
+
+        with patch.object(TelemetryClientFactory, "connection_failure_log"):
+            with pytest.raises(RequestError):
+                self._connect(enable_telemetry=True)
+
+        assert FeatureFlagsContextFactory._context_map["test-host"] is context
+        conn.close()
+
+    def test_closing_before_telemetry_is_set_up(self, MockSession):
+        release = threading.Event()
+        flag_request = MagicMock(
+            side_effect=lambda *args, **kwargs: release.wait(5)
+            and self._flag_response(True)
+        )
+        self._mock_session(MockSession, flag_request)
+
+        conn = self._connect(enable_telemetry=True)
+        conn.close()
+        release.set()
+
+        assert conn._await_background_startup(timeout=5)
+        assert conn.telemetry_enabled is False
+        assert "test-host" not in TelemetryClientFactory._clients
+
+    def test_closing_releases_telemetry_once_set_up(self, MockSession):
+        self._mock_session(MockSession, MagicMock())
+
+        conn = self._connect(enable_telemetry=False)
+        assert conn._await_background_startup(timeout=5)
+        assert TelemetryClientFactory._clients["test-host"].refcount == 1
+
+        conn.close()
+
+        assert "test-host" not in TelemetryClientFactory._clients
+
+    def test_closing_waits_for_the_initial_telemetry_log(self, MockSession):
+        self._mock_session(MockSession, MagicMock())
+        exporting = threading.Event()
+        release = threading.Event()
+        events = []
+        telemetry_client = MagicMock()
+
+        def export_initial_telemetry_log(**kwargs):
+            exporting.set()
+            release.wait(5)
+            events.append("export")
+
+        telemetry_client.export_initial_telemetry_log.side_effect = (
+            export_initial_telemetry_log
+        )
+        with patch.object(
+            TelemetryClientFactory,
+            "get_telemetry_client",
+            return_value=telemetry_client,
+        ), patch.object(
+            TelemetryClientFactory,
+            "close",
+            side_effect=lambda host_url: events.append("close"),
+        ):
+            conn = self._connect(enable_telemetry=False)
+            assert exporting.wait(5)
+            closer = threading.Thread(target=conn.close)
+            closer.start()
+            release.set()
+            closer.join(5)
+
+        assert events == ["export", "close"]
+
+
 class TestTelemetryEventModels:
     """Tests for telemetry event model data structures and JSON serialization."""
 
     def test_host_details_serialization(self):
         """Test HostDetails model serialization."""
         host = HostDetails(host_url="test-host.com", port=443)
-        
+
         # Test JSON string generation
         json_str = host.to_json()
         assert isinstance(json_str, str)
@@ -562,7 +750,7 @@ class TestTelemetryEventModels:
         host_info = HostDetails(host_url="workspace.databricks.com", port=443)
         proxy_info = HostDetails(host_url="proxy.company.com", port=8080)
         cf_proxy_info = HostDetails(host_url="cf-proxy.company.com", port=8080)
-        
+
         params = DriverConnectionParameters(
             http_path="/sql/1.0/warehouses/abc123",
             mode=DatabricksClientType.SEA,
@@ -591,11 +779,11 @@ class TestTelemetryEventModels:
             allowed_volume_ingestion_paths="/Volumes/catalog/schema/volume",
             query_tags="team:engineering,project:telemetry",
         )
-        
+
         # Serialize to JSON and parse back
         json_str = params.to_json()
         json_dict = json.loads(json_str)
-        
+
         # Verify all new fields are in JSON
         assert json_dict["http_path"] == "/sql/1.0/warehouses/abc123"
         assert json_dict["mode"] == "SEA"
@@ -603,7 +791,10 @@ class TestTelemetryEventModels:
         assert json_dict["auth_mech"] == "OAUTH"
         assert json_dict["auth_flow"] == "BROWSER_BASED_AUTHENTICATION"
         assert json_dict["socket_timeout"] == 30000
-        assert json_dict["azure_workspace_resource_id"] == "/subscriptions/test/resourceGroups/test"
+        assert (
+            json_dict["azure_workspace_resource_id"]
+            == "/subscriptions/test/resourceGroups/test"
+        )
         assert json_dict["azure_tenant_id"] == "tenant-123"
         assert json_dict["use_proxy"] is True
         assert json_dict["use_system_proxy"] is True
@@ -621,28 +812,31 @@ class TestTelemetryEventModels:
         assert json_dict["async_poll_interval_millis"] == 2000
         assert json_dict["support_many_parameters"] is True
         assert json_dict["enable_complex_datatype_support"] is True
-        assert json_dict["allowed_volume_ingestion_paths"] == "/Volumes/catalog/schema/volume"
+        assert (
+            json_dict["allowed_volume_ingestion_paths"]
+            == "/Volumes/catalog/schema/volume"
+        )
         assert json_dict["query_tags"] == "team:engineering,project:telemetry"
 
     def test_driver_connection_parameters_minimal_fields(self):
         """Test DriverConnectionParameters with only required fields."""
         host_info = HostDetails(host_url="workspace.databricks.com", port=443)
-        
+
         params = DriverConnectionParameters(
             http_path="/sql/1.0/warehouses/abc123",
             mode=DatabricksClientType.THRIFT,
             host_info=host_info,
         )
-        
+
         # Note: to_json() filters out None values, so we need to check asdict for complete structure
         json_str = params.to_json()
         json_dict = json.loads(json_str)
-        
+
         # Required fields should be present
         assert json_dict["http_path"] == "/sql/1.0/warehouses/abc123"
         assert json_dict["mode"] == "THRIFT"
         assert json_dict["host_info"]["host_url"] == "workspace.databricks.com"
-        
+
         # Optional fields with None are filtered out by to_json()
         # This is expected behavior - None values are excluded from JSON output
 
@@ -661,10 +855,10 @@ class TestTelemetryEventModels:
             locale_name="en_US",
             client_app_name="MyApp",
         )
-        
+
         json_str = sys_config.to_json()
         json_dict = json.loads(json_str)
-        
+
         assert json_dict["driver_name"] == "Databricks SQL Connector for Python"
         assert json_dict["driver_version"] == "3.0.0"
         assert json_dict["runtime_name"] == "CPython"
@@ -681,7 +875,7 @@ class TestTelemetryEventModels:
         """Test complete TelemetryEvent serialization with all nested objects."""
         host_info = HostDetails(host_url="workspace.databricks.com", port=443)
         proxy_info = HostDetails(host_url="proxy.company.com", port=8080)
-        
+
         connection_params = DriverConnectionParameters(
             http_path="/sql/1.0/warehouses/abc123",
             mode=DatabricksClientType.SEA,
@@ -692,7 +886,7 @@ class TestTelemetryEventModels:
             enable_arrow=True,
             rows_fetched_per_block=100000,
         )
-        
+
         sys_config = DriverSystemConfiguration(
             driver_name="Databricks SQL Connector for Python",
             driver_version="3.0.0",
@@ -704,12 +898,12 @@ class TestTelemetryEventModels:
             os_arch="arm64",
             char_set_encoding="utf-8",
         )
-        
+
         error_info = DriverErrorInfo(
             error_name="ConnectionError",
             stack_trace="Traceback...",
         )
-        
+
         event = TelemetryEvent(
             session_id="test-session-123",
             sql_statement_id="test-stmt-456",
@@ -719,42 +913,51 @@ class TestTelemetryEventModels:
             driver_connection_params=connection_params,
             error_info=error_info,
         )
-        
+
         # Test JSON serialization
         json_str = event.to_json()
         assert isinstance(json_str, str)
-        
+
         # Parse and verify structure
         parsed = json.loads(json_str)
         assert parsed["session_id"] == "test-session-123"
         assert parsed["sql_statement_id"] == "test-stmt-456"
         assert parsed["operation_latency_ms"] == 1500
         assert parsed["auth_type"] == "OAUTH"
-        
+
         # Verify nested objects
-        assert parsed["system_configuration"]["driver_name"] == "Databricks SQL Connector for Python"
-        assert parsed["driver_connection_params"]["http_path"] == "/sql/1.0/warehouses/abc123"
+        assert (
+            parsed["system_configuration"]["driver_name"]
+            == "Databricks SQL Connector for Python"
+        )
+        assert (
+            parsed["driver_connection_params"]["http_path"]
+            == "/sql/1.0/warehouses/abc123"
+        )
         assert parsed["driver_connection_params"]["use_proxy"] is True
-        assert parsed["driver_connection_params"]["proxy_host_info"]["host_url"] == "proxy.company.com"
+        assert (
+            parsed["driver_connection_params"]["proxy_host_info"]["host_url"]
+            == "proxy.company.com"
+        )
         assert parsed["error_info"]["error_name"] == "ConnectionError"
 
     def test_json_serialization_excludes_none_values(self):
         """Test that JSON serialization properly excludes None values."""
         host_info = HostDetails(host_url="workspace.databricks.com", port=443)
-        
+
         params = DriverConnectionParameters(
             http_path="/sql/1.0/warehouses/abc123",
             mode=DatabricksClientType.SEA,
             host_info=host_info,
             # All optional fields left as None
         )
-        
+
         json_str = params.to_json()
         parsed = json.loads(json_str)
-        
+
         # Required fields present
         assert parsed["http_path"] == "/sql/1.0/warehouses/abc123"
-        
+
         # None values should be EXCLUDED from JSON (not included as null)
         # This is the behavior of JsonSerializableMixin
         assert "auth_mech" not in parsed
@@ -763,11 +966,15 @@ class TestTelemetryEventModels:
 
 
 @patch("databricks.sql.client.Session")
-@patch("databricks.sql.common.unified_http_client.UnifiedHttpClient._setup_pool_managers")
+@patch(
+    "databricks.sql.common.unified_http_client.UnifiedHttpClient._setup_pool_managers"
+)
 class TestConnectionParameterTelemetry:
     """Tests for connection parameter population in telemetry."""
 
-    def test_connection_with_proxy_populates_telemetry(self, mock_setup_pools, mock_session):
+    def test_connection_with_proxy_populates_telemetry(
+        self, mock_setup_pools, mock_session
+    ):
         """Test that proxy configuration is captured in telemetry."""
         mock_session_instance = MagicMock()
         mock_session_instance.guid_hex = "test-session-proxy"
@@ -777,8 +984,10 @@ class TestConnectionParameterTelemetry:
         mock_session_instance.port = 443
         mock_session_instance.host = "workspace.databricks.com"
         mock_session.return_value = mock_session_instance
-        
-        with patch("databricks.sql.telemetry.telemetry_client.TelemetryClient.export_initial_telemetry_log") as mock_export:
+
+        with patch(
+            "databricks.sql.telemetry.telemetry_client.TelemetryClient.export_initial_telemetry_log"
+        ) as mock_export:
             conn = sql.connect(
                 server_hostname="workspace.databricks.com",
                 http_path="/sql/1.0/warehouses/test",
@@ -786,23 +995,26 @@ class TestConnectionParameterTelemetry:
                 enable_telemetry=True,
                 force_enable_telemetry=True,
             )
-            
+
             # Verify export was called
+            conn._await_background_startup()
             mock_export.assert_called_once()
             call_args = mock_export.call_args
-            
+
             # Extract driver_connection_params
             driver_params = call_args.kwargs.get("driver_connection_params")
             assert driver_params is not None
             assert isinstance(driver_params, DriverConnectionParameters)
-            
+
             # Verify fields are populated
             assert driver_params.http_path == "/sql/1.0/warehouses/test"
             assert driver_params.mode == DatabricksClientType.SEA
             assert driver_params.host_info.host_url == "workspace.databricks.com"
             assert driver_params.host_info.port == 443
 
-    def test_connection_with_azure_params_populates_telemetry(self, mock_setup_pools, mock_session):
+    def test_connection_with_azure_params_populates_telemetry(
+        self, mock_setup_pools, mock_session
+    ):
         """Test that Azure-specific parameters are captured in telemetry."""
         mock_session_instance = MagicMock()
         mock_session_instance.guid_hex = "test-session-azure"
@@ -812,8 +1024,10 @@ class TestConnectionParameterTelemetry:
         mock_session_instance.port = 443
         mock_session_instance.host = "workspace.azuredatabricks.net"
         mock_session.return_value = mock_session_instance
-        
-        with patch("databricks.sql.telemetry.telemetry_client.TelemetryClient.export_initial_telemetry_log") as mock_export:
+
+        with patch(
+            "databricks.sql.telemetry.telemetry_client.TelemetryClient.export_initial_telemetry_log"
+        ) as mock_export:
             conn = sql.connect(
                 server_hostname="workspace.azuredatabricks.net",
                 http_path="/sql/1.0/warehouses/test",
@@ -823,15 +1037,21 @@ class TestConnectionParameterTelemetry:
                 enable_telemetry=True,
                 force_enable_telemetry=True,
             )
-            
+
+            conn._await_background_startup()
             mock_export.assert_called_once()
             driver_params = mock_export.call_args.kwargs.get("driver_connection_params")
-            
+
             # Verify Azure fields
-            assert driver_params.azure_workspace_resource_id == "/subscriptions/test/resourceGroups/test"
+            assert (
+                driver_params.azure_workspace_resource_id
+                == "/subscriptions/test/resourceGroups/test"
+            )
             assert driver_params.azure_tenant_id == "tenant-123"
 
-    def test_connection_populates_arrow_and_performance_params(self, mock_setup_pools, mock_session):
+    def test_connection_populates_arrow_and_performance_params(
+        self, mock_setup_pools, mock_session
+    ):
         """Test that Arrow and performance parameters are captured in telemetry."""
         mock_session_instance = MagicMock()
         mock_session_instance.guid_hex = "test-session-perf"
@@ -841,15 +1061,18 @@ class TestConnectionParameterTelemetry:
         mock_session_instance.port = 443
         mock_session_instance.host = "workspace.databricks.com"
         mock_session.return_value = mock_session_instance
-        
-        with patch("databricks.sql.telemetry.telemetry_client.TelemetryClient.export_initial_telemetry_log") as mock_export:
+
+        with patch(
+            "databricks.sql.telemetry.telemetry_client.TelemetryClient.export_initial_telemetry_log"
+        ) as mock_export:
             # Import pyarrow availability check
             try:
                 import pyarrow
+
                 arrow_available = True
             except ImportError:
                 arrow_available = False
-            
+
             conn = sql.connect(
                 server_hostname="workspace.databricks.com",
                 http_path="/sql/1.0/warehouses/test",
@@ -858,10 +1081,11 @@ class TestConnectionParameterTelemetry:
                 enable_telemetry=True,
                 force_enable_telemetry=True,
             )
-            
+
+            conn._await_background_startup()
             mock_export.assert_called_once()
             driver_params = mock_export.call_args.kwargs.get("driver_connection_params")
-            
+
             # Verify performance fields
             assert driver_params.enable_arrow == arrow_available
             assert driver_params.enable_direct_results is True
@@ -870,7 +1094,9 @@ class TestConnectionParameterTelemetry:
             assert driver_params.async_poll_interval_millis == 2000
             assert driver_params.support_many_parameters is True
 
-    def test_federated_pat_populates_telemetry_as_pat(self, mock_setup_pools, mock_session):
+    def test_federated_pat_populates_telemetry_as_pat(
+        self, mock_setup_pools, mock_session
+    ):
         """End-to-end: a TokenFederationProvider wrapping a PAT should report mech=PAT in the captured telemetry payload."""
         federated_pat = TokenFederationProvider(
             hostname="workspace.databricks.com",
@@ -889,7 +1115,7 @@ class TestConnectionParameterTelemetry:
         with patch(
             "databricks.sql.telemetry.telemetry_client.TelemetryClient.export_initial_telemetry_log"
         ) as mock_export:
-            sql.connect(
+            conn = sql.connect(
                 server_hostname="workspace.databricks.com",
                 http_path="/sql/1.0/warehouses/test",
                 access_token="test-token",
@@ -897,12 +1123,15 @@ class TestConnectionParameterTelemetry:
                 force_enable_telemetry=True,
             )
 
+            conn._await_background_startup()
             mock_export.assert_called_once()
             driver_params = mock_export.call_args.kwargs.get("driver_connection_params")
             assert driver_params.auth_mech == AuthMech.PAT
             assert driver_params.auth_flow is None
 
-    def test_cf_proxy_fields_default_to_false_none(self, mock_setup_pools, mock_session):
+    def test_cf_proxy_fields_default_to_false_none(
+        self, mock_setup_pools, mock_session
+    ):
         """Test that CloudFlare proxy fields default to False/None (not yet supported)."""
         mock_session_instance = MagicMock()
         mock_session_instance.guid_hex = "test-session-cfproxy"
@@ -912,8 +1141,10 @@ class TestConnectionParameterTelemetry:
         mock_session_instance.port = 443
         mock_session_instance.host = "workspace.databricks.com"
         mock_session.return_value = mock_session_instance
-        
-        with patch("databricks.sql.telemetry.telemetry_client.TelemetryClient.export_initial_telemetry_log") as mock_export:
+
+        with patch(
+            "databricks.sql.telemetry.telemetry_client.TelemetryClient.export_initial_telemetry_log"
+        ) as mock_export:
             conn = sql.connect(
                 server_hostname="workspace.databricks.com",
                 http_path="/sql/1.0/warehouses/test",
@@ -921,7 +1152,8 @@ class TestConnectionParameterTelemetry:
                 enable_telemetry=True,
                 force_enable_telemetry=True,
             )
-            
+
+            conn._await_background_startup()
             mock_export.assert_called_once()
             driver_params = mock_export.call_args.kwargs.get("driver_connection_params")
 
@@ -1,6 +1,7 @@
 from collections import OrderedDict
 from decimal import Decimal
 import itertools
+import threading
 import unittest
 import pytest
 from unittest.mock import patch, MagicMock, Mock
@@ -88,6 +89,50 @@ class ThriftBackendTestSuite(unittest.TestCase):
         with self.assertRaises(DatabaseError):
             thrift_backend.make_request(mock_method, Mock())
 
+    @patch("databricks.sql.backend.thrift_backend.TCLIService.Client", autospec=True)
+    @patch("databricks.sql.auth.thrift_http_client.THttpClient")
+    def test_concurrent_requests_use_separate_transports(
+        self, mock_http_client_class, tcli_service_class
+    ):
+        primary_transport = mock_http_client_class.return_value
+        cloned_transport = primary_transport.clone.return_value
+        # Both requests must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_operation_status(request):
+            barrier.wait()
+            return ttypes.TGetOperationStatusResp(status=self.okay_status)
+
+        tcli_service_instance = tcli_service_class.return_value
+        tcli_service_instance.GetOperationStatus.side_effect = get_operation_status
+        thrift_backend = ThriftDatabricksClient(
+            "foobar",
+            443,
+            "path",
+            [],
+            auth_provider=AuthProvider(),
+            ssl_options=SSLOptions(),
+            http_client=MagicMock(),
+        )
+
+        threads = [
+            threading.Thread(
+                target=thrift_backend.make_request,
+                args=(tcli_service_instance.GetOperationStatus, Mock()),
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertFalse(barrier.broken)
+        primary_transport.clone.assert_called_once()
+        primary_transport.close.assert_called_once()
+        cloned_transport.close.assert_called_once()
+        self.assertEqual(len(thrift_backend._idle_transports), 2)
+
     def _make_type_desc(self, type):
         return ttypes.TTypeDesc(
             types=[
@@ -260,6 +305,36 @@ class ThriftBackendTestSuite(unittest.TestCase):
             t_http_client_class.call_args[1]["ssl_options"], mock_ssl_options
         )
 
+    def test_cloned_http_client_shares_pool_but_not_request_state(self):
+        from databricks.sql.auth.retry import CommandType, DatabricksRetryPolicy
+        from databricks.sql.auth.thrift_http_client import THttpClient
+
+        retry_policy = DatabricksRetryPolicy(
+            delay_min=1,
+            delay_max=60,
+            stop_after_attempts_count=30,
+            stop_after_attempts_duration=900,
+            delay_default=5,
+            force_dangerous_codes=[],
+        )
+        http_client = THttpClient(
+            auth_provider=None,
+            uri_or_host="https://example.com",
+            ssl_options=SSLOptions(),
+            retry_policy=retry_policy,
+        )
+        http_client.open()
+        http_client.write(b"pending request")
+
+        clone = http_client.clone()
+        clone.set_retry_command_type(CommandType.GET_OPERATION_STATUS)
+
+        self.assertIs(clone._THttpClient__pool, http_client._THttpClient__pool)
+        self.assertEqual(clone._THttpClient__wbuf.getvalue(), b"")
+        self.assertEqual(http_client._THttpClient__wbuf.getvalue(), b"pending request")
+        self.assertIsNot(clone.retry_policy, retry_policy)
+        self.assertIsNone(retry_policy.command_type)
+
     @patch("databricks.sql.types.create_default_context")
     def test_tls_cert_args_are_used_by_http_client(self, mock_create_default_context):
         from databricks.sql.auth.thrift_http_client import THttpClient
@@ -294,12 +369,16 @@ class ThriftBackendTestSuite(unittest.TestCase):
         conn_pool = http_client._THttpClient__pool
         self.assertIsInstance(conn_pool, HTTPSConnectionPool)
         self.assertEqual(conn_pool.cert_reqs, CERT_REQUIRED)
-        self.assertEqual(conn_pool.ca_certs, mock_ssl_options.tls_trusted_ca_file)
-        self.assertEqual(conn_pool.cert_file, mock_ssl_options.tls_client_cert_file)
-        self.assertEqual(conn_pool.key_file, mock_ssl_options.tls_client_cert_key_file)
-        self.assertEqual(
-            conn_pool.key_password, mock_ssl_options.tls_client_cert_key_password
-        )
+        # The CA file and client certificate are loaded once, into the shared context
+        self.assertIs(conn_pool.conn_kw["ssl_context"], http_client.context)
+        self.assertIs(http_client.context, mock_create_default_context.return_value)
+        http_client.context.load_cert_chain.assert_called_once_with(
+            certfile=mock_ssl_options.tls_client_cert_file,
+            keyfile=mock_ssl_options.tls_client_cert_key_file,
+            password=mock_ssl_options.tls_client_cert_key_password,
+        )
+        self.assertIsNone(conn_pool.ca_certs)
+        self.assertIsNone(conn_pool.cert_file)
 
     def test_tls_no_verify_is_respected_by_http_client(self):
         from databricks.sql.auth.thrift_http_client import THttpClient
@@ -0,0 +1,110 @@
+import os
+import time
+from io import BytesIO
+
+import pytest
+from urllib3 import HTTPResponse
+from thrift.protocol.TBinaryProtocol import (
+    TBinaryProtocol,
+    TBinaryProtocolAccelerated,
+)
+from thrift.transport.TTransport import TTransportBase
+
+from databricks.sql.thrift_api.TCLIService import TCLIService, ttypes
+from tests.unit.test_thrift_transport import (
+    fetch_results_response,
+    make_transport,
+    recorded_reply,
+)
+
+
+def recorded_response(body):
+    return HTTPResponse(body=BytesIO(body), status=200, preload_content=False)
+
+
+class UnbufferedTransport(TTransportBase):
+    """Reads straight from the response, as the HTTP transport did before buffering."""
+
+    def __init__(self, body):
+        self.body = body
+
+    def flush(self):
+        self.response = recorded_response(self.body)
+
+    def read(self, sz):
+        return self.response.read(sz)
+
+    def write(self, buf):
+        pass
+
+
+@pytest.mark.skipif(
+    not os.environ.get("DATABRICKS_SQL_RUN_BENCHMARKS"),
+    reason="Set DATABRICKS_SQL_RUN_BENCHMARKS=1 to run benchmarks",
+)
+class TestThriftDecodeBenchmark:
+    """
+    Micro benchmark of decoding recorded TCLIService replies: the pure-Python protocol
+    reading straight from the response, as before, against the pure-Python and the
+    accelerated protocol reading through the transport's buffer.
+    ( Not included in regular test runs. Run with -s to see the results. )
+    """
+
+    REPEAT = 5
+
+    @classmethod
+    def best_ms(cls, decode):
+        best = float("inf")
+        for _ in range(cls.REPEAT):
+            start = time.perf_counter()
+            decode()
+            best = min(best, time.perf_counter() - start)
+        return best * 1000
+
+    @pytest.mark.parametrize(
+        "label, method, response",
+        [
+            ("FetchResults 100k rows", "FetchResults", fetch_results_response(100_000)),
+            ("FetchResults 1k rows", "FetchResults", fetch_results_response(1_000)),
+            (
+                "GetOperationStatus",
+                "GetOperationStatus",
+                ttypes.TGetOperationStatusResp(
+                    status=ttypes.TStatus(statusCode=ttypes.TStatusCode.SUCCESS_STATUS),
+                    operationState=ttypes.TOperationState.RUNNING_STATE,
+                ),
+            ),
+        ],
+    )
+    def test_decode_recorded_reply(self, label, method, response):
+        body = recorded_reply(method, response)
+        request_class = getattr(ttypes, f"T{method}Req")
+
+        def decode_with(protocol_class, transport):
+            client = TCLIService.Client(protocol_class(transport))
+
+            def decode():
+                assert getattr(client, method)(request_class()) == response
+
+            return decode
+
+        def http_transport():
+            transport = make_transport([])
+            transport._THttpClient__pool.request.side_effect = (
+                lambda *args, **kwargs: recorded_response(body)
+            )
+            return transport
+
+        unbuffered = self.best_ms(
+            decode_with(TBinaryProtocol, UnbufferedTransport(body))
+        )
+        buffered = self.best_ms(decode_with(TBinaryProtocol, http_transport()))
+        accelerated = self.best_ms(
+            decode_with(TBinaryProtocolAccelerated, http_transport())
+        )
+
+        print(
+            f"\n{label:>24} ({len(body)} bytes): {unbuffered:8.2f} ms unbuffered, "
+            f"{buffered:8.2f} ms buffered, {accelerated:8.2f} ms accelerated "
+            f"({unbuffered / accelerated:.1f}x)"
+        )
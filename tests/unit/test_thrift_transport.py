@@ -0,0 +1,163 @@
+import sys
+from io import BytesIO
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from thrift.protocol.TBinaryProtocol import (
+    TBinaryProtocol,
+    TBinaryProtocolAccelerated,
+)
+from thrift.Thrift import TMessageType
+from thrift.transport.TTransport import CReadableTransport, TMemoryBuffer
+
+from databricks.sql.auth.authenticators import AuthProvider
+from databricks.sql.auth.thrift_http_client import THttpClient
+from databricks.sql.backend.thrift_backend import ThriftDatabricksClient
+from databricks.sql.thrift_api.TCLIService import TCLIService, ttypes
+from databricks.sql.types import SSLOptions
+
+
+def fetch_results_response(num_rows):
+    return ttypes.TFetchResultsResp(
+        status=ttypes.TStatus(statusCode=ttypes.TStatusCode.SUCCESS_STATUS),
+        hasMoreRows=False,
+        results=ttypes.TRowSet(
+            startRowOffset=0,
+            rows=[],
+            columns=[
+                ttypes.TColumn(
+                    i64Val=ttypes.TI64Column(values=list(range(num_rows)), nulls=b"")
+                ),
+                ttypes.TColumn(
+                    stringVal=ttypes.TStringColumn(
+                        values=[f"row-{i}" for i in range(num_rows)], nulls=b""
+                    )
+                ),
+            ],
+            arrowBatches=[
+                ttypes.TSparkArrowBatch(batch=b"\x01" * num_rows, rowCount=num_rows)
+            ],
+        ),
+    )
+
+
+def recorded_reply(method, response):
+    """Return the bytes a server sends in reply to `method`, with `response` as result."""
+    buffer = TMemoryBuffer()
+    protocol = TBinaryProtocol(buffer)
+    protocol.writeMessageBegin(method, TMessageType.REPLY, 0)
+    getattr(TCLIService, f"{method}_result")(success=response).write(protocol)
+    protocol.writeMessageEnd()
+    return buffer.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = BytesIO(body)
+        self.status = 200
+        self.reason = "OK"
+        self.headers = {}
+
+    def read(self, amt):
+        return self.body.read(amt)
+
+    def drain_conn(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+def make_transport(bodies, **kwargs):
+    transport = THttpClient(
+        auth_provider=AuthProvider(),
+        uri_or_host="https://foo/path",
+        ssl_options=SSLOptions(),
+        **kwargs,
+    )
+    transport.setCustomHeaders({"User-Agent": "test"})
+    transport.open()
+    transport._THttpClient__pool = Mock()
+    transport._THttpClient__pool.request.side_effect = [
+        FakeResponse(body) for body in bodies
+    ]
+    return transport
+
+
+class TestBufferedHttpTransport:
+    @pytest.mark.parametrize(
+        "protocol_class", [TBinaryProtocol, TBinaryProtocolAccelerated]
+    )
+    @pytest.mark.parametrize("read_buffer_size", [7, 65536])
+    def test_responses_decode_the_same_with_either_protocol(
+        self, protocol_class, read_buffer_size
+    ):
+        response = fetch_results_response(1000)
+        transport = make_transport(
+            [recorded_reply("FetchResults", response)],
+            read_buffer_size=read_buffer_size,
+        )
+        client = TCLIService.Client(protocol_class(transport))
+
+        assert isinstance(transport, CReadableTransport)
+        assert client.FetchResults(ttypes.TFetchResultsReq()) == response
+
+    def test_unread_bytes_are_dropped_before_the_next_request(self):
+        response = fetch_results_response(3)
+        transport = make_transport(
+            [recorded_reply("FetchResults", response) + b"trailing", b""]
+            + [recorded_reply("FetchResults", response)]
+        )
+        client = TCLIService.Client(TBinaryProtocolAccelerated(transport))
+
+        assert client.FetchResults(ttypes.TFetchResultsReq()) == response
+        # The trailing bytes are buffered but never read as part of a reply
+        transport.write(b"request")
+        transport.flush()
+        transport.close()
+        assert client.FetchResults(ttypes.TFetchResultsReq()) == response
+
+    def test_truncated_response_raises_eof(self):
+        body = recorded_reply("FetchResults", fetch_results_response(100))
+        transport = make_transport([body[: len(body) // 2]], read_buffer_size=16)
+        client = TCLIService.Client(TBinaryProtocolAccelerated(transport))
+
+        with pytest.raises(EOFError):
+            client.FetchResults(ttypes.TFetchResultsReq())
+
+
+class TestProtocolSelection:
+    def make_backend(self, **kwargs):
+        return ThriftDatabricksClient(
+            "foobar",
+            443,
+            "path",
+            [],
+            auth_provider=AuthProvider(),
+            ssl_options=SSLOptions(),
+            http_client=MagicMock(),
+            **kwargs,
+        )
+
+    @patch("databricks.sql.backend.thrift_backend.TCLIService.Client")
+    def test_accelerated_protocol_is_used(self, client_class):
+        self.make_backend()
+
+        (protocol,), _ = client_class.call_args
+        assert type(protocol) is TBinaryProtocolAccelerated
+        assert protocol._fast_decode is not None
+
+    @patch("databricks.sql.backend.thrift_backend.TCLIService.Client")
+    def test_falls_back_without_the_extension(self, client_class):
+        with patch.dict(sys.modules, {"thrift.protocol.fastbinary": None}):
+            self.make_backend()
+
+        (protocol,), _ = client_class.call_args
+        assert type(protocol) is TBinaryProtocol
+
+    @patch("databricks.sql.backend.thrift_backend.TCLIService.Client")
+    def test_accelerated_protocol_can_be_disabled(self, client_class):
+        self.make_backend(_use_accelerated_thrift_protocol=False)
+
+        (protocol,), _ = client_class.call_args
+        assert type(protocol) is TBinaryProtocol
@@ -0,0 +1,320 @@
+import threading
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import jwt
+import pytest
+
+import databricks.sql
+from databricks.sql.auth.authenticators import (
+    AzureServicePrincipalCredentialProvider,
+    CredentialsProvider,
+    DatabricksOAuthProvider,
+    ExternalAuthProvider,
+)
+from databricks.sql.auth.oauth import ClientCredentialsTokenSource, OAuthManager, Token
+from databricks.sql.auth.token_federation import Token as FederatedToken
+from databricks.sql.auth.token_federation import TokenFederationProvider
+from databricks.sql.auth.token_refresher import TokenRefresher
+
+
+def make_jwt(expires_in, **claims):
+    payload = {"sub": "user123", "exp": int(time.time()) + expires_in, **claims}
+    return jwt.encode(payload, "mysecret-of-at-least-32-bytes-long", algorithm="HS256")
+
+
+def run_concurrently(func, count):
+    threads = [threading.Thread(target=func) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def no_min_interval():
+    with patch("databricks.sql.auth.token_refresher.MIN_REFRESH_INTERVAL", 0):
+        yield
+
+
+class TestTokenRefresher:
+    def test_refresh_records_its_latency(self):
+        refresher = TokenRefresher(lambda: time.sleep(0.01))
+
+        refresher.refresh()
+
+        assert refresher.refreshes == 1
+        assert refresher.last_refresh_ms >= 10
+
+    def test_concurrent_refreshes_are_collapsed(self):
+        release = threading.Event()
+        refresh = Mock(side_effect=lambda: release.wait(5) and None)
+        refresher = TokenRefresher(refresh)
+        stale = [True]
+
+        def refresh_if_stale():
+            refresher.refresh(needed=lambda: stale[0])
+
+        threads = [threading.Thread(target=refresh_if_stale) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        wait_until(lambda: refresher.coalesced_refreshes == 4)
+        stale[0] = False
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        # A late request finds the token refreshed
+        refresh_if_stale()
+
+        refresh.assert_called_once()
+        assert refresher.refreshes == 1
+
+    def test_token_is_refreshed_in_the_background(self, no_min_interval):
+        refreshed = threading.Event()
+        refresher = TokenRefresher(refreshed.set, refresh_fraction=0.1)
+
+        start = time.monotonic()
+        refresher.schedule(time.time() + 1)
+
+        assert refreshed.wait(5)
+        assert time.monotonic() - start < 1
+        wait_until(lambda: refresher.background_refreshes == 1)
+        refresher.close()
+
+    def test_failed_background_refresh_is_retried(self, no_min_interval):
+        refresh = Mock(side_effect=[RuntimeError("token endpoint down"), None])
+        refresher = TokenRefresher(refresh, refresh_fraction=0.1)
+
+        refresher.schedule(time.time() + 1)
+
+        wait_until(lambda: refresher.background_refreshes == 1)
+        assert refresh.call_count == 2
+        assert refresher.failed_refreshes == 1
+        refresher.close()
+
+    def test_closed_refresher_does_not_refresh(self, no_min_interval):
+        refresh = Mock(return_value=None)
+        refresher = TokenRefresher(refresh, refresh_fraction=0.1)
+        refresher.schedule(time.time() + 1)
+
+        refresher.close()
+        time.sleep(0.3)
+
+        refresh.assert_not_called()
+
+    def test_background_refresh_can_be_disabled(self):
+        refresher = TokenRefresher(Mock(), refresh_fraction=None)
+
+        refresher.schedule(time.time() + 3600)
+
+        assert refresher._thread is None
+
+    @pytest.mark.parametrize("refresh_fraction", [0, 1, 1.5])
+    def test_refresh_fraction_must_be_a_fraction(self, refresh_fraction):
+        with pytest.raises(ValueError):
+            TokenRefresher(Mock(), refresh_fraction=refresh_fraction)
+
+
+class TestClientCredentialsTokenSource:
+    def make_token_source(self, **kwargs):
+        return ClientCredentialsTokenSource(
+            token_url="https://token_url.com",
+            client_id="client_id",
+            client_secret="client_secret",
+            http_client=MagicMock(),
+            **kwargs,
+        )
+
+    def test_refresh_is_scheduled_at_the_fraction_of_the_lifetime(self):
+        token_source = self.make_token_source(refresh_fraction=0.5)
+        token = Token(make_jwt(3600), "Bearer", None)
+
+        with patch.object(token_source, "refresh", return_value=token):
+            assert token_source.get_token() is token
+
+        due_in = token_source.refresher._due - time.monotonic()
+        assert 1790 < due_in <= 1800
+        token_source.close()
+
+    def test_concurrent_requests_share_one_refresh(self):
+        token_source = self.make_token_source()
+        release = threading.Event()
+
+        def refresh():
+            release.wait(5)
+            return Token(make_jwt(3600), "Bearer", None)
+
+        with patch.object(token_source, "refresh", side_effect=refresh) as mock:
+            threading.Timer(0.1, release.set).start()
+            run_concurrently(token_source.get_token, 5)
+
+        mock.assert_called_once()
+        token_source.close()
+
+
+class TestOAuthManagerRefresh:
+    @pytest.fixture
+    def oauth_manager(self):
+        oauth_manager = OAuthManager(
+            port_range=[8020],
+            client_id="client_id",
+            idp_endpoint=MagicMock(),
+            http_client=MagicMock(),
+        )
+        release = threading.Event()
+        fresh_token = make_jwt(3600)
+
+        def send_refresh_token_request(hostname, refresh_token):
+            release.wait(5)
+            return {"access_token": fresh_token, "refresh_token": "rotated"}
+
+        oauth_manager._OAuthManager__send_refresh_token_request = Mock(
+            side_effect=send_refresh_token_request
+        )
+        oauth_manager.release = release
+        return oauth_manager
+
+    def test_concurrent_refreshes_send_one_request(self, oauth_manager):
+        results = []
+        threading.Timer(0.1, oauth_manager.release.set).start()
+
+        run_concurrently(
+            lambda: results.append(
+                oauth_manager.check_and_refresh_access_token(
+                    "foo", make_jwt(10), "refresh_token"
+                )
+            ),
+            5,
+        )
+
+        oauth_manager._OAuthManager__send_refresh_token_request.assert_called_once()
+        assert len({result[:2] for result in results}) == 1
+        assert oauth_manager.last_refresh_ms >= 0
+
+    def test_exchanged_refresh_token_is_not_sent_again(self, oauth_manager):
+        oauth_manager.release.set()
+        first = oauth_manager.refresh_access_token("foo", "refresh_token")
+
+        assert oauth_manager.refresh_access_token("foo", "refresh_token") == first
+        oauth_manager._OAuthManager__send_refresh_token_request.assert_called_once()
+
+
+class TestDatabricksOAuthProvider:
+    @patch.object(OAuthManager, "refresh_access_token")
+    @patch.object(OAuthManager, "get_tokens")
+    def test_tokens_are_refreshed_before_they_expire(
+        self, mock_get_tokens, mock_refresh_access_token
+    ):
+        fresh_token = make_jwt(7200)
+        mock_get_tokens.return_value = (make_jwt(3600), "refresh_token")
+        mock_refresh_access_token.return_value = (fresh_token, "rotated")
+        oauth_persistence = Mock()
+        oauth_persistence.read.return_value = None
+        provider = DatabricksOAuthProvider(
+            hostname="foo.cloud.databricks.com",
+            oauth_persistence=oauth_persistence,
+            redirect_port_range=[8020],
+            client_id="client_id",
+            scopes=["sql"],
+            http_client=MagicMock(),
+        )
+
+        due_in = provider.refresher._due - time.monotonic()
+        assert 2870 < due_in <= 2880
+
+        # What the background thread runs once the refresh is due
+        provider.refresher.refresh()
+
+        mock_refresh_access_token.assert_called_once_with(
+            "foo.cloud.databricks.com", "refresh_token"
+        )
+        headers = {}
+        provider.add_headers(headers)
+        assert headers["Authorization"] == f"Bearer {fresh_token}"
+        assert oauth_persistence.persist.call_args[0][1].refresh_token == "rotated"
+        provider.close()
+
+
+class TestTokenFederationProvider:
+    def test_concurrent_requests_share_one_token_exchange(self):
+        external_provider = Mock()
+        external_provider.add_headers.side_effect = lambda headers: headers.update(
+            {"Authorization": "Bearer " + make_jwt(3600, iss="https://idp.example")}
+        )
+        release = threading.Event()
+
+        provider = TokenFederationProvider(
+            hostname="https://test.databricks.com/",
+            external_provider=external_provider,
+            http_client=Mock(),
+        )
+        exchanged_token = make_jwt(3600, iss="https://test.databricks.com")
+
+        def exchange_token(access_token):
+            release.wait(5)
+            return FederatedToken(exchanged_token)
+
+        with patch.object(provider, "_exchange_token", side_effect=exchange_token):
+            threading.Timer(0.1, release.set).start()
+            results = []
+
+            def add_headers():
+                headers = {}
+                provider.add_headers(headers)
+                results.append(headers["Authorization"])
+
+            run_concurrently(add_headers, 5)
+
+        external_provider.add_headers.assert_called_once()
+        assert results == [f"Bearer {exchanged_token}"] * 5
+        # The exchanged token is exchanged again in the background
+        assert provider.refresher._due is not None
+        provider.close()
+        external_provider.close.assert_called_once()
+
+
+class TestExternalAuthProvider:
+    class Credentials(CredentialsProvider):
+        def auth_type(self):
+            return "custom"
+
+        def __call__(self, *args, **kwargs):
+            return lambda: {}
+
+    def test_callers_credentials_provider_is_left_open(self):
+        credentials_provider = self.Credentials()
+        credentials_provider.close = Mock()
+
+        ExternalAuthProvider(credentials_provider).close()
+
+        credentials_provider.close.assert_not_called()
+
+    def test_azure_service_principal_provider_is_closed(self):
+        credentials_provider = Mock(spec=AzureServicePrincipalCredentialProvider)
+
+        ExternalAuthProvider(credentials_provider).close()
+
+        credentials_provider.close.assert_called_once()
+
+
+class TestConnectionClose:
+    @patch("databricks.sql.session.ThriftDatabricksClient")
+    def test_closing_the_connection_stops_token_refreshes(self, client_class):
+        connection = databricks.sql.connect(
+            server_hostname="foo",
+            http_path="dummy_path",
+            access_token="tok",
+            enable_telemetry=False,
+        )
+
+        with patch.object(connection.session.auth_provider, "close") as close:
+            connection.close()
+
+        close.assert_called_once()
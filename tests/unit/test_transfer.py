@@ -0,0 +1,219 @@
+import io
+import logging
+import os
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from databricks.sql.exc import OperationalError, RequestError
+from databricks.sql.common.transfer import (
+    PROGRESS_LOG_INTERVAL_BYTES,
+    ProgressReader,
+    RangedDownload,
+    TransferProgress,
+    get_stream_length,
+)
+
+
+class TestGetStreamLength:
+    def test_bytes_io_from_current_position(self):
+        stream = io.BytesIO(b"0123456789")
+        stream.seek(4)
+        assert get_stream_length(stream) == 6
+        assert stream.tell() == 4
+
+    def test_file(self, tmp_path):
+        path = tmp_path / "f"
+        path.write_bytes(b"x" * 100)
+        with open(path, "rb") as fh:
+            assert get_stream_length(fh) == 100
+
+    def test_unseekable_stream(self):
+        class Unseekable(io.RawIOBase):
+            def readable(self):
+                return True
+
+        assert get_stream_length(Unseekable()) is None
+
+
+class TestProgressReader:
+    def test_counts_bytes_read(self):
+        progress = TransferProgress("PUT", "https://host/path?sig=secret")
+        reader = ProgressReader(io.BytesIO(b"x" * 10), progress)
+
+        assert reader.read(4) == b"xxxx"
+        assert reader.read() == b"xxxxxx"
+        assert reader.read() == b""
+        assert progress.bytes_transferred == 10
+
+    def test_delegates_seek_and_tell(self):
+        reader = ProgressReader(io.BytesIO(b"abc"), TransferProgress("PUT", "u"))
+        reader.read()
+        assert reader.tell() == 3
+        reader.seek(0)
+        assert reader.read() == b"abc"
+
+
+class TestTransferProgress:
+    def test_completion_log_hides_url_query(self, caplog):
+        progress = TransferProgress("PUT", "https://host/path?sig=secret")
+        progress.update(PROGRESS_LOG_INTERVAL_BYTES + 1)
+
+        with caplog.at_level(logging.INFO, logger="databricks.sql.common.transfer"):
+            progress.log_completion()
+
+        assert "Staging PUT completed" in caplog.text
+        assert "https://host/path" in caplog.text
+        assert "secret" not in caplog.text
+
+
+class FakeRangeHttpClient:
+    """Serves `payload` from request_context, honouring Range headers when
+    `accept_ranges` is set. `fail_once_at` cuts off the first response that
+    would cross that byte offset."""
+
+    def __init__(self, payload, accept_ranges=True, fail_once_at=None, status=None):
+        self.payload = payload
+        self.accept_ranges = accept_ranges
+        self.fail_once_at = fail_once_at
+        self.status = status
+        self.requested_ranges = []
+
+    @contextmanager
+    def request_context(self, method, url, headers=None, **kwargs):
+        # Like UnifiedHttpClient, report anything raised while the response is open
+        # as a failed request
+        try:
+            with self._respond(headers, **kwargs) as response:
+                yield response
+        except Exception as e:
+            raise RequestError(f"HTTP request error: {e}")
+
+    @contextmanager
+    def _respond(self, headers, **kwargs):
+        assert kwargs.get("preload_content") is False
+        range_header = (headers or {}).get("Range")
+        self.requested_ranges.append(range_header)
+        response = MagicMock()
+        response.data = b""
+        if self.status is not None:
+            response.status = self.status
+            response.data = b"denied"
+            yield response
+            return
+
+        body = self.payload
+        start = 0
+        if range_header and self.accept_ranges:
+            start, end = (int(v) for v in range_header[len("bytes=") :].split("-"))
+            end = min(end, len(self.payload) - 1)
+            body = self.payload[start : end + 1]
+            response.status = 206
+            response.headers = {
+                "Content-Range": f"bytes {start}-{end}/{len(self.payload)}"
+            }
+        else:
+            response.status = 200
+            response.headers = {}
+
+        def stream(chunk_size):
+            for i in range(0, len(body), 7):
+                if self.fail_once_at is not None and start + i + 7 > self.fail_once_at:
+                    self.fail_once_at = None
+                    raise RequestError("connection reset")
+                yield body[i : i + 7]
+
+        response.stream.side_effect = stream
+        yield response
+
+
+class TestRangedDownload:
+    payload = bytes(range(256)) * 4
+
+    def test_parallel_ranges(self, tmp_path):
+        http_client = FakeRangeHttpClient(self.payload)
+        local_file = tmp_path / "out"
+
+        progress = RangedDownload(
+            http_client, "https://u", str(local_file), part_size=100, max_workers=3
+        ).run()
+
+        assert local_file.read_bytes() == self.payload
+        assert progress.bytes_transferred == len(self.payload)
+        assert http_client.requested_ranges[0] == "bytes=0-99"
+        assert sorted(http_client.requested_ranges[1:]) == sorted(
+            f"bytes={s}-{min(s + 99, len(self.payload) - 1)}"
+            for s in range(100, len(self.payload), 100)
+        )
+
+    def test_resumes_interrupted_range(self, tmp_path):
+        http_client = FakeRangeHttpClient(self.payload, fail_once_at=150)
+        local_file = tmp_path / "out"
+
+        RangedDownload(
+            http_client, "https://u", str(local_file), part_size=100, max_workers=1
+        ).run()
+
+        assert local_file.read_bytes() == self.payload
+        assert "bytes=149-199" in http_client.requested_ranges
+
+    def test_server_without_range_support_streams_sequentially(self, tmp_path):
+        http_client = FakeRangeHttpClient(self.payload, accept_ranges=False)
+        local_file = tmp_path / "out"
+
+        RangedDownload(http_client, "https://u", str(local_file), part_size=100).run()
+
+        assert local_file.read_bytes() == self.payload
+        assert len(http_client.requested_ranges) == 1
+
+    def test_http_error_raises_operational_error(self, tmp_path):
+        http_client = FakeRangeHttpClient(self.payload, status=403)
+
+        with pytest.raises(OperationalError, match="403-denied"):
+            RangedDownload(http_client, "https://u", str(tmp_path / "out")).run()
+
+    @pytest.mark.parametrize("fail_at", [0, 100])
+    def test_local_write_error_is_raised_as_is(self, tmp_path, monkeypatch, fail_at):
+        """A full disk is not reported or retried as a failed request."""
+        http_client = FakeRangeHttpClient(self.payload)
+        disk_full = OSError(28, "No space left on device")
+        pwrite = os.pwrite
+
+        def failing_pwrite(fd, data, offset):
+            if offset >= fail_at:
+                raise disk_full
+            return pwrite(fd, data, offset)
+
+        monkeypatch.setattr("databricks.sql.common.transfer.os.pwrite", failing_pwrite)
+
+        with pytest.raises(OSError) as excinfo:
+            RangedDownload(
+                http_client, "https://u", str(tmp_path / "out"), part_size=100
+            ).run()
+
+        assert excinfo.value is disk_full
+        ranges = http_client.requested_ranges
+        assert len(ranges) == len(set(ranges))
+
+    def test_failed_download_keeps_the_existing_file(self, tmp_path):
+        http_client = FakeRangeHttpClient(self.payload, status=404)
+        local_file = tmp_path / "out"
+        local_file.write_bytes(b"previous contents")
+
+        with pytest.raises(OperationalError, match="404-denied"):
+            RangedDownload(http_client, "https://u", str(local_file)).run()
+
+        assert local_file.read_bytes() == b"previous contents"
+        assert os.listdir(tmp_path) == ["out"]
+
+    def test_interrupted_download_leaves_no_partial_file(self, tmp_path):
+        http_client = FakeRangeHttpClient(self.payload, fail_once_at=150)
+        local_file = tmp_path / "out"
+
+        with pytest.raises(RequestError):
+            RangedDownload(
+                http_client, "https://u", str(local_file), part_size=100, max_attempts=1
+            ).run()
+
+        assert os.listdir(tmp_path) == []
@@ -0,0 +1,204 @@
+import threading
+from unittest.mock import Mock, MagicMock, patch
+
+import pytest
+
+import databricks.sql.client as client
+from databricks.sql.exc import (
+    MaxRetryDurationError,
+    NonRecoverableNetworkError,
+    OperationalError,
+    ProgrammingError,
+    RequestError,
+    UnsafeToRetryError,
+)
+
+
+class TestVolumeTransfer:
+    """Unit tests for Cursor.put_files / Cursor.get_files."""
+
+    @pytest.fixture
+    def connection(self, tmp_path):
+        connection = Mock()
+        connection.staging_allowed_local_path = str(tmp_path)
+        connection.statements = []
+        connection.failures = {}
+        lock = threading.Lock()
+
+        def new_cursor():
+            file_cursor = MagicMock()
+            file_cursor.__enter__.return_value = file_cursor
+
+            def execute(operation):
+                with lock:
+                    connection.statements.append(operation)
+                    remaining = connection.failures.get(operation, 0)
+                    connection.failures[operation] = remaining - 1
+                if remaining > 0:
+                    raise OperationalError("connection reset")
+                if operation.startswith("GET"):
+                    local_file = operation.split(" TO ")[1].strip("'")
+                    with open(local_file, "wb") as fh:
+                        fh.write(b"downloaded")
+
+            file_cursor.execute.side_effect = execute
+            return file_cursor
+
+        connection.cursor.side_effect = new_cursor
+        return connection
+
+    @pytest.fixture
+    def cursor(self, connection):
+        return client.Cursor(connection=connection, backend=Mock())
+
+    def _local_files(self, tmp_path, count):
+        paths = []
+        for i in range(count):
+            path = tmp_path / f"f{i}.csv"
+            path.write_bytes(b"x" * (i + 1))
+            paths.append(str(path))
+        return paths
+
+    def test_put_files_uploads_each_file(self, cursor, connection, tmp_path):
+        local_files = self._local_files(tmp_path, 5)
+        mapping = {f: f"/Volumes/c/s/v/{i}.csv" for i, f in enumerate(local_files)}
+
+        report = cursor.put_files(mapping, overwrite=True, max_workers=3)
+
+        assert sorted(connection.statements) == sorted(
+            f"PUT '{f}' INTO '/Volumes/c/s/v/{i}.csv' OVERWRITE"
+            for i, f in enumerate(local_files)
+        )
+        assert [r.source for r in report.results] == local_files
+        assert len(report.succeeded) == 5 and not report.failed
+        assert report.bytes_transferred == 1 + 2 + 3 + 4 + 5
+
+    def test_get_files_downloads_each_file(self, cursor, connection, tmp_path):
+        mapping = {
+            "/Volumes/c/s/v/a.csv": str(tmp_path / "a.csv"),
+            "/Volumes/c/s/v/b.csv": str(tmp_path / "b.csv"),
+        }
+
+        report = cursor.get_files(mapping)
+
+        assert sorted(connection.statements) == [
+            f"GET '/Volumes/c/s/v/a.csv' TO '{tmp_path / 'a.csv'}'",
+            f"GET '/Volumes/c/s/v/b.csv' TO '{tmp_path / 'b.csv'}'",
+        ]
+        assert [r.destination for r in report.results] == list(mapping.values())
+        assert report.bytes_transferred == 2 * len(b"downloaded")
+
+    @patch("databricks.sql.client.time.sleep")
+    def test_transient_failure_is_retried(
+        self, mock_sleep, cursor, connection, tmp_path
+    ):
+        (local_file,) = self._local_files(tmp_path, 1)
+        operation = f"PUT '{local_file}' INTO '/Volumes/c/s/v/f.csv'"
+        connection.failures[operation] = 2
+
+        report = cursor.put_files({local_file: "/Volumes/c/s/v/f.csv"})
+
+        assert report.results[0].succeeded
+        assert report.results[0].attempts == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("databricks.sql.client.time.sleep")
+    def test_failures_are_reported_not_raised(
+        self, mock_sleep, cursor, connection, tmp_path
+    ):
+        good, bad = self._local_files(tmp_path, 2)
+        connection.failures[f"PUT '{bad}' INTO '/Volumes/c/s/v/bad.csv'"] = 10
+
+        report = cursor.put_files(
+            {good: "/Volumes/c/s/v/good.csv", bad: "/Volumes/c/s/v/bad.csv"},
+            max_attempts=2,
+        )
+
+        assert [r.source for r in report.succeeded] == [good]
+        (failed,) = report.failed
+        assert failed.source == bad
+        assert failed.attempts == 2
+        assert isinstance(failed.error, OperationalError)
+        assert failed.bytes_transferred is None
+
+    def test_non_transient_failure_is_not_retried(self, cursor, connection, tmp_path):
+        (local_file,) = self._local_files(tmp_path, 1)
+        self._fail_with(connection, ProgrammingError("bad path"))
+
+        report = cursor.put_files({local_file: "/Volumes/c/s/v/f.csv"})
+
+        assert report.results[0].attempts == 1
+        assert isinstance(report.results[0].error, ProgrammingError)
+
+    def _fail_with(self, connection, error):
+        file_cursor = MagicMock()
+        file_cursor.__enter__.return_value = file_cursor
+        file_cursor.execute.side_effect = error
+        connection.cursor.side_effect = None
+        connection.cursor.return_value = file_cursor
+
+    @patch("databricks.sql.client.time.sleep")
+    def test_forbidden_upload_is_attempted_once(
+        self, mock_sleep, cursor, connection, tmp_path
+    ):
+        (local_file,) = self._local_files(tmp_path, 1)
+        connection.session.host = None
+        response = Mock(status=403, data=b"Forbidden")
+        self._fail_with(
+            connection, lambda _: cursor._handle_staging_http_response(response)
+        )
+
+        report = cursor.put_files({local_file: "/Volumes/c/s/v/f.csv"})
+
+        assert report.results[0].attempts == 1
+        assert "403-Forbidden" in str(report.results[0].error)
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            OperationalError("not found", {"http-code": 404}),
+            RequestError("HTTP request failed", {"http-code": 400}),
+            NonRecoverableNetworkError("not implemented"),
+            UnsafeToRetryError("unsafe to retry"),
+            MaxRetryDurationError("retries exhausted"),
+        ],
+    )
+    @patch("databricks.sql.client.time.sleep")
+    def test_non_recoverable_errors_are_not_retried(
+        self, mock_sleep, error, cursor, connection, tmp_path
+    ):
+        (local_file,) = self._local_files(tmp_path, 1)
+        self._fail_with(connection, error)
+
+        report = cursor.put_files({local_file: "/Volumes/c/s/v/f.csv"})
+
+        assert report.results[0].attempts == 1
+        assert report.results[0].error is error
+
+    @pytest.mark.parametrize("http_code", [429, 500, 503])
+    @patch("databricks.sql.client.time.sleep")
+    def test_throttling_and_server_errors_are_retried(
+        self, mock_sleep, http_code, cursor, connection, tmp_path
+    ):
+        (local_file,) = self._local_files(tmp_path, 1)
+        self._fail_with(connection, OperationalError("busy", {"http-code": http_code}))
+
+        report = cursor.put_files({local_file: "/Volumes/c/s/v/f.csv"})
+
+        assert report.results[0].attempts == 3
+
+    def test_local_file_outside_allowed_path_is_rejected(
+        self, cursor, connection, tmp_path
+    ):
+        connection.staging_allowed_local_path = str(tmp_path / "allowed")
+
+        with pytest.raises(ProgrammingError, match="restricted"):
+            cursor.put_files({str(tmp_path / "other.csv"): "/Volumes/c/s/v/o.csv"})
+        assert connection.statements == []
+
+    def test_missing_allowed_path_is_rejected(self, cursor, connection, tmp_path):
+        connection.staging_allowed_local_path = None
+
+        with pytest.raises(ProgrammingError):
+            cursor.get_files({"/Volumes/c/s/v/a.csv": str(tmp_path / "a.csv")})